@@ -0,0 +1,117 @@
+"""Micro-benchmark for the best-available picker on 5k-seat synthetic charts.
+
+Pure CPU, no server or database needed (Django is only configured so the seating
+package imports cleanly):
+
+    uv run python -m benchmark.best_available
+    uv run python -m benchmark.best_available --repeat 200 --seed 7
+
+Each chart is 50 rows x 100 seats at a given sold ratio; every case times the
+picker against the exhaustive baseline it replaced (score every placement, sort
+them all) and checks both return the same seats.
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import time
+import typing as t
+import uuid
+
+from .seating_load.harness import setup_django
+
+ROWS = 50
+SEATS_PER_ROW = 100
+SOLD_RATIOS = (0.0, 0.5, 0.9)
+QUANTITIES = (2, 8, 20)
+
+
+def _chart(rng: random.Random, sold_ratio: float) -> list[t.Any]:
+    from events.service.seating.best_available import CandidateSeat
+
+    return [
+        CandidateSeat(
+            id=uuid.uuid4(),
+            row_order=row,
+            adjacency_index=i,
+            is_accessible=False,
+            sector_display_order=0,
+            row_length=SEATS_PER_ROW,
+            row_label=f"R{row}",
+        )
+        for row in range(ROWS)
+        for i in range(SEATS_PER_ROW)
+        if rng.random() >= sold_ratio
+    ]
+
+
+def _exhaustive(pool: list[t.Any], quantity: int, seed: int) -> list[uuid.UUID]:
+    """The pre-index picker: every (run, start) placement scored and sorted."""
+    rows: dict[tuple[int, int, str | None], list[t.Any]] = {}
+    for s in pool:
+        rows.setdefault((s.sector_display_order, s.row_order, s.row_label), []).append(s)
+    placements = []
+    for seats in rows.values():
+        ordered = sorted(seats, key=lambda s: s.adjacency_index)
+        center = (seats[0].row_length - 1) / 2
+        for _, group in itertools.groupby(enumerate(ordered), key=lambda pair: pair[1].adjacency_index - pair[0]):
+            run = [seat for _, seat in group]
+            for start in range(len(run) - quantity + 1):
+                block = run[start : start + quantity]
+                centrality = abs((block[0].adjacency_index + block[-1].adjacency_index) / 2 - center)
+                fragmentation = (start == 1) + (len(run) - start - quantity == 1)
+                placements.append(
+                    ((block[0].row_order, centrality, fragmentation, block[0].sector_display_order), block)
+                )
+    if not placements:
+        return []
+    placements.sort(key=lambda p: p[0])
+    best = placements[0][0]
+    near_equal = [
+        p
+        for p in placements
+        if p[0][0] == best[0] and abs(p[0][1] - best[1]) <= 0.5 and p[0][2] == best[2] and p[0][3] == best[3]
+    ]
+    return [s.id for s in random.Random(seed).choice(near_equal)[1]]
+
+
+def _median_ms(fn: t.Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    """Run every (sold ratio, quantity) case and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Best-available picker micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per case (median reported)")
+    parser.add_argument("--seed", type=int, default=1337)
+    args = parser.parse_args()
+
+    setup_django()
+    from events.service.seating.best_available import pick_best_available
+
+    rng = random.Random(args.seed)
+    print(f"{ROWS}x{SEATS_PER_ROW} chart, median of {args.repeat} runs")
+    print(f"{'sold':>6} {'qty':>4} {'seats':>6} {'exhaustive ms':>14} {'indexed ms':>11} {'speedup':>8}")
+    mismatches = 0
+    for sold_ratio in SOLD_RATIOS:
+        pool = _chart(rng, sold_ratio)
+        for quantity in QUANTITIES:
+            picked = pick_best_available(pool, quantity, seed=args.seed)
+            if picked != _exhaustive(pool, quantity, args.seed):
+                mismatches += 1
+                print(f"  MISMATCH sold={sold_ratio} qty={quantity}")
+            old = _median_ms(lambda: _exhaustive(pool, quantity, args.seed), args.repeat)
+            new = _median_ms(lambda: pick_best_available(pool, quantity, seed=args.seed), args.repeat)
+            print(f"{sold_ratio:>6.0%} {quantity:>4} {len(pool):>6} {old:>14.3f} {new:>11.3f} {old / new:>7.1f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
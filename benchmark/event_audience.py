@@ -0,0 +1,176 @@
+"""Benchmark for resolving and notifying the audience of an event in a big organization.
+
+Needs a migrated development database (no server); everything it creates is rolled back:
+
+    uv run python -m benchmark.event_audience
+    uv run python -m benchmark.event_audience --members 50000 --rsvps 2000 --repeat 5
+
+Builds an organization with ``--members`` members and a PUBLIC event with
+``--rsvps`` RSVPs and ``--invitations`` invitations, then times three things for
+EVENT_OPEN:
+
+- ``legacy``: the previous resolver, one ``RevelUser`` query ORing joins across
+  owned organizations, staff, memberships, RSVPs, tickets and invitations with
+  ``DISTINCT``, then every candidate through ``is_user_eligible_for_notification``;
+- ``union``: ``get_eligible_users_for_event_notification``, the UNION of per-table
+  subqueries with the preference checks in SQL, fetched as ids;
+- ``notify``: ``notify_event_opened`` end to end (ids streamed in chunks into
+  ``notify_many``); the batch dispatches it queues never run, as nothing commits.
+
+The two resolvers' results are compared; a mismatch fails the run.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import typing as t
+import uuid
+from datetime import timedelta
+from itertools import batched
+
+from .seating_load.harness import setup_django
+
+
+class _Rollback(Exception):
+    """Raised to roll the fixture back once the timings are in."""
+
+
+def _legacy_audience(event: t.Any) -> set[uuid.UUID]:
+    """The pre-UNION resolver for EVENT_OPEN on a PUBLIC event."""
+    from django.db.models import Q
+
+    from accounts.models import RevelUser
+    from events.models import EventRSVP, OrganizationMember, Ticket
+    from notifications.enums import NotificationType
+    from notifications.service.eligibility import BatchParticipationChecker, is_user_eligible_for_notification
+
+    org_id = event.organization_id
+    participants = (
+        Q(owned_organizations=org_id)
+        | Q(organization_staff_memberships__organization_id=org_id)
+        | Q(
+            organization_memberships__organization_id=org_id,
+            organization_memberships__status__in=[
+                OrganizationMember.MembershipStatus.ACTIVE,
+                OrganizationMember.MembershipStatus.PAUSED,
+            ],
+        )
+        | Q(rsvps__event=event, rsvps__status__in=[EventRSVP.RsvpStatus.YES, EventRSVP.RsvpStatus.MAYBE])
+        | Q(tickets__event=event, tickets__status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.PENDING])
+        | Q(invitations__event=event)
+    )
+    candidates = (
+        RevelUser.objects.filter(participants & ~Q(notification_preferences__silence_all_notifications=True))
+        .select_related("notification_preferences")
+        .distinct()
+    )
+    checker = BatchParticipationChecker(event)
+    return {
+        user.id
+        for user in candidates
+        if is_user_eligible_for_notification(user, NotificationType.EVENT_OPEN, event=event, batch_checker=checker)
+    }
+
+
+def _union_audience(event: t.Any) -> set[uuid.UUID]:
+    from notifications.enums import NotificationType
+    from notifications.service.eligibility import get_eligible_users_for_event_notification
+
+    return set(
+        get_eligible_users_for_event_notification(event, NotificationType.EVENT_OPEN).values_list("id", flat=True)
+    )
+
+
+def _build(members: int, rsvps: int, invitations: int) -> t.Any:
+    """An organization with ``members`` members and a DRAFT PUBLIC event (no signals fire on bulk rows)."""
+    from django.utils import timezone
+
+    from accounts.models import RevelUser
+    from events.models import Event, EventInvitation, EventRSVP, Organization, OrganizationMember
+    from notifications.models import NotificationPreference
+
+    tag = uuid.uuid4().hex[:8]
+    owner = RevelUser.objects.create_user(username=f"audience-owner-{tag}@bench.test", password="x")
+    organization = Organization.objects.create(name=f"Audience {tag}", slug=f"audience-{tag}", owner=owner)
+    event = Event.objects.create(
+        organization=organization,
+        name="Audience benchmark",
+        slug=f"audience-{tag}",
+        visibility=Event.Visibility.PUBLIC,
+        status=Event.EventStatus.DRAFT,
+        start=timezone.now() + timedelta(days=7),
+        requires_ticket=False,
+    )
+    for chunk in batched(range(members), 5000):
+        users = RevelUser.objects.bulk_create(
+            RevelUser(username=f"audience-{tag}-{i}@bench.test", email=f"audience-{tag}-{i}@bench.test", password="!")
+            for i in chunk
+        )
+        NotificationPreference.objects.bulk_create(NotificationPreference(user=u) for u in users)
+        OrganizationMember.objects.bulk_create(OrganizationMember(organization=organization, user=u) for u in users)
+    members_qs = OrganizationMember.objects.filter(organization=organization).order_by("user_id")
+    user_ids = list(members_qs.values_list("user_id", flat=True))
+    EventRSVP.objects.bulk_create(
+        EventRSVP(event=event, user_id=user_id, status=EventRSVP.RsvpStatus.YES) for user_id in user_ids[:rsvps]
+    )
+    EventInvitation.objects.bulk_create(
+        EventInvitation(event=event, user_id=user_id) for user_id in user_ids[rsvps : rsvps + invitations]
+    )
+    return event
+
+
+def _time[T](fn: t.Callable[[], T], repeat: int) -> tuple[float, T]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main() -> int:
+    """Build the fixture, check both resolvers agree, print timings, roll back."""
+    parser = argparse.ArgumentParser(description="Event audience resolution benchmark")
+    parser.add_argument("--members", type=int, default=50_000, help="Organization members")
+    parser.add_argument("--rsvps", type=int, default=2_000, help="Members who RSVP'd YES")
+    parser.add_argument("--invitations", type=int, default=500, help="Members with an invitation")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path (median reported)")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection, transaction
+
+    from notifications.service.notification_helpers import notify_event_opened
+
+    mismatched = False
+    try:
+        with transaction.atomic():
+            start = time.perf_counter()
+            event = _build(args.members, args.rsvps, args.invitations)
+            print(f"fixture: {args.members} members built in {time.perf_counter() - start:.1f}s")
+
+            legacy_s, legacy = _time(lambda: _legacy_audience(event), args.repeat)
+            union_s, union = _time(lambda: _union_audience(event), args.repeat)
+            mismatched = legacy != union
+            if mismatched:
+                print(f"  MISMATCH: legacy={len(legacy)} union={len(union)}")
+
+            # Dispatches are queued on commit, which never comes: count the queued callbacks.
+            queued = len(connection.run_on_commit)
+            notify_s, sent = _time(lambda: notify_event_opened(event), 1)
+            batches = len(connection.run_on_commit) - queued
+
+            print(f"audience: {len(union)} users")
+            print(f"{'path':>8} {'seconds':>9}")
+            print(f"{'legacy':>8} {legacy_s:>9.3f}")
+            print(f"{'union':>8} {union_s:>9.3f}  ({legacy_s / union_s:.1f}x)")
+            print(f"{'notify':>8} {notify_s:>9.3f}  ({sent} notifications, {batches} dispatch batches queued)")
+            raise _Rollback
+    except _Rollback:
+        pass
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Benchmark for the new-event follower audience of a popular organization.
+
+Needs a migrated development database (no server); everything it creates is rolled back:
+
+    uv run python -m benchmark.follower_audience
+    uv run python -m benchmark.follower_audience --followers 100000 --members 5000 --series 20000 --repeat 5
+
+Builds an organization with ``--followers`` org followers, ``--members`` of whom are
+also members, and an event series followed by ``--series`` of the org followers.
+Then it times three things:
+
+- ``legacy``: the previous resolver, a Python set of every member and staff id, then
+  both follow tables walked with ``select_related("user")``, one user at a time;
+- ``set``: ``new_event_follower_audience``, one UNION ALL statement, fetched as ids;
+- ``notify``: the follower signal's send path, with ids streamed in chunks into
+  ``notify_many``. The batch dispatches it queues never run, as nothing commits.
+
+The two resolvers' results are compared; a mismatch fails the run.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import typing as t
+import uuid
+from itertools import batched
+
+from .seating_load.harness import setup_django
+
+
+class _Rollback(Exception):
+    """Raised to roll the fixture back once the timings are in."""
+
+
+def _legacy_audience(organization: t.Any, series: t.Any) -> set[tuple[uuid.UUID, str]]:
+    """The pre-set-based resolver, as it was."""
+    from events.models import OrganizationMember
+    from events.models.follow import EventSeriesFollow, OrganizationFollow
+    from notifications.enums import NotificationType
+
+    excluded = set(
+        OrganizationMember.objects.filter(organization=organization)
+        .exclude(status=OrganizationMember.MembershipStatus.CANCELLED)
+        .values_list("user_id", flat=True)
+    )
+    excluded.update(organization.staff_members.values_list("id", flat=True))
+    excluded.add(organization.owner_id)
+
+    audience: dict[uuid.UUID, str] = {}
+    series_follows = EventSeriesFollow.objects.filter(
+        event_series=series, is_archived=False, notify_new_events=True
+    ).select_related("user")
+    for follow in series_follows:
+        if follow.user_id not in excluded:
+            audience.setdefault(follow.user.id, NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES)
+    org_follows = OrganizationFollow.objects.filter(
+        organization=organization, is_archived=False, notify_new_events=True
+    ).select_related("user")
+    for org_follow in org_follows:
+        if org_follow.user_id not in excluded:
+            audience.setdefault(org_follow.user.id, NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG)
+    return set(audience.items())
+
+
+def _set_audience(organization: t.Any, series: t.Any) -> set[tuple[uuid.UUID, str]]:
+    from events.service.follow_service import new_event_follower_audience
+    from notifications.enums import NotificationType
+
+    return {(user_id, NotificationType(value)) for user_id, value in new_event_follower_audience(organization, series)}
+
+
+def _notify(organization: t.Any, series: t.Any) -> int:
+    """The follower signal's send path, minus the context it builds around it."""
+    from events.service.follow_service import iter_new_event_follower_chunks
+    from notifications.enums import NotificationType
+    from notifications.service.dispatcher import notify_many
+
+    context: dict[str, t.Any] = {
+        "organization_id": str(organization.id),
+        "organization_name": organization.name,
+        "event_id": str(uuid.uuid4()),
+        "event_name": "Follower benchmark",
+        "event_description": "",
+        "event_start": "",
+        "event_start_formatted": "",
+        "event_location": "",
+        "event_url": "https://example.com/events/benchmark",
+    }
+    type_contexts = {
+        NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG: context,
+        NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES: {
+            **context,
+            "event_series_id": str(series.id),
+            "event_series_name": series.name,
+        },
+    }
+    sent = 0
+    for by_type in iter_new_event_follower_chunks(organization, series):
+        for notification_type, user_ids in by_type.items():
+            sent += notify_many(notification_type, user_ids, type_contexts[notification_type])
+    return sent
+
+
+def _build(followers: int, members: int, series_followers: int) -> tuple[t.Any, t.Any]:
+    """An organization and a series with bulk-created followers (no signals fire on bulk rows)."""
+    from accounts.models import RevelUser
+    from events.models import EventSeries, Organization, OrganizationMember
+    from events.models.follow import EventSeriesFollow, OrganizationFollow
+    from notifications.models import NotificationPreference
+
+    tag = uuid.uuid4().hex[:8]
+    owner = RevelUser.objects.create_user(username=f"followers-owner-{tag}@bench.test", password="x")
+    organization = Organization.objects.create(name=f"Followers {tag}", slug=f"followers-{tag}", owner=owner)
+    series = EventSeries.objects.create(organization=organization, name="Weekly", slug=f"weekly-{tag}")
+    for chunk in batched(range(followers), 5000):
+        users = RevelUser.objects.bulk_create(
+            RevelUser(username=f"follower-{tag}-{i}@bench.test", email=f"follower-{tag}-{i}@bench.test", password="!")
+            for i in chunk
+        )
+        NotificationPreference.objects.bulk_create(NotificationPreference(user=u) for u in users)
+        OrganizationFollow.objects.bulk_create(
+            OrganizationFollow(organization=organization, user=u, notify_new_events=True) for u in users
+        )
+    follows_qs = OrganizationFollow.objects.filter(organization=organization).order_by("user_id")
+    user_ids = list(follows_qs.values_list("user_id", flat=True))
+    OrganizationMember.objects.bulk_create(
+        OrganizationMember(organization=organization, user_id=user_id) for user_id in user_ids[:members]
+    )
+    EventSeriesFollow.objects.bulk_create(
+        EventSeriesFollow(event_series=series, user_id=user_id, notify_new_events=True)
+        for user_id in user_ids[-series_followers:]
+    )
+    return organization, series
+
+
+def _time[T](fn: t.Callable[[], T], repeat: int) -> tuple[float, T]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main() -> int:
+    """Build the fixture, check both resolvers agree, print timings, roll back."""
+    parser = argparse.ArgumentParser(description="New-event follower audience benchmark")
+    parser.add_argument("--followers", type=int, default=100_000, help="Organization followers")
+    parser.add_argument("--members", type=int, default=5_000, help="Followers who are also members")
+    parser.add_argument("--series", type=int, default=20_000, help="Followers who also follow the series")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path (median reported)")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection, transaction
+
+    mismatched = False
+    try:
+        with transaction.atomic():
+            start = time.perf_counter()
+            organization, series = _build(args.followers, args.members, args.series)
+            print(f"fixture: {args.followers} followers built in {time.perf_counter() - start:.1f}s")
+
+            legacy_s, legacy = _time(lambda: _legacy_audience(organization, series), args.repeat)
+            set_s, audience = _time(lambda: _set_audience(organization, series), args.repeat)
+            mismatched = legacy != audience
+            if mismatched:
+                print(f"  MISMATCH: legacy={len(legacy)} set={len(audience)}")
+
+            # Dispatches are queued on commit, which never comes: count the queued callbacks.
+            queued = len(connection.run_on_commit)
+            notify_s, sent = _time(lambda: _notify(organization, series), 1)
+            batches = len(connection.run_on_commit) - queued
+
+            print(f"audience: {len(audience)} followers")
+            print(f"{'path':>8} {'seconds':>9}")
+            print(f"{'legacy':>8} {legacy_s:>9.3f}")
+            print(f"{'set':>8} {set_s:>9.3f}  ({legacy_s / set_s:.1f}x)")
+            print(f"{'notify':>8} {notify_s:>9.3f}  ({sent} notifications, {batches} dispatch batches queued)")
+            raise _Rollback
+    except _Rollback:
+        pass
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
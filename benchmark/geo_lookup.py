@@ -0,0 +1,90 @@
+"""Micro-benchmark for IP geolocation lookups against the real IP2Location database.
+
+Needs the downloaded ``.BIN`` (``geo/data/IP2LOCATION-LITE-DB5.BIN`` by default), no
+server or database:
+
+    uv run python -m benchmark.geo_lookup
+    uv run python -m benchmark.geo_lookup --lookups 200000 --distinct 5000 --db path/to/DB5.BIN
+
+Times three ways of resolving the same stream of addresses, drawn with repetition
+from a pool of ``--distinct`` random IPv4 addresses the way request traffic repeats
+clients:
+
+- ``file_io``: the previous path, an IP2Location FILE_IO handle plus a ``stat()`` of
+  the database and a full ``get_all()`` decode per lookup;
+- ``mmap``: ``IP2LocationReader.lookup`` with no cache;
+- ``resolve``: ``resolve_ip_to_point``, the reader behind the /24 LRU.
+
+Every pool address is checked to resolve to the same city and coordinates on both
+readers before timing.
+"""
+
+import argparse
+import random
+import sys
+import time
+import typing as t
+from pathlib import Path
+
+from .seating_load.harness import setup_django
+
+
+def _rate(fn: t.Callable[[str], object], ips: list[str]) -> float:
+    start = time.perf_counter()
+    for ip in ips:
+        fn(ip)
+    return len(ips) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    """Check both readers agree, then print lookups/sec for each path."""
+    parser = argparse.ArgumentParser(description="IP geolocation lookup micro-benchmark")
+    parser.add_argument("--db", type=Path, default=None, help="IP2Location .BIN (default: the app's path)")
+    parser.add_argument("--lookups", type=int, default=100_000, help="Lookups timed per path")
+    parser.add_argument("--distinct", type=int, default=2_000, help="Distinct client addresses in the stream")
+    parser.add_argument("--seed", type=int, default=1337)
+    args = parser.parse_args()
+
+    setup_django()
+    from IP2Location import IP2Location
+
+    from geo import conf, ip2
+
+    db_path = args.db or conf.IP2LOCATION_DB_PATH
+    conf.IP2LOCATION_DB_PATH = db_path
+    rng = random.Random(args.seed)
+    pool = [".".join(str(rng.randrange(1, 224)) for _ in range(4)) for _ in range(args.distinct)]
+    stream = [rng.choice(pool) for _ in range(args.lookups)]
+
+    file_io = IP2Location(str(db_path))
+    reader = ip2.IP2LocationReader(db_path)
+    mismatches = 0
+    for ip in pool:
+        old = file_io.get_all(ip)
+        new = reader.lookup(ip)
+        if new is None or (old.city, float(old.latitude), float(old.longitude)) != tuple(new):
+            mismatches += 1
+            print(f"  MISMATCH {ip}: file_io={old.city},{old.latitude},{old.longitude} mmap={new}")
+
+    def previous(ip: str) -> object:
+        db_path.stat()
+        return file_io.get_all(ip)
+
+    rates = {
+        "file_io": _rate(previous, stream),
+        "mmap": _rate(reader.lookup, stream),
+    }
+    ip2.clear_lookup_cache()
+    rates["resolve"] = _rate(ip2.resolve_ip_to_point, stream)
+    cache = ip2._lookup.cache_info()
+
+    print(f"{db_path.name}: {args.lookups} lookups over {args.distinct} distinct addresses")
+    print(f"{'path':>8} {'lookups/s':>12} {'speedup':>8}")
+    for name, rate in rates.items():
+        print(f"{name:>8} {rate:>12,.0f} {rate / rates['file_io']:>7.1f}x")
+    print(f"resolve cache: {cache.hits} hits, {cache.misses} misses")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -602,8 +602,13 @@ def scenario_purchase_race(client: LoadClient, fx: Fixtures, seed: int) -> Scena
     )
     ok &= check(dup == 0, "ORM: no seat has >1 non-cancelled ticket", f"ORM: {dup} double-sold seats", notes)
     attack_statuses = sorted({c.status for c in attack_calls})
+    # Headline p99: every checkout on the event serializes on its capacity lock, so
+    # this is the number to compare across commits that touch the capacity check.
+    checkout_p99 = percentile([c.elapsed_ms for c in buy_calls + attack_calls], 99)
     notes.insert(
-        0, f"buyers 200={sum(1 for c in buy_calls if c.status == 200)}/30, attacker statuses={attack_statuses}"
+        0,
+        f"buyers 200={sum(1 for c in buy_calls if c.status == 200)}/30, attacker statuses={attack_statuses}, "
+        f"checkout p99={checkout_p99:.0f}ms",
     )
     return ScenarioResult("purchase_race", ok, notes)
 
@@ -686,13 +691,13 @@ def scenario_probes(client: LoadClient, fx: Fixtures, seed: int) -> ScenarioResu
 
 
 def invariant_sweep() -> ScenarioResult:
-    """Post-run ORM sweep: duplicate tickets, hold owner XOR, hold lifetime bound."""
+    """Post-run ORM sweep: duplicate tickets, hold owner XOR, hold lifetime bound, capacity ledgers."""
     print("\n=== Global invariant sweep (ORM) ===")
     import datetime
 
     from django.db.models import Count, F, Q
 
-    from events.models import SeatHold, Ticket
+    from events.models import EventCapacityLedger, SeatHold, Ticket
 
     notes: list[str] = []
     dup = (
@@ -721,4 +726,20 @@ def invariant_sweep() -> ScenarioResult:
         f"{over_ttl} holds exceed the 30min lifetime cap",
         notes,
     )
+
+    ledgers = dict(EventCapacityLedger.objects.values_list("event_id", "committed_tickets"))
+    actual = dict(
+        Ticket.objects.filter(event_id__in=ledgers)
+        .exclude(status=Ticket.TicketStatus.CANCELLED)
+        .values("event_id")
+        .annotate(n=Count("id"))
+        .values_list("event_id", "n")
+    )
+    drifted = sum(1 for event_id, committed in ledgers.items() if actual.get(event_id, 0) != committed)
+    ok &= check(
+        drifted == 0,
+        f"capacity ledger matches the ticket count on all {len(ledgers)} events",
+        f"{drifted} event(s) whose capacity ledger drifted from the ticket count",
+        notes,
+    )
     return ScenarioResult("invariant_sweep", ok, notes)
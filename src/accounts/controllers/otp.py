@@ -62,7 +62,7 @@ class OtpController(UserAwareController):
         if not totp.verify(payload.otp):
             raise HttpError(status.HTTP_403_FORBIDDEN, "Invalid OTP")
         user.totp_active = True
-        user.save()
+        user.save(update_fields=["totp_active"])
         return user
 
     @route.post(
@@ -82,5 +82,5 @@ class OtpController(UserAwareController):
         if not totp.verify(payload.otp):
             raise HttpError(status.HTTP_403_FORBIDDEN, "Invalid OTP")
         user.totp_active = False
-        user.save()
+        user.save(update_fields=["totp_active"])
         return user
@@ -0,0 +1,168 @@
+"""Cached snapshot of the user row behind JWT authentication.
+
+Every JWT-authenticated request resolves its user by ``USER_ID_FIELD`` before the view runs,
+and the hottest views (``/permissions/my-permissions`` alone sees ~147k requests a week)
+need nothing from that row beyond the id, the active/staff/superuser flags, email
+verification and language. :func:`get_user` serves the row from two layers:
+
+- a per-process LRU, for ``LOCAL_TTL_SECONDS``;
+- the shared cache, for ``CACHE_TTL_SECONDS``;
+
+and falls back to one ``values_list`` query. The user is rebuilt with ``Model.from_db``,
+so callers get a real :class:`RevelUser`. Credentials (``SECRET_FIELDS``) never leave
+Postgres: they stay deferred and load on first access. Saving such an instance writes
+only its loaded fields, so a deferred password is never overwritten, but the loaded
+values can be a few seconds old: writers must pass ``update_fields`` so a stale
+``is_active`` (say) is never written back over a ban.
+
+Invalidation (:func:`invalidate`, wired to user saves/deletes and bans in
+``accounts.signals``) deletes the shared entry now and again after commit, and the
+local entry in the writing process. Other processes may keep serving their local copy
+for up to ``LOCAL_TTL_SECONDS``. That bounds how long a deactivated or banned user's
+access token keeps working, next to the token's own lifetime. ``update()`` writers
+bypass the signals and ride ``CACHE_TTL_SECONDS``.
+
+Cache ops fail open: a broken Redis costs the query, never the request.
+"""
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from uuid import UUID
+
+import structlog
+from django.core.cache import cache
+from django.db import router, transaction
+from ninja_jwt.settings import api_settings
+from prometheus_client import Counter
+
+from accounts.models import RevelUser
+
+logger = structlog.get_logger(__name__)
+
+# Bump when SNAPSHOT_FIELDS changes so a rolling deploy never rebuilds a user from an old shape.
+CACHE_VERSION = "v1"
+CACHE_TTL_SECONDS = 60
+LOCAL_TTL_SECONDS = 5
+LOCAL_MAX_ENTRIES = 2048
+
+SECRET_FIELDS = frozenset({"password", "totp_secret"})
+SNAPSHOT_FIELDS: tuple[str, ...] = tuple(
+    field.attname for field in RevelUser._meta.concrete_fields if field.name not in SECRET_FIELDS
+)
+
+# A rate, not an alert: per-worker values are enough for a hit ratio, so this lives here
+# rather than in common.observability.metrics.
+AUTH_SNAPSHOT_LOOKUPS = Counter(
+    "revel_auth_snapshot_lookups",
+    "JWT user resolutions by source (local, shared, db, or error when the shared cache was unreachable).",
+    ["source"],
+)
+
+
+class _LocalSnapshots:
+    """A small thread-safe LRU of snapshot rows with per-entry expiry."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, tuple[t.Any, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> tuple[t.Any, ...] | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return values
+
+    def set(self, user_id: str, values: tuple[t.Any, ...]) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + LOCAL_TTL_SECONDS, values)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, *user_ids: str) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_local = _LocalSnapshots(LOCAL_MAX_ENTRIES)
+
+
+def get_cache_key(user_id: UUID | str) -> str:
+    """Cache key for a user's auth snapshot, by the token's ``USER_ID_FIELD`` value."""
+    return f"auth_snapshot:{CACHE_VERSION}:{user_id}"
+
+
+def get_user(user_id: UUID | str) -> RevelUser | None:
+    """The user with this id, rebuilt from the snapshot when one is cached; None if there is none."""
+    user_id = str(user_id)
+    values = _local.get(user_id)
+    if values is not None:
+        AUTH_SNAPSHOT_LOOKUPS.labels(source="local").inc()
+        return _build(values)
+
+    key = get_cache_key(user_id)
+    try:
+        values = cache.get(key)
+        source = "db"
+    except Exception:
+        logger.warning("auth_snapshot_cache_get_failed", exc_info=True)
+        source = "error"
+    if values is not None:
+        AUTH_SNAPSHOT_LOOKUPS.labels(source="shared").inc()
+        _local.set(user_id, values)
+        return _build(values)
+
+    AUTH_SNAPSHOT_LOOKUPS.labels(source=source).inc()
+    values = RevelUser.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).values_list(*SNAPSHOT_FIELDS).first()
+    if values is None:
+        return None
+    if source == "db":
+        try:
+            cache.set(key, values, timeout=CACHE_TTL_SECONDS)
+        except Exception:
+            logger.warning("auth_snapshot_cache_set_failed", exc_info=True)
+    _local.set(user_id, values)
+    return _build(values)
+
+
+def _build(values: tuple[t.Any, ...]) -> RevelUser:
+    return RevelUser.from_db(router.db_for_read(RevelUser), SNAPSHOT_FIELDS, values)
+
+
+def invalidate(*user_ids: UUID | str) -> None:
+    """Drop the users' snapshots now and again after commit.
+
+    Now, so the rest of this transaction (and this process) sees the write; after commit,
+    because a concurrent request may have re-cached the *old* committed row in between.
+    """
+    ids = [str(user_id) for user_id in user_ids]
+    keys = [get_cache_key(user_id) for user_id in ids]
+
+    def _delete() -> None:
+        _local.discard(*ids)
+        try:
+            cache.delete_many(keys)
+        except Exception:
+            logger.warning("auth_snapshot_cache_delete_failed", exc_info=True)
+
+    _delete()
+    transaction.on_commit(_delete)
+
+
+def clear_local() -> None:
+    """Empty this process's snapshot LRU."""
+    _local.clear()
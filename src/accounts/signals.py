@@ -2,10 +2,12 @@
 
 import structlog
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from ninja_jwt.settings import api_settings
 
 from accounts.models import GlobalBan, RevelUser
+from accounts.service import auth_snapshot
 from accounts.tasks import notify_admin_new_user_joined, notify_admin_new_user_joined_discord
 from common.models import SiteSettings
 
@@ -60,6 +62,16 @@ def notify_admin_on_user_creation(
     )
 
 
+@receiver(post_save, sender=RevelUser)
+@receiver(post_delete, sender=RevelUser)
+def invalidate_auth_snapshot(sender: type[RevelUser], instance: RevelUser, **kwargs: object) -> None:
+    """Drop the cached JWT auth snapshot of a saved or deleted user.
+
+    Covers deactivation (bans go through ``user.save``), role flags and language.
+    """
+    auth_snapshot.invalidate(getattr(instance, api_settings.USER_ID_FIELD))
+
+
 @receiver(post_save, sender=GlobalBan)
 def handle_global_ban_created(sender: type[GlobalBan], instance: GlobalBan, created: bool, **kwargs: object) -> None:
     """Enforce a global ban when it is first created.
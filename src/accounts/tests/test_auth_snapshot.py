@@ -0,0 +1,115 @@
+"""Tests for the cached user resolution behind JWT authentication."""
+
+from unittest.mock import patch
+
+import orjson
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from ninja_jwt.exceptions import AuthenticationFailed
+from ninja_jwt.tokens import RefreshToken
+
+from accounts.models import RevelUser
+from accounts.service import auth_snapshot
+from common.authentication import I18nJWTAuth
+
+pytestmark = pytest.mark.django_db
+
+
+def _authenticate(user: RevelUser) -> RevelUser:
+    token = str(RefreshToken.for_user(user).access_token)
+    result: RevelUser = I18nJWTAuth().authenticate(RequestFactory().get("/"), token)
+    return result
+
+
+def _user_queries(queries: CaptureQueriesContext) -> int:
+    table = RevelUser._meta.db_table
+    return sum(f'FROM "{table}"' in query["sql"] for query in queries.captured_queries)
+
+
+def test_repeat_authentication_skips_the_user_query(user: RevelUser) -> None:
+    _authenticate(user)
+
+    with CaptureQueriesContext(connection) as queries:
+        resolved = _authenticate(user)
+
+    assert _user_queries(queries) == 0
+    assert resolved.pk == user.pk
+    assert resolved.email == user.email
+
+
+def test_shared_cache_serves_other_processes(user: RevelUser) -> None:
+    _authenticate(user)
+    auth_snapshot.clear_local()
+
+    with CaptureQueriesContext(connection) as queries:
+        _authenticate(user)
+
+    assert _user_queries(queries) == 0
+
+
+def test_credentials_are_not_cached_but_load_on_access(user: RevelUser) -> None:
+    user.set_password("s3cret-pass")
+    user.save()
+
+    resolved = _authenticate(user)
+
+    cached = cache.get(auth_snapshot.get_cache_key(user.pk))
+    assert user.password not in cached
+    assert resolved.get_deferred_fields() == auth_snapshot.SECRET_FIELDS
+    assert resolved.check_password("s3cret-pass")
+
+
+def test_save_invalidates_the_snapshot(user: RevelUser) -> None:
+    _authenticate(user)
+
+    user.language = "de"
+    user.save()
+
+    assert _authenticate(user).language == "de"
+
+
+def test_deactivated_user_is_rejected(user: RevelUser) -> None:
+    _authenticate(user)
+
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+
+    with pytest.raises(AuthenticationFailed):
+        _authenticate(user)
+
+
+def test_saving_a_snapshot_user_keeps_the_password(user: RevelUser) -> None:
+    user.set_password("s3cret-pass")
+    user.save()
+    resolved = _authenticate(user)
+
+    resolved.preferred_name = "Snap"
+    resolved.save()
+
+    user.refresh_from_db()
+    assert user.preferred_name == "Snap"
+    assert user.check_password("s3cret-pass")
+
+
+@pytest.mark.parametrize("url_name", ["api:enable-otp", "api:disable-otp"])
+@patch("pyotp.TOTP.verify", return_value=True)
+def test_otp_toggle_from_a_stale_snapshot_keeps_a_ban(
+    _verify: object, auth_client: Client, user: RevelUser, url_name: str
+) -> None:
+    """A snapshot still cached as active elsewhere must not write ``is_active`` back."""
+    _authenticate(user)
+    # Another process bans the user; this process's local entry is still active.
+    RevelUser.objects.filter(pk=user.pk).update(is_active=False)
+
+    payload = orjson.dumps({"otp": "123456"})
+    response = auth_client.post(reverse(url_name), data=payload, content_type="application/json")
+
+    assert response.status_code == 200
+    user.refresh_from_db()
+    assert user.is_active is False
+    assert user.totp_active is (url_name == "api:enable-otp")
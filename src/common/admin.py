@@ -140,7 +140,7 @@ class FileExportAdmin(ModelAdmin):  # type: ignore[misc]
     list_select_related = ["requested_by"]
     list_filter = ["export_type", "status", "created_at"]
     search_fields = ["requested_by__email"]
-    readonly_fields = ["id", "created_at", "updated_at", "completed_at", "parameters"]
+    readonly_fields = ["id", "created_at", "updated_at", "completed_at", "parameters", "metadata"]
     date_hierarchy = "created_at"
     ordering = ["-created_at"]
 
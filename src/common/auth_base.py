@@ -10,6 +10,11 @@ from django.utils.translation import gettext_lazy as _
 from ninja_extra import status
 from ninja_extra.exceptions import APIException
 from ninja_jwt.authentication import JWTAuth
+from ninja_jwt.exceptions import AuthenticationFailed, InvalidToken
+from ninja_jwt.settings import api_settings
+from ninja_jwt.tokens import Token
+
+from accounts.service import auth_snapshot
 
 
 class PermissionDenied(APIException):
@@ -46,6 +51,27 @@ class BaseJWTAuth(JWTAuth):
         self.requires_verified_email = requires_verified_email
         super().__init__()
 
+    def get_user(self, validated_token: Token) -> t.Any:
+        """Resolve the token's user from the auth snapshot instead of a query per request.
+
+        Mirrors ``JWTAuth.get_user``; see ``accounts.service.auth_snapshot`` for what is
+        cached and how long a deactivation can take to show. Token revocation checks
+        need the password hash, so they keep the uncached path.
+        """
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = auth_snapshot.get_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"))
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"))
+        return user
+
     def authenticate(self, request: HttpRequest, token: str) -> t.Any:
         """Authenticate and verify user permissions.
 
@@ -8,20 +8,28 @@ Usage:
     python manage.py generate_thumbnails --sync             # Run synchronously
     python manage.py generate_thumbnails --force            # Regenerate existing
     python manage.py generate_thumbnails --limit 100        # Process only 100 instances
+    python manage.py generate_thumbnails --workers 8        # Backfill in a local process pool
 """
 
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import batched, repeat
 
+import django
 from django.apps import apps
-from django.core.management.base import BaseCommand, CommandParser
-from django.db import models
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections, models
 
 from common.thumbnails.config import (
     THUMBNAIL_CONFIGS,
     ModelThumbnailConfig,
     get_thumbnail_field_names,
 )
+from common.thumbnails.service import ThumbnailResult, generate_and_save_thumbnails
+
+# Instances handed to the pool per worker per round; bounds how many rows are held at once.
+POOL_ROUND_PER_WORKER = 16
 
 
 @dataclass
@@ -70,6 +78,11 @@ class Command(BaseCommand):
             type=int,
             help="Maximum number of instances to process (useful for staged rollouts)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Generate in a pool of this many local processes instead of Celery tasks (for backfills)",
+        )
 
     def handle(self, *args: t.Any, **options: t.Any) -> None:
         """Execute the command."""
@@ -79,6 +92,9 @@ class Command(BaseCommand):
         sync = options.get("sync", False)
         force = options.get("force", False)
         limit = options.get("limit")
+        workers = options.get("workers")
+        if workers is not None and workers < 1:
+            raise CommandError("--workers must be at least 1")
 
         if dry_run:
             self.stdout.write(self.style.WARNING("DRY RUN MODE - no thumbnails will be generated"))
@@ -93,12 +109,14 @@ class Command(BaseCommand):
         stats = ProcessingStats()
         remaining_limit = limit
         for config_key, config in configs:
-            remaining_limit = self._process_config(config_key, config, dry_run, sync, force, stats, remaining_limit)
+            remaining_limit = self._process_config(
+                config_key, config, dry_run, sync, force, stats, remaining_limit, workers
+            )
             if remaining_limit is not None and remaining_limit <= 0:
                 self.stdout.write(self.style.WARNING("Limit reached, stopping."))
                 break
 
-        self._print_summary(dry_run, sync, stats)
+        self._print_summary(dry_run, sync or workers is not None, stats)
 
     def _filter_configs(
         self,
@@ -130,6 +148,7 @@ class Command(BaseCommand):
         force: bool,
         stats: ProcessingStats,
         limit: int | None,
+        workers: int | None = None,
     ) -> int | None:
         """Process a single model/field configuration.
 
@@ -161,7 +180,9 @@ class Command(BaseCommand):
         if limit is not None:
             queryset = queryset[:limit]
 
-        if sync:
+        if workers is not None:
+            processed = self._process_pool(queryset, model_name, field_name, config, stats, workers)
+        elif sync:
             processed = self._process_sync(queryset, model_name, field_name, config, stats)
         else:
             processed = self._process_async(queryset, app_label, model_name, field_name, stats)
@@ -209,12 +230,9 @@ class Command(BaseCommand):
         Returns:
             Number of instances processed (including skipped).
         """
-        from common.thumbnails.service import generate_and_save_thumbnails
-
         count = 0
         for instance in queryset.iterator():
             count += 1
-            pk = instance.pk
             file_field = getattr(instance, field_name, None)
 
             if not file_field:
@@ -222,33 +240,79 @@ class Command(BaseCommand):
                 continue
 
             try:
-                original_path = file_field.name
-                result = generate_and_save_thumbnails(original_path, config)
-
-                update_fields = []
-                for thumb_field_name, path in result.thumbnails.items():
-                    if hasattr(instance, thumb_field_name):
-                        setattr(instance, thumb_field_name, path)
-                        update_fields.append(thumb_field_name)
-
-                if update_fields:
-                    instance.save(update_fields=update_fields)
-
-                stats.processed += 1
-                if result.has_failures:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"  Partial success for {model_name} pk={pk}: "
-                            f"{len(result.thumbnails)} generated, {len(result.failures)} failed"
-                        )
-                    )
-                else:
-                    self.stdout.write(f"  Generated thumbnails for {model_name} pk={pk}")
+                result: ThumbnailResult | Exception = generate_and_save_thumbnails(file_field.name, config)
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  Failed to generate thumbnails for pk={pk}: {e}"))
-                stats.skipped += 1
+                result = e
+            self._apply_result(instance, model_name, result, stats)
+        return count
+
+    def _process_pool(
+        self,
+        queryset: models.QuerySet[models.Model],
+        model_name: str,
+        field_name: str,
+        config: ModelThumbnailConfig,
+        stats: ProcessingStats,
+        workers: int,
+    ) -> int:
+        """Generate in a local process pool; results are written back from this process.
+
+        Workers only decode, resize and write files, so image work runs in parallel
+        while database access stays in the parent. Instances are fed to the pool in
+        rounds to bound how many are held in memory.
+
+        Returns:
+            Number of instances processed (including skipped).
+        """
+        # Connections must not be shared with the workers.
+        connections.close_all()
+
+        count = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+            for round_ in batched(queryset.iterator(), workers * POOL_ROUND_PER_WORKER):
+                count += len(round_)
+                instances = [instance for instance in round_ if getattr(instance, field_name, None)]
+                stats.skipped += len(round_) - len(instances)
+                paths = [getattr(instance, field_name).name for instance in instances]
+                results = pool.map(_generate_in_worker, paths, repeat(config))
+                for instance, result in zip(instances, results, strict=True):
+                    self._apply_result(instance, model_name, result, stats)
         return count
 
+    def _apply_result(
+        self,
+        instance: models.Model,
+        model_name: str,
+        result: ThumbnailResult | Exception,
+        stats: ProcessingStats,
+    ) -> None:
+        """Store the generated thumbnail paths on the instance and report the outcome."""
+        pk = instance.pk
+        if isinstance(result, Exception):
+            self.stdout.write(self.style.ERROR(f"  Failed to generate thumbnails for pk={pk}: {result}"))
+            stats.skipped += 1
+            return
+
+        update_fields = []
+        for thumb_field_name, path in result.thumbnails.items():
+            if hasattr(instance, thumb_field_name):
+                setattr(instance, thumb_field_name, path)
+                update_fields.append(thumb_field_name)
+
+        if update_fields:
+            instance.save(update_fields=update_fields)
+
+        stats.processed += 1
+        if result.has_failures:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"  Partial success for {model_name} pk={pk}: "
+                    f"{len(result.thumbnails)} generated, {len(result.failures)} failed"
+                )
+            )
+        else:
+            self.stdout.write(f"  Generated thumbnails for {model_name} pk={pk}")
+
     def _process_async(
         self,
         queryset: models.QuerySet[models.Model],
@@ -316,3 +380,11 @@ class Command(BaseCommand):
             )
         else:
             self.stdout.write(self.style.SUCCESS(f"Scheduled {stats.scheduled} thumbnail generation tasks"))
+
+
+def _generate_in_worker(original_path: str, config: ModelThumbnailConfig) -> ThumbnailResult | Exception:
+    """Pool worker: generate one file's thumbnails, returning the error instead of raising it."""
+    try:
+        return generate_and_save_thumbnails(original_path, config)
+    except Exception as e:
+        return e
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.15 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("common", "0015_alter_fileexport_export_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fileexport",
+            name="metadata",
+            field=models.JSONField(
+                blank=True, default=dict, help_text="Generation stats, e.g. file size and peak RSS."
+            ),
+        ),
+    ]
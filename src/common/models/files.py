@@ -28,6 +28,7 @@ class FileExport(TimeStampedModel):
     error_message = models.TextField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     parameters = models.JSONField(default=dict, blank=True)
+    metadata = models.JSONField(default=dict, blank=True, help_text="Generation stats, e.g. file size and peak RSS.")
 
     def __str__(self) -> str:
         return f"FileExport({self.export_type}, {self.status})"
@@ -1,5 +1,11 @@
 """Generic helpers for FileExport lifecycle transitions."""
 
+import resource
+import sys
+import tempfile
+import typing as t
+
+from django.core.files import File
 from django.core.files.base import ContentFile
 from django.utils import timezone
 
@@ -7,6 +13,9 @@ from common.models import FileExport
 
 EXPORT_URL_EXPIRES_IN = 7 * 24 * 3600  # 7 days
 
+# Streamed exports stay in memory up to this size, then roll over to a temp file on disk.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
 
 def start_export(export: FileExport) -> None:
     """Transition export to PROCESSING."""
@@ -17,9 +26,46 @@ def start_export(export: FileExport) -> None:
 def complete_export(export: FileExport, file_bytes: bytes, filename: str) -> None:
     """Save the generated file and mark the export as READY."""
     export.file.save(filename, ContentFile(file_bytes), save=False)
+    _mark_ready(export)
+
+
+def complete_streamed_export(export: FileExport, filename: str, write: t.Callable[[t.IO[bytes]], None]) -> None:
+    """Generate the file into a spooled temp file, upload it by streaming and mark the export READY.
+
+    ``write`` receives the open file to write the export into. The storage backend reads
+    the file back in chunks, so the export never needs to fit in memory as a whole.
+
+    The file size and the worker's peak resident set size go into ``export.metadata``:
+    ``peak_rss_bytes`` is the process high-water mark once the file is uploaded and
+    ``peak_rss_growth_bytes`` how far this export raised it (0 when an earlier job had
+    already taken the worker higher).
+    """
+    peak_before = peak_rss_bytes()
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+        write(spool)
+        size = spool.seek(0, 2)
+        spool.seek(0)
+        export.file.save(filename, File(spool, name=filename), save=False)
+    peak_after = peak_rss_bytes()
+    export.metadata = {
+        **export.metadata,
+        "size_bytes": size,
+        "peak_rss_bytes": peak_after,
+        "peak_rss_growth_bytes": peak_after - peak_before,
+    }
+    _mark_ready(export, "metadata")
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process so far, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # KiB everywhere but macOS
+
+
+def _mark_ready(export: FileExport, *extra_fields: str) -> None:
     export.status = FileExport.ExportStatus.READY
     export.completed_at = timezone.now()
-    export.save(update_fields=["file", "status", "completed_at", "updated_at"])
+    export.save(update_fields=["file", "status", "completed_at", "updated_at", *extra_fields])
 
 
 def fail_export(export: FileExport, error: str) -> None:
@@ -14,6 +14,8 @@ from django.db import models
 from django.template.loader import render_to_string
 from weasyprint import HTML
 
+from common.service import pdf_rendering
+
 CURRENCY_SYMBOLS: dict[str, str] = {
     "EUR": "\u20ac",
     "USD": "$",
@@ -80,7 +82,8 @@ def render_pdf(template_name: str, context: dict[str, t.Any]) -> bytes:
 
     Automatically injects ``font_dir`` and ``brand_logo`` into the context so
     every invoice/payout template gets Nata Sans and the brand logo without
-    each caller repeating the path wiring.
+    each caller repeating the path wiring. Fonts and those local assets come from
+    the process-wide cache in :mod:`common.service.pdf_rendering`.
 
     Args:
         template_name: Path to the Django template (e.g. ``"invoices/foo.html"``).
@@ -96,5 +99,7 @@ def render_pdf(template_name: str, context: dict[str, t.Any]) -> bytes:
     brand_context.update(context)
     html_content = render_to_string(template_name, brand_context)
     pdf_buffer = BytesIO()
-    HTML(string=html_content).write_pdf(pdf_buffer)
+    HTML(string=html_content, url_fetcher=pdf_rendering.url_fetcher).write_pdf(
+        pdf_buffer, font_config=pdf_rendering.font_configuration()
+    )
     return pdf_buffer.getvalue()
@@ -0,0 +1,175 @@
+"""Shared WeasyPrint rendering for ticket, pass, card and invoice PDFs.
+
+A fresh ``HTML(...).write_pdf()`` reloads and re-registers the Nata Sans font files,
+re-reads every ``file://`` asset (fonts, brand mark, brand logo) and — in the ticket
+templates — re-downloads and base64-encodes the cover art. All of that is the same
+for every document, so per process we keep:
+
+- one ``FontConfiguration``, handed to every ``write_pdf``;
+- the bytes of local ``file://`` assets, served by :func:`url_fetcher`;
+- cover art and logos as data URIs, keyed by storage name and checked against the
+  file's modified time (a re-upload can reuse the name), up to
+  ``DATA_URI_CACHE_BYTES`` in total.
+
+Nothing here touches the database, so :func:`html_to_pdf` is safe to run in a
+process pool; :func:`pdf_renderer` sets one up for batch renderers such as
+``ticket_file_service.render_tickets``.
+"""
+
+import base64
+import mimetypes
+import threading
+import typing as t
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+import django
+import structlog
+from django.core.files.storage import default_storage
+from django.db import connections
+
+if t.TYPE_CHECKING:
+    from weasyprint.text.fonts import FontConfiguration
+
+logger = structlog.get_logger(__name__)
+
+LOCAL_ASSET_CACHE_SIZE = 32
+# Branding assets are per event, series or organization; a busy on-sale touches few.
+# The bound is on their encoded size, since one cover art can run to megabytes.
+DATA_URI_CACHE_BYTES = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def font_configuration() -> "FontConfiguration":
+    """This process's shared font configuration (fonts from ``@font-face`` load once)."""
+    from weasyprint.text.fonts import FontConfiguration
+
+    return FontConfiguration()
+
+
+@lru_cache(maxsize=LOCAL_ASSET_CACHE_SIZE)
+def _fetch_local(url: str) -> tuple[bytes, str | None]:
+    from weasyprint import default_url_fetcher
+
+    result = default_url_fetcher(url)
+    if file_obj := result.get("file_obj"):
+        with file_obj:
+            return file_obj.read(), result.get("mime_type")
+    return result["string"], result.get("mime_type")
+
+
+def url_fetcher(url: str, *args: t.Any, **kwargs: t.Any) -> dict[str, t.Any]:
+    """WeasyPrint URL fetcher that serves local ``file://`` assets from memory."""
+    if url.startswith("file://"):
+        data, mime_type = _fetch_local(url)
+        return {"string": data, "mime_type": mime_type, "redirected_url": url}
+    from weasyprint import default_url_fetcher
+
+    return t.cast(dict[str, t.Any], default_url_fetcher(url, *args, **kwargs))
+
+
+def html_to_pdf(html: str) -> bytes:
+    """Lay out ``html`` as a PDF with the shared fonts and asset cache."""
+    from weasyprint import HTML
+
+    return t.cast(bytes, HTML(string=html, url_fetcher=url_fetcher).write_pdf(font_config=font_configuration()))
+
+
+def _html_to_pdf_or_error(html: str) -> bytes | Exception:
+    """Pool worker: lay out one document, returning the error instead of raising it."""
+    try:
+        return html_to_pdf(html)
+    except Exception as e:
+        return e
+
+
+@contextmanager
+def pdf_renderer(workers: int = 1) -> Iterator[Callable[[list[str]], list[bytes | Exception]]]:
+    """Yield a function that lays out a list of HTML documents, in order.
+
+    With ``workers > 1`` the layout runs in a pool of that many processes, each with
+    its own font configuration and asset cache, kept for the whole ``with`` block.
+    A document that fails comes back as its exception so one bad ticket can't sink
+    a batch. Celery prefork workers are daemonic and can't start children: tasks
+    must use ``workers=1``.
+    """
+    if workers <= 1:
+        yield lambda htmls: [_html_to_pdf_or_error(html) for html in htmls]
+        return
+
+    # Connections must not be shared with the workers.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+        yield lambda htmls: list(pool.map(_html_to_pdf_or_error, htmls))
+
+
+class _DataUriCache:
+    """An LRU of data URIs bounded by their total length rather than their count.
+
+    Each entry remembers the ``version`` it was loaded at (the file's modified time);
+    asking for another version reloads it and replaces the entry. A URI longer than a
+    quarter of the budget is returned without being kept, so one huge upload cannot
+    flush everything else.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[t.Hashable, str]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, name: str, version: t.Hashable, load: Callable[[str], str]) -> str:
+        with self._lock:
+            if (entry := self._entries.get(name)) is not None and entry[0] == version:
+                self._entries.move_to_end(name)
+                return entry[1]
+        # Raises on a failed read, so the failure is never remembered.
+        uri = load(name)
+        with self._lock:
+            if (stale := self._entries.pop(name, None)) is not None:
+                self._size -= len(stale[1])
+            if len(uri) <= self.max_bytes // 4:
+                self._entries[name] = (version, uri)
+                self._size += len(uri)
+                while self._size > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+        return uri
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_data_uri_cache = _DataUriCache(DATA_URI_CACHE_BYTES)
+
+
+def _storage_data_uri(name: str) -> str:
+    with default_storage.open(name, "rb") as f:
+        data = f.read()
+    mime_type = mimetypes.guess_type(name)[0] or "image/jpeg"
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('utf-8')}"
+
+
+def file_data_uri(file_field: t.Any) -> str | None:
+    """A stored image as a base64 data URI, or None if it's unset or unreadable.
+
+    Cached per storage name and modified time: replacing an upload deletes the old
+    file first, so the new one can land under the same name. A storage that can't
+    report modified times is read every time.
+    """
+    if not file_field:
+        return None
+    try:
+        try:
+            version = default_storage.get_modified_time(file_field.name)
+        except NotImplementedError:
+            return _storage_data_uri(file_field.name)
+        return _data_uri_cache.get(file_field.name, version, _storage_data_uri)
+    except Exception:
+        logger.debug("file_to_data_uri_failed", file_name=file_field.name)
+        return None
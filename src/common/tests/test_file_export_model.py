@@ -2,7 +2,7 @@
 
 Tests cover:
 - FileExport creation with all statuses and export types
-- Status transitions via export_service helpers (start_export, complete_export, fail_export)
+- Status transitions via export_service helpers (start_export, complete_export, complete_streamed_export, fail_export)
 - cleanup_expired_file_exports task (deletes files older than 7 days)
 """
 
@@ -14,7 +14,13 @@ from django.utils import timezone
 
 from accounts.models import RevelUser
 from common.models import FileExport
-from common.service.export_service import complete_export, fail_export, start_export
+from common.service.export_service import (
+    SPOOL_MAX_BYTES,
+    complete_export,
+    complete_streamed_export,
+    fail_export,
+    start_export,
+)
 from common.tasks import cleanup_expired_file_exports
 from conftest import RevelUserFactory
 
@@ -149,6 +155,27 @@ class TestCompleteExport:
         assert pending_export.completed_at >= before
 
 
+class TestCompleteStreamedExport:
+    """Tests for complete_streamed_export helper."""
+
+    @pytest.mark.parametrize("size", [16, SPOOL_MAX_BYTES + 1], ids=["in-memory", "rolled-to-disk"])
+    def test_streams_file_and_records_metadata(self, pending_export: FileExport, size: int) -> None:
+        """The written file is stored whole; its size and the worker's peak RSS land in metadata."""
+        start_export(pending_export)
+        pending_export.metadata = {"source": "test"}
+
+        complete_streamed_export(pending_export, "export.xlsx", lambda file: file.write(b"x" * size))
+
+        pending_export.refresh_from_db()
+        assert pending_export.status == FileExport.ExportStatus.READY
+        assert pending_export.completed_at is not None
+        assert pending_export.file.size == size
+        assert pending_export.metadata["source"] == "test"
+        assert pending_export.metadata["size_bytes"] == size
+        assert pending_export.metadata["peak_rss_bytes"] > 0
+        assert 0 <= pending_export.metadata["peak_rss_growth_bytes"] <= pending_export.metadata["peak_rss_bytes"]
+
+
 class TestFailExport:
     """Tests for fail_export helper."""
 
@@ -0,0 +1,63 @@
+"""Tests for the size-bounded, versioned data URI cache behind ``file_data_uri``."""
+
+from collections.abc import Callable
+
+import pytest
+
+from common.service.pdf_rendering import _DataUriCache
+
+
+def _loader(calls: list[str], size: int) -> Callable[[str], str]:
+    def load(name: str) -> str:
+        calls.append(name)
+        return "x" * size
+
+    return load
+
+
+def test_evicts_least_recently_used_by_total_size() -> None:
+    cache = _DataUriCache(max_bytes=100)
+    calls: list[str] = []
+    load = _loader(calls, 25)
+
+    for name in ["a", "b", "c", "d"]:
+        cache.get(name, 1, load)
+    cache.get("a", 1, load)  # a is now the most recent
+    cache.get("e", 1, load)  # 125 bytes: b goes
+
+    cache.get("a", 1, load)
+    cache.get("b", 1, load)
+    assert calls == ["a", "b", "c", "d", "e", "b"]
+
+
+def test_oversized_uri_is_not_kept() -> None:
+    cache = _DataUriCache(max_bytes=100)
+    calls: list[str] = []
+
+    cache.get("big", 1, _loader(calls, 26))
+    cache.get("big", 1, _loader(calls, 26))
+
+    assert calls == ["big", "big"]
+
+
+def test_failed_load_is_not_remembered() -> None:
+    cache = _DataUriCache(max_bytes=100)
+
+    def fail(name: str) -> str:
+        raise OSError("unreadable")
+
+    with pytest.raises(OSError):
+        cache.get("a", 1, fail)
+    assert cache.get("a", 1, lambda name: "ok") == "ok"
+
+
+def test_new_version_reloads_and_replaces_the_entry() -> None:
+    cache = _DataUriCache(max_bytes=100)
+    calls: list[str] = []
+
+    assert cache.get("logo.png", 1, lambda name: "old") == "old"
+    assert cache.get("logo.png", 2, _loader(calls, 10)) == "x" * 10
+    cache.get("logo.png", 2, _loader(calls, 10))
+
+    assert calls == ["logo.png"]
+    assert cache._size == 10
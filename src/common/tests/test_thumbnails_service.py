@@ -5,6 +5,7 @@ This module tests the thumbnail service functions and configuration helpers.
 
 import typing as t
 from io import BytesIO
+from unittest.mock import patch
 
 import piexif
 import pytest
@@ -24,6 +25,7 @@ from common.thumbnails.service import (
     delete_thumbnails_for_paths,
     generate_and_save_thumbnails,
     generate_thumbnail,
+    generate_thumbnails,
     get_thumbnail_path,
     is_image_mime_type,
 )
@@ -239,6 +241,55 @@ class TestGenerateThumbnail:
             generate_thumbnail(b"not an image at all", test_thumbnail_spec)
 
 
+class TestGenerateThumbnails:
+    """Tests for the single-decode multi-size generate_thumbnails function."""
+
+    def test_decodes_once_for_all_specs(self, large_image_bytes: bytes) -> None:
+        """All sizes come from one decode and fit their bounds."""
+        specs = (
+            ThumbnailSpec("thumbnail", 150, 150),
+            ThumbnailSpec("preview", 800, 800),
+            ThumbnailSpec("card", 400, 300),
+        )
+
+        with patch("common.thumbnails.service.Image.open", wraps=Image.open) as mock_open:
+            result = generate_thumbnails(large_image_bytes, specs)
+
+        mock_open.assert_called_once()
+        assert set(result) == {"thumbnail", "preview", "card"}
+        for spec in specs:
+            with Image.open(BytesIO(result[spec.field_name])) as img:
+                assert img.format == "JPEG"
+                assert img.width <= spec.max_width and img.height <= spec.max_height
+                assert abs(img.width / img.height - 2000 / 1500) < 0.01
+
+    def test_size_outside_previous_box_is_derived_from_source(self) -> None:
+        """A smaller spec is not cut down to a previous thumbnail that doesn't contain its box."""
+        buffer = BytesIO()
+        Image.new("RGB", (1000, 1000), color="green").save(buffer, format="JPEG")
+        specs = (ThumbnailSpec("banner", 800, 200), ThumbnailSpec("square", 300, 300))
+
+        result = generate_thumbnails(buffer.getvalue(), specs)
+
+        with Image.open(BytesIO(result["banner"])) as banner, Image.open(BytesIO(result["square"])) as square:
+            assert banner.size == (200, 200)
+            assert square.size == (300, 300)
+
+    def test_exif_orientation_applied_to_every_size(self, image_with_exif_orientation: bytes) -> None:
+        """Orientation is applied once, before any size is derived."""
+        specs = (ThumbnailSpec("thumbnail", 50, 50), ThumbnailSpec("preview", 150, 150))
+
+        result = generate_thumbnails(image_with_exif_orientation, specs)
+
+        for data in result.values():
+            with Image.open(BytesIO(data)) as img:
+                assert img.height > img.width
+
+    def test_no_specs(self, rgb_image_bytes: bytes) -> None:
+        """No specs means nothing to decode."""
+        assert generate_thumbnails(rgb_image_bytes, ()) == {}
+
+
 # =============================================================================
 # Tests for generate_and_save_thumbnails()
 # =============================================================================
@@ -283,6 +334,41 @@ class TestGenerateAndSaveThumbnails:
             generate_and_save_thumbnails("nonexistent.jpg", test_thumbnail_config)
         assert "not found" in str(exc_info.value).lower()
 
+    def test_opens_source_once_and_skips_existence_checks(
+        self,
+        rgb_image_bytes: bytes,
+        test_thumbnail_config: ModelThumbnailConfig,
+    ) -> None:
+        """The source is opened once and outputs are overwritten without exists() round-trips."""
+        original_path = "test-thumbnails/original-calls.jpg"
+        default_storage.save(original_path, ContentFile(rgb_image_bytes))
+        result = ThumbnailResult()
+
+        try:
+            with patch("common.thumbnails.service.default_storage", wraps=default_storage) as mock_storage:
+                result = generate_and_save_thumbnails(original_path, test_thumbnail_config)
+
+            assert result.is_complete
+            mock_storage.open.assert_called_once_with(original_path, "rb")
+            mock_storage.exists.assert_not_called()
+        finally:
+            default_storage.delete(original_path)
+            for path in result.thumbnails.values():
+                default_storage.delete(path)
+
+    def test_undecodable_source_fails_every_spec(self, test_thumbnail_config: ModelThumbnailConfig) -> None:
+        """If the image cannot be decoded, every spec is reported as failed."""
+        original_path = "test-thumbnails/not-an-image.jpg"
+        default_storage.save(original_path, ContentFile(b"not an image at all"))
+
+        try:
+            result = generate_and_save_thumbnails(original_path, test_thumbnail_config)
+        finally:
+            default_storage.delete(original_path)
+
+        assert not result.thumbnails
+        assert set(result.failures) == {spec.field_name for spec in test_thumbnail_config.specs}
+
     def test_replaces_existing_thumbnail(
         self,
         rgb_image_bytes: bytes,
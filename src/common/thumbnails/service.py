@@ -76,6 +76,11 @@ def get_thumbnail_path(original_path: str, field_name: str) -> str:
     return str(parent / f"{stem}_{suffix}.jpg")
 
 
+# Let the JPEG decoder downscale while keeping at least this many times the largest
+# target size, so the final LANCZOS pass still has detail to work with.
+DRAFT_REDUCING_GAP = 2
+
+
 def generate_thumbnail(image_source: bytes | t.IO[bytes], spec: ThumbnailSpec) -> bytes:
     """Generate a single thumbnail from image bytes or file handle.
 
@@ -91,6 +96,31 @@ def generate_thumbnail(image_source: bytes | t.IO[bytes], spec: ThumbnailSpec) -
         PIL.UnidentifiedImageError: If image cannot be read.
         OSError: If image processing fails.
     """
+    return generate_thumbnails(image_source, (spec,))[spec.field_name]
+
+
+def generate_thumbnails(image_source: bytes | t.IO[bytes], specs: t.Sequence[ThumbnailSpec]) -> dict[str, bytes]:
+    """Generate every thumbnail in ``specs`` from a single decode of the image.
+
+    The source is decoded once — JPEGs at a reduced scale via ``Image.draft()`` when
+    the largest spec allows it — and EXIF orientation and RGB conversion are applied
+    once. Sizes are then derived from largest to smallest, each from the previous
+    thumbnail when that one's bounding box contains it.
+
+    Args:
+        image_source: Original image as bytes or a file-like object.
+        specs: Thumbnail specifications with dimensions.
+
+    Returns:
+        Dict mapping spec field_name -> JPEG bytes.
+
+    Raises:
+        PIL.UnidentifiedImageError: If image cannot be read.
+        OSError: If image processing fails.
+    """
+    if not specs:
+        return {}
+
     # Normalize input: wrap bytes in BytesIO, use file handle directly
     source: t.IO[bytes]
     if isinstance(image_source, bytes):
@@ -98,26 +128,52 @@ def generate_thumbnail(image_source: bytes | t.IO[bytes], spec: ThumbnailSpec) -
     else:
         source = image_source
 
+    largest_side = max(max(spec.max_width, spec.max_height) for spec in specs)
+    thumbnails: dict[str, bytes] = {}
+
     with Image.open(source) as img:
-        # Handle EXIF orientation before processing
-        processed: Image.Image = _apply_exif_orientation(img)
+        # The draft box is square because EXIF orientation is applied after decoding
+        # and may swap width and height. No-op for formats other than JPEG.
+        draft_side = largest_side * DRAFT_REDUCING_GAP
+        img.draft("RGB", (draft_side, draft_side))
+
+        base = _to_rgb(_apply_exif_orientation(img))
+
+        previous: tuple[ThumbnailSpec, Image.Image] | None = None
+        for spec in sorted(specs, key=lambda s: s.max_width * s.max_height, reverse=True):
+            if previous is not None and _box_contains(previous[0], spec):
+                thumb = previous[1].copy()
+            else:
+                thumb = base.copy()
+            # Use LANCZOS for high-quality downsampling
+            thumb.thumbnail((spec.max_width, spec.max_height), Image.Resampling.LANCZOS)
+            thumbnails[spec.field_name] = _encode_jpeg(thumb)
+            previous = (spec, thumb)
+
+    return thumbnails
 
-        # Convert to RGB if necessary (HEIC, RGBA, P modes)
-        if processed.mode in ("RGBA", "LA"):
-            # Create white background for transparent images
-            background = Image.new("RGB", processed.size, (255, 255, 255))
-            background.paste(processed, mask=processed.split()[-1])
-            processed = background
-        elif processed.mode != "RGB":
-            processed = processed.convert("RGB")
 
-        # Use LANCZOS for high-quality downsampling
-        processed.thumbnail((spec.max_width, spec.max_height), Image.Resampling.LANCZOS)
+def _box_contains(outer: ThumbnailSpec, inner: ThumbnailSpec) -> bool:
+    """Whether a thumbnail fitted to ``outer`` can be shrunk to ``inner`` without losing size."""
+    return outer.max_width >= inner.max_width and outer.max_height >= inner.max_height
 
-        output = BytesIO()
-        processed.save(output, format="JPEG", quality=85, optimize=True)
-        output.seek(0)
-        return output.read()
+
+def _to_rgb(img: Image.Image) -> Image.Image:
+    """Convert to RGB (HEIC, RGBA, P modes), flattening transparency onto white."""
+    if img.mode in ("RGBA", "LA"):
+        # Create white background for transparent images
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def _encode_jpeg(img: Image.Image) -> bytes:
+    output = BytesIO()
+    img.save(output, format="JPEG", quality=85, optimize=True)
+    return output.getvalue()
 
 
 def _apply_exif_orientation(img: Image.Image) -> Image.Image:
@@ -144,43 +200,37 @@ def generate_and_save_thumbnails(
 ) -> ThumbnailResult:
     """Generate and save all thumbnails for a file.
 
-    Opens the source file separately for each thumbnail spec to minimize memory usage.
-    This allows large images to be processed without loading the entire file into memory
-    at once - PIL streams from the file handle as needed.
+    The source is opened and decoded once for all specs (see :func:`generate_thumbnails`);
+    PIL streams from the storage file handle. Each thumbnail is written to its fixed
+    path, replacing any previous version.
 
     Args:
         original_path: Path to original file in storage.
         config: Thumbnail configuration for this model/field.
 
     Returns:
-        ThumbnailResult containing successful thumbnails and any failures.
+        ThumbnailResult containing successful thumbnails and any failures. If the
+        image cannot be decoded, every spec is reported as failed.
 
     Raises:
         FileNotFoundError: If original file doesn't exist.
-        PIL.UnidentifiedImageError: If file is not a valid image.
     """
-    if not default_storage.exists(original_path):
-        raise FileNotFoundError(f"Original file not found: {original_path}")
-
     result = ThumbnailResult()
 
+    try:
+        with default_storage.open(original_path, "rb") as f:
+            thumbnails = generate_thumbnails(f, config.specs)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Original file not found: {original_path}") from e
+    except Exception as e:
+        for spec in config.specs:
+            _record_failure(result, original_path, spec, e)
+        return result
+
     for spec in config.specs:
         try:
-            # Open file for each spec to minimize memory usage.
-            # PIL streams from the file handle, avoiding loading full image into memory.
-            with default_storage.open(original_path, "rb") as f:
-                thumb_data = generate_thumbnail(f, spec)
-
             thumb_path = get_thumbnail_path(original_path, spec.field_name)
-
-            # Delete existing thumbnail if present (for regeneration)
-            if default_storage.exists(thumb_path):
-                default_storage.delete(thumb_path)
-
-            saved_path = default_storage.save(
-                thumb_path,
-                ContentFile(thumb_data, name=Path(thumb_path).name),
-            )
+            saved_path = _save_overwriting(thumb_path, thumbnails[spec.field_name])
             result.thumbnails[spec.field_name] = saved_path
 
             logger.info(
@@ -192,19 +242,33 @@ def generate_and_save_thumbnails(
                 height=spec.max_height,
             )
         except Exception as e:
-            error_msg = str(e)
-            result.failures[spec.field_name] = error_msg
-            logger.error(
-                "thumbnail_generation_failed",
-                original=original_path,
-                field=spec.field_name,
-                error=error_msg,
-                exc_info=True,
-            )
+            _record_failure(result, original_path, spec, e)
 
     return result
 
 
+def _save_overwriting(path: str, data: bytes) -> str:
+    """Save ``data`` at exactly ``path``, replacing any existing file.
+
+    Deleting a missing file is a no-op for the storage backends we use, so this
+    costs two storage calls instead of exists + delete + save.
+    """
+    default_storage.delete(path)
+    return default_storage.save(path, ContentFile(data, name=Path(path).name))
+
+
+def _record_failure(result: ThumbnailResult, original_path: str, spec: ThumbnailSpec, error: Exception) -> None:
+    error_msg = str(error)
+    result.failures[spec.field_name] = error_msg
+    logger.error(
+        "thumbnail_generation_failed",
+        original=original_path,
+        field=spec.field_name,
+        error=error_msg,
+        exc_info=True,
+    )
+
+
 def delete_thumbnails_for_paths(paths: list[str]) -> None:
     """Delete thumbnail files from storage.
 
@@ -13,6 +13,7 @@ from django.utils import timezone, translation
 from pytest import MonkeyPatch
 
 from accounts.models import RevelUser
+from geo import ip2
 from questionnaires.models import Questionnaire
 
 
@@ -28,9 +29,9 @@ class MockRecord:
 
 
 class MockIP2Location:
-    """A mock IP2Location object."""
+    """A mock IP2Location reader."""
 
-    def get_all(self, ip: str) -> MockRecord | None:
+    def lookup(self, ip: str) -> MockRecord | None:
         """
         Returns a MockRecord for any given IP, or None if the IP is empty.
         """
@@ -50,6 +51,7 @@ def mock_ip2location(monkeypatch: MonkeyPatch) -> None:
         return MockIP2Location()
 
     monkeypatch.setattr("geo.ip2.get_ip2location", mock_get_ip2location)
+    ip2.clear_lookup_cache()
 
 
 @pytest.fixture(autouse=True)
@@ -81,10 +83,12 @@ def use_locmem_cache(settings: t.Any) -> t.Generator[None]:
     across sequential tests in the same worker. That matters in particular for
     django-solo (``SOLO_CACHE``), which caches whole singleton model instances —
     a cached SiteSettings/Legal row tied to a rolled-back DB row would otherwise
-    leak into the next test.
+    leak into the next test. The per-process JWT auth snapshot LRU is cleared with it.
     """
     from django.core.cache import cache
 
+    from accounts.service import auth_snapshot
+
     settings.CACHES = {
         "default": {
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
@@ -92,8 +96,10 @@ def use_locmem_cache(settings: t.Any) -> t.Generator[None]:
         }
     }
     cache.clear()
+    auth_snapshot.clear_local()
     yield
     cache.clear()
+    auth_snapshot.clear_local()
 
 
 @pytest.fixture(autouse=True)
@@ -167,6 +173,29 @@ class RevelUserFactory:
         return self.create_user(**kwargs)
 
 
+def notify_many_sends(mock_notify_many: t.Any) -> list[t.Any]:
+    """Expand the calls of a mocked ``notify_many`` into one ``notification_requested.send``-style call per recipient.
+
+    Each returned ``call`` has ``notification_type``, ``user`` and the recipient's merged
+    ``context`` as kwargs, so fan-out assertions read like they did against the signal.
+    """
+    import inspect
+    from unittest.mock import call
+
+    from notifications.service.dispatcher import notify_many
+
+    signature = inspect.signature(notify_many)
+    sends = []
+    for notify_call in mock_notify_many.call_args_list:
+        args = signature.bind(*notify_call.args, **notify_call.kwargs).arguments
+        overrides = args.get("per_user_overrides") or {}
+        for user in args["recipients"]:
+            user_id = getattr(user, "id", user)  # recipients may be users or user ids
+            context = {**args["shared_context"], **overrides.get(user_id, {})}
+            sends.append(call(notification_type=args["notification_type"], user=user, context=context))
+    return sends
+
+
 @pytest.fixture
 def revel_user_factory() -> RevelUserFactory:
     return RevelUserFactory()
@@ -96,7 +96,7 @@ class DashboardController(UserAwareController):
         today = timezone.localdate()
         qs = qs.filter(Q(start__date__gte=today) | Q(start__isnull=True))
 
-        # No .distinct() needed - get_user_related_events already filters by unique IDs
+        # No .distinct() needed - get_user_related_events joins nothing multi-valued
         return qs.order_by(order_by)
 
     @route.get("/calendar", url_name="dashboard_calendar", response=list[schema.EventInListSchema])
@@ -138,7 +138,7 @@ class DashboardController(UserAwareController):
         # Filter to events within the calendar date range
         qs = qs.filter(start__gte=start_datetime, start__lt=end_datetime)
 
-        # No .distinct() needed - get_user_related_events already filters by unique IDs
+        # No .distinct() needed - get_user_related_events joins nothing multi-valued
         return qs.order_by("start")
 
     @route.get(
@@ -10,14 +10,12 @@ from ninja_extra import (
     route,
 )
 from ninja_extra.pagination import PageNumberPaginationExtra, PaginatedResponseSchema, paginate
-from ninja_extra.searching import searching
 
 from common.authentication import I18nJWTAuth, OptionalAuth
-from common.controllers import DistinctSearching
 from common.schema import ErrorDetail, ResponseMessage
 from common.throttling import WriteThrottle
 from events import filters, models, schema
-from events.service import event_service, stripe_service
+from events.service import event_search, event_service, stripe_service
 from events.service import guest as guest_service
 from events.service.event_manager import EventUserEligibility
 
@@ -34,23 +32,12 @@ class EventPublicDiscoveryController(EventPublicBaseController):
 
     @route.get("/", url_name="list_events", response=PaginatedResponseSchema[schema.EventInListSchema])
     @paginate(PageNumberPaginationExtra, page_size=20)
-    @searching(
-        DistinctSearching,
-        search_fields=[
-            "name",
-            "description",
-            "event_series__name",
-            "event_series__description",
-            "organization__name",
-            "organization__description",
-            "tags__tag__name",
-        ],
-    )
     def list_events(
         self,
         params: t.Annotated[filters.EventFilterSchema, Query(...)],
         order_by: t.Literal["start", "-start", "distance"] = "distance",
         include_past: bool = False,
+        search: str | None = None,
     ) -> QuerySet[models.Event]:
         """Browse and search events visible to the current user.
 
@@ -59,6 +46,10 @@ class EventPublicDiscoveryController(EventPublicBaseController):
         Ordering: 'distance' (default) shows nearest events based on user location, 'start' shows
         soonest first, '-start' shows latest first. Supports filtering by organization, series,
         tags, and text search.
+
+        `search` matches words (or word prefixes) in the event's name, description, tags, and its
+        series' and organization's names and descriptions. Search results are ranked by relevance,
+        with `order_by` breaking ties.
         """
         params.next_events = not include_past
 
@@ -66,6 +57,9 @@ class EventPublicDiscoveryController(EventPublicBaseController):
         filtered_qs = params.filter(
             self.get_discovery_queryset(include_past=include_past or params.past_events is True)
         )
+        search_query = event_search.build_search_query(search) if search else None
+        if search_query is not None:
+            filtered_qs = event_search.filter_by_search(filtered_qs, search_query)
 
         # Materialize IDs to avoid expensive COUNT(*) on complex DISTINCT subquery
         # This is the same optimization used in dashboard endpoints
@@ -75,14 +69,19 @@ class EventPublicDiscoveryController(EventPublicBaseController):
         qs = models.Event.objects.full().filter(id__in=event_ids).with_user_bookmark(self.maybe_user())
 
         if order_by == "distance":
-            return event_service.order_by_distance(self.user_location(), qs)
-        return qs.order_by(order_by)
+            qs = event_service.order_by_distance(self.user_location(), qs)
+        else:
+            qs = qs.order_by(order_by)
+        if search_query is not None:
+            return event_search.order_by_rank(qs, search_query)
+        return qs
 
     @route.get("/calendar", url_name="calendar_events", response=list[schema.EventInListSchema])
     def calendar_events(
         self,
         params: t.Annotated[filters.EventFilterSchema, Query(...)],
         calendar_params: t.Annotated[filters.CalendarParamsSchema, Query(...)],
+        search: str | None = None,
     ) -> QuerySet[models.Event]:
         """Get events for a calendar view (week, month, or year).
 
@@ -101,7 +100,8 @@ class EventPublicDiscoveryController(EventPublicBaseController):
         - `/calendar?year=2025` - All 2025 events
 
         **Additional Filters:**
-        Supports all EventFilterSchema filters (organization, tags, event_type, etc.).
+        Supports all EventFilterSchema filters (organization, tags, event_type, etc.), and `search`
+        with the same matching as the event list.
         Note: The `next_events` filter is disabled by default for calendar views since the date
         range is explicitly specified. Use `start_after` or `start_before` to filter events
         within the calendar's date range if needed.
@@ -113,8 +113,10 @@ class EventPublicDiscoveryController(EventPublicBaseController):
         # Disable next_events default filter for calendar views since date range is explicit.
         # Users can still filter using start_after/start_before if needed.
         params.next_events = None
-        qs = params.filter(qs).distinct()
-        return qs.order_by("start")
+        qs = params.filter(qs)
+        if search and (search_query := event_search.build_search_query(search)) is not None:
+            qs = event_search.filter_by_search(qs, search_query)
+        return qs.distinct().order_by("start")
 
     @route.get(
         "/tokens/{token_id}",
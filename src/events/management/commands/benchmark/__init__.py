@@ -11,6 +11,7 @@ Benchmark classes:
 - DashboardBenchmark: Profile dashboard endpoints (P1 N+1 issues)
 - NotificationsBenchmark: Profile notification dispatch (P3 N+1 issues)
 - CheckoutBenchmark: Profile checkout endpoint and eligibility
+- SearchBenchmark: Compare icontains discovery search with full-text search
 """
 
 from .base import BaseBenchmarkCommand, BenchmarkResult, BenchmarkScenario
@@ -18,6 +19,7 @@ from .checkout import CheckoutBenchmark
 from .dashboard import DashboardBenchmark
 from .notifications import NotificationsBenchmark
 from .query_utils import QueryBreakdown, analyze_queries, format_query_breakdown
+from .search import SearchBenchmark
 from .visibility import VisibilityBenchmark
 
 __all__ = [
@@ -34,4 +36,5 @@ __all__ = [
     "DashboardBenchmark",
     "NotificationsBenchmark",
     "CheckoutBenchmark",
+    "SearchBenchmark",
 ]
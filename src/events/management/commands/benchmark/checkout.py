@@ -8,6 +8,10 @@ Profiles:
 Usage via run_benchmark command:
     python manage.py run_benchmark --checkout --runs 10
     python manage.py run_benchmark --checkout --runs 1 --query-breakdown
+    python manage.py run_benchmark --checkout --scenario large-org --large-org-members 20000 --large-org-tickets 5000
+
+The large-org scenario also asserts that EligibilityService loads exactly as many
+queries and rows for its event as for an identically configured empty one.
 
 For Silk profiling (requires Silk to be enabled):
     python manage.py run_benchmark --checkout --runs 10 --silk
@@ -16,7 +20,10 @@ For Silk profiling (requires Silk to be enabled):
 import gc
 import time
 import typing as t
+from itertools import batched
 
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import CommandError
 from django.db import connection, reset_queries, transaction
 
 from accounts.models import RevelUser
@@ -25,6 +32,7 @@ from events.models import (
     Event,
     EventInvitation,
     EventRSVP,
+    OrganizationMember,
     OrganizationQuestionnaire,
     Ticket,
     TicketTier,
@@ -34,6 +42,23 @@ from questionnaires.models import Questionnaire, QuestionnaireEvaluation, Questi
 
 from .base import BaseBenchmarkCommand, BenchmarkResult, BenchmarkScenario
 
+SEED_BATCH_SIZE = 5000
+
+
+class _RowCounter:
+    """``connection.execute_wrapper`` that counts the rows returned by SELECTs."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.rows = 0
+
+    def __call__(self, execute: t.Callable[..., t.Any], sql: str, params: t.Any, many: bool, context: t.Any) -> t.Any:
+        result = execute(sql, params, many, context)
+        self.queries += 1
+        if sql.lstrip().upper().startswith("SELECT"):
+            self.rows += max(context["cursor"].rowcount, 0)
+        return result
+
 
 class CheckoutBenchmark(BaseBenchmarkCommand):
     """Benchmark the /checkout endpoint and related components."""
@@ -46,10 +71,24 @@ class CheckoutBenchmark(BaseBenchmarkCommand):
         parser.add_argument(
             "--scenario",
             type=str,
-            choices=["all", "minimal", "heavy", "gates"],
+            choices=["all", "minimal", "heavy", "gates", "large-org"],
             default="all",
             help="Which scenarios to run",
         )
+        parser.add_argument(
+            "--large-org-members",
+            type=int,
+            default=20_000,
+            dest="large_org_members",
+            help="Active members in the large-org scenario (default: 20000)",
+        )
+        parser.add_argument(
+            "--large-org-tickets",
+            type=int,
+            default=5_000,
+            dest="large_org_tickets",
+            help="Tickets sold for the large-org event (default: 5000)",
+        )
 
     def create_scenarios(self, options: dict[str, t.Any]) -> list[BenchmarkScenario]:
         """Create checkout benchmark scenarios."""
@@ -66,6 +105,11 @@ class CheckoutBenchmark(BaseBenchmarkCommand):
         if scenario_filter in ("all", "gates"):
             scenarios.extend(self._create_gate_scenarios())
 
+        if scenario_filter in ("all", "large-org"):
+            members = options.get("large_org_members") or 20_000
+            tickets = min(options.get("large_org_tickets") or 5_000, members)
+            scenarios.append(self._create_large_org_scenario(members, tickets))
+
         return scenarios
 
     def run_benchmarks(self, scenarios: list[BenchmarkScenario], runs: int) -> dict[str, list[BenchmarkResult]]:
@@ -82,6 +126,8 @@ class CheckoutBenchmark(BaseBenchmarkCommand):
             # Benchmark 1: EligibilityService initialization + check
             result = self._benchmark_eligibility(scenario, runs)
             scenario_results.append(result)
+            if "baseline_event" in scenario.extra_data:
+                self._assert_loader_is_scale_invariant(scenario)
 
             # Benchmark 2: Full checkout flow (without actual ticket creation)
             result = self._benchmark_full_checkout_flow(scenario, runs)
@@ -474,8 +520,101 @@ class CheckoutBenchmark(BaseBenchmarkCommand):
             user=user,
         )
 
+    def _create_large_org_scenario(self, member_count: int, ticket_count: int) -> BenchmarkScenario:
+        """Create a large organization whose event has sold thousands of tickets.
+
+        Also creates a baseline: an identically configured event in an empty
+        organization, which the loader must read just as cheaply.
+        """
+        self.stdout.write(f"  Creating LARGE_ORG scenario ({member_count} members, {ticket_count} tickets)...")
+
+        owner = self.create_test_user("large_owner")
+        org = self.create_test_organization("large", owner)
+        event = self.create_test_event(org, "Large Org Event", max_attendees=ticket_count * 2)
+        tier = self.create_test_tier(event, total_quantity=ticket_count * 2)
+
+        password = make_password(None)
+        for batch in batched(range(member_count), SEED_BATCH_SIZE):
+            members = RevelUser.objects.bulk_create(
+                RevelUser(
+                    username=f"bench_large_{self.run_id}_{i}@benchmark.test",
+                    email=f"bench_large_{self.run_id}_{i}@benchmark.test",
+                    password=password,
+                )
+                for i in batch
+            )
+            OrganizationMember.objects.bulk_create(
+                OrganizationMember(organization=org, user=member, status=OrganizationMember.MembershipStatus.ACTIVE)
+                for member in members
+            )
+            Ticket.objects.bulk_create(
+                Ticket(event=event, tier=tier, user=member, guest_name="Attendee", status=Ticket.TicketStatus.ACTIVE)
+                for i, member in zip(batch, members, strict=True)
+                if i < ticket_count
+            )
+
+        baseline_owner = self.create_test_user("large_baseline_owner")
+        baseline_org = self.create_test_organization("large-baseline", baseline_owner)
+        baseline_event = self.create_test_event(
+            baseline_org, "Large Org Baseline Event", max_attendees=ticket_count * 2
+        )
+        self.create_test_tier(baseline_event, total_quantity=ticket_count * 2)
+
+        user = self.create_test_user("large_user")
+
+        return BenchmarkScenario(
+            name="LARGE_ORG",
+            description=f"{member_count} active members, {ticket_count} tickets sold, non-member buyer",
+            organization=org,
+            event=event,
+            tier=tier,
+            user=user,
+            extra_data={
+                "member_count": member_count,
+                "ticket_count": ticket_count,
+                "baseline_event": baseline_event,
+                "baseline_owner": baseline_owner,
+            },
+        )
+
+    def _cleanup_scenarios(self, scenarios: list[BenchmarkScenario]) -> None:
+        """Bulk-seeded members and the large-org baseline don't hang off the scenario's org and user."""
+        for scenario in scenarios:
+            if baseline_event := scenario.extra_data.get("baseline_event"):
+                baseline_event.organization.delete()
+                scenario.extra_data["baseline_owner"].delete()
+                RevelUser.objects.filter(username__startswith=f"bench_large_{self.run_id}_").delete()
+        super()._cleanup_scenarios(scenarios)
+
     # --- Benchmark Methods ---
 
+    def _assert_loader_is_scale_invariant(self, scenario: BenchmarkScenario) -> None:
+        """EligibilityService must load as many queries and rows for the large event as for the empty one."""
+        from events.service.event_manager.service import EligibilityService
+
+        def load(event: Event) -> _RowCounter:
+            user = RevelUser.objects.get(pk=scenario.user.pk)
+            event = Event.objects.get(pk=event.pk)
+            counter = _RowCounter()
+            with connection.execute_wrapper(counter):
+                eligibility = EligibilityService(user, event).check_eligibility()
+            if not eligibility.allowed:
+                raise CommandError(f"LARGE_ORG: buyer unexpectedly ineligible - {eligibility.reason}")
+            return counter
+
+        large = load(scenario.event)
+        baseline = load(scenario.extra_data["baseline_event"])
+        self.stdout.write(
+            f"    Loader cost: {large.queries} queries / {large.rows} rows "
+            f"(baseline: {baseline.queries} queries / {baseline.rows} rows)"
+        )
+        if (large.queries, large.rows) != (baseline.queries, baseline.rows):
+            raise CommandError(
+                f"EligibilityService cost grows with the event: {large.queries} queries / {large.rows} rows "
+                f"for {scenario.extra_data['ticket_count']} tickets and {scenario.extra_data['member_count']} "
+                f"members vs {baseline.queries} / {baseline.rows} for an empty event"
+            )
+
     def _benchmark_eligibility(self, scenario: BenchmarkScenario, runs: int) -> BenchmarkResult:
         """Benchmark EligibilityService initialization and check_eligibility."""
         from events.service.event_manager.service import EligibilityService
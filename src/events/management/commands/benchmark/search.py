@@ -0,0 +1,179 @@
+"""Event discovery search benchmark.
+
+Compares the previous discovery search — an OR of ``icontains`` over seven fields,
+joined through series, organization and tags, then DISTINCT — with the full-text
+search over the GIN-indexed ``Event.search_vector``.
+
+Usage via run_benchmark command:
+    python manage.py run_benchmark --search --runs 5
+    python manage.py run_benchmark --search --search-events 100000 --runs 3
+    python manage.py run_benchmark --search --runs 1 --query-breakdown
+"""
+
+import random
+import typing as t
+from datetime import timedelta
+from itertools import batched
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.utils import timezone
+
+from common.models import Tag, TagAssignment
+from events.models import Event, EventSeries
+from events.service import event_search
+from events.tasks.search import fill_missing_event_search_vectors
+
+from .base import BaseBenchmarkCommand, BenchmarkResult, BenchmarkScenario
+
+# The search fields the discovery list used with DistinctSearching.
+LEGACY_SEARCH_FIELDS = [
+    "name",
+    "description",
+    "event_series__name",
+    "event_series__description",
+    "organization__name",
+    "organization__description",
+    "tags__tag__name",
+]
+
+_ADJECTIVES = ["Summer", "Winter", "Open", "Late", "Underground", "Acoustic", "Family", "Charity", "Rooftop", "Indie"]
+_NOUNS = ["Festival", "Workshop", "Meetup", "Concert", "Market", "Conference", "Screening", "Jam", "Retreat", "Tour"]
+_TOPICS = ["jazz", "python", "pottery", "salsa", "climate", "poetry", "techno", "yoga", "startup", "chess"]
+_CITIES = ["Vienna", "Berlin", "Lisbon", "Milan", "Lyon", "Madrid", "Graz", "Porto", "Zurich", "Munich"]
+
+SEARCH_TERMS = ["jazz", "rooftop concert", "berlin workshop"]
+SEED_BATCH_SIZE = 5000
+
+
+class SearchBenchmark(BaseBenchmarkCommand):
+    """Benchmark discovery search: legacy icontains + DISTINCT vs. full-text search."""
+
+    help = "Benchmark event discovery search"
+    benchmark_name = "Event Discovery Search"
+
+    def add_extra_arguments(self, parser: t.Any) -> None:
+        """Add search-specific arguments."""
+        parser.add_argument(
+            "--search-events",
+            type=int,
+            default=100_000,
+            dest="search_events",
+            help="Number of events to seed (default: 100000)",
+        )
+
+    def create_scenarios(self, options: dict[str, t.Any]) -> list[BenchmarkScenario]:
+        """Seed one organization with many events, a few series and tags."""
+        self.stdout.write(self.style.HTTP_INFO("\n--- Setting up benchmark scenarios ---"))
+        return [self._create_search_scenario(options.get("search_events") or 100_000)]
+
+    def run_benchmarks(self, scenarios: list[BenchmarkScenario], runs: int) -> dict[str, list[BenchmarkResult]]:
+        """Time each search term both ways: full match count plus the first ranked page."""
+        self.stdout.write(self.style.HTTP_INFO("\n--- Running Benchmarks ---"))
+        results: dict[str, list[BenchmarkResult]] = {}
+
+        for scenario in scenarios:
+            self.stdout.write(f"\n  Scenario: {scenario.name}")
+            self.stdout.write(f"  Description: {scenario.description}")
+            events = Event.objects.filter(organization=scenario.organization)
+            scenario_results: list[BenchmarkResult] = []
+
+            for term in SEARCH_TERMS:
+                legacy = self._legacy_search(events, term)
+                scenario_results.append(
+                    self.time_operation(f"icontains+DISTINCT '{term}'", lambda qs=legacy: self._page(qs), runs)
+                )
+
+                query = event_search.build_search_query(term)
+                assert query is not None
+                matched = event_search.filter_by_search(events, query)
+                ranked = event_search.order_by_rank(matched, query)
+                scenario_results.append(
+                    self.time_operation(
+                        f"full-text '{term}'", lambda qs=matched, page=ranked: self._page(qs, page), runs
+                    )
+                )
+                self.stdout.write(f"    '{term}': {legacy.count()} legacy matches, {matched.count()} full-text matches")
+
+            results[scenario.name] = scenario_results
+
+        return results
+
+    @staticmethod
+    def _legacy_search(events: t.Any, term: str) -> t.Any:
+        q = Q()
+        for field in LEGACY_SEARCH_FIELDS:
+            q |= Q(**{f"{field}__icontains": term})
+        return events.filter(q).distinct()
+
+    @staticmethod
+    def _page(matched: t.Any, page: t.Any = None) -> None:
+        """What a list request costs: the count, then the first page of 20."""
+        matched.count()
+        list((page if page is not None else matched).values_list("id", flat=True)[:20])
+
+    def _create_search_scenario(self, count: int) -> BenchmarkScenario:
+        self.stdout.write(f"  Seeding {count} events...")
+        rng = random.Random(42)
+        owner = self.create_test_user("search_owner")
+        org = self.create_test_organization("search", owner)
+        org.description = "Community events across Europe."
+        org.save(update_fields=["description"])
+        series = [
+            EventSeries.objects.create(
+                organization=org,
+                name=f"{city} {noun} Series",
+                slug=f"bench-series-{i}-{self.run_id}",
+                description=f"A recurring {noun.lower()} in {city}.",
+            )
+            for i, (city, noun) in enumerate(zip(_CITIES, _NOUNS, strict=True))
+        ]
+        tags = [Tag.objects.get_or_create(name=f"bench-{topic}")[0] for topic in _TOPICS]
+        event_type = ContentType.objects.get_for_model(Event)
+        start = timezone.now() + timedelta(days=7)
+
+        for batch in batched(range(count), SEED_BATCH_SIZE):
+            created = Event.objects.bulk_create(
+                [
+                    Event(
+                        organization=org,
+                        name=f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} {i}",
+                        slug=f"bench-search-{i}-{self.run_id}",
+                        description=f"{rng.choice(_TOPICS).title()} in {rng.choice(_CITIES)}.",
+                        event_series=rng.choice(series) if i % 3 == 0 else None,
+                        status=Event.EventStatus.OPEN,
+                        visibility=Event.Visibility.PUBLIC,
+                        event_type=Event.EventType.PUBLIC,
+                        start=start + timedelta(hours=i % 2000),
+                        end=start + timedelta(hours=i % 2000 + 3),
+                    )
+                    for i in batch
+                ]
+            )
+            TagAssignment.objects.bulk_create(
+                [
+                    TagAssignment(tag=tag, content_type=event_type, object_id=event.pk)
+                    for event in created
+                    for tag in rng.sample(tags, k=rng.randint(0, 2))
+                ]
+            )
+
+        self.stdout.write("  Building search documents...")
+        fill_missing_event_search_vectors()
+
+        first_event = Event.objects.filter(organization=org).first()
+        assert first_event is not None
+        return BenchmarkScenario(
+            name=f"{count} EVENTS",
+            description=f"{count} events, {len(series)} series, {len(tags)} tags",
+            organization=org,
+            event=first_event,
+            user=owner,
+            extra_data={"events": count, "tag_ids": [tag.pk for tag in tags]},
+        )
+
+    def _cleanup_scenarios(self, scenarios: list[BenchmarkScenario]) -> None:
+        """Tags are global and their assignments generic: neither cascades from the organization."""
+        for scenario in scenarios:
+            Tag.objects.filter(pk__in=scenario.extra_data.get("tag_ids", [])).delete()
+        super()._cleanup_scenarios(scenarios)
@@ -7,13 +7,24 @@ For an event with 50 attendees and 100 viewers, this resulted in:
 50 × 100 × 5 = 25,000 queries!
 
 After optimization: 4 queries total (for context) + O(1) per pair.
+
+The task still writes the whole viewer×target matrix, though, which is O(N²) per
+confirmed ticket. The XLARGE scenario (1,000 attendees) compares that full rebuild
+with the incremental path a single attendee joining now takes: only their row and
+column, upserted.
+
+Benchmark 5 reads one attendee-list page as a regular attendee both ways: from the
+materialized matrix, and resolved at query time (``ATTENDEE_VISIBILITY_MODE = "lazy"``,
+see ``events.service.attendee_visibility``), which needs no matrix at all.
 """
 
 import gc
 import time
 import typing as t
 
+from django.core.cache import cache
 from django.db import connection, reset_queries, transaction
+from django.test import override_settings
 
 from accounts.models import RevelUser
 from events.models import (
@@ -51,7 +62,7 @@ class VisibilityBenchmark(BaseBenchmarkCommand):
         parser.add_argument(
             "--scenario",
             type=str,
-            choices=["all", "small", "medium", "large"],
+            choices=["all", "small", "medium", "large", "xlarge"],
             default="all",
             help="Which scenarios to run",
         )
@@ -75,12 +86,17 @@ class VisibilityBenchmark(BaseBenchmarkCommand):
 
             # Large scenario: 100 viewers, 50 attendees = 5000 pairs = 25000 queries worst case
             scenarios.append(self._create_visibility_scenario("large", viewers=100, attendees=50))
+
+            # XLarge scenario: 1,000 attendees = 1M-flag matrix (full rebuild vs one-attendee delta)
+            scenarios.append(self._create_visibility_scenario("xlarge", viewers=1000, attendees=1000))
         elif scenario_filter == "small":
             scenarios.append(self._create_visibility_scenario("small", viewers=10, attendees=5))
         elif scenario_filter == "medium":
             scenarios.append(self._create_visibility_scenario("medium", viewers=50, attendees=20))
         elif scenario_filter == "large":
             scenarios.append(self._create_visibility_scenario("large", viewers=100, attendees=50))
+        elif scenario_filter == "xlarge":
+            scenarios.append(self._create_visibility_scenario("xlarge", viewers=1000, attendees=1000))
         else:
             # Custom based on --viewers and --attendees
             scenarios.append(self._create_visibility_scenario("custom", viewers=viewers, attendees=attendees))
@@ -99,8 +115,10 @@ class VisibilityBenchmark(BaseBenchmarkCommand):
             scenario_results: list[BenchmarkResult] = []
 
             # Benchmark 1: resolve_visibility() per pair (OLD N+1 behavior)
-            result = self._benchmark_resolve_visibility_n1(scenario, runs)
-            scenario_results.append(result)
+            # Skipped past a few thousand pairs: at 1M pairs it is ~5M queries.
+            if scenario.extra_data["viewer_count"] * scenario.extra_data["attendee_count"] <= 10_000:
+                result = self._benchmark_resolve_visibility_n1(scenario, runs)
+                scenario_results.append(result)
 
             # Benchmark 2: resolve_visibility_fast() with context (OPTIMIZED)
             result = self._benchmark_resolve_visibility_optimized(scenario, runs)
@@ -110,6 +128,15 @@ class VisibilityBenchmark(BaseBenchmarkCommand):
             result = self._benchmark_full_visibility_task(scenario, runs)
             scenario_results.append(result)
 
+            # Benchmark 4: one attendee joins — incremental row + column upsert
+            result = self._benchmark_delta_visibility_update(scenario, runs)
+            scenario_results.append(result)
+
+            # Benchmark 5: one attendee-list page, materialized matrix vs query-time resolution
+            for mode in ("materialized", "lazy"):
+                result = self._benchmark_attendee_page(scenario, runs, mode)
+                scenario_results.append(result)
+
             results[scenario.name] = scenario_results
 
         return results
@@ -378,3 +405,79 @@ class VisibilityBenchmark(BaseBenchmarkCommand):
                 self._print_query_breakdown(queries_snapshot if queries_snapshot else list(connection.queries))
 
         return result
+
+    def _benchmark_delta_visibility_update(self, scenario: BenchmarkScenario, runs: int) -> BenchmarkResult:
+        """Benchmark the incremental update for one attendee joining an already-built matrix."""
+        from events.tasks import build_attendee_visibility_flags
+        from events.tasks.attendees import refresh_attendee_visibility_flags
+
+        result = BenchmarkResult(name="refresh_attendee_visibility_flags (1 joiner)", runs=runs)
+
+        event_id = str(scenario.event.pk)
+        joiner = self.create_test_user(f"vis_{scenario.name.lower()}_joiner")
+        # The delta's baseline: the matrix as the full rebuild leaves it, committed.
+        build_attendee_visibility_flags(event_id)
+
+        for i in range(runs):
+            gc.collect()
+            reset_queries()
+            queries_snapshot: list[dict[str, str]] = []
+
+            start = time.perf_counter()
+            try:
+                with transaction.atomic():
+                    EventRSVP.objects.create(event=scenario.event, user=joiner, status=EventRSVP.RsvpStatus.YES)
+                    refresh_attendee_visibility_flags(event_id, {joiner.id})
+                    queries_snapshot = list(connection.queries)
+                    raise Exception("Rollback")
+            except Exception:
+                pass  # Intentional rollback
+            end = time.perf_counter()
+
+            result.timings.append(end - start)
+            result.query_counts.append(len(queries_snapshot))
+
+            if i == 0:
+                pairs = scenario.extra_data["viewer_count"] + scenario.extra_data["attendee_count"] + 1
+                self.stdout.write(f"    Delta: ~{pairs} flags upserted in {len(queries_snapshot)} queries")
+
+            if i == 0 and self.query_breakdown:
+                self._print_query_breakdown(queries_snapshot)
+
+        return result
+
+    def _benchmark_attendee_page(self, scenario: BenchmarkScenario, runs: int, mode: str) -> BenchmarkResult:
+        """Benchmark one 20-row attendee-list page (plus its count) for a regular attendee."""
+        from events.models import Event
+        from events.service import attendee_visibility
+
+        result = BenchmarkResult(name=f"attendee list page ({mode})", runs=runs)
+
+        # A viewer who sees the list through the visibility rules (not staff/owner).
+        viewer = scenario.extra_data["attendees"][0]
+        event = Event.objects.with_organization().get(pk=scenario.event.pk)
+
+        with override_settings(ATTENDEE_VISIBILITY_MODE=mode, ATTENDEE_VISIBILITY_LAZY_THRESHOLD=0):
+            for i in range(runs):
+                gc.collect()
+                # Measure the steady state: the per-event context cache is warm after the first run.
+                if i == 0:
+                    cache.delete(attendee_visibility.get_cache_key(event.pk))
+                reset_queries()
+
+                start = time.perf_counter()
+                qs = attendee_visibility.visible_attendees(event, viewer).distinct()
+                total = qs.count()
+                page = list(qs[:20])
+                end = time.perf_counter()
+
+                result.timings.append(end - start)
+                result.query_counts.append(len(connection.queries))
+
+                if i == 0:
+                    self.stdout.write(f"    {mode}: {len(page)} of {total} visible, {len(connection.queries)} queries")
+
+                if i == 0 and self.query_breakdown:
+                    self._print_query_breakdown(list(connection.queries))
+
+        return result
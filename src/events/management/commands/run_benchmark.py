@@ -5,12 +5,14 @@ This command provides a single entry point for all benchmark types:
 - --dashboard: Profile dashboard endpoints (P1 N+1 issues)
 - --notifications: Profile notification dispatch (P3 N+1 issues)
 - --checkout: Profile checkout endpoint and eligibility
+- --search: Compare icontains discovery search with full-text search
 
 Usage:
     python manage.py run_benchmark --visibility --runs 3
     python manage.py run_benchmark --dashboard --scenario large
     python manage.py run_benchmark --notifications --query-breakdown
     python manage.py run_benchmark --checkout --scenario heavy --runs 5
+    python manage.py run_benchmark --search --search-events 100000 --runs 3
     python manage.py run_benchmark --all  # Run all benchmarks
 
 Common options:
@@ -55,6 +57,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Run checkout endpoint benchmarks",
         )
+        benchmark_group.add_argument(
+            "--search",
+            action="store_true",
+            help="Run event discovery search benchmarks (icontains vs full-text)",
+        )
         benchmark_group.add_argument(
             "--all",
             action="store_true",
@@ -143,6 +150,33 @@ class Command(BaseCommand):
             help="Number of users to create",
         )
 
+        # Checkout-specific options
+        checkout_group = parser.add_argument_group("Checkout Options (--checkout)")
+        checkout_group.add_argument(
+            "--large-org-members",
+            type=int,
+            default=20_000,
+            dest="large_org_members",
+            help="Active members in the large-org scenario (default: 20000)",
+        )
+        checkout_group.add_argument(
+            "--large-org-tickets",
+            type=int,
+            default=5_000,
+            dest="large_org_tickets",
+            help="Tickets sold for the large-org event (default: 5000)",
+        )
+
+        # Search-specific options
+        search_group = parser.add_argument_group("Search Options (--search)")
+        search_group.add_argument(
+            "--search-events",
+            type=int,
+            default=100_000,
+            dest="search_events",
+            help="Number of events to seed (default: 100000)",
+        )
+
         # Scenario selection (shared)
         parser.add_argument(
             "--scenario",
@@ -158,11 +192,12 @@ class Command(BaseCommand):
         run_dashboard = options["dashboard"] or options["all"]
         run_notifications = options["notifications"] or options["all"]
         run_checkout = options["checkout"] or options["all"]
+        run_search = options["search"] or options["all"]
 
-        if not any([run_visibility, run_dashboard, run_notifications, run_checkout]):
+        if not any([run_visibility, run_dashboard, run_notifications, run_checkout, run_search]):
             raise CommandError(
                 "Please specify at least one benchmark type: "
-                "--visibility, --dashboard, --notifications, --checkout, or --all"
+                "--visibility, --dashboard, --notifications, --checkout, --search, or --all"
             )
 
         # Import benchmark classes
@@ -170,6 +205,7 @@ class Command(BaseCommand):
             CheckoutBenchmark,
             DashboardBenchmark,
             NotificationsBenchmark,
+            SearchBenchmark,
             VisibilityBenchmark,
         )
 
@@ -186,6 +222,9 @@ class Command(BaseCommand):
         if run_checkout:
             self._run_benchmark(CheckoutBenchmark, "Checkout", options)
 
+        if run_search:
+            self._run_benchmark(SearchBenchmark, "Search", options)
+
         self.stdout.write(self.style.SUCCESS("\nAll requested benchmarks completed."))
 
     def _run_benchmark(
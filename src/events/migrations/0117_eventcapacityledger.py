@@ -0,0 +1,51 @@
+"""Per-event committed-ticket counter, backfilled from the ticket table.
+
+Every event gets its ledger row here so the capacity checks never have to seed one
+for a pre-existing event. Events created afterwards are seeded lazily by
+``capacity_ledger.locked_committed_tickets`` under the Event lock.
+"""
+
+import typing as t
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_ledgers(apps: t.Any, schema_editor: t.Any) -> None:
+    Event = apps.get_model("events", "Event")
+    EventCapacityLedger = apps.get_model("events", "EventCapacityLedger")
+
+    counted = Event.objects.annotate(
+        committed=Count("tickets", filter=~Q(tickets__status="cancelled"))
+    ).values_list("pk", "committed")
+    EventCapacityLedger.objects.bulk_create(
+        (EventCapacityLedger(event_id=pk, committed_tickets=committed) for pk, committed in counted.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0116_backfill_layered_ticket_caps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventCapacityLedger',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('committed_tickets', models.PositiveIntegerField(default=0)),
+                ('reconciled_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='capacity_ledger', to='events.event')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(backfill_ledgers, migrations.RunPython.noop),
+    ]
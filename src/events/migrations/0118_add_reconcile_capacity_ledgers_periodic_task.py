@@ -0,0 +1,45 @@
+import typing as t
+
+from django.db import migrations
+
+
+def create_reconcile_capacity_ledgers_task(apps: t.Any, schema_editor: t.Any) -> None:
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = CrontabSchedule.objects.get_or_create(
+        minute="17",
+        hour="*",
+        day_of_week="*",
+        day_of_month="*",
+        month_of_year="*",
+        timezone="UTC",
+    )
+
+    PeriodicTask.objects.update_or_create(
+        name="Reconcile event capacity ledgers",
+        defaults={
+            "task": "events.reconcile_capacity_ledgers",
+            "crontab": schedule,
+            "enabled": True,
+        },
+    )
+
+
+def delete_reconcile_capacity_ledgers_task(apps: t.Any, schema_editor: t.Any) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Reconcile event capacity ledgers").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0117_eventcapacityledger"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_reconcile_capacity_ledgers_task, reverse_code=delete_reconcile_capacity_ledgers_task
+        ),
+    ]
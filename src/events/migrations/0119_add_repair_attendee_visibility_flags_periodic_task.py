@@ -0,0 +1,45 @@
+import typing as t
+
+from django.db import migrations
+
+
+def create_repair_attendee_visibility_flags_task(apps: t.Any, schema_editor: t.Any) -> None:
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = CrontabSchedule.objects.get_or_create(
+        minute="40",
+        hour="3",
+        day_of_week="*",
+        day_of_month="*",
+        month_of_year="*",
+        timezone="UTC",
+    )
+
+    PeriodicTask.objects.update_or_create(
+        name="Repair attendee visibility flags",
+        defaults={
+            "task": "events.tasks.repair_attendee_visibility_flags",
+            "crontab": schedule,
+            "enabled": True,
+        },
+    )
+
+
+def delete_repair_attendee_visibility_flags_task(apps: t.Any, schema_editor: t.Any) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Repair attendee visibility flags").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0118_add_reconcile_capacity_ledgers_periodic_task"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_repair_attendee_visibility_flags_task, reverse_code=delete_repair_attendee_visibility_flags_task
+        ),
+    ]
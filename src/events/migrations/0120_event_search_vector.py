@@ -0,0 +1,28 @@
+"""Full-text search document for event discovery.
+
+Existing events start with a NULL vector; ``fill_missing_event_search_vectors``
+(scheduled in 0121) backfills them in chunks.
+"""
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0119_add_repair_attendee_visibility_flags_periodic_task'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='idx_event_search_vector'),
+        ),
+    ]
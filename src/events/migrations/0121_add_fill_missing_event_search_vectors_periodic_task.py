@@ -0,0 +1,38 @@
+import typing as t
+
+from django.db import migrations
+
+
+def create_fill_missing_event_search_vectors_task(apps: t.Any, schema_editor: t.Any) -> None:
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = IntervalSchedule.objects.get_or_create(every=5, period="minutes")
+
+    PeriodicTask.objects.update_or_create(
+        name="Fill missing event search vectors",
+        defaults={
+            "task": "events.tasks.fill_missing_event_search_vectors",
+            "interval": schedule,
+            "enabled": True,
+        },
+    )
+
+
+def delete_fill_missing_event_search_vectors_task(apps: t.Any, schema_editor: t.Any) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Fill missing event search vectors").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0120_event_search_vector"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_fill_missing_event_search_vectors_task, reverse_code=delete_fill_missing_event_search_vectors_task
+        ),
+    ]
@@ -2,6 +2,7 @@ from .announcement import Announcement
 from .attendee_invoice import AttendeeInvoice, AttendeeInvoiceCreditNote, AttendeeInvoiceStatus
 from .blacklist import Blacklist, WhitelistRequest
 from .bookmark import EventBookmark
+from .capacity import EventCapacityLedger
 from .discount_code import DiscountCode
 from .event import (
     AttendeeVisibilityFlag,
@@ -75,6 +76,7 @@ __all__ = [
     "EventToken",
     "EventWaitList",
     "EventBookmark",
+    "EventCapacityLedger",
     "WaitlistOffer",
     "Payment",
     "PendingEventInvitation",
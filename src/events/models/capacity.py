@@ -0,0 +1,25 @@
+"""Per-event capacity counter: the one row event-capacity checks lock."""
+
+from django.db import models
+
+from common.models import TimeStampedModel
+
+from .event import Event
+
+
+class EventCapacityLedger(TimeStampedModel):
+    """Running count of an event's capacity-holding (non-cancelled) tickets.
+
+    Maintained in the same transaction as every ticket write that moves the count
+    (see ``events.service.capacity_ledger``), so the capacity checks lock this row
+    instead of every sold ticket. The ticket table stays the ground truth:
+    ``events.reconcile_capacity_ledgers`` compares the two and repairs drift.
+    """
+
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name="capacity_ledger")
+    committed_tickets = models.PositiveIntegerField(default=0)
+    # Last time the reconciliation task had to overwrite the counter (i.e. found drift).
+    reconciled_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    def __str__(self) -> str:
+        return f"{self.event_id}: {self.committed_tickets}"
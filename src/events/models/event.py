@@ -5,6 +5,8 @@ from uuid import UUID
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.gis.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import BooleanField, Exists, OuterRef, Prefetch, Q, Value
 from django.utils import timezone
@@ -25,7 +27,7 @@ from .mixins import (
     SlugFromNameMixin,
     VisibilityMixin,
 )
-from .organization import Organization, OrganizationMember
+from .organization import Organization, OrganizationMember, OrganizationStaff
 from .ticket import _get_payment_default_expiry  # noqa: F401  # Re-export for migration compatibility
 from .venue import Venue
 
@@ -79,13 +81,27 @@ class EventQuerySet(models.QuerySet["Event"]):
     def for_user(
         self, user: RevelUser | AnonymousUser, include_past: bool = False, allowed_ids: list[UUID] | None = None
     ) -> t.Self:
-        """Get the queryset based on the user, using an efficient subquery strategy.
+        """Get the events ``user`` may see; see :meth:`visible_to` for the rules.
+
+        DISTINCT is kept for callers that go on to join multi-valued relations.
+        """
+        return self.visible_to(user, include_past=include_past, allowed_ids=allowed_ids).distinct()
+
+    def visible_to(
+        self, user: RevelUser | AnonymousUser, include_past: bool = False, allowed_ids: list[UUID] | None = None
+    ) -> t.Self:
+        """Filter to the events ``user`` may see, as one ``WHERE`` of ``Exists`` subqueries.
+
+        Joins nothing multi-valued and materializes no id sets, so it composes with other
+        filters, counts and pagination in a single statement without DISTINCT.
 
         Membership status handling:
         - BANNED users: Cannot see events from organizations where they are banned, even if public
         - CANCELLED users: Treated as if they have no membership
         - PAUSED/ACTIVE users: Can see events based on visibility rules
         """
+        from events.utils.blacklist import get_hard_blacklisted_org_ids
+
         from .invitation import EventInvitation
         from .rsvp import EventRSVP
         from .ticket import Ticket
@@ -112,62 +128,40 @@ class EventQuerySet(models.QuerySet["Event"]):
                 | is_allowed_special
             )
 
-        # --- Get banned and blacklisted organization IDs ---
+        organization = OuterRef("organization_id")
         # Users banned/blacklisted from an organization cannot see its events, even if public
-        from events.utils.blacklist import get_hard_blacklisted_org_ids
-
-        banned_org_ids = OrganizationMember.objects.filter(
-            user=user, status=OrganizationMember.MembershipStatus.BANNED
-        ).values_list("organization_id", flat=True)
-
-        blacklisted_org_ids = get_hard_blacklisted_org_ids(user)
-
-        # Combine banned and blacklisted org IDs
-        excluded_org_ids = set(banned_org_ids) | set(blacklisted_org_ids)
-
-        # --- Subquery Strategy ---
-        # 1. Get IDs of all non-public events this user has a specific relationship with.
-
-        # Events they are invited to
-        invited_event_ids = EventInvitation.objects.filter(user=user).values_list("event_id", flat=True)
-
-        # Events where they are a valid member of the organization (not cancelled, not banned)
-        member_org_ids = (
-            OrganizationMember.objects.for_visibility().filter(user=user).values_list("organization_id", flat=True)
-        )
-        member_event_ids = self.filter(
-            visibility=Event.Visibility.MEMBERS_ONLY, organization_id__in=member_org_ids
-        ).values_list("id", flat=True)
-
-        # Combine these IDs into a single set
-        ticket_event_ids = Ticket.objects.filter(user=user).values_list("event_id", flat=True)
-        rsvp_event_ids = EventRSVP.objects.filter(user=user).values_list("event_id", flat=True)
-
-        # Combine all these IDs into a single set
-        allowed_non_public_ids = (
-            set(invited_event_ids)
-            | set(member_event_ids)
-            | set(ticket_event_ids)
-            | set(rsvp_event_ids)
-            | set(allowed_ids or [])  # allow specific extra ids (e.g., when an EventToken is used).
+        is_excluded_org = Q(
+            Exists(
+                OrganizationMember.objects.filter(
+                    organization_id=organization, user=user, status=OrganizationMember.MembershipStatus.BANNED
+                )
+            )
+        ) | Q(organization_id__in=get_hard_blacklisted_org_ids(user))
+        is_owner_or_staff = Q(organization__owner=user) | Q(
+            Exists(OrganizationStaff.objects.filter(organization_id=organization, user=user))
         )
-
-        # 2. Build the final query
-        is_owner_or_staff = Q(organization__owner=user) | Q(organization__staff_members=user)
         # UNLISTED events are accessible like PUBLIC (e.g. via direct link);
         # discovery listings use discoverable_for_user() to hide them.
-        is_public = Q(visibility__in=Event.Visibility.publicly_accessible()) & ~Q(organization_id__in=excluded_org_ids)
-        is_allowed_non_public = Q(id__in=list(allowed_non_public_ids))
+        is_public = Q(visibility__in=Event.Visibility.publicly_accessible()) & ~is_excluded_org
+        # Non-public events the user has a specific relationship with: invited, holding a
+        # ticket or RSVP, or a valid (not cancelled, not banned) member for members-only events.
+        is_allowed_non_public = (
+            Q(Exists(EventInvitation.objects.filter(event_id=OuterRef("pk"), user=user)))
+            | Q(Exists(Ticket.objects.filter(event_id=OuterRef("pk"), user=user)))
+            | Q(Exists(EventRSVP.objects.filter(event_id=OuterRef("pk"), user=user)))
+            | Q(
+                Exists(OrganizationMember.objects.for_visibility().filter(organization_id=organization, user=user)),
+                visibility=Event.Visibility.MEMBERS_ONLY,
+            )
+            | is_allowed_special  # specific extra ids (e.g., when an EventToken is used)
+        )
 
         # Users see events if they are public (and not banned), if they are staff/owner,
         # or if they have a specific permission (invite/member)
         final_qs = base_qs.filter(is_public | is_owner_or_staff | is_allowed_non_public)
 
         # Only staff/owners can see drafts
-        if not (user.is_staff or user.is_superuser):
-            final_qs = final_qs.exclude(~is_owner_or_staff & Q(status=Event.EventStatus.DRAFT))
-
-        return final_qs.distinct()
+        return final_qs.exclude(~is_owner_or_staff & Q(status=Event.EventStatus.DRAFT))
 
     def discoverable_for_user(
         self, user: RevelUser | AnonymousUser, include_past: bool = False, allowed_ids: list[UUID] | None = None
@@ -225,6 +219,12 @@ class EventManager(models.Manager["Event"]):
         """Get the queryset based on the user."""
         return self.get_queryset().for_user(user, include_past=include_past, allowed_ids=allowed_ids)
 
+    def visible_to(
+        self, user: RevelUser | AnonymousUser, include_past: bool = False, allowed_ids: list[UUID] | None = None
+    ) -> EventQuerySet:
+        """Filter to the events the user may see, without DISTINCT."""
+        return self.get_queryset().visible_to(user, include_past=include_past, allowed_ids=allowed_ids)
+
     def discoverable_for_user(
         self, user: RevelUser | AnonymousUser, include_past: bool = False, allowed_ids: list[UUID] | None = None
     ) -> EventQuerySet:
@@ -400,6 +400,9 @@ class Event(
         "venue's city, then the event's city, falling back to the organization's VAT country.",
     )
 
+    # Discovery search document, maintained by events.service.event_search (NULL until computed).
+    search_vector = SearchVectorField(null=True, editable=False)
+
     @property
     def effective_vat_country(self) -> str:
         """The country whose VAT applies to admission to this event (#869).
@@ -454,6 +457,7 @@ class Event(
             models.Index(fields=["event_type", "start"], name="idx_type_start"),
             models.Index(fields=["status", "start"], name="idx_status_start"),
             models.Index(fields=["visibility", "organization"], name="idx_visibility_organization"),
+            GinIndex(fields=["search_vector"], name="idx_event_search_vector"),
         ]
         ordering = ["start"]
 
@@ -719,6 +723,12 @@ class Event(
         has_rsvp = EventRSVP.objects.filter(user=user, event=self, status=EventRSVP.RsvpStatus.YES).exists()
         return has_ticket or has_rsvp
 
+    def can_user_see_all_attendees(self, viewer: RevelUser) -> bool:
+        """Whether the viewer bypasses attendee visibility entirely (admins, owner, staff)."""
+        # Use .all() to leverage prefetched data when available (from with_organization())
+        is_staff_member = any(m.id == viewer.id for m in self.organization.staff_members.all())
+        return viewer.is_superuser or viewer.is_staff or self.organization.owner_id == viewer.id or is_staff_member
+
     def attendees(self, viewer: RevelUser) -> models.QuerySet[RevelUser]:
         """Return attendees based on who wants to see them.
 
@@ -731,9 +741,7 @@ class Event(
         from .rsvp import EventRSVP
         from .ticket import Ticket
 
-        # Use .all() to leverage prefetched data when available (from with_organization())
-        is_staff_member = any(m.id == viewer.id for m in self.organization.staff_members.all())
-        if viewer.is_superuser or viewer.is_staff or self.organization.owner_id == viewer.id or is_staff_member:
+        if self.can_user_see_all_attendees(viewer):
             return RevelUser.objects.filter(
                 Q(tickets__event=self, tickets__status=Ticket.TicketStatus.ACTIVE)
                 | Q(rsvps__event=self, rsvps__status=EventRSVP.RsvpStatus.YES)
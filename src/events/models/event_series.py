@@ -47,9 +47,16 @@ class EventSeriesQuerySet(models.QuerySet["EventSeries"]):
         )
 
     def for_user(self, user: RevelUser | AnonymousUser) -> t.Self:
-        """Get the queryset based on the user, using a high-performance UNION-based strategy.
+        """Get the event series ``user`` may see; see :meth:`visible_to` for the rules.
 
-        An event series is visible if its parent organization is visible.
+        DISTINCT is kept for callers that go on to join multi-valued relations.
+        """
+        return self.visible_to(user).distinct()
+
+    def visible_to(self, user: RevelUser | AnonymousUser) -> t.Self:
+        """Filter to the event series ``user`` may see: those whose organization is visible.
+
+        A single ``WHERE`` over :meth:`OrganizationQuerySet.visible_to`, without DISTINCT.
         """
         # --- Fast paths for special users ---
         if user.is_superuser or user.is_staff:
@@ -58,16 +65,7 @@ class EventSeriesQuerySet(models.QuerySet["EventSeries"]):
             # UNLISTED orgs are accessible like PUBLIC (e.g. via direct link);
             # discovery listings use discoverable_for_user() to hide them.
             return self.filter(organization__visibility__in=Organization.Visibility.publicly_accessible())
-
-        # --- "Gather-then-filter" strategy for standard users ---
-
-        # 1. Get the IDs of all organizations this user can see.
-        # We can reuse the already optimized for_user method from the Organization model!
-        visible_org_ids = Organization.objects.for_user(user).values("id")
-
-        # 2. Filter the EventSeries queryset based on those organization IDs.
-        # This results in a simple and fast query.
-        return self.filter(organization_id__in=visible_org_ids).distinct()
+        return self.filter(organization_id__in=Organization.objects.visible_to(user).values("id"))
 
     def discoverable_for_user(self, user: RevelUser | AnonymousUser) -> t.Self:
         """Get queryset for discovery listings (browse/search).
@@ -93,6 +91,10 @@ class EventSeriesManager(models.Manager["EventSeries"]):
         """Get the queryset based on the user."""
         return self.get_queryset().for_user(user)
 
+    def visible_to(self, user: RevelUser | AnonymousUser) -> EventSeriesQuerySet:
+        """Filter to the event series the user may see, without DISTINCT."""
+        return self.get_queryset().visible_to(user)
+
     def discoverable_for_user(self, user: RevelUser | AnonymousUser) -> EventSeriesQuerySet:
         """Get queryset for discovery listings."""
         return self.get_queryset().discoverable_for_user(user)
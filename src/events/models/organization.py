@@ -9,7 +9,7 @@ from django.contrib.auth.models import AnonymousUser
 from django.contrib.gis.db import models
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db.models import Prefetch, Q
+from django.db.models import Exists, OuterRef, Prefetch, Q
 from django.utils.translation import gettext_lazy as _
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic import ValidationError as PydanticValidationError
@@ -59,9 +59,17 @@ class OrganizationQuerySet(models.QuerySet["Organization"]):
         return self.select_related("city")
 
     def for_user(self, user: RevelUser | AnonymousUser, allowed_ids: list[UUID] | None = None) -> t.Self:
-        """Get queryset for user using a high-performance UNION-based strategy.
+        """Get the organizations ``user`` may see; see :meth:`visible_to` for the rules.
 
-        Avoid slow, multi-JOIN queries.
+        DISTINCT is kept for callers that go on to join multi-valued relations.
+        """
+        return self.visible_to(user, allowed_ids).distinct()
+
+    def visible_to(self, user: RevelUser | AnonymousUser, allowed_ids: list[UUID] | None = None) -> t.Self:
+        """Filter to the organizations ``user`` may see, as one ``WHERE`` of ``Exists`` subqueries.
+
+        Joins nothing, so it composes with other filters, counts and pagination in a
+        single statement without DISTINCT.
 
         Membership status handling:
         - BANNED users: Cannot see ANY organizations, even public ones
@@ -73,65 +81,35 @@ class OrganizationQuerySet(models.QuerySet["Organization"]):
         # --- Fast paths for special users ---
         if user.is_superuser or user.is_staff:
             return self.all()
+        # UNLISTED orgs are accessible like PUBLIC (e.g. via direct link);
+        # discovery listings use discoverable_for_user() to hide them.
+        is_public = Q(visibility__in=Organization.Visibility.publicly_accessible())
         if user.is_anonymous:
-            # UNLISTED orgs are accessible like PUBLIC (e.g. via direct link);
-            # discovery listings use discoverable_for_user() to hide them.
-            return self.filter(Q(visibility__in=Organization.Visibility.publicly_accessible()) | is_allowed_special)
+            return self.filter(is_public | is_allowed_special)
 
-        # --- Check if user is banned or blacklisted from any organization ---
-        # If a user is banned/blacklisted, they cannot see the organization at all, even if it's public
+        # A user banned/blacklisted from an organization cannot see it, even if it's public.
         from events.utils.blacklist import get_hard_blacklisted_org_ids
 
-        banned_org_ids = OrganizationMember.objects.filter(
-            user=user, status=OrganizationMember.MembershipStatus.BANNED
-        ).values_list("organization_id", flat=True)
-
-        blacklisted_org_ids = get_hard_blacklisted_org_ids(user)
-
-        # Combine banned and blacklisted org IDs
-        excluded_org_ids = set(banned_org_ids) | set(blacklisted_org_ids)
-
-        # --- "Gather-then-filter" strategy for standard users ---
-
-        # 1. Gather IDs from all distinct sources of visibility.
-
-        # A) Publicly accessible organizations (PUBLIC + UNLISTED; exclude banned/blacklisted).
-        #    UNLISTED orgs are accessible like PUBLIC ones (e.g. via direct link),
-        #    but are filtered out from discovery listings by discoverable_for_user().
-        public_orgs_qs = (
-            self.filter(visibility__in=Organization.Visibility.publicly_accessible())
-            .exclude(id__in=excluded_org_ids)
-            .values("id")
-        )
-
-        # B) Organizations the user owns
-        owned_orgs_qs = self.filter(owner=user).values("id")
-
-        # C) Organizations where the user is a staff member
-        staff_orgs_qs = self.filter(staff_members=user).values("id")
-
-        # D) Restricted organizations where the user is a valid member (not cancelled, not banned)
-        member_orgs_qs = (
-            self.filter(
-                visibility__in=[Organization.Visibility.MEMBERS_ONLY, Organization.Visibility.PRIVATE],
-                memberships__user=user,
-            )
-            .exclude(
-                memberships__status__in=[
-                    OrganizationMember.MembershipStatus.CANCELLED,
-                    OrganizationMember.MembershipStatus.BANNED,
-                ]
+        is_banned = Exists(
+            OrganizationMember.objects.filter(
+                organization_id=OuterRef("pk"), user=user, status=OrganizationMember.MembershipStatus.BANNED
             )
-            .values("id")
         )
-
-        # 2. Combine the querysets of IDs using UNION.
-        # This is extremely fast and efficiently handled by the database.
-        visible_org_ids_qs = public_orgs_qs.union(owned_orgs_qs, staff_orgs_qs, member_orgs_qs)
-
-        # 3. Filter the main queryset using the gathered IDs.
-        # This final query is very fast as it filters on the primary key.
-        return self.filter(Q(id__in=visible_org_ids_qs) | is_allowed_special).distinct()
+        is_excluded = Q(is_banned) | Q(id__in=get_hard_blacklisted_org_ids(user))
+        is_staff = Exists(OrganizationStaff.objects.filter(organization_id=OuterRef("pk"), user=user))
+        # Restricted organizations need a membership that isn't cancelled or banned.
+        is_member = Exists(
+            OrganizationMember.objects.for_visibility().filter(organization_id=OuterRef("pk"), user=user)
+        )
+        is_restricted = Q(visibility__in=[Organization.Visibility.MEMBERS_ONLY, Organization.Visibility.PRIVATE])
+
+        return self.filter(
+            (is_public & ~is_excluded)
+            | Q(owner=user)
+            | Q(is_staff)
+            | (is_restricted & Q(is_member))
+            | is_allowed_special
+        )
 
     def discoverable_for_user(self, user: RevelUser | AnonymousUser, allowed_ids: list[UUID] | None = None) -> t.Self:
         """Get queryset for discovery listings (browse/search).
@@ -231,6 +209,12 @@ class OrganizationManager(models.Manager["Organization"]):
         """Get queryset for user."""
         return self.get_queryset().for_user(user, allowed_ids)
 
+    def visible_to(
+        self, user: RevelUser | AnonymousUser, allowed_ids: list[UUID] | None = None
+    ) -> OrganizationQuerySet:
+        """Filter to the organizations the user may see, without DISTINCT."""
+        return self.get_queryset().visible_to(user, allowed_ids)
+
     def discoverable_for_user(
         self, user: RevelUser | AnonymousUser, allowed_ids: list[UUID] | None = None
     ) -> OrganizationQuerySet:
@@ -777,6 +777,10 @@ class Ticket(TimeStampedModel):
 
     objects = TicketManager()
 
+    # Status as last read from / written to the database; lets the capacity ledger
+    # tell a CANCELLED transition from a re-save (see service.capacity_ledger.sync_ticket).
+    _loaded_status: str | None = None
+
     class Meta:
         constraints = [
             # Note: unique_ticket_event_user_tier constraint was removed to allow
@@ -795,6 +799,20 @@ class Ticket(TimeStampedModel):
         ]
         ordering = ["-created_at"]
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: t.Collection[str], values: t.Collection[t.Any]) -> t.Self:
+        """Remember the loaded status (``None`` when deferred)."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+    def refresh_from_db(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Re-read the row, re-baselining the loaded status if it was refreshed."""
+        super().refresh_from_db(*args, **kwargs)
+        fields = kwargs.get("fields")
+        if fields is None or "status" in fields:
+            self._loaded_status = self.__dict__.get("status")
+
     def _validate_seat(self) -> VenueSector | None:
         """Validate and auto-fill sector from seat. Returns the sector for chaining."""
         seat = self.seat
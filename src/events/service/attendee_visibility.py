@@ -0,0 +1,124 @@
+"""Query-time attendee visibility for events too large to materialize.
+
+``AttendeeVisibilityFlag`` stores a viewer×target matrix per event — quadratic in the
+attendee count and mostly never read. With ``ATTENDEE_VISIBILITY_MODE = "lazy"``,
+events with at least ``ATTENDEE_VISIBILITY_LAZY_THRESHOLD`` attendees skip the matrix:
+the flag tasks drop it, and :func:`visible_attendees` resolves the current viewer's
+list at request time instead.
+
+For one viewer, :func:`~events.service.user_preferences_service.resolve_visibility_fast`
+only varies with the target's preference and org membership — the viewer's side
+(invited or attending, member) is fixed. So the viewer's facts are read from a cached
+per-event :class:`VisibilityContext` and the target's side becomes a SQL filter; the
+attendee list stays a queryset the endpoint paginates (and counts) in the database.
+"""
+
+from uuid import UUID
+
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Q, QuerySet
+
+from accounts.models import RevelUser
+from events.models import Event, EventRSVP, GeneralUserPreferences, OrganizationMember, Ticket
+from events.service.user_preferences_service import VisibilityContext
+
+logger = structlog.get_logger(__name__)
+
+# Bump when VisibilityContext's shape changes so a rolling deploy never unpickles an old entry.
+CACHE_VERSION = "v1"
+# Every attendee write invalidates the entry (see invalidate_visibility_context); the TTL
+# bounds staleness from what doesn't (membership and staff changes).
+CACHE_TTL_SECONDS = 60
+
+ATTENDEE_STATUSES = (Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.CHECKED_IN)
+
+
+def get_cache_key(event_id: UUID | str) -> str:
+    """Cache key for an event's visibility context."""
+    return f"visibility_context:{CACHE_VERSION}:{event_id}"
+
+
+def uses_lazy_visibility(event: Event) -> bool:
+    """Whether the event's attendee visibility is resolved at query time rather than materialized."""
+    return (
+        settings.ATTENDEE_VISIBILITY_MODE == "lazy"
+        and event.attendee_count >= settings.ATTENDEE_VISIBILITY_LAZY_THRESHOLD
+    )
+
+
+def get_visibility_context(event: Event) -> VisibilityContext:
+    """Return the event's visibility context from the cache, building it on a miss.
+
+    Fails open: a cache error costs the 4-query build, never the request.
+    """
+    key = get_cache_key(event.pk)
+    try:
+        cached = cache.get(key)
+    except Exception:
+        logger.warning("visibility_context_cache_get_failed", exc_info=True)
+        cached = None
+    if isinstance(cached, VisibilityContext):
+        return cached
+
+    organization = event.organization
+    staff_ids = {sm.id for sm in organization.staff_members.all()}
+    context = VisibilityContext.for_event(event, organization.owner_id, staff_ids)
+    try:
+        cache.set(key, context, timeout=CACHE_TTL_SECONDS)
+    except Exception:
+        logger.warning("visibility_context_cache_set_failed", exc_info=True)
+    return context
+
+
+def invalidate_visibility_context(event_id: UUID | str) -> None:
+    """Drop the event's cached context (call after commit: the next reader rebuilds it)."""
+    try:
+        cache.delete(get_cache_key(event_id))
+    except Exception:
+        logger.warning("visibility_context_cache_delete_failed", exc_info=True)
+
+
+def _visible_target_q(event: Event, viewer: RevelUser, context: VisibilityContext) -> Q:
+    """``resolve_visibility_fast(viewer, <target>, context)`` as a filter over targets."""
+    prefs = GeneralUserPreferences.VisibilityPreference
+    invited_or_attending = context.is_viewer_invited_or_attending(viewer.id)
+
+    shown: list[str] = [prefs.ALWAYS]
+    if invited_or_attending:
+        shown += [prefs.TO_INVITEES, prefs.TO_BOTH]
+    q = Q(general_preferences__show_me_on_attendee_list__in=shown)
+
+    if viewer.id in context.org_member_ids:
+        to_members: list[str] = [prefs.TO_MEMBERS] if invited_or_attending else [prefs.TO_MEMBERS, prefs.TO_BOTH]
+        target_is_member = Exists(
+            OrganizationMember.objects.filter(organization_id=event.organization_id, user_id=OuterRef("pk"))
+        )
+        q |= Q(general_preferences__show_me_on_attendee_list__in=to_members) & Q(target_is_member)
+    return q
+
+
+def visible_attendees(event: Event, viewer: RevelUser) -> QuerySet[RevelUser]:
+    """The attendees ``viewer`` may see, from the flag matrix or resolved at query time.
+
+    Same contract as :meth:`Event.attendees`, which it delegates to unless the event
+    is lazily resolved and the viewer is not privileged.
+    """
+    if not uses_lazy_visibility(event) or event.can_user_see_all_attendees(viewer):
+        return event.attendees(viewer)
+    if not event.can_user_see_attendee_list(viewer):
+        return RevelUser.objects.none()
+
+    context = get_visibility_context(event)
+    # The matrix only has rows for invited or attending viewers; anyone else sees nobody.
+    is_viewer = (
+        context.is_viewer_invited_or_attending(viewer.id)
+        or Ticket.objects.filter(event=event, user=viewer, status=Ticket.TicketStatus.CHECKED_IN).exists()
+    )
+    if not is_viewer:
+        return RevelUser.objects.none()
+    attending = Exists(
+        Ticket.objects.filter(event=event, user_id=OuterRef("pk"), status__in=ATTENDEE_STATUSES)
+    ) | Exists(EventRSVP.objects.filter(event=event, user_id=OuterRef("pk"), status=EventRSVP.RsvpStatus.YES))
+    return RevelUser.objects.filter(attending).filter(_visible_target_q(event, viewer, context))
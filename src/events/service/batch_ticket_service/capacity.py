@@ -12,6 +12,7 @@ from django.utils.translation import gettext_lazy as _
 from ninja.errors import HttpError
 
 from events.models import Event, Ticket, TicketTier, VenueSector, WaitlistOffer
+from events.service import capacity_ledger
 from events.service.batch_ticket_service.context import BatchTicketContext
 
 if t.TYPE_CHECKING:
@@ -47,8 +48,8 @@ class CapacityMixin(BatchTicketContext):
         """Assert that the event has capacity for the requested tickets.
 
         Uses effective_capacity (min of max_attendees and venue.capacity) as the soft limit.
-        Uses select_for_update to prevent race conditions when multiple users
-        purchase tickets simultaneously.
+        Locks the Event row and then the event's capacity ledger row — one counter
+        row instead of every sold ticket — so concurrent purchases serialize here.
 
         Counts committed tickets PLUS pending unexpired waitlist offers
         (excluding cutoff-batch offers which race FCFS against real seats,
@@ -71,13 +72,8 @@ class CapacityMixin(BatchTicketContext):
         # and other capacity-modifying flows.
         self.event = Event.objects.select_for_update().get(pk=self.event.pk)
 
-        # Count all non-cancelled tickets with row-level locking
-        current_count = (
-            Ticket.objects.select_for_update()
-            .filter(event=self.event)
-            .exclude(status=Ticket.TicketStatus.CANCELLED)
-            .count()
-        )
+        # Non-cancelled tickets, read off the locked ledger row.
+        current_count = capacity_ledger.locked_committed_tickets(self.event.pk)
 
         now = timezone.now()
         pending_offers = (
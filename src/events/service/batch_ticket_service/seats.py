@@ -294,9 +294,11 @@ class SeatResolutionMixin(BatchTicketContext):
         if (held := self._try_consume_held_block(count, zone_id, tier, cart_assigned)) is not None:
             return held
 
-        for _attempt in range(3):
+        for attempt in range(3):
             # Same identity rule as _verify_and_consume_holds: a guest session, when
             # present, IS the hold identity — the buyer's own holds stay candidates.
+            # The first attempt proposes from the cached seat index; the lock below
+            # re-verifies it, and every retry reads the tables instead.
             candidates = load_candidates(
                 self.event,
                 tier,
@@ -304,8 +306,11 @@ class SeatResolutionMixin(BatchTicketContext):
                 zone_id=zone_id,
                 hold_owner_user=None if self.guest_session else self.user,
                 hold_owner_guest_session=self.guest_session,
+                from_index=attempt == 0,
             )
             picked_ids = pick_best_available(candidates, count, accessible_required=accessible_required)
+            if not picked_ids and attempt == 0:
+                continue  # the index may trail a release — confirm "nothing fits" against the tables
             if not picked_ids:
                 if accessible_required:
                     raise HttpError(
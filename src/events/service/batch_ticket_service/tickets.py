@@ -12,9 +12,11 @@ from django.db import transaction
 from events.models import Ticket, TicketTier, VenueSeat
 from events.models.discount_code import DiscountCode
 from events.schema import TicketPurchaseItem
+from events.service import capacity_ledger
 from events.service.batch_ticket_service.context import BatchTicketContext
+from events.service.seating import seat_index
 from events.service.seating.pricing import TicketPrice
-from events.tasks import build_attendee_visibility_flags
+from events.tasks import enqueue_attendee_visibility_update, enqueue_ticket_file_prewarm
 from notifications.signals.ticket import send_batch_ticket_created_notifications
 from notifications.signals.waitlist import remove_user_from_waitlist
 
@@ -97,7 +99,12 @@ class TicketWriterMixin(BatchTicketContext):
             ticket.clean()
             tickets.append(ticket)
 
-        return Ticket.objects.bulk_create(tickets)
+        created = Ticket.objects.bulk_create(tickets)
+        # bulk_create skips the post_save receivers that keep the seat index and the
+        # capacity ledger in sync.
+        seat_index.record_sold(self.event.id, [seat.id for seat in seats if seat is not None])
+        capacity_ledger.record_committed(created)
+        return created
 
     def _default_guest_name(self) -> str:
         """Holder-name fallback when the buyer omitted one (flag off).
@@ -156,18 +163,21 @@ class TicketWriterMixin(BatchTicketContext):
 
         Django's bulk_create does NOT trigger post_save signals, so we must
         manually trigger the necessary side effects:
-        - Update attendee_count via build_attendee_visibility_flags task
+        - Update attendee_count and visibility flags via enqueue_attendee_visibility_update
         - Send ticket created notifications
         - Remove user from waitlist
+        - Pre-generate the files of active tickets via enqueue_ticket_file_prewarm
 
         Args:
             tickets: List of tickets created via bulk_create.
         """
+        # Update attendee_count and the buyer's visibility flags (once per batch, not per ticket)
+        enqueue_attendee_visibility_update(self.event.id, {ticket.user_id for ticket in tickets})
+        # PENDING (online) tickets are prewarmed by the webhook's save() once paid.
+        if any(ticket.status == Ticket.TicketStatus.ACTIVE for ticket in tickets):
+            enqueue_ticket_file_prewarm(self.event.id)
 
         def on_commit() -> None:
-            # Update attendee_count (once per batch, not per ticket)
-            build_attendee_visibility_flags.delay(str(self.event.id))
-
             # Send notifications for all tickets in batch (fetches shared data once)
             send_batch_ticket_created_notifications(tickets)
 
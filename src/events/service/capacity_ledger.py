@@ -0,0 +1,161 @@
+"""Per-event committed-ticket counter backing the event capacity checks.
+
+``EventCapacityLedger.committed_tickets`` mirrors ``tickets.exclude(CANCELLED).count()``
+so the capacity checks lock one row instead of every sold ticket. The counter moves
+in the same transaction as the ticket write that changes it:
+
+- single-row ``save()`` / ``delete()`` (and queryset ``delete()``, which sends
+  ``post_delete`` per row) go through :func:`sync_ticket`, wired as a Ticket receiver
+  in ``events.signals`` — cancellations, refunds, pending-checkout expiry;
+- ``bulk_create`` and queryset ``update()`` fire no signals, so those writers call
+  :func:`record_committed` / :func:`record_released` themselves.
+
+The ticket table stays the ground truth. A missing ledger row is seeded from it
+under the caller's Event lock, and :func:`reconcile` repairs any drift (writes made
+behind the ORM's back, e.g. admin SQL).
+"""
+
+import typing as t
+from collections import Counter
+from datetime import timedelta
+from uuid import UUID
+
+import structlog
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from events.models import Event, EventCapacityLedger, Ticket
+
+logger = structlog.get_logger(__name__)
+
+# Ended events can't sell, so drift there is harmless; a day of slack covers
+# post-end cancellations and refunds still landing.
+RECONCILE_ENDED_GRACE = timedelta(days=1)
+
+
+def _holds_capacity(status: str | None) -> bool:
+    return status != Ticket.TicketStatus.CANCELLED
+
+
+def count_committed_tickets(event_id: UUID) -> int:
+    """Ground truth: the event's non-cancelled tickets, counted without locks."""
+    return Ticket.objects.filter(event_id=event_id).exclude(status=Ticket.TicketStatus.CANCELLED).count()
+
+
+def locked_committed_tickets(event_id: UUID) -> int:
+    """Lock the event's ledger row and return its count, seeding the row if missing.
+
+    The caller must already hold the Event row lock: that is what makes the seed
+    count safe (every other capacity check is queued behind it) and keeps two
+    seeders from racing the insert.
+    """
+    ledger = EventCapacityLedger.objects.select_for_update().filter(event_id=event_id).first()
+    if ledger is None:
+        ledger = EventCapacityLedger.objects.create(
+            event_id=event_id, committed_tickets=count_committed_tickets(event_id)
+        )
+    return ledger.committed_tickets
+
+
+def _shift(tickets: t.Iterable[Ticket], sign: int) -> None:
+    per_event: Counter[UUID] = Counter()
+    for ticket in tickets:
+        if _holds_capacity(ticket.status):
+            per_event[ticket.event_id] += 1
+        # Re-baseline so a later save() of the same instance isn't counted twice.
+        ticket._loaded_status = ticket.status if sign > 0 else Ticket.TicketStatus.CANCELLED
+    # Sorted for a deterministic ledger lock order across concurrent multi-event writers.
+    for event_id, count in sorted(per_event.items()):
+        delta = F("committed_tickets") + count if sign > 0 else Greatest(F("committed_tickets") - count, Value(0))
+        EventCapacityLedger.objects.filter(event_id=event_id).update(committed_tickets=delta)
+
+
+def record_committed(tickets: t.Iterable[Ticket]) -> None:
+    """Count freshly written tickets (``bulk_create``) against their events."""
+    _shift(tickets, 1)
+
+
+def record_released(tickets: t.Iterable[Ticket]) -> None:
+    """Release tickets cancelled through a queryset ``update()``.
+
+    Pass the instances as they were *before* the update (their status still the
+    capacity-holding one); already-cancelled tickets are skipped.
+    """
+    _shift(tickets, -1)
+
+
+def sync_ticket(ticket: Ticket, *, created: bool, deleted: bool, update_fields: t.AbstractSet[str] | None) -> None:
+    """Move the counter for one saved or deleted ticket, if its status crossed CANCELLED.
+
+    The previous status comes from what the instance was loaded with
+    (``Ticket._loaded_status``); when that is unknown — a deferred ``status`` or an
+    instance built by hand and saved over an existing row — the write is left to
+    :func:`reconcile` rather than guessed.
+    """
+    if created:
+        was = False
+    elif not deleted and update_fields is not None and "status" not in update_fields:
+        return
+    elif ticket._loaded_status is None:
+        return
+    else:
+        was = _holds_capacity(ticket._loaded_status)
+    now = not deleted and _holds_capacity(ticket.status)
+    ticket._loaded_status = None if deleted else ticket.status
+    if now == was:
+        return
+    delta = F("committed_tickets") + 1 if now else Greatest(F("committed_tickets") - 1, Value(0))
+    EventCapacityLedger.objects.filter(event_id=ticket.event_id).update(committed_tickets=delta)
+
+
+class ReconcileCounters(t.TypedDict):
+    """Telemetry counters returned by :func:`reconcile`."""
+
+    checked: int
+    drifted: int
+
+
+def reconcile() -> ReconcileCounters:
+    """Compare every live event's ledger with its ticket count and repair drift.
+
+    Candidates are found with one lock-free query; each mismatch is then re-read
+    under the Event and ledger locks (so an in-flight checkout can't be mistaken for
+    drift) and overwritten with the ground truth. Every repair logs an error —
+    drift means some writer bypassed this module and is worth finding.
+    """
+    now = timezone.now()
+    live = EventCapacityLedger.objects.filter(event__end__gte=now - RECONCILE_ENDED_GRACE)
+    actual = (
+        Ticket.objects.filter(event_id=OuterRef("event_id"))
+        .exclude(status=Ticket.TicketStatus.CANCELLED)
+        .order_by()
+        .values("event_id")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    suspects = list(
+        live.annotate(actual=Coalesce(Subquery(actual), 0))
+        .filter(~Q(committed_tickets=F("actual")))
+        .values_list("event_id", flat=True)
+    )
+    counters: ReconcileCounters = {"checked": live.count(), "drifted": 0}
+    for event_id in suspects:
+        with transaction.atomic():
+            Event.objects.select_for_update().filter(pk=event_id).first()
+            ledger = EventCapacityLedger.objects.select_for_update().get(event_id=event_id)
+            truth = count_committed_tickets(event_id)
+            if ledger.committed_tickets == truth:
+                continue
+            logger.error(
+                "capacity_ledger_drift",
+                event_id=str(event_id),
+                ledger=ledger.committed_tickets,
+                actual=truth,
+            )
+            ledger.committed_tickets = truth
+            ledger.reconciled_at = now
+            ledger.save(update_fields=["committed_tickets", "reconciled_at", "updated_at"])
+            counters["drifted"] += 1
+    return counters
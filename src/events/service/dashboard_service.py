@@ -1,9 +1,11 @@
 """Dashboard query-composition helpers.
 
 Centralises the "authorized ∩ relationship" intersection logic used by the
-dashboard endpoints, plus the invitation-exclusion chain. Materialising the
-two ID sets in Python (rather than using SQL ``INTERSECT`` or nested
-subqueries) keeps pagination ``COUNT(*)`` fast on large datasets.
+dashboard endpoints, plus the invitation-exclusion chain. Both sides stay in
+SQL: the visibility predicate (``visible_to``) is a ``WHERE`` of ``Exists``
+subqueries and the relationship side a ``UNION`` of id subqueries, so the
+intersection, the pagination ``COUNT(*)`` and the page are each one statement —
+no id set (and never the platform's whole public catalogue) reaches Python.
 """
 
 from __future__ import annotations
@@ -31,8 +33,8 @@ def get_user_related_events(
     2. Events matching the dashboard relationship filters
        (owner / staff / member / rsvp / tickets / invitations / bookmarks).
 
-    IDs are materialised in Python to keep the final ``WHERE id IN (...)``
-    pagination-friendly. Optionally narrows further by ``requires_ticket``.
+    Both sides are composed into one query. Optionally narrows further by
+    ``requires_ticket``.
 
     Args:
         user: The authenticated user.
@@ -42,13 +44,12 @@ def get_user_related_events(
     Returns:
         A queryset of full Event objects matching the intersection.
     """
-    authorized_event_ids = set(
-        models.Event.objects.for_user(user, include_past=include_past).values_list("id", flat=True)
+    qs = (
+        models.Event.objects.full()
+        .visible_to(user, include_past=include_past)
+        .filter(id__in=params.get_events_queryset(user.id).values("id"))
+        .with_user_bookmark(user)
     )
-    relationship_event_ids = set(params.get_events_queryset(user.id).values_list("id", flat=True))
-    final_event_ids = authorized_event_ids & relationship_event_ids
-
-    qs = models.Event.objects.full().filter(id__in=list(final_event_ids)).with_user_bookmark(user)
     if params.requires_ticket is not None:
         qs = qs.filter(requires_ticket=params.requires_ticket)
     return qs
@@ -67,10 +68,11 @@ def get_user_related_organizations(
     Returns:
         A queryset of full Organization objects matching the intersection.
     """
-    authorized_org_ids = set(models.Organization.objects.for_user(user).values_list("id", flat=True))
-    relationship_org_ids = set(params.get_organizations_queryset(user.id).values_list("id", flat=True))
-    final_org_ids = authorized_org_ids & relationship_org_ids
-    return models.Organization.objects.full().filter(id__in=list(final_org_ids))
+    return (
+        models.Organization.objects.full()
+        .visible_to(user)
+        .filter(id__in=params.get_organizations_queryset(user.id).values("id"))
+    )
 
 
 def get_user_related_event_series(
@@ -86,10 +88,11 @@ def get_user_related_event_series(
     Returns:
         A queryset of full EventSeries objects matching the intersection.
     """
-    authorized_series_ids = set(models.EventSeries.objects.for_user(user).values_list("id", flat=True))
-    relationship_series_ids = set(params.get_event_series_queryset(user.id).values_list("id", flat=True))
-    final_series_ids = authorized_series_ids & relationship_series_ids
-    return models.EventSeries.objects.full().filter(id__in=list(final_series_ids))
+    return (
+        models.EventSeries.objects.full()
+        .visible_to(user)
+        .filter(id__in=params.get_event_series_queryset(user.id).values("id"))
+    )
 
 
 def get_user_invitations(
@@ -26,6 +26,8 @@ _EXCLUDED_FROM_COPY: frozenset[str] = frozenset(
         "logo_thumbnail",
         "cover_art_thumbnail",
         "cover_art_social",
+        # derived from the copy's own name and tags once saved
+        "search_vector",
         # per-occurrence state
         "attendee_count",
         "is_template",
@@ -0,0 +1,146 @@
+"""Short-lived cache of ``EligibilityService(user, event).check_eligibility()`` results.
+
+Read paths — ``GET /my-status`` and the Telegram notification keyboards — ask the same
+user/event question over and over, and every answer costs the full eligibility load.
+:func:`get_eligibility` serves those from a cache entry keyed by (event, user) and
+three version tokens:
+
+- the event's, bumped by writes that change the answer for everyone: tickets, RSVPs,
+  waitlist entries and offers, tiers and the event itself;
+- the organization's, bumped by organization and org-questionnaire edits;
+- the user's, bumped by writes that change only their answer: invitations and requests,
+  membership, staff seats, blacklist and whitelist entries, questionnaire submissions
+  and evaluations, and profile edits.
+
+Bumping deletes the token, so the next reader mints a fresh one and every result cached
+under the old token is orphaned until its TTL runs out. The receivers live in
+``events.signals``. Tokens are read *before* the result is computed, so a result is never
+stored under a token newer than the state it was computed from. The TTL bounds what no
+signal covers: time-based gates (sales windows, deadlines) and ``update()`` writers.
+
+Safety model: a cached result only decides what the UI offers. Every write path —
+ticket checkout, RSVP, waitlist joins — builds its own ``EventManager`` /
+``EligibilityService`` and re-verifies uncached, with capacity checked under the event's
+row lock. Nothing that grants a seat may call :func:`get_eligibility`.
+
+Cache ops fail open: a broken Redis costs the uncached check, never the request.
+"""
+
+import uuid
+from uuid import UUID
+
+import structlog
+from django.core.cache import cache
+from django.db import transaction
+from prometheus_client import Counter
+
+from accounts.models import RevelUser
+from events.models import Event
+from events.service.event_manager import EligibilityService, EventUserEligibility
+
+logger = structlog.get_logger(__name__)
+
+# Bump when EventUserEligibility's shape changes so a rolling deploy never reads an old entry.
+CACHE_VERSION = "v1"
+CACHE_TTL_SECONDS = 30
+# Tokens must outlive every result cached under them; an expired token only costs misses.
+TOKEN_TTL_SECONDS = 24 * 60 * 60
+
+# A rate, not an alert: per-worker values are enough for a hit ratio, so this lives here
+# rather than in common.observability.metrics.
+ELIGIBILITY_CACHE_LOOKUPS = Counter(
+    "revel_eligibility_cache_lookups",
+    "Eligibility cache lookups by result (hit, miss, or error when the cache was unreachable).",
+    ["result"],
+)
+
+
+def _event_token_key(event_id: UUID | str) -> str:
+    return f"eligibility_token:event:{event_id}"
+
+
+def _organization_token_key(organization_id: UUID | str) -> str:
+    return f"eligibility_token:org:{organization_id}"
+
+
+def _user_token_key(user_id: UUID | str) -> str:
+    return f"eligibility_token:user:{user_id}"
+
+
+def _read_tokens(keys: list[str]) -> list[str]:
+    """Current value of each token, minting any that are missing."""
+    tokens = cache.get_many(keys)
+    missing = [key for key in keys if key not in tokens]
+    if missing:
+        for key in missing:
+            cache.add(key, uuid.uuid4().hex, timeout=TOKEN_TTL_SECONDS)
+        # add() loses to a concurrent minter: re-read so everyone agrees on the winner.
+        tokens.update(cache.get_many(missing))
+    return [str(tokens.get(key, "")) for key in keys]
+
+
+def get_cache_key(event: Event, user: RevelUser) -> str:
+    """Cache key for ``user``'s eligibility for ``event`` at the current token versions."""
+    tokens = _read_tokens(
+        [_event_token_key(event.pk), _organization_token_key(event.organization_id), _user_token_key(user.pk)]
+    )
+    return f"eligibility:{CACHE_VERSION}:{event.pk}:{user.pk}:{':'.join(tokens)}"
+
+
+def get_eligibility(user: RevelUser, event: Event) -> EventUserEligibility:
+    """Return ``EligibilityService(user, event).check_eligibility()``, cached for CACHE_TTL_SECONDS.
+
+    For read paths only; see the module docstring.
+    """
+    try:
+        key: str | None = get_cache_key(event, user)
+        cached = cache.get(key)
+    except Exception:
+        logger.warning("eligibility_cache_get_failed", exc_info=True)
+        key = cached = None
+
+    if isinstance(cached, EventUserEligibility):
+        ELIGIBILITY_CACHE_LOOKUPS.labels(result="hit").inc()
+        return cached
+    ELIGIBILITY_CACHE_LOOKUPS.labels(result="miss" if key else "error").inc()
+
+    eligibility = EligibilityService(user, event).check_eligibility()
+    if key:
+        try:
+            cache.set(key, eligibility, timeout=CACHE_TTL_SECONDS)
+        except Exception:
+            logger.warning("eligibility_cache_set_failed", exc_info=True)
+    return eligibility
+
+
+def _bump(keys: list[str]) -> None:
+    """Delete tokens now and again after commit.
+
+    Now, so later reads in the same transaction see the write; after commit, because a
+    concurrent request may have re-minted the token and cached the *old* committed state
+    in between (the race ``permission_snapshot.invalidate_my_permissions`` describes).
+    """
+
+    def _delete() -> None:
+        try:
+            cache.delete_many(keys)
+        except Exception:
+            logger.warning("eligibility_cache_bump_failed", exc_info=True)
+
+    _delete()
+    transaction.on_commit(_delete)
+
+
+def bump_event(*event_ids: UUID | str) -> None:
+    """Invalidate every user's cached eligibility for the given events."""
+    _bump([_event_token_key(event_id) for event_id in event_ids])
+
+
+def bump_organization(*organization_ids: UUID | str) -> None:
+    """Invalidate every cached eligibility for the organizations' events."""
+    _bump([_organization_token_key(organization_id) for organization_id in organization_ids])
+
+
+def bump_user(*user_ids: UUID | str) -> None:
+    """Invalidate the users' cached eligibility for every event."""
+    _bump([_user_token_key(user_id) for user_id in user_ids])
@@ -17,10 +17,8 @@ from django.utils.translation import gettext as _
 from events import models
 from events.models import (
     EventInvitationRequest,
-    EventRSVP,
     OrganizationMember,
     OrganizationQuestionnaire,
-    Ticket,
     WhitelistRequest,
 )
 from questionnaires.models import Questionnaire, QuestionnaireEvaluation, QuestionnaireSubmission
@@ -69,7 +67,7 @@ class PrivilegedAccessGate(BaseEligibilityGate):
 
     def check(self) -> EventUserEligibility | None:
         """Check whether a user is staff."""
-        if self.event.organization.owner_id == self.user.id or self.user.id in self.handler.staff_ids:
+        if self.event.organization.owner_id == self.user.id or self.handler.is_staff:
             return EventUserEligibility(allowed=True, tier="staff", event_id=self.event.pk)
         return None
 
@@ -95,7 +93,7 @@ class BlacklistGate(BaseEligibilityGate):
             )
 
         # 2. Active members bypass fuzzy matching (trusted users don't need verification)
-        if self.handler.membership_status_map.get(self.user.id) == OrganizationMember.MembershipStatus.ACTIVE:
+        if self.handler.is_active_member:
             return None
 
         # 3. No fuzzy matches - pass through
@@ -272,7 +270,7 @@ class ApplyDeadlineGate(BaseEligibilityGate):
 
         for org_questionnaire in relevant_questionnaires:
             # Skip if user is member-exempt
-            if org_questionnaire.members_exempt and self.user.id in self.handler.member_ids:
+            if org_questionnaire.members_exempt and self.handler.is_active_member:
                 continue
 
             questionnaire_id = org_questionnaire.questionnaire_id
@@ -358,11 +356,11 @@ class MembershipGate(BaseEligibilityGate):
             return None
 
         # Check if user is an active member
-        if self.user.id in self.handler.member_ids:
+        if self.handler.is_active_member:
             return None
 
         # Check if user has a membership but it's not active
-        membership_status = self.handler.membership_status_map.get(self.user.id)
+        membership_status = self.handler.membership_status
         if membership_status is not None and membership_status != OrganizationMember.MembershipStatus.ACTIVE:
             return EventUserEligibility(
                 allowed=False,
@@ -433,7 +431,7 @@ class QuestionnaireGate(BaseEligibilityGate):
         return [
             oq
             for oq in self.handler.event.organization.relevant_org_questionnaires  # type: ignore[attr-defined]
-            if not (oq.members_exempt and self.user.id in self.handler.member_ids)
+            if not (oq.members_exempt and self.handler.is_active_member)
         ]
 
     def _get_submissions(self, org_questionnaire: OrganizationQuestionnaire) -> list[QuestionnaireSubmission] | None:
@@ -666,20 +664,16 @@ class AvailabilityGate(BaseEligibilityGate):
         return NextStep.JOIN_WAITLIST
 
     def _get_attendee_count(self) -> int:
-        """Count attendees using prefetched data.
+        """Count attendees from the ``attendee_count_for_check`` annotation.
 
         Uses the same counting logic as EventManager._assert_capacity():
         - For ticket events: count non-cancelled tickets (each ticket = one attendee)
         - For RSVP events: count YES RSVPs
 
-        This operates on prefetched data for performance, while _assert_capacity()
-        makes fresh DB queries with locking for race-safety.
+        The count is taken when EligibilityService loads the event, while
+        _assert_capacity() makes fresh DB queries with locking for race-safety.
         """
-        if self.event.requires_ticket:
-            return len(
-                [ticket for ticket in self.event.tickets.all() if ticket.status != Ticket.TicketStatus.CANCELLED]
-            )
-        return len([rsvp for rsvp in self.event.rsvps.all() if rsvp.status == EventRSVP.RsvpStatus.YES])
+        return getattr(self.event, "attendee_count_for_check", 0) or 0
 
     def _pending_offer_count_for_check(self) -> int:
         """Pending unexpired offers, excluding the current user's own active offer.
@@ -9,9 +9,9 @@ from accounts.models import RevelUser
 from events import models
 from events.models import (
     EventRSVP,
-    Ticket,
     TicketTier,
 )
+from events.service import capacity_ledger
 from events.service.waitlist_service import enqueue_waitlist_processing
 
 from .enums import NextStep, Reasons
@@ -24,6 +24,9 @@ class EventManager:
 
     It is responsible to handle RSVP and ticket issuance for events,
     ensuring eligibility checks pass and there are no race conditions.
+
+    Always checks eligibility afresh: it never reads ``events.service.eligibility_cache``,
+    which is for read paths only.
     """
 
     def __init__(self, user: RevelUser, event: models.Event) -> None:
@@ -191,13 +194,8 @@ class EventManager:
         self.event = models.Event.objects.select_for_update().get(pk=self.event.pk)
 
         if use_tickets:
-            # Count all non-cancelled tickets (each ticket represents one attendee)
-            count = (
-                Ticket.objects.select_for_update()
-                .filter(event=self.event)
-                .exclude(status=Ticket.TicketStatus.CANCELLED)
-                .count()
-            )
+            # Non-cancelled tickets (each ticket represents one attendee), off the locked ledger row.
+            count = capacity_ledger.locked_committed_tickets(self.event.pk)
             if not tier:
                 raise ValueError("Tier must be provided for ticket counts.")
             if tier.total_quantity and tier.quantity_sold >= tier.total_quantity:
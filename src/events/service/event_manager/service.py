@@ -1,10 +1,12 @@
 """EligibilityService for checking user eligibility for events."""
 
 import functools
+import typing as t
 import uuid
 from collections import defaultdict
 
-from django.db.models import Count, Exists, OuterRef, Prefetch, Q
+from django.db.models import Case, Count, Exists, IntegerField, OuterRef, Prefetch, Q, QuerySet, Subquery, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from accounts.models import RevelUser
@@ -15,6 +17,7 @@ from events.models import (
     EventRSVP,
     OrganizationMember,
     OrganizationQuestionnaire,
+    OrganizationStaff,
     WhitelistRequest,
 )
 from questionnaires.models import Questionnaire, QuestionnaireSubmission
@@ -23,6 +26,12 @@ from .gates import ELIGIBILITY_GATES, AvailabilityGate, BaseEligibilityGate
 from .types import EventUserEligibility
 
 
+def _count(rows: QuerySet[t.Any]) -> Coalesce:
+    """Correlated ``COUNT(*)`` of ``rows`` belonging to the outer event."""
+    counted = rows.filter(event_id=OuterRef("pk")).order_by().values("event_id").annotate(n=Count("pk")).values("n")
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+
 class EligibilityService:
     """The Eligibility Service Class.
 
@@ -33,6 +42,12 @@ class EligibilityService:
     def __init__(self, user: RevelUser, event: models.Event) -> None:
         """Initialize the service, pre-fetching all required data in a highly optimized way.
 
+        Everything loaded is scoped to ``user``: their invitation, request, membership,
+        staff seat and waitlist entry are fetched with filtered prefetches and ``Exists``
+        / subquery annotations, and event-wide facts (attendee and pending offer counts)
+        come back as counts. The cost therefore doesn't grow with the size of the event
+        or the organization.
+
         This ensures all subsequent checks are performed in-memory without further database hits.
         """
         # First, get the user with all their relevant submissions and evaluations.
@@ -57,7 +72,6 @@ class EligibilityService:
         self.event = (
             models.Event.objects.select_related("organization")
             .prefetch_related(
-                Prefetch("tickets", queryset=models.Ticket.objects.only("id", "event_id", "user_id", "status")),
                 Prefetch(
                     "invitations",
                     queryset=models.EventInvitation.objects.filter(user=user).prefetch_related("tiers"),
@@ -66,46 +80,39 @@ class EligibilityService:
                     "invitation_requests",
                     queryset=EventInvitationRequest.objects.filter(user=user),
                 ),
-                # Use .only("id") to fetch lightweight model instances with only the ID populated.
-                Prefetch(
-                    "organization__staff_members",
-                    queryset=RevelUser.objects.only("id"),
-                    to_attr="staff_members_prefetched",
-                ),
-                Prefetch(
-                    "organization__members",
-                    queryset=RevelUser.objects.filter(
-                        organization_memberships__status=OrganizationMember.MembershipStatus.ACTIVE
-                    ).only("id"),
-                    to_attr="active_members_prefetched",
-                ),
-                Prefetch(
-                    "organization__memberships",
-                    queryset=OrganizationMember.objects.only("id", "user_id", "organization_id", "status"),
-                    to_attr="all_memberships_prefetched",
-                ),
                 Prefetch(
                     "organization__org_questionnaires",
                     queryset=models.OrganizationQuestionnaire.objects.filter(questionnaire_filter).distinct(),
                     to_attr="relevant_org_questionnaires",
                 ),
-                Prefetch(
-                    "rsvps",
-                    queryset=models.EventRSVP.objects.filter(status=EventRSVP.RsvpStatus.YES),
-                ),
                 "ticket_tiers",  # Prefetch ticket tiers for sales window checking
             )
-            .annotate(user_is_waitlisted=Exists(models.EventWaitList.objects.filter(event=OuterRef("pk"), user=user)))
             .annotate(
-                pending_waitlist_offer_count=Count(
-                    "waitlist_offers",
-                    filter=Q(
-                        waitlist_offers__status=models.WaitlistOffer.WaitlistOfferStatus.PENDING,
-                        waitlist_offers__expires_at__gt=timezone.now(),
-                        waitlist_offers__is_cutoff_batch=False,
+                user_is_staff=Exists(
+                    OrganizationStaff.objects.filter(organization_id=OuterRef("organization_id"), user=user)
+                ),
+                user_membership_status=Subquery(
+                    OrganizationMember.objects.filter(organization_id=OuterRef("organization_id"), user=user).values(
+                        "status"
+                    )[:1]
+                ),
+                user_is_waitlisted=Exists(models.EventWaitList.objects.filter(event=OuterRef("pk"), user=user)),
+                # Same counting as EventManager._assert_capacity(): non-cancelled tickets for
+                # ticketed events, YES RSVPs otherwise. CASE only runs the branch it needs.
+                attendee_count_for_check=Case(
+                    When(
+                        requires_ticket=True,
+                        then=_count(models.Ticket.objects.exclude(status=models.Ticket.TicketStatus.CANCELLED)),
                     ),
-                    distinct=True,
-                )
+                    default=_count(models.EventRSVP.objects.filter(status=EventRSVP.RsvpStatus.YES)),
+                ),
+                pending_waitlist_offer_count=_count(
+                    models.WaitlistOffer.objects.filter(
+                        status=models.WaitlistOffer.WaitlistOfferStatus.PENDING,
+                        expires_at__gt=timezone.now(),
+                        is_cutoff_batch=False,
+                    )
+                ),
             )
             .get(pk=event.pk)
         )
@@ -120,14 +127,9 @@ class EligibilityService:
             .first()
         )
 
-        # Create sets of IDs from the prefetched lightweight model instances.
-        self.staff_ids = {staff.id for staff in self.event.organization.staff_members_prefetched}  # type: ignore[attr-defined]
-        self.member_ids = {member.id for member in self.event.organization.active_members_prefetched}  # type: ignore[attr-defined]
-
-        # Build a map of user_id -> membership status for all memberships
-        self.membership_status_map: dict[uuid.UUID, OrganizationMember.MembershipStatus] = {}
-        for membership in self.event.organization.all_memberships_prefetched:  # type: ignore[attr-defined]
-            self.membership_status_map[membership.user_id] = membership.status
+        self.is_staff: bool = self.event.user_is_staff  # type: ignore[attr-defined]
+        self.membership_status: OrganizationMember.MembershipStatus | None = self.event.user_membership_status  # type: ignore[attr-defined]
+        self.is_active_member = self.membership_status == OrganizationMember.MembershipStatus.ACTIVE
 
         self.invitation = self.event.invitations.first()
         self.invitation_request = self.event.invitation_requests.first()
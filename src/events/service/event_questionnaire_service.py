@@ -239,9 +239,6 @@ def aggregate_mc_distributions(
 ) -> list[McQuestionStatSchema]:
     """Compute multiple-choice answer distributions for a questionnaire.
 
-    Public reusable helper — also called from :mod:`polls.service.aggregation`
-    to compute MC stats for poll results.
-
     Args:
         questionnaire_id: Questionnaire whose MC questions should be
             tallied.
@@ -0,0 +1,108 @@
+"""Full-text search for event discovery (the public event list and calendar).
+
+Every event carries a maintained ``search_vector`` (GIN-indexed): its name (weight A),
+organization and series names (B), tag names (C) and the event, series and organization
+descriptions (D). The document is indexed in ``simple`` plus every text-search config
+in ``settings.EVENT_SEARCH_CONFIGS``, so a stemmed query matches in any locale we ship
+without knowing which language an event is written in; queries run in ``simple`` and
+the request language's config.
+
+The vector is kept current by ``events.signals`` — synchronously for event and tag
+writes, through :func:`~events.tasks.refresh_event_search_vectors` for organization and
+series edits — and by the ``fill_missing_event_search_vectors`` sweep for rows still
+NULL (events written by ``bulk_create``, such as generated recurring occurrences, and
+the backfill after the column was added).
+"""
+
+import re
+import typing as t
+from functools import reduce
+from operator import add
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, OuterRef, QuerySet, Subquery
+from django.utils import translation
+
+from common.models import TagAssignment
+from events.models import Event, EventSeries, Organization
+
+# Event fields that feed the document; saves touching none of them keep the vector.
+DOCUMENT_FIELDS = frozenset({"name", "description", "organization", "event_series"})
+# Organization / series fields that feed their events' documents.
+RELATED_DOCUMENT_FIELDS = frozenset({"name", "description"})
+
+_WORD = re.compile(r"\w+")
+
+
+def _search_configs() -> list[str]:
+    return ["simple", *dict.fromkeys(settings.EVENT_SEARCH_CONFIGS.values())]
+
+
+def _document() -> SearchVector:
+    organization = Organization.objects.filter(pk=OuterRef("organization_id"))
+    series = EventSeries.objects.filter(pk=OuterRef("event_series_id"))
+    tags = (
+        TagAssignment.objects.filter(content_type=ContentType.objects.get_for_model(Event), object_id=OuterRef("pk"))
+        .order_by()
+        .values("object_id")
+        .annotate(names=StringAgg("tag__name", delimiter=" "))
+        .values("names")
+    )
+    return reduce(
+        add,
+        (
+            SearchVector("name", weight="A", config=config)
+            + SearchVector(
+                Subquery(organization.values("name")), Subquery(series.values("name")), weight="B", config=config
+            )
+            + SearchVector(Subquery(tags), weight="C", config=config)
+            + SearchVector(
+                "description",
+                Subquery(series.values("description")),
+                Subquery(organization.values("description")),
+                weight="D",
+                config=config,
+            )
+            for config in _search_configs()
+        ),
+    )
+
+
+def update_search_vectors(events: QuerySet[Event]) -> int:
+    """Recompute the search document of every event in ``events`` in one UPDATE.
+
+    Returns:
+        The number of events updated.
+    """
+    return events.order_by().update(search_vector=_document())
+
+
+def build_search_query(term: str) -> SearchQuery | None:
+    """Turn a user's search term into a prefix-matching tsquery, or None if it has no words.
+
+    Each word matches as a prefix (``conf`` finds "Conference"), all words must match,
+    and the term is parsed both unstemmed and in the request language's config.
+    """
+    words = _WORD.findall(term)
+    if not words:
+        return None
+    raw = " & ".join(f"{word}:*" for word in words)
+    query = SearchQuery(raw, search_type="raw", config="simple")
+    language = (translation.get_language() or settings.LANGUAGE_CODE).split("-")[0]
+    if config := settings.EVENT_SEARCH_CONFIGS.get(language):
+        query |= SearchQuery(raw, search_type="raw", config=config)
+    return query
+
+
+def filter_by_search(events: QuerySet[Event], query: SearchQuery) -> QuerySet[Event]:
+    """Events whose search document matches ``query`` (served by the GIN index)."""
+    return events.filter(search_vector=query)
+
+
+def order_by_rank(events: QuerySet[Event], query: SearchQuery) -> QuerySet[Event]:
+    """Best matches first; the queryset's existing ordering breaks ties."""
+    then: t.Sequence[t.Any] = events.query.order_by or Event._meta.ordering
+    return events.annotate(search_rank=SearchRank(F("search_vector"), query)).order_by("-search_rank", *then)
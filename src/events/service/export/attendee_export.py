@@ -1,110 +1,100 @@
-"""Generate Excel export of event attendee list."""
+"""Generate Excel export of event attendee list.
+
+The workbook is streamed: the summary is aggregated in the database, attendee rows are
+read in chunks into a write-only sheet, and the file is spooled to disk and uploaded
+without ever being held in memory whole (see ``complete_streamed_export``).
+"""
 
 import typing as t
-from io import BytesIO
 from uuid import UUID
 
 import structlog
+from django.db.models import Exists, OuterRef, Q, QuerySet
 from openpyxl import Workbook
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
+from accounts.models import RevelUser
 from common.models import FileExport
-from common.service.export_service import complete_export, fail_export, start_export
+from common.service.export_service import complete_streamed_export, fail_export, start_export
 from events.models import Event, EventRSVP, Ticket
 
-from .formatting import auto_fit_columns, compute_pronoun_distribution, style_header_row, style_summary_sheet
+from .formatting import (
+    STREAM_CHUNK_SIZE,
+    pronoun_distribution,
+    set_auto_filter,
+    write_header_row,
+    write_summary_rows,
+)
 
 logger = structlog.get_logger(__name__)
 
+ATTENDEE_TICKET_STATUSES = (Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.CHECKED_IN)
+
 
 def generate_attendee_export(export_id: UUID) -> None:
     """Build an Excel workbook with attendee data for an event."""
     export = FileExport.objects.select_related("requested_by").get(pk=export_id)
     start_export(export)
     try:
-        file_bytes = _build_attendee_workbook(export)
-        complete_export(export, file_bytes, f"attendee_export_{export_id}.xlsx")
-        logger.info("attendee_export_completed", export_id=str(export_id))
+        event_id = UUID(export.parameters["event_id"])
+        event = Event.objects.select_related("venue", "organization").get(pk=event_id)
+        complete_streamed_export(
+            export,
+            f"attendee_export_{export_id}.xlsx",
+            lambda file: _write_attendee_workbook(event, file),
+        )
+        logger.info("attendee_export_completed", export_id=str(export_id), **export.metadata)
     except Exception as e:
         fail_export(export, f"Export failed: {e}")
         logger.exception("attendee_export_failed", export_id=str(export_id))
         raise
 
 
-def _build_attendee_workbook(export: FileExport) -> bytes:
-    """Build the Excel workbook and return raw bytes."""
-    event_id = UUID(export.parameters["event_id"])
-    event = Event.objects.select_related("venue", "organization").get(pk=event_id)
-
-    tickets = list(
-        Ticket.objects.filter(
-            event=event,
-            status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.CHECKED_IN],
-        ).select_related("user", "tier", "seat", "seat__sector", "payment")
-    )
-
-    rsvps = list(EventRSVP.objects.filter(event=event, status=EventRSVP.RsvpStatus.YES).select_related("user"))
-
-    ticket_checked_in = sum(1 for tk in tickets if tk.status == Ticket.TicketStatus.CHECKED_IN)
+def _write_attendee_workbook(event: Event, file: t.IO[bytes]) -> None:
+    """Stream the attendee workbook for ``event`` into ``file``."""
+    tickets = Ticket.objects.filter(event=event, status__in=ATTENDEE_TICKET_STATUSES)
+    rsvps = EventRSVP.objects.filter(event=event, status=EventRSVP.RsvpStatus.YES)
 
-    wb = Workbook()
-    _write_summary_sheet(wb, event, tickets, rsvps, ticket_checked_in)
-    _write_attendees_sheet(wb, tickets, rsvps)
-
-    buf = BytesIO()
-    wb.save(buf)
-    file_bytes = buf.getvalue()
-    buf.close()
+    wb = Workbook(write_only=True)
+    _write_summary_sheet(wb.create_sheet("Summary"), event, tickets, rsvps)
+    _write_attendees_sheet(wb.create_sheet("Attendees"), tickets, rsvps)
+    wb.save(file)
     wb.close()
-    return file_bytes
 
 
 def _write_summary_sheet(
-    wb: Workbook,
+    ws: WriteOnlyWorksheet,
     event: Event,
-    tickets: list[Ticket],
-    rsvps: list[EventRSVP],
-    ticket_checked_in: int,
+    tickets: QuerySet[Ticket],
+    rsvps: QuerySet[EventRSVP],
 ) -> None:
-    """Populate the Summary sheet."""
-    ws = wb.active
-    if ws is None:
-        ws = wb.create_sheet()
-    ws.title = "Summary"
-
-    # Pronoun distribution (deduplicated by user)
-    def _user_pairs() -> t.Iterator[tuple[UUID, t.Any]]:
-        for ticket in tickets:
-            if ticket.user:
-                yield ticket.user_id, ticket.user
-        for rsvp in rsvps:
-            if rsvp.user:
-                yield rsvp.user_id, rsvp.user
-
-    pronoun_stats = compute_pronoun_distribution(_user_pairs())
-    sorted_pronouns = pronoun_stats.sorted_pronouns
-    total_with_pronouns = pronoun_stats.total_with
-    total_without_pronouns = pronoun_stats.total_without
+    """Populate the Summary sheet from database aggregates."""
+    ticket_count = tickets.count()
+    rsvp_count = rsvps.count()
+    ticket_checked_in = tickets.filter(status=Ticket.TicketStatus.CHECKED_IN).count()
+
+    # Pronoun distribution over distinct attendees (a user may hold a ticket and an RSVP)
+    attendees = RevelUser.objects.filter(
+        Q(Exists(tickets.filter(user_id=OuterRef("pk")))) | Q(Exists(rsvps.filter(user_id=OuterRef("pk"))))
+    )
+    pronoun_stats = pronoun_distribution(attendees)
 
     summary_rows: list[tuple[str, t.Any]] = [
         ("Event", event.name),
         ("Date", event.start.isoformat() if event.start else "N/A"),
         ("Venue", event.venue.name if event.venue else "N/A"),
         ("Organization", event.organization.name),
-        ("Total attendees", len(tickets) + len(rsvps)),
-        ("Tickets", len(tickets)),
-        ("RSVPs", len(rsvps)),
+        ("Total attendees", ticket_count + rsvp_count),
+        ("Tickets", ticket_count),
+        ("RSVPs", rsvp_count),
         ("Checked in", ticket_checked_in),
         ("", ""),
         ("Pronoun Distribution", ""),
-        ("Total with pronouns", total_with_pronouns),
-        ("Total without pronouns", total_without_pronouns),
+        ("Total with pronouns", pronoun_stats.total_with),
+        ("Total without pronouns", pronoun_stats.total_without),
     ]
-    for row in summary_rows:
-        ws.append(row)
-    for pronouns, count in sorted_pronouns:
-        ws.append((f"  {pronouns}", count))
-
-    style_summary_sheet(ws)
+    summary_rows += [(f"  {pronouns}", count) for pronouns, count in pronoun_stats.sorted_pronouns]
+    write_summary_rows(ws, summary_rows)
 
 
 _STATUS_DISPLAY: dict[str, str] = {
@@ -121,26 +111,31 @@ _RSVP_STATUS_DISPLAY: dict[str, str] = {
 }
 
 
-def _write_attendees_sheet(wb: Workbook, tickets: list[Ticket], rsvps: list[EventRSVP]) -> None:
-    """Populate the Attendees sheet."""
-    ws = wb.create_sheet("Attendees")
-    headers = [
-        "Name",
-        "Email",
-        "Pronouns",
-        "Type",
-        "RSVP Status",
-        "Ticket Tier",
-        "Ticket Status",
-        "Checked In",
-        "Checked In At",
-        "Guest Name",
-        "Seat",
-        "Payment",
-    ]
-    ws.append(headers)
+_ATTENDEE_HEADERS = [
+    "Name",
+    "Email",
+    "Pronouns",
+    "Type",
+    "RSVP Status",
+    "Ticket Tier",
+    "Ticket Status",
+    "Checked In",
+    "Checked In At",
+    "Guest Name",
+    "Seat",
+    "Payment",
+]
+
+_ATTENDEE_WIDTHS = {"Name": 28, "Email": 34, "Pronouns": 14, "Ticket Tier": 24, "Checked In At": 28, "Guest Name": 24}
+
+
+def _write_attendees_sheet(ws: WriteOnlyWorksheet, tickets: QuerySet[Ticket], rsvps: QuerySet[EventRSVP]) -> None:
+    """Populate the Attendees sheet, streaming tickets then RSVPs in chunks."""
+    write_header_row(ws, _ATTENDEE_HEADERS, _ATTENDEE_WIDTHS)
+    rows = 1
 
-    for ticket in tickets:
+    ticket_rows = tickets.select_related("user", "tier", "seat", "seat__sector", "payment").order_by("created_at", "pk")
+    for ticket in ticket_rows.iterator(chunk_size=STREAM_CHUNK_SIZE):
         payment = getattr(ticket, "payment", None)
         seat_label = ticket.seat.label if ticket.seat else ""
         is_checked_in = ticket.status == Ticket.TicketStatus.CHECKED_IN
@@ -160,8 +155,9 @@ def _write_attendees_sheet(wb: Workbook, tickets: list[Ticket], rsvps: list[Even
                 payment.status if payment else (ticket.tier.payment_method if ticket.tier else ""),
             ]
         )
+        rows += 1
 
-    for rsvp in rsvps:
+    for rsvp in rsvps.select_related("user").order_by("created_at", "pk").iterator(chunk_size=STREAM_CHUNK_SIZE):
         ws.append(
             [
                 rsvp.user.get_full_name() if rsvp.user else "",
@@ -178,6 +174,6 @@ def _write_attendees_sheet(wb: Workbook, tickets: list[Ticket], rsvps: list[Even
                 "",
             ]
         )
+        rows += 1
 
-    style_header_row(ws)
-    auto_fit_columns(ws)
+    set_auto_filter(ws, len(_ATTENDEE_HEADERS), rows)
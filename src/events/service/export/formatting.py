@@ -1,15 +1,27 @@
-"""Shared Excel formatting utilities for export services."""
+"""Shared Excel formatting utilities for export services.
+
+Attendee and questionnaire exports stream: their write-only worksheets flush each row
+as it is appended, so they are fed from chunked querysets (``STREAM_CHUNK_SIZE``) and
+styled up front with :func:`write_header_row` / :func:`write_summary_rows`. The
+in-memory helpers (:func:`style_header_row`, :func:`auto_fit_columns`) serve the
+small workbooks built whole, such as the revenue report.
+"""
 
 import typing as t
-from uuid import UUID
 
+from django.db.models import Count, QuerySet
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.worksheet import Worksheet
 
 if t.TYPE_CHECKING:
     from accounts.models import RevelUser
 
+# Rows fetched per round trip when streaming a queryset into a sheet.
+STREAM_CHUNK_SIZE = 1000
+
 
 class PronounStats(t.NamedTuple):
     """Result of computing pronoun distribution.
@@ -25,23 +37,20 @@ class PronounStats(t.NamedTuple):
     total_without: int
 
 
-def compute_pronoun_distribution(users: t.Iterable[tuple[UUID, "RevelUser"]]) -> PronounStats:
-    """Compute pronoun distribution from an iterable of (user_id, user) pairs.
+def pronoun_distribution(users: "QuerySet[RevelUser]") -> PronounStats:
+    """Compute the pronoun distribution of ``users`` with one GROUP BY in the database.
 
-    Deduplicates by user_id. Users should already be resolved (not None).
+    ``users`` must not repeat a user: filter with ``Exists`` rather than a join.
     """
-    pronoun_counts: dict[str, int] = {}
-    seen_user_ids: set[UUID] = set()
-    for user_id, user in users:
-        if user_id not in seen_user_ids:
-            seen_user_ids.add(user_id)
-            key = user.pronouns or ""
-            pronoun_counts[key] = pronoun_counts.get(key, 0) + 1
-
-    total_without = pronoun_counts.pop("", 0)
-    total_with = sum(pronoun_counts.values())
-    sorted_pronouns = sorted(pronoun_counts.items(), key=lambda x: x[1], reverse=True)
-    return PronounStats(sorted_pronouns, total_with, total_without)
+    rows = users.order_by().values("pronouns").annotate(count=Count("id")).order_by("-count", "pronouns")
+    sorted_pronouns: list[tuple[str, int]] = []
+    total_without = 0
+    for row in rows:
+        if row["pronouns"]:
+            sorted_pronouns.append((row["pronouns"], row["count"]))
+        else:
+            total_without = row["count"]
+    return PronounStats(sorted_pronouns, sum(count for _, count in sorted_pronouns), total_without)
 
 
 HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
@@ -87,3 +96,43 @@ def style_summary_sheet(ws: Worksheet) -> None:
     # Set reasonable widths for label/value columns
     ws.column_dimensions["A"].width = 30
     ws.column_dimensions["B"].width = 40
+
+
+def write_summary_rows(ws: WriteOnlyWorksheet, rows: t.Iterable[tuple[str, t.Any]]) -> None:
+    """Write label/value rows to a write-only summary sheet: bold labels, fixed widths."""
+    ws.column_dimensions["A"].width = 30
+    ws.column_dimensions["B"].width = 40
+    for label, value in rows:
+        label_cell = WriteOnlyCell(ws, value=label)
+        if label:
+            label_cell.font = LABEL_FONT
+        ws.append([label_cell, value])
+
+
+def write_header_row(
+    ws: WriteOnlyWorksheet, headers: t.Sequence[str], widths: t.Mapping[str, int] | None = None
+) -> None:
+    """Write the styled header row of a write-only sheet and size its columns.
+
+    Rows are flushed as they are appended, so columns cannot be fitted to their content
+    afterwards: a column is ``widths[header]`` wide, or as wide as its header, clamped
+    to [MIN_WIDTH, MAX_WIDTH]. Must be called before any other row is appended.
+    """
+    for col_idx, header in enumerate(headers, 1):
+        width = (widths or {}).get(header, len(header) + 3)
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(max(width, MIN_WIDTH), MAX_WIDTH)
+    ws.row_dimensions[1].height = 30
+
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = HEADER_ALIGNMENT
+        cells.append(cell)
+    ws.append(cells)
+
+
+def set_auto_filter(ws: WriteOnlyWorksheet, column_count: int, row_count: int) -> None:
+    """Filter a streamed sheet's header over its ``row_count`` rows (header included)."""
+    ws.auto_filter.ref = f"A1:{get_column_letter(max(column_count, 1))}{max(row_count, 1)}"
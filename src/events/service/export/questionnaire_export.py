@@ -1,16 +1,21 @@
-"""Generate Excel export of questionnaire submissions."""
+"""Generate Excel export of questionnaire submissions.
+
+Streamed like the attendee export: summary statistics are aggregated in the database,
+submissions (with their answers prefetched per chunk) are written to a write-only
+sheet, and the spooled file is uploaded by streaming.
+"""
 
 import typing as t
-from io import BytesIO
 from uuid import UUID
 
 import structlog
-from django.db.models import Count, Q, QuerySet
+from django.db.models import Avg, Count, Exists, Max, Min, OuterRef, Q, QuerySet
 from openpyxl import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
+from accounts.models import RevelUser
 from common.models import FileExport
-from common.service.export_service import complete_export, fail_export, start_export
+from common.service.export_service import complete_streamed_export, fail_export, start_export
 from events.models import Event, EventQuestionnaireSubmission
 from questionnaires.models import (
     FileUploadQuestion,
@@ -21,7 +26,13 @@ from questionnaires.models import (
     QuestionnaireSubmission,
 )
 
-from .formatting import auto_fit_columns, compute_pronoun_distribution, style_header_row, style_summary_sheet
+from .formatting import (
+    STREAM_CHUNK_SIZE,
+    pronoun_distribution,
+    set_auto_filter,
+    write_header_row,
+    write_summary_rows,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -46,30 +57,17 @@ def generate_questionnaire_export(export_id: UUID) -> None:
         event_series_id = _optional_uuid(export.parameters.get("event_series_id"))
 
         base_qs = _build_submission_queryset(questionnaire_id, event_id, event_series_id)
-
-        submissions = list(
-            base_qs.select_related("user", "evaluation").prefetch_related(
-                "multiplechoiceanswer_answers__question",
-                "multiplechoiceanswer_answers__option",
-                "freetextanswer_answers__question",
-                "fileuploadanswer_answers__question",
-                "fileuploadanswer_answers__files",
-            )
-        )
-
         all_questions, mc_options = _load_question_columns(questionnaire_id)
 
-        wb = Workbook()
-        _write_summary_sheet(wb, base_qs, submissions)
-        _write_submissions_sheet(wb, submissions, all_questions, mc_options)
+        def write(file: t.IO[bytes]) -> None:
+            wb = Workbook(write_only=True)
+            _write_summary_sheet(wb.create_sheet("Summary"), base_qs)
+            _write_submissions_sheet(wb.create_sheet("Submissions"), base_qs, all_questions, mc_options)
+            wb.save(file)
+            wb.close()
 
-        buf = BytesIO()
-        wb.save(buf)
-        file_bytes = buf.getvalue()
-        buf.close()
-        wb.close()
-        complete_export(export, file_bytes, f"questionnaire_export_{export_id}.xlsx")
-        logger.info("questionnaire_export_completed", export_id=str(export_id))
+        complete_streamed_export(export, f"questionnaire_export_{export_id}.xlsx", write)
+        logger.info("questionnaire_export_completed", export_id=str(export_id), **export.metadata)
 
     except Exception as e:
         fail_export(export, f"Export failed: {e}")
@@ -155,15 +153,8 @@ _EVAL_STATUS_DISPLAY: dict[str, str] = {
 }
 
 
-def _write_summary_sheet(
-    wb: Workbook,
-    base_qs: QuerySet[QuestionnaireSubmission],
-    submissions: list[QuestionnaireSubmission],
-) -> None:
-    """Populate the Summary sheet."""
-    ws: Worksheet = wb.active  # type: ignore[assignment]
-    ws.title = "Summary"
-
+def _write_summary_sheet(ws: WriteOnlyWorksheet, base_qs: QuerySet[QuestionnaireSubmission]) -> None:
+    """Populate the Summary sheet from database aggregates."""
     EvalStatus = QuestionnaireEvaluation.QuestionnaireEvaluationStatus
     stats = base_qs.aggregate(
         total=Count("id"),
@@ -172,54 +163,48 @@ def _write_summary_sheet(
         rejected=Count("id", filter=Q(evaluation__status=EvalStatus.REJECTED)),
         pending_review=Count("id", filter=Q(evaluation__status=EvalStatus.PENDING_REVIEW)),
         not_evaluated=Count("id", filter=Q(evaluation__isnull=True)),
+        avg_score=Avg("evaluation__score"),
+        min_score=Min("evaluation__score"),
+        max_score=Max("evaluation__score"),
     )
 
-    scores = [
-        float(eval_obj.score)
-        for s in submissions
-        if (eval_obj := getattr(s, "evaluation", None)) is not None and eval_obj.score is not None
-    ]
-    avg_score = sum(scores) / len(scores) if scores else None
-    min_score = min(scores) if scores else None
-    max_score = max(scores) if scores else None
+    def _score(value: t.Any) -> t.Any:
+        return round(float(value), 2) if value is not None else "N/A"
 
-    # Pronoun distribution (computed in-memory from prefetched users)
-    pronoun_stats = compute_pronoun_distribution((sub.user_id, sub.user) for sub in submissions if sub.user)
-    sorted_pronouns = pronoun_stats.sorted_pronouns
-    total_with_pronouns = pronoun_stats.total_with
-    total_without_pronouns = pronoun_stats.total_without
+    submitters = RevelUser.objects.filter(Exists(base_qs.filter(user_id=OuterRef("pk"))))
+    pronoun_stats = pronoun_distribution(submitters)
 
-    for label, value in [
+    summary_rows: list[tuple[str, t.Any]] = [
         ("Total submissions", stats["total"]),
         ("Unique users", stats["unique_users"]),
         ("Approved", stats["approved"]),
         ("Rejected", stats["rejected"]),
         ("Pending review", stats["pending_review"]),
         ("Not evaluated", stats["not_evaluated"]),
-        ("Average score", round(avg_score, 2) if avg_score is not None else "N/A"),
-        ("Min score", round(min_score, 2) if min_score is not None else "N/A"),
-        ("Max score", round(max_score, 2) if max_score is not None else "N/A"),
+        ("Average score", _score(stats["avg_score"])),
+        ("Min score", _score(stats["min_score"])),
+        ("Max score", _score(stats["max_score"])),
         ("", ""),
         ("Pronoun Distribution", ""),
-        ("Total with pronouns", total_with_pronouns),
-        ("Total without pronouns", total_without_pronouns),
-    ]:
-        ws.append((label, value))
+        ("Total with pronouns", pronoun_stats.total_with),
+        ("Total without pronouns", pronoun_stats.total_without),
+    ]
+    summary_rows += [(f"  {pronouns}", count) for pronouns, count in pronoun_stats.sorted_pronouns]
+    write_summary_rows(ws, summary_rows)
 
-    for pronouns, count in sorted_pronouns:
-        ws.append((f"  {pronouns}", count))
 
-    style_summary_sheet(ws)
+_SUBMISSION_WIDTHS = {"Email": 34, "Name": 28, "Submitted At": 28, "Evaluator Comments": 40, "Source Event": 30}
+# Answers can be long; question columns get this width unless the header is wider.
+_ANSWER_WIDTH = 30
 
 
 def _write_submissions_sheet(
-    wb: Workbook,
-    submissions: list[QuestionnaireSubmission],
+    ws: WriteOnlyWorksheet,
+    base_qs: QuerySet[QuestionnaireSubmission],
     all_questions: list[QuestionColumn],
     mc_options: dict[UUID, str],
 ) -> None:
-    """Populate the Submissions sheet."""
-    ws = wb.create_sheet("Submissions")
+    """Populate the Submissions sheet, streaming submissions with their answers in chunks."""
     headers = [
         "Email",
         "Name",
@@ -229,9 +214,18 @@ def _write_submissions_sheet(
         "Evaluator Comments",
         "Source Event",
     ] + [q.header_text for q in all_questions]
-    ws.append(headers)
-
-    for sub in submissions:
+    widths = _SUBMISSION_WIDTHS | {q.header_text: max(_ANSWER_WIDTH, len(q.header_text) + 3) for q in all_questions}
+    write_header_row(ws, headers, widths)
+    rows = 1
+
+    submissions = base_qs.select_related("user", "evaluation").prefetch_related(
+        "multiplechoiceanswer_answers__question",
+        "multiplechoiceanswer_answers__option",
+        "freetextanswer_answers__question",
+        "fileuploadanswer_answers__question",
+        "fileuploadanswer_answers__files",
+    )
+    for sub in submissions.iterator(chunk_size=STREAM_CHUNK_SIZE):
         eval_obj = getattr(sub, "evaluation", None)
         eval_status = _EVAL_STATUS_DISPLAY.get(eval_obj.status, eval_obj.status) if eval_obj else "Not Evaluated"
 
@@ -269,9 +263,9 @@ def _write_submissions_sheet(
                 row.append("; ".join(fu_answers.get(q.question_id, [])))
 
         ws.append(row)
+        rows += 1
 
-    style_header_row(ws)
-    auto_fit_columns(ws)
+    set_auto_filter(ws, len(headers), rows)
 
 
 def _optional_uuid(value: t.Any) -> UUID | None:
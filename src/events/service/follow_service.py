@@ -1,17 +1,20 @@
 """Service functions for following organizations and event series."""
 
 import typing as t
+from collections import defaultdict
+from itertools import batched
 from uuid import UUID
 
 from django.db import IntegrityError, transaction
-from django.db.models import Model, QuerySet
+from django.db.models import CharField, Model, QuerySet, Value
 from ninja.errors import HttpError
 
 from accounts.models import RevelUser
 from common.models import SiteSettings
-from events.models import EventSeries, Organization, OrganizationMember
+from events.models import EventSeries, Organization, OrganizationMember, OrganizationStaff
 from events.models.follow import EventSeriesFollow, OrganizationFollow
 from notifications.enums import NotificationType
+from notifications.service.dispatcher import NOTIFY_CHUNK_SIZE
 from notifications.service.eligibility import get_staff_for_notification
 from notifications.signals import notification_requested
 
@@ -371,14 +374,15 @@ def is_following_event_series(user: RevelUser, event_series: EventSeries) -> boo
     return EventSeriesFollow.objects.filter(user=user, event_series=event_series, is_archived=False).exists()
 
 
-def get_followers_for_new_event_notification(
+def new_event_follower_audience(
     organization: Organization,
     event_series: EventSeries | None = None,
-) -> t.Iterator[tuple[RevelUser, NotificationType]]:
-    """Get users to notify about a new event, yielding (user, notification_type) pairs.
+) -> QuerySet[t.Any, tuple[UUID, str]]:
+    """``(user_id, notification_type)`` for every follower to tell about a new event.
 
-    This function returns followers who have opted in to receive new event notifications.
-    It yields each user only once, prioritizing series follows over org follows.
+    One SQL statement: series followers, UNION ALL org followers who do not follow the
+    series (series follows take priority), each minus the users who already get
+    EVENT_OPEN or must not hear from the organization.
 
     IMPORTANT: Members are excluded because they already receive EVENT_OPEN notifications
     via the membership-based notification system. This prevents duplicate notifications.
@@ -387,56 +391,89 @@ def get_followers_for_new_event_notification(
         organization: The organization that created the event
         event_series: The event series (if the event belongs to one)
 
-    Yields:
-        Tuples of (user, notification_type) to notify
+    Returns:
+        Unordered queryset of ``(user_id, notification_type)`` rows, one per user
     """
-    # Build exclusion set: users who already get EVENT_OPEN or are banned.
-    # 1. ACTIVE/PAUSED/BANNED members (ACTIVE/PAUSED get EVENT_OPEN, BANNED get nothing)
-    #    CANCELLED members are NOT excluded — they left voluntarily but may still follow.
-    excluded_user_ids: set[UUID] = set(
-        OrganizationMember.objects.filter(
-            organization=organization,
-        )
+    # Users who already get EVENT_OPEN or are banned:
+    # ACTIVE/PAUSED/BANNED members (CANCELLED members left voluntarily but may still
+    # follow), staff (staff path) and the owner (owner path).
+    members = (
+        OrganizationMember.objects.filter(organization=organization)
         .exclude(status=OrganizationMember.MembershipStatus.CANCELLED)
-        .values_list("user_id", flat=True)
+        .values("user_id")
+    )
+    staff = OrganizationStaff.objects.filter(organization=organization).values("user_id")
+
+    def audience(follows: QuerySet[t.Any], notification_type: NotificationType) -> QuerySet[t.Any, tuple[UUID, str]]:
+        return (
+            follows.filter(is_archived=False, notify_new_events=True)
+            .exclude(user_id=organization.owner_id)
+            .exclude(user_id__in=members)
+            .exclude(user_id__in=staff)
+            .annotate(notification_type=Value(notification_type.value, output_field=CharField()))
+            .values_list("user_id", "notification_type")
+            .order_by()
+        )
+
+    org_follows = OrganizationFollow.objects.filter(organization=organization)
+    if event_series is None:
+        return audience(org_follows, NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG)
+
+    series_follows = EventSeriesFollow.objects.filter(event_series=event_series)
+    series_followers = series_follows.filter(is_archived=False, notify_new_events=True).values("user_id")
+    return audience(series_follows, NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES).union(
+        audience(
+            org_follows.exclude(user_id__in=series_followers),
+            NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG,
+        ),
+        all=True,
     )
 
-    # 2. Staff members (get EVENT_OPEN via staff path)
-    excluded_user_ids.update(organization.staff_members.values_list("id", flat=True))
-
-    # 3. Organization owner (gets EVENT_OPEN via owner path)
-    excluded_user_ids.add(organization.owner_id)
-
-    notified_user_ids: set[UUID] = set()
-
-    # First, notify series followers (if event is in a series)
-    if event_series:
-        series_followers = EventSeriesFollow.objects.filter(
-            event_series=event_series,
-            is_archived=False,
-            notify_new_events=True,
-        ).select_related("user")
-
-        for follow in series_followers:
-            # Skip staff/owner/active/paused/banned members — they already
-            # get EVENT_OPEN or should not receive any org notifications.
-            if follow.user_id in excluded_user_ids:
-                continue
-            if follow.user_id not in notified_user_ids:
-                notified_user_ids.add(follow.user_id)
-                yield follow.user, NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES
-
-    # Then, notify org followers (excluding those already notified via series)
-    org_followers = OrganizationFollow.objects.filter(
-        organization=organization,
-        is_archived=False,
-        notify_new_events=True,
-    ).select_related("user")
-
-    for org_follow in org_followers:
-        # Skip staff/owner/active/paused/banned members
-        if org_follow.user_id in excluded_user_ids:
-            continue
-        if org_follow.user_id not in notified_user_ids:
-            notified_user_ids.add(org_follow.user_id)
-            yield org_follow.user, NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
+
+def iter_new_event_follower_chunks(
+    organization: Organization,
+    event_series: EventSeries | None = None,
+    *,
+    chunk_size: int = NOTIFY_CHUNK_SIZE,
+) -> t.Iterator[dict[NotificationType, list[UUID]]]:
+    """Stream ``new_event_follower_audience`` in chunks, each grouped by notification type.
+
+    Args:
+        organization: The organization that created the event
+        event_series: The event series (if the event belongs to one)
+        chunk_size: Rows per chunk
+
+    Yields:
+        Mapping of notification type to the user ids in the chunk that get it
+    """
+    rows = new_event_follower_audience(organization, event_series).iterator(chunk_size=chunk_size)
+    for chunk in batched(rows, chunk_size):
+        by_type: dict[NotificationType, list[UUID]] = defaultdict(list)
+        for user_id, notification_type in chunk:
+            by_type[NotificationType(notification_type)].append(user_id)
+        yield by_type
+
+
+def get_followers_for_new_event_notification(
+    organization: Organization,
+    event_series: EventSeries | None = None,
+) -> t.Iterator[tuple[RevelUser, NotificationType]]:
+    """Get users to notify about a new event, yielding (user, notification_type) pairs.
+
+    This function returns followers who have opted in to receive new event notifications.
+    It yields each user only once, prioritizing series follows over org follows. The
+    audience comes from ``new_event_follower_audience``; users are loaded per chunk.
+    Bulk senders should stream ids with ``iter_new_event_follower_chunks`` instead.
+
+    Args:
+        organization: The organization that created the event
+        event_series: The event series (if the event belongs to one)
+
+    Yields:
+        Tuples of (user, notification_type) to notify
+    """
+    for by_type in iter_new_event_follower_chunks(organization, event_series):
+        users = RevelUser.objects.in_bulk([user_id for user_ids in by_type.values() for user_id in user_ids])
+        for notification_type, user_ids in by_type.items():
+            for user_id in user_ids:
+                yield users[user_id], notification_type
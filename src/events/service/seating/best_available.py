@@ -6,6 +6,7 @@ held/blocked seats) and locks only the returned seats (optimistic pick).
 
 import dataclasses
 import itertools
+import math
 import random
 import uuid
 
@@ -48,14 +49,57 @@ def _placement_score(run: list[CandidateSeat], start: int, quantity: int, row_le
     Among same-row equally-central placements it avoids stranding a single leftover
     seat on either side of the run (keeps the hall sellable late in the on-sale).
     """
-    seats = run[start : start + quantity]
-    row_order = seats[0].row_order
-    midpoint = (seats[0].adjacency_index + seats[-1].adjacency_index) / 2
+    first, last = run[start], run[start + quantity - 1]
+    midpoint = (first.adjacency_index + last.adjacency_index) / 2
     centrality = abs(midpoint - (row_len_hint - 1) / 2)
     leftover_left = start
     leftover_right = len(run) - (start + quantity)
     fragmentation = (1 if leftover_left == 1 else 0) + (1 if leftover_right == 1 else 0)
-    return (row_order, centrality, fragmentation, seats[0].sector_display_order)
+    return (first.row_order, centrality, fragmentation, first.sector_display_order)
+
+
+def _front_row_runs(
+    rows: dict[tuple[int, int, str | None], list[CandidateSeat]], quantity: int
+) -> list[tuple[tuple[int, int, str | None], list[CandidateSeat]]]:
+    """Runs long enough for the party in the front-most row_order that has one.
+
+    Rows are visited in row_order and the walk stops at the first row_order that
+    can fit the party: row_order is the dominant score key, so no placement further
+    back can ever win or join the near-equal set. Rows sharing that row_order keep
+    their insertion order (stable sort), as do runs within a row.
+    """
+    front_order: int | None = None
+    front: list[tuple[tuple[int, int, str | None], list[CandidateSeat]]] = []
+    for key, seats in sorted(rows.items(), key=lambda item: item[0][1]):
+        if front_order is not None and key[1] != front_order:
+            break
+        runs = [run for run in _contiguous_runs(seats) if len(run) >= quantity]
+        if runs:
+            front_order = key[1]
+            front.extend((key, run) for run in runs)
+    return front
+
+
+def _ideal_start(run: list[CandidateSeat], quantity: int, row_length: int) -> float:
+    """Start offset (within ``run``) whose placement midpoint sits on the row center.
+
+    Adjacency indexes are consecutive inside a run, so a placement's midpoint is
+    ``run[0].adjacency_index + start + (quantity - 1) / 2`` and its centrality is
+    simply ``abs(start - ideal)``.
+    """
+    return (row_length - quantity) / 2 - run[0].adjacency_index
+
+
+def _centrality_floor(run: list[CandidateSeat], quantity: int, row_length: int) -> float:
+    """Lower bound on the centrality of any placement in ``run``."""
+    ideal = _ideal_start(run, quantity, row_length)
+    return abs(min(max(ideal, 0), len(run) - quantity) - ideal)
+
+
+def _starts_within(run: list[CandidateSeat], quantity: int, row_length: int, slack: float) -> range:
+    """Start offsets in ``run`` whose centrality is at most ``slack``."""
+    ideal = _ideal_start(run, quantity, row_length)
+    return range(max(0, math.ceil(ideal - slack)), min(len(run) - quantity, math.floor(ideal + slack)) + 1)
 
 
 def _pick_general(pool: list[CandidateSeat], quantity: int, seed: int | None) -> list[uuid.UUID]:
@@ -67,17 +111,21 @@ def _pick_general(pool: list[CandidateSeat], quantity: int, seed: int | None) ->
         rows.setdefault((s.sector_display_order, s.row_order, s.row_label), []).append(s)
     # Full-row bounds carried by the candidates themselves — never derived from the
     # (already filtered) pool, which would move the midpoint when edge seats are taken.
-    row_len = {key: max(s.row_length for s in seats) for key, seats in rows.items()}
-
-    placements: list[tuple[tuple[float, ...], list[CandidateSeat]]] = []
-    for key, seats in rows.items():
-        for run in _contiguous_runs(seats):
-            for start in range(0, len(run) - quantity + 1):
-                score = _placement_score(run, start, quantity, row_len[key])
-                placements.append((score, run[start : start + quantity]))
-
-    if not placements:
+    front = _front_row_runs(rows, quantity)
+    if not front:
         return []
+    row_len = {key: max(s.row_length for s in rows[key]) for key, _run in front}
+
+    # Only placements that can land in the near-equal set below are scored: the best
+    # centrality is within half a seat of the closed-form floor, and near-equal admits
+    # another half seat on top. Everything further from center would be sorted and
+    # then discarded, so it is never built.
+    slack = min(_centrality_floor(run, quantity, row_len[key]) for key, run in front) + 1
+    placements: list[tuple[tuple[float, ...], list[CandidateSeat], int]] = [
+        (_placement_score(run, start, quantity, row_len[key]), run, start)
+        for key, run in front
+        for start in _starts_within(run, quantity, row_len[key], slack)
+    ]
 
     placements.sort(key=lambda p: p[0])
     best_score = placements[0][0]
@@ -94,8 +142,8 @@ def _pick_general(pool: list[CandidateSeat], quantity: int, seed: int | None) ->
         and p[0][3] == best_score[3]  # equal sector_display_order
     ]
     rng = random.Random(seed)
-    chosen = rng.choice(near_equal)
-    return [s.id for s in chosen[1]]
+    _score, run, start = rng.choice(near_equal)
+    return [s.id for s in run[start : start + quantity]]
 
 
 def _pick_accessible(pool: list[CandidateSeat], quantity: int) -> list[uuid.UUID]:
@@ -23,6 +23,7 @@ from events.schema import TicketPurchaseItem
 from events.service.batch_ticket_service import BatchTicketService
 from events.service.guest import get_or_create_guest_user
 from events.service.seating import holds as holds_service
+from events.service.seating import seat_index
 from events.service.seating.pricing import TicketPrice, build_batch_pricing, should_stamp_price_paid
 
 
@@ -230,4 +231,6 @@ def reseat(event: Event, *, ticket_id: uuid.UUID, target_seat_id: uuid.UUID) ->
     ticket.seat = target
     ticket.sector_id = target.sector_id
     ticket.save(update_fields=["seat", "sector"])
+    # post_save marks the target sold; only the write site knows which seat was vacated.
+    seat_index.record_freed(event.id, [current.id])
     return ticket
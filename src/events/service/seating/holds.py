@@ -19,6 +19,7 @@ from django.utils import timezone
 from accounts.models import RevelUser
 from events.models import Event, EventSeatOverride, SeatHold, Ticket, TicketTier, VenueSeat, VenueSector
 from events.schema.seating import HoldConflictReason
+from events.service.seating import seat_index
 
 HOLD_TTL = timedelta(minutes=10)
 HOLD_MAX_LIFETIME = timedelta(minutes=30)
@@ -172,7 +173,9 @@ def acquire_seats(
             event, user, guest_session, conflicts=exc.seat_ids, conflict_reason=HoldConflictReason.UNAVAILABLE
         )
 
-    return _current_result(event, user, guest_session, conflicts=[])
+    result = _current_result(event, user, guest_session, conflicts=[])
+    seat_index.record_holds(event.id, result.held)
+    return result
 
 
 def _upsert_holds(event: Event, ordered: list[uuid.UUID], identity: dict[str, t.Any]) -> None:
@@ -202,6 +205,8 @@ def release_seats(
     if seat_ids is not None:
         qs = qs.filter(seat_id__in=seat_ids)
     deleted, _ = qs.delete()
+    if deleted:
+        seat_index.record_released(event.id, seat_ids)
     return deleted
 
 
@@ -224,4 +229,6 @@ def verify_and_consume_holds(
     )
     if foreign:
         raise SeatHoldConflictError(foreign)
-    SeatHold.objects.filter(owner_q, event=event, seat_id__in=seat_ids).delete()
+    consumed, _ = SeatHold.objects.filter(owner_q, event=event, seat_id__in=seat_ids).delete()
+    if consumed:
+        seat_index.record_released(event.id, seat_ids)
@@ -6,6 +6,7 @@ from django.db import transaction
 
 from events.models import Event, EventSeatOverride, Ticket, VenueSeat
 from events.schema.seating import SeatOverridesResponse
+from events.service.seating import seat_index
 
 
 @transaction.atomic
@@ -50,7 +51,7 @@ def apply_overrides(
         .values_list("seat_id", flat=True)
     )
 
-    applied = 0
+    applied_ids: list[uuid.UUID] = []
     for seat_id, status, reason in set_items:
         if seat_id in rejected:
             continue
@@ -60,8 +61,12 @@ def apply_overrides(
         EventSeatOverride.objects.update_or_create(
             event=event, seat_id=seat_id, defaults={"status": status, "reason": reason}
         )
-        applied += 1
+        applied_ids.append(seat_id)
 
     release_ok = [sid for sid in release_seat_ids if sid not in rejected]
     released, _ = EventSeatOverride.objects.filter(event=event, seat_id__in=release_ok).delete()
+    # Blocked first, then unblocked: the release-wins rule above holds in the index too.
+    seat_index.record_blocked(event.id, applied_ids)
+    seat_index.record_unblocked(event.id, release_ok)
+    applied = len(applied_ids)
     return SeatOverridesResponse(applied=applied, released=released, rejected=rejected)
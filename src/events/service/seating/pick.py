@@ -5,13 +5,16 @@ import typing as t
 from uuid import UUID
 
 from django.db.models import Max
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from accounts.models import RevelUser
 from events.exceptions import InvalidZoneSelectionError
 from events.models import Event, EventSeatOverride, PriceCategory, SeatHold, Ticket, TicketTier, VenueSeat, VenueSector
+from events.schema.seating import HoldConflictReason
+from events.service.seating import seat_index
 from events.service.seating.best_available import CandidateSeat, pick_best_available
-from events.service.seating.holds import HoldResult, acquire_seats
+from events.service.seating.holds import HOLD_TTL, HoldResult, acquire_seats
 from events.utils.tier_pricing import parse_price_map
 
 _MAX_ATTEMPTS = 3
@@ -140,6 +143,7 @@ def load_candidates(
     zone_id: UUID | None = None,
     hold_owner_user: RevelUser | None = None,
     hold_owner_guest_session: str | None = None,
+    from_index: bool = False,
 ) -> list[CandidateSeat]:
     """Load holdable seats in the tier's pool, excluding sold/held/blocked/inactive/lost.
 
@@ -154,9 +158,21 @@ def load_candidates(
 
     Returned in stable PK order so the seeded tiebreak in ``pick_best_available`` is
     reproducible across requests (and the re-pick after a conflict is deterministic).
+
+    ``from_index=True`` reads the cached seat index instead of the tables — for an
+    optimistic FIRST attempt only: the index may trail the tables by a patch (see
+    :mod:`events.service.seating.seat_index`), so whatever it proposes is still verified
+    under lock, and a caller whose proposal conflicts retries with the table read.
     """
     if not tier.sector_id or event.venue_id is None:
         return []
+    if from_index and (index := seat_index.get_seat_index(event)) is not None:
+        owner_key = (
+            seat_index.hold_owner_key(hold_owner_user, hold_owner_guest_session)
+            if hold_owner_user is not None or hold_owner_guest_session is not None
+            else None
+        )
+        return index.candidates(tier.sector_id, exclude, zone_id=zone_id, owner_key=owner_key)
     taken = (
         load_taken_seats(
             event,
@@ -219,6 +235,10 @@ def hold_best_available(
 ) -> HoldResult:
     """Optimistic pick: read unlocked, score, hold only the winners; retry excluding losers.
 
+    The first attempt reads the cached seat index; retries read the tables, so a stale
+    index costs at most one extra round. Seats that conflicted as unavailable are patched
+    into the index as held, so the next request in a herd does not propose them again.
+
     Returns an empty result (no held, no conflicts) when no block of ``quantity`` seats
     fits — the caller maps that to a 409.
 
@@ -228,13 +248,17 @@ def hold_best_available(
     zone_id = resolve_requested_zone(tier, price_category_id)
     exclude: set[t.Any] = set()
     last = HoldResult(held=[], conflicts=[], expires_at=None)
-    for _attempt in range(_MAX_ATTEMPTS):
-        candidates = load_candidates(event, tier, exclude, zone_id=zone_id)
+    for attempt in range(_MAX_ATTEMPTS):
+        candidates = load_candidates(event, tier, exclude, zone_id=zone_id, from_index=attempt == 0)
         picked = pick_best_available(candidates, quantity, accessible_required=accessible_required)
         if not picked:
+            if attempt == 0:
+                continue  # the index may trail a release — confirm "nothing fits" against the tables
             return HoldResult(held=[], conflicts=[], expires_at=None)
         last = acquire_seats(event, picked, user=user, guest_session=guest_session)
         if not last.conflicts:
             return last
+        if last.conflict_reason == HoldConflictReason.UNAVAILABLE:
+            seat_index.record_unavailable(event.id, last.conflicts, until=timezone.now() + HOLD_TTL)
         exclude |= set(last.conflicts)
     return last
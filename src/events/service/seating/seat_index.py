@@ -0,0 +1,381 @@
+"""Cached per-event seat availability index for best-available picking.
+
+``hold_best_available`` used to rebuild its whole world from the tables on every attempt:
+three full-set queries in :func:`~events.service.seating.pick.load_taken_seats`, a
+``Max(adjacency_index)`` aggregate and a sector scan in
+:func:`~events.service.seating.pick.load_candidates`. During an on-sale herd that is the
+dominant cost of ``/seating/holds/best-available``, and every request recomputes the same
+answer the previous one just did.
+
+This module keeps one compact entry per event in the shared cache instead: the venue's
+seated layout as rows (ordered by ``(sector display_order, row_order, row_label)``, the
+picker's own grouping) and, per row, two bitsets over the row's seat ordinals — *sold*
+and *blocked* — plus the live holds with their expiry and owner. Holds are kept as a map
+rather than a bitset because they expire on a clock nobody writes to; the reader drops
+expired ones at read time, exactly like ``SeatHold.objects.active()``.
+
+Freshness model:
+
+* The layout half is versioned by ``Venue.chart_version`` (and the event's venue): every
+  chart write bumps it, so a reader that sees another version rebuilds from scratch.
+* The occupancy half is patched incrementally, post-commit, by the writers —
+  :mod:`~events.service.seating.holds` (acquire/release/consume),
+  :mod:`~events.service.seating.overrides`, ticket creation and ticket cancellation
+  (``record_*`` below). A patch is a read-modify-write, so two concurrent patches can
+  lose one; the entry's short TTL bounds how long such drift can live.
+
+Safety model: the index only ever *proposes* seats. Every pick is still verified against
+the tables under lock — ``acquire_seats`` (hold path) and ``_lock_and_verify_block``
+(checkout) — so a stale entry costs a conflict and a retry, never a double sale. Callers
+use the index for their first attempt only and fall back to the authoritative table read
+once a proposal conflicts; the hold path also patches the seats that conflicted into the entry.
+
+Cache ops fail open: a broken/unreachable Redis degrades to the table read and never fails
+a request or a write.
+"""
+
+import dataclasses
+import datetime
+import typing as t
+import uuid
+from collections.abc import Callable, Iterable
+
+import structlog
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import RevelUser
+from events.models import Event, EventSeatOverride, SeatHold, Ticket, VenueSeat, VenueSector
+from events.service.seating.best_available import CandidateSeat
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the entry's shape changes so a rolling deploy never unpickles an old-shape
+# entry into new code.
+CACHE_VERSION = "v1"
+# Bounds the life of drift from a lost incremental patch (see module docstring).
+CACHE_TTL_SECONDS = 120
+
+RowKey = tuple[int, int, str | None]
+
+
+def get_cache_key(event_id: uuid.UUID | str) -> str:
+    """Cache key for an event's seat index."""
+    return f"seat_index:{CACHE_VERSION}:{event_id}"
+
+
+def hold_owner_key(user: RevelUser | None, guest_session: str | None) -> str:
+    """Identity of a hold owner, mirroring :meth:`SeatHold.owner_q`."""
+    if user is not None and getattr(user, "is_authenticated", False):
+        return f"u:{user.id}"
+    return f"g:{guest_session or '__none__'}"
+
+
+def _row_owner_key(user_id: uuid.UUID | None, guest_session: str) -> str:
+    """Owner key for a stored hold row (exactly one of the two is set)."""
+    return f"u:{user_id}" if user_id is not None else f"g:{guest_session}"
+
+
+@dataclasses.dataclass(frozen=True)
+class IndexedSeat:
+    id: uuid.UUID
+    adjacency_index: int
+    is_accessible: bool
+    price_category_id: uuid.UUID | None
+
+
+@dataclasses.dataclass(frozen=True)
+class IndexedRow:
+    """One physical row of a seated sector, seats in adjacency order.
+
+    Bit ``n`` of the owning index's per-row bitsets refers to ``seats[n]`` — an ordinal,
+    not the adjacency index itself, so duplicate or sparse adjacency values still map to
+    distinct bits.
+    """
+
+    sector_id: uuid.UUID
+    key: RowKey
+    # Full physical row length (max adjacency_index + 1), as in CandidateSeat.row_length.
+    row_length: int
+    seats: tuple[IndexedSeat, ...]
+
+
+@dataclasses.dataclass
+class SeatIndex:
+    """Per-event availability snapshot: immutable layout + incrementally patched occupancy."""
+
+    event_id: uuid.UUID
+    venue_id: uuid.UUID
+    chart_version: datetime.datetime | None
+    rows: list[IndexedRow]
+    # seat id -> (row position in ``rows``, bit within that row)
+    positions: dict[uuid.UUID, tuple[int, int]]
+    sold: list[int]
+    blocked: list[int]
+    # seat id -> (expires_at, owner key); may contain expired entries, filtered on read.
+    held: dict[uuid.UUID, tuple[datetime.datetime, str]]
+
+    def _set_bits(self, masks: list[int], seat_ids: Iterable[uuid.UUID], *, on: bool) -> None:
+        for seat_id in seat_ids:
+            position = self.positions.get(seat_id)
+            if position is None:  # not a seated, active seat of this layout
+                continue
+            row, bit = position
+            masks[row] = masks[row] | (1 << bit) if on else masks[row] & ~(1 << bit)
+
+    def candidates(
+        self,
+        sector_id: uuid.UUID,
+        exclude: set[t.Any],
+        *,
+        zone_id: uuid.UUID | None = None,
+        owner_key: str | None = None,
+    ) -> list[CandidateSeat]:
+        """Free seats of one sector as picker candidates — the index twin of ``load_candidates``.
+
+        With an ``owner_key`` (purchase path) only foreign live holds exclude a seat; without
+        one (hold-acquisition path) every live hold does. Returned in PK order, like the table
+        read, so the picker's seeded tiebreak sees the same sequence either way.
+        """
+        now = timezone.now()
+        live_held = {
+            seat_id for seat_id, (expires_at, owner) in self.held.items() if expires_at > now and owner != owner_key
+        }
+        result: list[CandidateSeat] = []
+        for position, row in enumerate(self.rows):
+            if row.sector_id != sector_id:
+                continue
+            taken = self.sold[position] | self.blocked[position]
+            for bit, seat in enumerate(row.seats):
+                if taken >> bit & 1 or seat.id in live_held or seat.id in exclude:
+                    continue
+                if zone_id is not None and seat.price_category_id != zone_id:
+                    continue
+                result.append(
+                    CandidateSeat(
+                        id=seat.id,
+                        row_order=row.key[1],
+                        adjacency_index=seat.adjacency_index,
+                        is_accessible=seat.is_accessible,
+                        sector_display_order=row.key[0],
+                        row_length=row.row_length,
+                        row_label=row.key[2],
+                    )
+                )
+        result.sort(key=lambda c: c.id)
+        return result
+
+
+def build_seat_index(event: Event, chart_version: datetime.datetime | None) -> SeatIndex | None:
+    """Build an event's index from the tables: one layout query plus the three taken-set reads."""
+    if event.venue_id is None:
+        return None
+    layout = VenueSeat.objects.filter(
+        sector__venue_id=event.venue_id,
+        sector__kind=VenueSector.Kind.SEATED,
+        is_active=True,
+    ).values_list(
+        "id",
+        "sector_id",
+        "sector__display_order",
+        "row_order",
+        "row_label",
+        "adjacency_index",
+        "is_accessible",
+        "default_price_category_id",
+    )
+    seats_by_row: dict[tuple[uuid.UUID, RowKey], list[IndexedSeat]] = {}
+    for seat_id, sector_id, s_order, row_order, row_label, adjacency_index, is_accessible, category_id in layout:
+        seats_by_row.setdefault((sector_id, (s_order, row_order, row_label)), []).append(
+            IndexedSeat(
+                id=seat_id, adjacency_index=adjacency_index, is_accessible=is_accessible, price_category_id=category_id
+            )
+        )
+
+    rows: list[IndexedRow] = []
+    positions: dict[uuid.UUID, tuple[int, int]] = {}
+    # Row keys mix ints with a nullable label; sort None-safe so the order is deterministic.
+    for (sector_id, key), seats in sorted(
+        seats_by_row.items(), key=lambda item: (item[1][0], item[1][1], item[1][2] or "", str(item[0]))
+    ):
+        ordered = tuple(sorted(seats, key=lambda s: (s.adjacency_index, s.id)))
+        for bit, seat in enumerate(ordered):
+            positions[seat.id] = (len(rows), bit)
+        rows.append(
+            IndexedRow(
+                sector_id=sector_id,
+                key=key,
+                row_length=max(s.adjacency_index for s in ordered) + 1,
+                seats=ordered,
+            )
+        )
+
+    index = SeatIndex(
+        event_id=event.id,
+        venue_id=event.venue_id,
+        chart_version=chart_version,
+        rows=rows,
+        positions=positions,
+        sold=[0] * len(rows),
+        blocked=[0] * len(rows),
+        held={},
+    )
+    # Non-cancelled = occupied, matching unique_ticket_event_seat (same reads as load_taken_seats).
+    index._set_bits(
+        index.sold,
+        Ticket.objects.filter(event=event, seat__isnull=False)
+        .exclude(status=Ticket.TicketStatus.CANCELLED)
+        .values_list("seat_id", flat=True),
+        on=True,
+    )
+    index._set_bits(
+        index.blocked, EventSeatOverride.objects.filter(event=event).values_list("seat_id", flat=True), on=True
+    )
+    index.held = {
+        seat_id: (expires_at, _row_owner_key(user_id, guest_session))
+        for seat_id, expires_at, user_id, guest_session in SeatHold.objects.active()
+        .filter(event=event)
+        .values_list("seat_id", "expires_at", "user_id", "guest_session")
+    }
+    return index
+
+
+def _store(index: SeatIndex) -> None:
+    try:
+        cache.set(get_cache_key(index.event_id), index, timeout=CACHE_TTL_SECONDS)
+    except Exception:
+        logger.warning("seat_index_cache_set_failed", exc_info=True)
+
+
+def get_seat_index(event: Event) -> SeatIndex | None:
+    """Return the event's index, rebuilding it when missing or built for another chart.
+
+    Costs one primary-key read of ``Venue.chart_version`` on a hit. Returns ``None`` for an
+    event without a venue.
+    """
+    from events.service.seating.availability import resolve_chart_version
+
+    if event.venue_id is None:
+        return None
+    chart_version = resolve_chart_version(event.venue_id)
+    try:
+        cached = cache.get(get_cache_key(event.id))
+    except Exception:
+        logger.warning("seat_index_cache_get_failed", exc_info=True)
+        cached = None
+    if isinstance(cached, SeatIndex) and cached.venue_id == event.venue_id and cached.chart_version == chart_version:
+        return cached
+    return refresh_seat_index(event, chart_version=chart_version)
+
+
+def refresh_seat_index(event: Event, *, chart_version: datetime.datetime | None = None) -> SeatIndex | None:
+    """Rebuild the event's index from the tables and store it (self-heal after a conflict)."""
+    from events.service.seating.availability import resolve_chart_version
+
+    if event.venue_id is None:
+        return None
+    if chart_version is None:
+        chart_version = resolve_chart_version(event.venue_id)
+    index = build_seat_index(event, chart_version)
+    if index is not None:
+        _store(index)
+    return index
+
+
+def _patch(event_id: uuid.UUID, mutate: Callable[[SeatIndex], None]) -> None:
+    """Apply ``mutate`` to the cached entry after commit; a missing entry is left missing.
+
+    ``on_commit`` for the same reason as the permission snapshot: patching before commit
+    would publish state that a rollback then un-happens. A missing entry is not built here —
+    the next reader builds it from committed tables, which already include this write.
+    """
+
+    def _apply() -> None:
+        key = get_cache_key(event_id)
+        try:
+            index = cache.get(key)
+            if isinstance(index, SeatIndex):
+                mutate(index)
+                cache.set(key, index, timeout=CACHE_TTL_SECONDS)
+        except Exception:
+            logger.warning("seat_index_cache_patch_failed", exc_info=True)
+
+    transaction.on_commit(_apply)
+
+
+def record_sold(event_id: uuid.UUID, seat_ids: Iterable[uuid.UUID]) -> None:
+    """Mark seats ticketed. A sold seat's hold has been consumed, so it is dropped too."""
+    ids = list(seat_ids)
+
+    def mutate(index: SeatIndex) -> None:
+        index._set_bits(index.sold, ids, on=True)
+        for seat_id in ids:
+            index.held.pop(seat_id, None)
+
+    _patch(event_id, mutate)
+
+
+def record_freed(event_id: uuid.UUID, seat_ids: Iterable[uuid.UUID]) -> None:
+    """Mark seats no longer ticketed (cancellation, reseat away)."""
+    ids = list(seat_ids)
+    _patch(event_id, lambda index: index._set_bits(index.sold, ids, on=False))
+
+
+def record_blocked(event_id: uuid.UUID, seat_ids: Iterable[uuid.UUID]) -> None:
+    """Mark seats box-office overridden (held/killed) for this event."""
+    ids = list(seat_ids)
+    _patch(event_id, lambda index: index._set_bits(index.blocked, ids, on=True))
+
+
+def record_unblocked(event_id: uuid.UUID, seat_ids: Iterable[uuid.UUID]) -> None:
+    """Mark seats' box-office overrides released."""
+    ids = list(seat_ids)
+    _patch(event_id, lambda index: index._set_bits(index.blocked, ids, on=False))
+
+
+def record_holds(event_id: uuid.UUID, holds: Iterable[SeatHold]) -> None:
+    """Record (or refresh) live holds with their expiry and owner."""
+    entries = {h.seat_id: (h.expires_at, _row_owner_key(h.user_id, h.guest_session)) for h in holds}
+    _patch(event_id, lambda index: index.held.update(entries))
+
+
+def record_released(event_id: uuid.UUID, seat_ids: Iterable[uuid.UUID] | None) -> None:
+    """Drop holds. ``None`` means "all of an identity's holds" — the entry is rebuilt instead."""
+    if seat_ids is None:
+        invalidate_seat_index(event_id)
+        return
+    ids = list(seat_ids)
+
+    def mutate(index: SeatIndex) -> None:
+        for seat_id in ids:
+            index.held.pop(seat_id, None)
+
+    _patch(event_id, mutate)
+
+
+def record_unavailable(event_id: uuid.UUID, seat_ids: Iterable[uuid.UUID], *, until: datetime.datetime) -> None:
+    """Hide seats a hold attempt just found taken, as if held by an unknown owner until ``until``.
+
+    The conflict itself proves the index trailed the tables for these seats; whichever
+    writer took them will patch the true state in (sold/held/released) on its own commit.
+    """
+    entries = dict.fromkeys(seat_ids, (until, ""))
+
+    def mutate(index: SeatIndex) -> None:
+        for seat_id, entry in entries.items():
+            index.held.setdefault(seat_id, entry)
+
+    _patch(event_id, mutate)
+
+
+def invalidate_seat_index(event_id: uuid.UUID) -> None:
+    """Schedule a post-commit delete of the event's index (next reader rebuilds it)."""
+
+    def _delete() -> None:
+        try:
+            cache.delete(get_cache_key(event_id))
+        except Exception:
+            logger.warning("seat_index_cache_delete_failed", exc_info=True)
+
+    transaction.on_commit(_delete)
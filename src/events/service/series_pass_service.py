@@ -37,9 +37,9 @@ from events.models import (
 )
 from events.models.ticket import CancellationSource
 from events.schema.series_pass import SeriesPassCreateSchema
-from events.service import refund_service
+from events.service import capacity_ledger, refund_service
 from events.service.vat_service import distribute_amount_across_items
-from events.tasks import materialize_series_pass_holders
+from events.tasks import enqueue_ticket_file_prewarm, materialize_series_pass_holders
 from notifications.signals.series_pass import send_series_pass_cancelled, send_series_pass_purchased
 
 logger = structlog.get_logger(__name__)
@@ -294,7 +294,8 @@ def materialize_tickets(
     """bulk_create one ticket per link, skipping events already ticketed for this pass.
 
     bulk_create bypasses post_save signals by design — per-ticket notifications must
-    never fire for pass tickets (spec §Notifications).
+    never fire for pass tickets (spec §Notifications). File pre-generation, which
+    post_save would also have triggered, is enqueued here instead.
 
     Args:
         held_pass: The HeldSeriesPass the tickets are materialized for.
@@ -329,7 +330,16 @@ def materialize_tickets(
         for link in links
         if link.event_id not in existing_event_ids
     ]
-    return Ticket.objects.bulk_create(tickets)
+    created = Ticket.objects.bulk_create(tickets)
+    capacity_ledger.record_committed(created)
+    _prewarm_ticket_files(created)
+    return created
+
+
+def _prewarm_ticket_files(tickets: t.Iterable[Ticket]) -> None:
+    """Enqueue file pre-generation for each event with an active ticket among ``tickets``."""
+    for event_id in {ticket.event_id for ticket in tickets if ticket.status == Ticket.TicketStatus.ACTIVE}:
+        enqueue_ticket_file_prewarm(event_id)
 
 
 def backfill_missing_tickets(held_pass: HeldSeriesPass) -> list[Ticket]:
@@ -736,6 +746,7 @@ def confirm_held_pass_payment(held_pass: HeldSeriesPass) -> HeldSeriesPass:
             ticket.status = Ticket.TicketStatus.ACTIVE
             ticket.price_paid = share
         Ticket.objects.bulk_update(pending_tickets, ["status", "price_paid"])
+        _prewarm_ticket_files(pending_tickets)
 
     # Catch up on events linked to the pass while it sat PENDING (the extension
     # task only materializes for ACTIVE holders).
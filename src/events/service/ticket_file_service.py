@@ -3,6 +3,8 @@
 Generates and caches PDF and Apple Wallet (.pkpass) files for tickets.
 Files are persisted via ProtectedFileField and served via signed URLs.
 A content hash based on updated_at timestamps detects staleness.
+:func:`render_tickets` fills the cache ahead of demand for a batch of tickets; the
+``events.tasks.prewarm_ticket_files`` task drives it when tickets are activated.
 
 Critical: Uses QuerySet.update() instead of model.save() for cache writes
 to avoid triggering auto_now on updated_at, which would immediately
@@ -10,13 +12,21 @@ invalidate the hash we just stored.
 """
 
 import hashlib
+import time
 import typing as t
+from collections.abc import Iterable
 from functools import lru_cache
+from itertools import batched
+from uuid import UUID
 
 import structlog
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+from prometheus_client import Counter, Histogram
 
+from common.service.pdf_rendering import pdf_renderer
 from events.models import Ticket
 
 if t.TYPE_CHECKING:
@@ -24,6 +34,23 @@ if t.TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Tickets loaded, laid out and persisted per round of render_tickets.
+RENDER_CHUNK_SIZE = 100
+
+# Rates, not alerts (see events.service.eligibility_cache). hit / (hit + miss) is the
+# share of downloads the pre-generation got to first.
+TICKET_FILE_LOOKUPS = Counter(
+    "revel_ticket_file_cache_lookups",
+    "Ticket file downloads by kind (pdf, pkpass) and result (hit: cached file served; miss: rendered on request).",
+    ["kind", "result"],
+)
+TICKET_FILE_GENERATION_SECONDS = Histogram(
+    "revel_ticket_file_generation_seconds",
+    "Time to generate one ticket file, by kind (pdf, pkpass) and source (request, batch).",
+    ["kind", "source"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+)
+
 
 @lru_cache(maxsize=1)
 def get_apple_pass_generator() -> "ApplePassGenerator":
@@ -61,6 +88,13 @@ def compute_content_hash(ticket: Ticket) -> str:
     return hashlib.sha256(raw.encode()).hexdigest()
 
 
+def wallet_passes_enabled() -> bool:
+    """Whether Apple Wallet signing is configured, i.e. whether pkpass files can be made."""
+    from wallet.apple.signer import ApplePassSigner
+
+    return ApplePassSigner().is_configured()
+
+
 def is_cache_valid(ticket: Ticket) -> bool:
     """Check whether the cached files are still fresh.
 
@@ -88,17 +122,114 @@ def get_or_generate_pdf(ticket: Ticket) -> bytes:
         try:
             with ticket.pdf_file.open("rb") as f:
                 data: bytes = f.read()
-                return data
+            TICKET_FILE_LOOKUPS.labels(kind="pdf", result="hit").inc()
+            return data
         except Exception:
             logger.warning("failed_to_read_cached_pdf", ticket_id=str(ticket.id))
 
     from events.utils import create_ticket_pdf
 
-    pdf_bytes = create_ticket_pdf(ticket)
+    TICKET_FILE_LOOKUPS.labels(kind="pdf", result="miss").inc()
+    with TICKET_FILE_GENERATION_SECONDS.labels(kind="pdf", source="request").time():
+        pdf_bytes = create_ticket_pdf(ticket)
     _persist_and_update(ticket, pdf_bytes=pdf_bytes)
     return pdf_bytes
 
 
+def _needs_render(ticket: Ticket, include_pkpass: bool) -> bool:
+    if not ticket.pdf_file or not is_cache_valid(ticket):
+        return True
+    return include_pkpass and not ticket.pkpass_file
+
+
+def stale_ticket_ids(
+    event_id: UUID | str, *, limit: int, include_pkpass: bool = False, after: UUID | str | None = None
+) -> list[UUID]:
+    """Active tickets of an upcoming event whose cached files are missing or stale, at most ``limit``.
+
+    Tickets come in creation order; ``after`` resumes the scan past that ticket, so a
+    caller walking the event in batches never looks at the same ticket twice.
+    """
+    tickets = (
+        Ticket.objects.filter(event_id=event_id, status=Ticket.TicketStatus.ACTIVE, event__end__gt=timezone.now())
+        .select_related("event", "tier")
+        .only(
+            "id", "updated_at", "file_content_hash", "pdf_file", "pkpass_file", "event__updated_at", "tier__updated_at"
+        )
+        .order_by("created_at", "pk")
+    )
+    if after is not None:
+        cursor = Ticket.objects.filter(pk=after).values_list("created_at", flat=True).first()
+        if cursor is not None:
+            tickets = tickets.filter(Q(created_at__gt=cursor) | Q(created_at=cursor, pk__gt=after))
+    stale: list[UUID] = []
+    for ticket in tickets.iterator(chunk_size=RENDER_CHUNK_SIZE * 10):
+        if _needs_render(ticket, include_pkpass):
+            stale.append(ticket.id)
+            if len(stale) >= limit:
+                break
+    return stale
+
+
+def render_tickets(ticket_ids: Iterable[UUID | str], *, workers: int = 1, include_pkpass: bool = False) -> int:
+    """Generate and cache files for ``ticket_ids`` ahead of demand.
+
+    Tickets whose cached files are still fresh are skipped. Loading, HTML rendering and
+    persisting stay in this process; only the WeasyPrint layout goes to ``workers``
+    processes (see :func:`common.service.pdf_rendering.pdf_renderer`, including why
+    Celery tasks must pass ``workers=1``). A ticket that fails to render is logged
+    and left for on-demand generation.
+
+    The PDF and pkpass share one content hash, so a ticket that already has a
+    pkpass gets it regenerated with the PDF even when ``include_pkpass`` is False;
+    otherwise the fresh hash would vouch for a stale pass.
+
+    Returns:
+        The number of tickets whose files were generated.
+    """
+    from events.utils import ticket_pdf_html
+
+    rendered = 0
+    with pdf_renderer(workers) as render:
+        for chunk in batched(ticket_ids, RENDER_CHUNK_SIZE):
+            tickets = [
+                ticket
+                for ticket in Ticket.objects.full().select_related("event__event_series").filter(pk__in=chunk)
+                if _needs_render(ticket, include_pkpass)
+            ]
+            if not tickets:
+                continue
+            started = time.perf_counter()
+            results = render([ticket_pdf_html(ticket) for ticket in tickets])
+            per_ticket = (time.perf_counter() - started) / len(tickets)
+            for ticket, result in zip(tickets, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.warning("ticket_pdf_render_failed", ticket_id=str(ticket.id), error=str(result))
+                    continue
+                TICKET_FILE_GENERATION_SECONDS.labels(kind="pdf", source="batch").observe(per_ticket)
+                rendered += _persist_rendered(ticket, result, include_pkpass or bool(ticket.pkpass_file))
+    return rendered
+
+
+def _persist_rendered(ticket: Ticket, pdf_bytes: bytes, with_pkpass: bool) -> bool:
+    """Persist a batch-rendered PDF, generating the pkpass alongside when asked.
+
+    The PDF is kept even when the pkpass fails; an existing pass is dropped then, so
+    the fresh hash does not vouch for it and downloads regenerate it on demand.
+    """
+    pkpass_bytes = None
+    if with_pkpass:
+        try:
+            with TICKET_FILE_GENERATION_SECONDS.labels(kind="pkpass", source="batch").time():
+                pkpass_bytes = get_apple_pass_generator().generate_pass(ticket)
+        except Exception:
+            logger.warning("ticket_pkpass_render_failed", ticket_id=str(ticket.id), exc_info=True)
+            _persist_and_update(ticket, pdf_bytes=pdf_bytes, drop_pkpass=True)
+            return True
+    _persist_and_update(ticket, pdf_bytes=pdf_bytes, pkpass_bytes=pkpass_bytes)
+    return True
+
+
 def get_or_generate_pkpass(ticket: Ticket) -> bytes:
     """Return cached pkpass bytes or generate and cache a new one.
 
@@ -112,12 +243,15 @@ def get_or_generate_pkpass(ticket: Ticket) -> bytes:
         try:
             with ticket.pkpass_file.open("rb") as f:
                 data: bytes = f.read()
-                return data
+            TICKET_FILE_LOOKUPS.labels(kind="pkpass", result="hit").inc()
+            return data
         except Exception:
             logger.warning("failed_to_read_cached_pkpass", ticket_id=str(ticket.id))
 
     generator = get_apple_pass_generator()
-    pkpass_bytes = generator.generate_pass(ticket)
+    TICKET_FILE_LOOKUPS.labels(kind="pkpass", result="miss").inc()
+    with TICKET_FILE_GENERATION_SECONDS.labels(kind="pkpass", source="request").time():
+        pkpass_bytes = generator.generate_pass(ticket)
     _persist_and_update(ticket, pkpass_bytes=pkpass_bytes)
     return pkpass_bytes
 
@@ -147,6 +281,8 @@ def _persist_and_update(
     ticket: Ticket,
     pdf_bytes: bytes | None = None,
     pkpass_bytes: bytes | None = None,
+    *,
+    drop_pkpass: bool = False,
 ) -> None:
     """Save files to storage and update the DB via QuerySet.update().
 
@@ -163,6 +299,7 @@ def _persist_and_update(
         ticket: The ticket to update.
         pdf_bytes: PDF content to save (or None to skip).
         pkpass_bytes: pkpass content to save (or None to skip).
+        drop_pkpass: Clear the cached pkpass instead (ignored when ``pkpass_bytes`` is given).
     """
     update_fields: dict[str, object] = {}
     old_files: list[str] = []
@@ -185,6 +322,10 @@ def _persist_and_update(
             update_fields["pkpass_file"] = ticket.pkpass_file.name
             if old_pkpass_name:
                 old_files.append(old_pkpass_name)
+        elif drop_pkpass and ticket.pkpass_file:
+            old_files.append(ticket.pkpass_file.name)
+            ticket.pkpass_file = ""
+            update_fields["pkpass_file"] = ""
 
         if update_fields:
             content_hash = compute_content_hash(ticket)
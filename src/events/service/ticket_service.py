@@ -263,8 +263,8 @@ def get_user_event_status(event: Event, user: RevelUser) -> UserEventStatus | Ev
     Returns:
         UserEventStatus if user has tickets or RSVP, otherwise EventUserEligibility.
     """
+    from events.service import eligibility_cache
     from events.service.batch_ticket_service import BatchTicketService
-    from events.service.event_manager import EventManager
 
     # Get all user's tickets for this event using the optimized full() queryset
     tickets = list(Ticket.objects.full().filter(event=event, user_id=user.id).order_by("-created_at"))
@@ -287,8 +287,8 @@ def get_user_event_status(event: Event, user: RevelUser) -> UserEventStatus | Ev
         # Check for RSVP (non-ticketed events)
         if rsvp := EventRSVP.objects.filter(event=event, user_id=user.id).first():
             return UserEventStatus(tickets=[], rsvp=rsvp, event_remaining=event_remaining)
-        # No active tickets or RSVP - run eligibility check
-        eligibility = EventManager(user, event).check_eligibility()
+        # No active tickets or RSVP - run eligibility check (a read: the cached result is fine)
+        eligibility = eligibility_cache.get_eligibility(user, event)
         if not eligibility.allowed or not tickets:
             eligibility.event_remaining = event_remaining
             return eligibility
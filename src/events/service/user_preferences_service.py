@@ -4,7 +4,6 @@ import typing as t
 from dataclasses import dataclass, field
 from uuid import UUID
 
-from django.db import transaction
 from django.utils import timezone
 from pydantic import BaseModel
 
@@ -12,7 +11,7 @@ from accounts.models import RevelUser
 from events.models import Event, EventInvitation, EventRSVP, GeneralUserPreferences, OrganizationMember, Ticket
 from events.service import update_db_instance
 from events.service.location_service import invalidate_user_location_cache
-from events.tasks import build_attendee_visibility_flags
+from events.tasks import enqueue_attendee_visibility_update
 
 
 @dataclass
@@ -117,7 +116,7 @@ def set_general_preferences(
 
 
 def trigger_visibility_flags_for_user(user_id: UUID) -> None:
-    """Dispatch build_attendee_visibility_flags for all future events the user is attending.
+    """Enqueue a visibility update for all future events the user is attending.
 
     Args:
         user_id: The user ID
@@ -137,13 +136,8 @@ def trigger_visibility_flags_for_user(user_id: UUID) -> None:
             ).values_list("event_id", flat=True)
         )
     )
-    event_id_strs = [str(event_id) for event_id in event_ids]
-
-    def _dispatch_visibility_flags() -> None:
-        for event_id in event_id_strs:
-            build_attendee_visibility_flags.delay(event_id)
-
-    transaction.on_commit(_dispatch_visibility_flags)
+    for event_id in event_ids:
+        enqueue_attendee_visibility_update(event_id, [user_id])
 
 
 def resolve_visibility_fast(
@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
-import random
+import itertools
 import typing as t
 import uuid
 
 from django.db import transaction
+from django.db.models import CharField, QuerySet, Value
+from django.db.models.functions import MD5, Cast, Concat
 from django.utils import timezone
 
 from events.models import Event, EventRSVP, EventWaitList, Ticket, WaitlistOffer
@@ -43,26 +45,11 @@ class ProcessResult:
         }
 
 
-@transaction.atomic
-def process_waitlist_for_event(event_id: uuid.UUID) -> ProcessResult:
-    """Create the next batch of waitlist offers for an event.
-
-    Idempotent: concurrent invocations serialize on the Event row lock and the
-    second invocation typically finds no_spots.
+OFFER_CHUNK_SIZE = 1000
 
-    Args:
-        event_id: UUID of the event to process.
-
-    Returns:
-        ProcessResult describing what happened.
-    """
-    event = Event.objects.select_for_update().get(pk=event_id)
-    if not event.waitlist_open or event.waitlist_time_window is None:
-        return ProcessResult(status="disabled")
 
-    now = timezone.now()
-    # The Event row lock above serializes concurrent processing; we don't need
-    # to additionally lock the offer rows here for the count.
+def _available_spots(event: Event, now: datetime.datetime) -> int:
+    """Seats neither taken nor reserved by a live, capacity-reserving offer."""
     # Cutoff-batch offers do NOT reserve capacity — they compete first-come-first-served
     # against any remaining real seats, so they must be excluded from this count.
     pending_count = WaitlistOffer.objects.filter(
@@ -71,19 +58,16 @@ def process_waitlist_for_event(event_id: uuid.UUID) -> ProcessResult:
         expires_at__gt=now,
         is_cutoff_batch=False,
     ).count()
-    available = event.effective_capacity - event.attendee_count - pending_count
-    if available <= 0:
-        return ProcessResult(status="no_spots")
+    return event.effective_capacity - event.attendee_count - pending_count
 
-    past_cutoff = event.waitlist_cutoff_date is not None and now >= event.waitlist_cutoff_date
-    if past_cutoff and WaitlistOffer.objects.filter(event=event, is_cutoff_batch=True).exists():
-        return ProcessResult(status="cutoff_already_processed")
 
+def _eligible_user_ids(event: Event) -> QuerySet[EventWaitList, uuid.UUID]:
+    """User ids on the event's waitlist that may get an offer, in FIFO order."""
     # Exclude users who have either a PENDING offer (already holding a seat) or a
     # REVOKED offer (admin explicitly skipped them — only a reactivate or a manual
     # create should bring them back). EXPIRED stays eligible: that's the normal
     # batch-timeout lifecycle and users should rotate back into selection.
-    waitlist_qs = (
+    return (
         EventWaitList.objects.filter(event=event)
         .exclude(
             user__waitlist_offers__event=event,
@@ -92,51 +76,122 @@ def process_waitlist_for_event(event_id: uuid.UUID) -> ProcessResult:
                 WaitlistOffer.WaitlistOfferStatus.REVOKED,
             ],
         )
-        .select_related("user")
         .order_by("created_at")
+        .values_list("user_id", flat=True)
     )
 
+
+def _lottery_draw(event: Event, count: int, seed: str) -> list[uuid.UUID]:
+    """Draw ``count`` eligible user ids at random, in SQL.
+
+    Each id is ranked by ``md5(seed || user_id)``: only ids are read and Postgres keeps
+    just the top ``count`` while sorting. The same seed over the same pool gives the
+    same draw.
+    """
+    rank = MD5(Concat(Value(seed), Cast("user_id", output_field=CharField())))
+    return list(_eligible_user_ids(event).order_by(rank)[:count])
+
+
+def process_waitlist_for_event(event_id: uuid.UUID, *, seed: str | None = None) -> ProcessResult:
+    """Create the next batch of waitlist offers for an event.
+
+    Selection reads only user ids and runs without any lock. The Event row is locked
+    only around the insert (see ``_create_offers``), which rechecks capacity and
+    eligibility, so concurrent invocations stay idempotent: the second typically finds
+    no_spots.
+
+    Args:
+        event_id: UUID of the event to process.
+        seed: Lottery seed. Defaults to the new batch's id, so any draw can be
+            reproduced from the ``batch_id`` stored on its offers.
+
+    Returns:
+        ProcessResult describing what happened.
+    """
+    event = Event.objects.get(pk=event_id)
+    if not event.waitlist_open or event.waitlist_time_window is None:
+        return ProcessResult(status="disabled")
+
+    now = timezone.now()
+    available = _available_spots(event, now)
+    if available <= 0:
+        return ProcessResult(status="no_spots")
+
+    past_cutoff = event.waitlist_cutoff_date is not None and now >= event.waitlist_cutoff_date
+    if past_cutoff and WaitlistOffer.objects.filter(event=event, is_cutoff_batch=True).exists():
+        return ProcessResult(status="cutoff_already_processed")
+
+    batch_id = uuid.uuid4()
     if past_cutoff:
-        selected = [w.user for w in waitlist_qs]
-        expires_at = event.start
-        is_cutoff = True
+        selected = list(_eligible_user_ids(event))
     elif event.waitlist_batch_size == 0:
-        selected = [w.user for w in waitlist_qs[:available]]
-        expires_at = now + event.waitlist_time_window
-        is_cutoff = False
+        selected = list(_eligible_user_ids(event)[:available])
     else:
         batch_count = min(event.waitlist_batch_size, available)
         if event.waitlist_lottery_mode:
-            pool = list(waitlist_qs)
-            selected = [w.user for w in random.sample(pool, min(batch_count, len(pool)))]
+            selected = _lottery_draw(event, batch_count, seed or str(batch_id))
         else:
-            selected = [w.user for w in waitlist_qs[:batch_count]]
-        expires_at = now + event.waitlist_time_window
-        is_cutoff = False
+            selected = list(_eligible_user_ids(event)[:batch_count])
 
     if not selected:
         return ProcessResult(status="no_eligible_users")
 
-    batch_id = uuid.uuid4()
-    offers = WaitlistOffer.objects.bulk_create(
-        [
+    return _create_offers(event_id, selected, batch_id=batch_id, is_cutoff=past_cutoff)
+
+
+@transaction.atomic
+def _create_offers(
+    event_id: uuid.UUID, selected: list[uuid.UUID], *, batch_id: uuid.UUID, is_cutoff: bool
+) -> ProcessResult:
+    """Insert offers for the users selected without the lock, under the Event row lock.
+
+    Everything the selection read may have changed since, so it is rechecked here:
+    capacity, the one-shot cutoff, and each user's eligibility. Users who are no
+    longer eligible are dropped, and a non-cutoff batch is trimmed to the seats
+    still free. Offers are inserted in chunks of ``OFFER_CHUNK_SIZE``.
+    """
+    event = Event.objects.select_for_update().get(pk=event_id)
+    if not event.waitlist_open or event.waitlist_time_window is None:
+        return ProcessResult(status="disabled")
+
+    now = timezone.now()
+    available = _available_spots(event, now)
+    if available <= 0:
+        return ProcessResult(status="no_spots")
+
+    if is_cutoff:
+        if WaitlistOffer.objects.filter(event=event, is_cutoff_batch=True).exists():
+            return ProcessResult(status="cutoff_already_processed")
+        expires_at = event.start
+    else:
+        expires_at = now + event.waitlist_time_window
+
+    offer_ids: list[uuid.UUID] = []
+    for chunk in itertools.batched(selected, OFFER_CHUNK_SIZE):
+        still_eligible = set(_eligible_user_ids(event).filter(user_id__in=chunk))
+        user_ids = [user_id for user_id in chunk if user_id in still_eligible]
+        if not is_cutoff:
+            user_ids = user_ids[: available - len(offer_ids)]
+        offers = WaitlistOffer.objects.bulk_create(
             WaitlistOffer(
                 event=event,
-                user=u,
+                user_id=user_id,
                 expires_at=expires_at,
                 batch_id=batch_id,
                 is_cutoff_batch=is_cutoff,
             )
-            for u in selected
-        ]
-    )
+            for user_id in user_ids
+        )
+        offer_ids.extend(o.id for o in offers)
+
+    if not offer_ids:
+        return ProcessResult(status="no_eligible_users")
 
-    offer_ids = [o.id for o in offers]
     transaction.on_commit(lambda: _dispatch_offer_notifications(offer_ids))
 
     return ProcessResult(
         status="ok",
-        offers_created=len(offers),
+        offers_created=len(offer_ids),
         batch_id=batch_id,
         is_cutoff_batch=is_cutoff,
     )
@@ -145,7 +200,7 @@ def process_waitlist_for_event(event_id: uuid.UUID) -> ProcessResult:
 def _count_attendees_and_pending(event: Event) -> tuple[int, int]:
     """Return (attendee_count, capacity-reserving pending offer count) for an event.
 
-    Mirrors the counting logic used by ``process_waitlist_for_event`` and
+    Mirrors the counting logic used by ``_available_spots`` and
     ``_assert_capacity``: cutoff-batch offers do NOT count toward reserved
     capacity, and cancelled tickets / non-YES RSVPs are excluded.
     """
@@ -263,15 +318,12 @@ def enqueue_waitlist_processing(event_id: uuid.UUID) -> None:
 
 
 def _dispatch_offer_notifications(offer_ids: list[uuid.UUID]) -> None:
-    """Dispatch WAITLIST_SPOT_AVAILABLE notifications for fresh offers.
-
-    The notification task is fully implemented in Task 20. Until then,
-    `send_waitlist_offer_notification_task` is a no-op stub added in Task 7.
+    """Dispatch WAITLIST_SPOT_AVAILABLE notifications for fresh offers, as one batch task.
 
     Args:
         offer_ids: UUIDs of the WaitlistOffer rows to notify about.
     """
-    from events.tasks import send_waitlist_offer_notification_task
+    from events.tasks import send_waitlist_offer_notifications_task
 
-    for offer_id in offer_ids:
-        send_waitlist_offer_notification_task.delay(str(offer_id))
+    if offer_ids:
+        send_waitlist_offer_notifications_task.delay([str(offer_id) for offer_id in offer_ids])
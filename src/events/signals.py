@@ -3,18 +3,21 @@
 import typing as t
 
 import structlog
+from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from accounts.models import RevelUser
-from common.models import SiteSettings
+from common.models import SiteSettings, TagAssignment
 from events.models import (
     DEFAULT_TICKET_TIER_NAME,
     Blacklist,
     Event,
     EventInvitation,
+    EventInvitationRequest,
     EventRSVP,
+    EventSeries,
     EventWaitList,
     GeneralUserPreferences,
     MembershipPayment,
@@ -22,27 +25,35 @@ from events.models import (
     MembershipSubscriptionPlan,
     Organization,
     OrganizationMember,
+    OrganizationQuestionnaire,
     OrganizationStaff,
     PendingEventInvitation,
     ReservedSlugToken,
     Ticket,
     TicketTier,
+    WaitlistOffer,
+    WhitelistRequest,
 )
 from events.models.organization import MembershipTier
-from events.service import permission_snapshot
+from events.service import capacity_ledger, eligibility_cache, event_search, permission_snapshot
 from events.service.blacklist_service import apply_blacklist_consequences, link_blacklist_entries_for_user
-from events.service.follow_service import get_followers_for_new_event_notification
+from events.service.follow_service import iter_new_event_follower_chunks
 from events.service.potluck_service import unclaim_user_potluck_items
+from events.service.seating import seat_index
 from events.service.user_preferences_service import trigger_visibility_flags_for_user
 from events.tasks import (
-    build_attendee_visibility_flags,
+    enqueue_attendee_visibility_update,
+    enqueue_ticket_file_prewarm,
     notify_admin_new_organization_discord,
     notify_admin_new_organization_pushover,
+    refresh_event_search_vectors,
 )
 from events.utils import format_event_datetime, get_invitation_message
 from events.utils.reserved_slug_tokens import invalidate_reserved_tokens_cache
 from notifications.enums import NotificationType
+from notifications.service.dispatcher import notify_many
 from notifications.signals import notification_requested
+from questionnaires.models import QuestionnaireEvaluation, QuestionnaireSubmission
 
 __all__ = ["unclaim_user_potluck_items"]
 
@@ -62,6 +73,44 @@ def handle_event_save(sender: type[Event], instance: Event, created: bool, **kwa
         TicketTier.objects.create(event=instance, name=DEFAULT_TICKET_TIER_NAME)
 
 
+@receiver(post_save, sender=Event)
+def refresh_event_search_vector(
+    sender: type[Event], instance: Event, update_fields: frozenset[str] | None = None, **kwargs: t.Any
+) -> None:
+    """Recompute the event's discovery search document when a field feeding it is saved."""
+    if update_fields is not None and not event_search.DOCUMENT_FIELDS & update_fields:
+        return
+    event_search.update_search_vectors(Event.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=TagAssignment)
+@receiver(post_delete, sender=TagAssignment)
+def refresh_tagged_event_search_vector(sender: type[TagAssignment], instance: TagAssignment, **kwargs: t.Any) -> None:
+    """Tag names are part of the search document; recompute it for tagged events."""
+    if instance.content_type_id != ContentType.objects.get_for_model(Event).id:
+        return
+    event_search.update_search_vectors(Event.objects.filter(pk=instance.object_id))
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_save, sender=EventSeries)
+def refresh_related_event_search_vectors(
+    sender: type[Organization] | type[EventSeries],
+    instance: Organization | EventSeries,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: t.Any,
+) -> None:
+    """Queue a refresh of every event whose document embeds this organization's or series' text.
+
+    Background rather than inline: an organization can have thousands of events.
+    """
+    if created or (update_fields is not None and not event_search.RELATED_DOCUMENT_FIELDS & update_fields):
+        return
+    scope = {"organization_id" if sender is Organization else "event_series_id": str(instance.pk)}
+    transaction.on_commit(lambda: refresh_event_search_vectors.delay(**scope))
+
+
 @receiver(post_save, sender=Organization)
 def handle_organization_creation(
     sender: type[Organization], instance: Organization, created: bool, **kwargs: t.Any
@@ -146,8 +195,7 @@ def handle_event_rsvp_save(sender: type[EventRSVP], instance: EventRSVP, created
     we automatically unclaim all potluck items they had previously claimed, since they
     are no longer confirmed to attend.
     """
-    event_id = str(instance.event_id)
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(event_id))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
 
     if instance.status in [EventRSVP.RsvpStatus.NO, EventRSVP.RsvpStatus.MAYBE]:
         unclaim_user_potluck_items(instance.event_id, instance.user_id)
@@ -159,8 +207,7 @@ def handle_event_rsvp_delete(sender: type[EventRSVP], instance: EventRSVP, **kwa
 
     When a user deletes their RSVP entirely, we unclaim all potluck items they had claimed.
     """
-    event_id = str(instance.event_id)
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(event_id))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
     # Unclaim items when RSVP is deleted entirely
     unclaim_user_potluck_items(instance.event_id, instance.user_id)
 
@@ -179,8 +226,7 @@ def handle_ticket_visibility_and_potluck(
     - notifications.signals.ticket.handle_ticket_notifications: Sends notifications
     - notifications.signals.waitlist.handle_ticket_waitlist_logic: Manages waitlist removal
     """
-    event_id = str(instance.event_id)
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(event_id))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
 
     if instance.status == Ticket.TicketStatus.CANCELLED:
         unclaim_user_potluck_items(instance.event_id, instance.user_id)
@@ -192,17 +238,117 @@ def handle_ticket_delete(sender: type[Ticket], instance: Ticket, **kwargs: t.Any
 
     When a user's ticket is deleted entirely, we unclaim all potluck items they had claimed.
     """
-    event_id = str(instance.event_id)
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(event_id))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
     # Unclaim items when ticket is deleted
     unclaim_user_potluck_items(instance.event_id, instance.user_id)
 
 
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def sync_seat_index_on_ticket_change(sender: type[Ticket], instance: Ticket, **kwargs: t.Any) -> None:
+    """Patch the event's cached seat index when a seated ticket is saved or deleted.
+
+    A receiver rather than call sites: tickets are cancelled from half a dozen services
+    (refunds, webhooks, cancellation, series passes). ``bulk_create`` and queryset
+    ``update()`` bypass it — those writers call ``seat_index`` themselves.
+    """
+    if instance.seat_id is None:
+        return
+    if kwargs.get("signal") is post_delete or instance.status == Ticket.TicketStatus.CANCELLED:
+        seat_index.record_freed(instance.event_id, [instance.seat_id])
+    else:
+        seat_index.record_sold(instance.event_id, [instance.seat_id])
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def sync_capacity_ledger_on_ticket_change(sender: type[Ticket], instance: Ticket, **kwargs: t.Any) -> None:
+    """Move the event's committed-ticket counter when a ticket enters or leaves CANCELLED.
+
+    Same receiver-over-call-sites reasoning as the seat index above; runs inside the
+    writer's transaction, so the counter commits or rolls back with the ticket.
+    """
+    capacity_ledger.sync_ticket(
+        instance,
+        created=kwargs.get("created", False),
+        deleted=kwargs.get("signal") is post_delete,
+        update_fields=kwargs.get("update_fields"),
+    )
+
+
+@receiver(post_save, sender=Ticket)
+def prewarm_ticket_files_on_activation(sender: type[Ticket], instance: Ticket, **kwargs: t.Any) -> None:
+    """Have an active ticket's files generated in the background before its holder downloads them.
+
+    Fires on every save of an active ticket, not just the transition: edits such as a
+    guest-name change also stale the files. The task skips fresh caches and coalesces
+    per event.
+    """
+    if instance.status == Ticket.TicketStatus.ACTIVE:
+        enqueue_ticket_file_prewarm(instance.event_id)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=TicketTier)
+@receiver(post_delete, sender=TicketTier)
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+@receiver(post_save, sender=EventRSVP)
+@receiver(post_delete, sender=EventRSVP)
+@receiver(post_save, sender=EventWaitList)
+@receiver(post_delete, sender=EventWaitList)
+@receiver(post_save, sender=WaitlistOffer)
+@receiver(post_delete, sender=WaitlistOffer)
+def bump_event_eligibility(sender: type[t.Any], instance: t.Any, **kwargs: t.Any) -> None:
+    """Writes that can change any user's eligibility for the event (capacity, offers, tiers, config).
+
+    Receivers rather than call sites, as with the capacity ledger; ``bulk_create`` and
+    queryset ``update()`` writers ride the cache's short TTL.
+    """
+    eligibility_cache.bump_event(instance.pk if sender is Event else instance.event_id)
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_save, sender=OrganizationQuestionnaire)
+@receiver(post_delete, sender=OrganizationQuestionnaire)
+def bump_organization_eligibility(sender: type[t.Any], instance: t.Any, **kwargs: t.Any) -> None:
+    """Organization settings and required questionnaires feed every event's eligibility."""
+    eligibility_cache.bump_organization(instance.pk if sender is Organization else instance.organization_id)
+
+
+@receiver(post_save, sender=RevelUser)
+@receiver(post_save, sender=EventInvitation)
+@receiver(post_delete, sender=EventInvitation)
+@receiver(post_save, sender=EventInvitationRequest)
+@receiver(post_delete, sender=EventInvitationRequest)
+@receiver(post_save, sender=OrganizationMember)
+@receiver(post_delete, sender=OrganizationMember)
+@receiver(post_save, sender=OrganizationStaff)
+@receiver(post_delete, sender=OrganizationStaff)
+@receiver(post_save, sender=Blacklist)
+@receiver(post_delete, sender=Blacklist)
+@receiver(post_save, sender=WhitelistRequest)
+@receiver(post_delete, sender=WhitelistRequest)
+@receiver(post_save, sender=QuestionnaireSubmission)
+@receiver(post_delete, sender=QuestionnaireSubmission)
+@receiver(post_save, sender=QuestionnaireEvaluation)
+def bump_user_eligibility(sender: type[t.Any], instance: t.Any, **kwargs: t.Any) -> None:
+    """Writes that change one user's eligibility: access, membership, bans, questionnaires, profile."""
+    if sender is RevelUser:
+        user_id = instance.pk
+    elif sender is QuestionnaireEvaluation:
+        user_id = instance.submission.user_id
+    else:
+        user_id = instance.user_id
+    if user_id is not None:
+        eligibility_cache.bump_user(user_id)
+
+
 @receiver(post_delete, sender=EventInvitation)
 def handle_invitation_delete(sender: type[EventInvitation], instance: EventInvitation, **kwargs: t.Any) -> None:
     """Trigger visibility task after invitation is deleted."""
-    event_id = str(instance.event_id)
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(event_id))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
 
 
 @receiver(post_save, sender=GeneralUserPreferences)
@@ -472,29 +618,29 @@ def handle_event_opened_notify_followers(sender: type[Event], instance: Event, c
         event_series = instance.event_series
         event_location = _get_event_location_string(instance)
 
-        for user, notification_type in get_followers_for_new_event_notification(organization, event_series):
-            context: dict[str, t.Any] = {
-                "organization_id": str(organization.id),
-                "organization_name": organization.name,
-                "event_id": str(instance.id),
-                "event_name": instance.name,
-                "event_description": instance.description or "",
-                "event_start": instance.start.isoformat() if instance.start else "",
-                "event_start_formatted": format_event_datetime(instance.start, instance),
-                "event_location": event_location,
-                "event_url": f"{frontend_base_url}/events/{instance.id}",
+        context: dict[str, t.Any] = {
+            "organization_id": str(organization.id),
+            "organization_name": organization.name,
+            "event_id": str(instance.id),
+            "event_name": instance.name,
+            "event_description": instance.description or "",
+            "event_start": instance.start.isoformat() if instance.start else "",
+            "event_start_formatted": format_event_datetime(instance.start, instance),
+            "event_location": event_location,
+            "event_url": f"{frontend_base_url}/events/{instance.id}",
+        }
+        type_contexts = {NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG: context}
+        if event_series:
+            type_contexts[NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES] = {
+                **context,
+                "event_series_id": str(event_series.id),
+                "event_series_name": event_series.name,
             }
 
-            if notification_type == NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES and event_series:
-                context["event_series_id"] = str(event_series.id)
-                context["event_series_name"] = event_series.name
-
-            notification_requested.send(
-                sender=sender,
-                user=user,
-                notification_type=notification_type,
-                context=context,
-            )
+        # The audience is one SQL statement, streamed as id chunks into notify_many.
+        for by_type in iter_new_event_follower_chunks(organization, event_series):
+            for notification_type, user_ids in by_type.items():
+                notify_many(notification_type, user_ids, type_contexts[notification_type])
 
         logger.info(
             "follower_notifications_sent_for_event",
@@ -712,7 +858,6 @@ def handle_waitlist_entry_deleted(sender: type[EventWaitList], instance: EventWa
     AFTER claim flips status) and EXPIRED offers (leave_waitlist flips status BEFORE
     delete) are not touched.
     """
-    from events.models import WaitlistOffer
     from events.service.waitlist_service import enqueue_waitlist_processing
 
     # Use a conditional UPDATE so a concurrent claim/expire flip cannot be
@@ -1,7 +1,7 @@
 """Celery tasks for event management.
 
 This package groups the event app's asynchronous tasks by domain
-(attendees, payments, invoicing, recurrence, subscriptions, waitlist,
+(attendees, capacity, payments, invoicing, recurrence, subscriptions, waitlist,
 exports, organization). Every task is re-exported here so the historical
 ``from events.tasks import <task>`` import path keeps working.
 """
@@ -9,9 +9,13 @@ exports, organization). Every task is re-exported here so the historical
 from events.tasks.announcements import resend_announcements_to_new_signups, send_scheduled_announcements
 from events.tasks.attendees import (
     build_attendee_visibility_flags,
+    enqueue_attendee_visibility_update,
+    repair_attendee_visibility_flags,
     send_guest_rsvp_confirmation,
     send_guest_ticket_confirmation,
+    update_attendee_visibility_flags,
 )
+from events.tasks.capacity import reconcile_capacity_ledgers
 from events.tasks.exports import generate_attendee_export_task, generate_questionnaire_export_task
 from events.tasks.invoicing import (
     calculate_referral_payouts,
@@ -40,9 +44,11 @@ from events.tasks.refunds import (
     send_event_refund_summary_task,
 )
 from events.tasks.revenue import generate_revenue_report_task, send_scheduled_revenue_reports_task
+from events.tasks.search import fill_missing_event_search_vectors, refresh_event_search_vectors
 from events.tasks.seating import cleanup_expired_seat_holds
 from events.tasks.series_pass import materialize_series_pass_holders
 from events.tasks.stripe_webhooks import prune_stripe_webhook_events
+from events.tasks.ticket_files import enqueue_ticket_file_prewarm, prewarm_ticket_files
 from events.tasks.subscriptions import (
     expire_subscriptions_past_grace,
     migrate_plan_subscribers,
@@ -55,6 +61,7 @@ from events.tasks.waitlist import (
     nudge_open_waitlists_task,
     process_waitlist_for_event_task,
     send_waitlist_offer_notification_task,
+    send_waitlist_offer_notifications_task,
 )
 
 __all__ = [
@@ -65,8 +72,11 @@ __all__ = [
     "cleanup_ticket_file_cache",
     "deliver_attendee_credit_note_task",
     "deliver_attendee_invoice_task",
+    "enqueue_attendee_visibility_update",
+    "enqueue_ticket_file_prewarm",
     "expire_subscriptions_past_grace",
     "expire_waitlist_offers_task",
+    "fill_missing_event_search_vectors",
     "generate_attendee_credit_note_task",
     "generate_attendee_export_task",
     "generate_attendee_invoice_task",
@@ -80,12 +90,16 @@ __all__ = [
     "notify_admin_new_organization_discord",
     "notify_admin_new_organization_pushover",
     "nudge_open_waitlists_task",
+    "prewarm_ticket_files",
     "process_waitlist_for_event_task",
     "prune_stripe_webhook_events",
+    "reconcile_capacity_ledgers",
     "reconcile_stripe_subscriptions",
     "redispatch_undelivered_invoices_task",
+    "refresh_event_search_vectors",
     "refund_cancelled_event_tickets",
     "refund_one_cancelled_event_ticket",
+    "repair_attendee_visibility_flags",
     "resend_announcements_to_new_signups",
     "reset_demo_data",
     "resync_org_subscription_fees",
@@ -101,4 +115,6 @@ __all__ = [
     "send_scheduled_revenue_reports_task",
     "send_subscription_renewal_reminders",
     "send_waitlist_offer_notification_task",
+    "send_waitlist_offer_notifications_task",
+    "update_attendee_visibility_flags",
 ]
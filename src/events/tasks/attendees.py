@@ -1,12 +1,17 @@
 """Celery tasks for attendee visibility flags and guest confirmation emails."""
 
 import hashlib
+import typing as t
+from uuid import UUID
 
 import structlog
 from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
 from django.db import connection, transaction
 from django.db.models import Q
 from django.template.loader import render_to_string
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from accounts.models import RevelUser
@@ -28,20 +33,12 @@ def visibility_rebuild_lock_key(event_id: str) -> int:
     return int.from_bytes(digest[:8], byteorder="big", signed=True)
 
 
-@shared_task(name="events.tasks.build_attendee_visibility_flags")
-def build_attendee_visibility_flags(event_id: str) -> None:
-    """A task that builds flags for attendee visibility events.
-
-    Optimized to use batch visibility resolution with prefetched data
-    to avoid N+1 queries. Uses VisibilityContext for O(1) lookups.
-    """
-    from events.service.user_preferences_service import VisibilityContext, resolve_visibility_fast
-
+def _refresh_attendee_count(event_id: str) -> None:
     # Update attendee count atomically with a lock to prevent race conditions.
     # Multiple tasks may run concurrently when tickets are confirmed rapidly;
     # this ensures the count is read and written while holding the lock.
     with transaction.atomic():
-        event = Event.objects.with_organization().select_for_update().get(pk=event_id)
+        event = Event.objects.select_for_update().get(pk=event_id)
         ticket_count = Ticket.objects.filter(
             event=event,
             status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.CHECKED_IN],
@@ -50,6 +47,23 @@ def build_attendee_visibility_flags(event_id: str) -> None:
         event.attendee_count = ticket_count + rsvp_count
         event.save(update_fields=["attendee_count"])
 
+
+def refresh_attendee_visibility_flags(event_id: str, user_ids: t.Collection[UUID] | None = None) -> None:
+    """Rewrite an event's viewer×target visibility matrix, whole or in part.
+
+    A flag ``(viewer, target)`` depends only on facts about the viewer (owner/staff,
+    invited or attending, org member) and about the target (preferences, org member).
+    So when ``user_ids`` changed, only their rows (as viewer) and columns (as target)
+    can differ: those are recomputed and upserted, and the row/column of a user who
+    is no longer a viewer/attendee is dropped. ``None`` — or a delta large enough that
+    the full matrix is cheaper — deletes and rebuilds everything.
+
+    Events resolved at query time (``events.service.attendee_visibility``) keep no
+    matrix: whatever is left from before they crossed the threshold is dropped.
+    """
+    from events.service.attendee_visibility import uses_lazy_visibility
+    from events.service.user_preferences_service import VisibilityContext, resolve_visibility_fast
+
     with transaction.atomic():
         # Serialize concurrent rebuilds of the same event's matrix. Every confirmed
         # ticket/RSVP dispatches this task, so a checkout rush runs several rebuilds
@@ -67,6 +81,9 @@ def build_attendee_visibility_flags(event_id: str) -> None:
 
         # Re-fetch event without a row lock for visibility flag building (read-only)
         event = Event.objects.with_organization().get(pk=event_id)
+        if uses_lazy_visibility(event):
+            AttendeeVisibilityFlag.objects.filter(event=event).delete()
+            return
 
         organization = event.organization
         owner_id = organization.owner_id
@@ -87,30 +104,167 @@ def build_attendee_visibility_flags(event_id: str) -> None:
         # Users invited or attending = potential viewers
         viewers = list(RevelUser.objects.filter(Q(invitations__event=event) | attendees_q).distinct())
 
-        flags = []
+        # A delta of k users touches k * (viewers + attendees) pairs; past the size of
+        # the whole matrix, rebuilding it outright is cheaper.
+        full = user_ids is None or len(user_ids) * (len(viewers) + len(attendees)) >= len(viewers) * len(attendees)
+        # A delta has nothing to patch when the matrix was dropped while the event was lazy.
+        full = full or not AttendeeVisibilityFlag.objects.filter(event=event).exists()
+        if full:
+            row_viewers, column_targets = viewers, attendees
+            AttendeeVisibilityFlag.objects.filter(event=event).delete()
+        else:
+            changed = set(user_ids or ())
+            row_viewers = [viewer for viewer in viewers if viewer.id in changed]
+            column_targets = [target for target in attendees if target.id in changed]
+            gone_viewers = changed - {viewer.id for viewer in viewers}
+            gone_targets = changed - {target.id for target in attendees}
+            if gone_viewers or gone_targets:
+                AttendeeVisibilityFlag.objects.filter(event=event).filter(
+                    Q(user_id__in=gone_viewers) | Q(target_id__in=gone_targets)
+                ).delete()
 
-        AttendeeVisibilityFlag.objects.filter(event=event).delete()
-        for viewer in viewers:
+        # Keyed by pair: a changed user who is both viewer and attendee appears in its
+        # own row and column, and bulk upsert rejects duplicate conflict keys.
+        flags: dict[tuple[UUID, UUID], AttendeeVisibilityFlag] = {}
+        for viewer in row_viewers:
             for target in attendees:
                 # O(1) visibility check using prefetched context
-                visible = resolve_visibility_fast(viewer, target, context)
-                flags.append(
-                    AttendeeVisibilityFlag(
+                flags[viewer.id, target.id] = AttendeeVisibilityFlag(
+                    user=viewer, target=target, event=event, is_visible=resolve_visibility_fast(viewer, target, context)
+                )
+        if not full:
+            for target in column_targets:
+                for viewer in viewers:
+                    flags[viewer.id, target.id] = AttendeeVisibilityFlag(
                         user=viewer,
                         target=target,
                         event=event,
-                        is_visible=visible,
+                        is_visible=resolve_visibility_fast(viewer, target, context),
                     )
-                )
 
         AttendeeVisibilityFlag.objects.bulk_create(
-            flags,
+            list(flags.values()),
             update_conflicts=True,
             update_fields=["is_visible"],
             unique_fields=["user", "event", "target"],
         )
 
 
+@shared_task(name="events.tasks.build_attendee_visibility_flags")
+def build_attendee_visibility_flags(event_id: str) -> None:
+    """A task that builds flags for attendee visibility events.
+
+    Rebuilds the whole matrix. Ticket/RSVP/invitation writes go through
+    :func:`enqueue_attendee_visibility_update` instead; this full pass is the
+    fallback when the pending delta is lost, and the periodic repair
+    (:func:`repair_attendee_visibility_flags`).
+    """
+    _refresh_attendee_count(event_id)
+    refresh_attendee_visibility_flags(event_id)
+
+
+# Per-event delta queue, kept in the shared cache: a sequence counter, one
+# ``dirty:<n>`` entry (a list of user ids) per enqueue, the last sequence number a
+# delta run applied, and a marker that one debounced run is already scheduled.
+PENDING_TTL_SECONDS = 24 * 60 * 60
+# Lets the scheduled marker expire (and the next write reschedule) if its run was lost.
+SCHEDULED_GRACE_SECONDS = 60
+# Past this many unapplied entries the delta is not worth reading back.
+MAX_PENDING_ENTRIES = 500
+
+
+def _pending_key(event_id: str, suffix: str) -> str:
+    return f"attendee_visibility:{event_id}:{suffix}"
+
+
+def enqueue_attendee_visibility_update(event_id: UUID | str, user_ids: t.Iterable[UUID]) -> None:
+    """Record that ``user_ids`` joined, left or changed for an event, after commit.
+
+    Writes within ``ATTENDEE_VISIBILITY_DEBOUNCE_SECONDS`` of each other coalesce
+    into one :func:`update_attendee_visibility_flags` run, which applies all of
+    their rows and columns at once; the event's cached visibility context is
+    dropped right away. Cache errors fail open to a full rebuild.
+    """
+    event_id = str(event_id)
+    ids = [str(user_id) for user_id in user_ids]
+    debounce = settings.ATTENDEE_VISIBILITY_DEBOUNCE_SECONDS
+
+    def _enqueue() -> None:
+        from events.service.attendee_visibility import invalidate_visibility_context
+
+        invalidate_visibility_context(event_id)
+        try:
+            cache.add(_pending_key(event_id, "seq"), 0, timeout=PENDING_TTL_SECONDS)
+            seq = cache.incr(_pending_key(event_id, "seq"))
+            cache.set(_pending_key(event_id, f"dirty:{seq}"), ids, timeout=PENDING_TTL_SECONDS)
+            scheduled = not cache.add(
+                _pending_key(event_id, "scheduled"), 1, timeout=debounce + SCHEDULED_GRACE_SECONDS
+            )
+        except Exception:
+            logger.warning("attendee_visibility_enqueue_failed", event_id=event_id, exc_info=True)
+            build_attendee_visibility_flags.delay(event_id)
+            return
+        if not scheduled:
+            update_attendee_visibility_flags.apply_async((event_id,), countdown=debounce)
+
+    transaction.on_commit(_enqueue)
+
+
+@shared_task(name="events.tasks.update_attendee_visibility_flags")
+def update_attendee_visibility_flags(event_id: str) -> None:
+    """Apply every visibility change enqueued for an event since the last run.
+
+    Falls back to the full rebuild when the queue can't be read back completely
+    (an entry expired or was evicted, or the cache is down).
+    """
+    _refresh_attendee_count(event_id)
+    try:
+        # Clear the marker before reading: a write landing after this point
+        # schedules its own run instead of being folded into one that missed it.
+        cache.delete(_pending_key(event_id, "scheduled"))
+        seq = cache.get(_pending_key(event_id, "seq"))
+        done = cache.get(_pending_key(event_id, "done"), 0)
+        keys = [_pending_key(event_id, f"dirty:{n}") for n in range(done + 1, (seq or 0) + 1)]
+        entries = cache.get_many(keys) if seq is not None and len(keys) <= MAX_PENDING_ENTRIES else {}
+    except Exception:
+        logger.warning("attendee_visibility_queue_read_failed", event_id=event_id, exc_info=True)
+        seq, keys, entries = None, [], {}
+
+    # ``done`` past ``seq`` means the counter expired and restarted: entries were lost.
+    if seq is not None and done <= seq and len(entries) == len(keys):
+        if not keys:
+            return
+        refresh_attendee_visibility_flags(event_id, {UUID(user_id) for ids in entries.values() for user_id in ids})
+    else:
+        logger.info("attendee_visibility_delta_incomplete", event_id=event_id)
+        refresh_attendee_visibility_flags(event_id)
+
+    if seq is None:
+        return
+    try:
+        cache.set(_pending_key(event_id, "done"), seq, timeout=PENDING_TTL_SECONDS)
+        cache.delete_many(keys)
+    except Exception:
+        logger.warning("attendee_visibility_queue_ack_failed", event_id=event_id, exc_info=True)
+
+
+@shared_task(name="events.tasks.repair_attendee_visibility_flags")
+def repair_attendee_visibility_flags() -> int:
+    """Periodically rebuild the full matrix of every event that hasn't ended.
+
+    Catches what the per-user deltas don't see: staff and membership changes, and
+    writes made behind the ORM's back.
+
+    Returns:
+        Number of rebuilds dispatched.
+    """
+    event_ids = list(Event.objects.filter(end__gte=timezone.now(), attendee_count__gt=0).values_list("id", flat=True))
+    for event_id in event_ids:
+        build_attendee_visibility_flags.delay(str(event_id))
+    logger.info("attendee_visibility_repair_dispatched", count=len(event_ids))
+    return len(event_ids)
+
+
 @shared_task(name="events.tasks.send_guest_rsvp_confirmation")
 def send_guest_rsvp_confirmation(email: str, token: str, event_name: str) -> None:
     """Send RSVP confirmation email to guest user.
@@ -0,0 +1,20 @@
+"""Capacity-ledger hygiene: the ticket table is the truth, the ledger a cached count."""
+
+import typing as t
+
+from celery import shared_task
+
+if t.TYPE_CHECKING:
+    from events.service.capacity_ledger import ReconcileCounters
+
+
+@shared_task(name="events.reconcile_capacity_ledgers")
+def reconcile_capacity_ledgers() -> "ReconcileCounters":
+    """Repair live events whose committed-ticket counter drifted from the ticket count.
+
+    Runs hourly via Celery beat (see migration 0118). Each repair logs
+    ``capacity_ledger_drift`` at error level.
+    """
+    from events.service import capacity_ledger
+
+    return capacity_ledger.reconcile()
@@ -9,8 +9,9 @@ from django.utils import timezone
 from events.exceptions import NothingToRefundError, RefundInsufficientBalanceError, StripeRefundFailed
 from events.models import Event, Payment, Refund, Ticket, TicketTier
 from events.models.ticket import CancellationSource
-from events.service import refund_service
-from events.tasks.attendees import build_attendee_visibility_flags
+from events.service import capacity_ledger, refund_service
+from events.service.seating import seat_index
+from events.tasks.attendees import enqueue_attendee_visibility_update
 from notifications.signals.payment import send_event_refund_summary
 
 logger = structlog.get_logger(__name__)
@@ -78,7 +79,7 @@ def refund_one_cancelled_event_ticket(ticket_id: str, initiated_by_id: str | Non
     potluck is moot), but ``Event.attendee_count``/``is_full`` recompute is NOT optional
     — it's the only path that keeps those fields from freezing at their
     pre-cancellation value once the un-cancel guard makes the event unrecoverable — so
-    ``build_attendee_visibility_flags`` is dispatched explicitly below, once the cancel
+    the attendee's visibility update is enqueued explicitly below, once the cancel
     transaction commits. It also deliberately skips
     ``notifications.signals.waitlist.handle_ticket_waitlist_logic``: the event is
     cancelled, so there is nothing left to reprocess on the waitlist.
@@ -131,6 +132,7 @@ def refund_one_cancelled_event_ticket(ticket_id: str, initiated_by_id: str | Non
         TicketTier.objects.filter(pk=locked_ticket.tier_id, quantity_sold__gt=0).update(
             quantity_sold=F("quantity_sold") - 1
         )
+        capacity_ledger.record_released([locked_ticket])
         Ticket.objects.filter(pk=locked_ticket.pk).update(
             status=Ticket.TicketStatus.CANCELLED,
             cancelled_at=timezone.now(),
@@ -142,8 +144,9 @@ def refund_one_cancelled_event_ticket(ticket_id: str, initiated_by_id: str | Non
         # attendee_count/is_full recompute (events.signals
         # .handle_ticket_visibility_and_potluck) never ran — replicate it explicitly,
         # same per-ticket dispatch cost as the signal, and idempotent either way.
-        event_id = str(locked_ticket.event_id)
-        transaction.on_commit(lambda: build_attendee_visibility_flags.delay(event_id))
+        enqueue_attendee_visibility_update(locked_ticket.event_id, [locked_ticket.user_id])
+        if locked_ticket.seat_id is not None:
+            seat_index.record_freed(locked_ticket.event_id, [locked_ticket.seat_id])
 
 
 @shared_task(name="events.send_event_refund_summary")
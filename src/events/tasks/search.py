@@ -0,0 +1,70 @@
+"""Event discovery search documents: refreshes fanned out from related writes, and the NULL sweep."""
+
+import typing as t
+
+import structlog
+from celery import shared_task
+
+logger = structlog.get_logger(__name__)
+
+# Events recomputed per UPDATE; keeps each statement (and its row locks) short.
+SEARCH_VECTOR_CHUNK_SIZE = 1000
+
+
+def _update_in_chunks(events: t.Any) -> int:
+    from events.service import event_search
+
+    updated = 0
+    cursor = None
+    while True:
+        page = events.filter(pk__gt=cursor) if cursor else events
+        ids = list(page.order_by("pk").values_list("pk", flat=True)[:SEARCH_VECTOR_CHUNK_SIZE])
+        if not ids:
+            return updated
+        updated += event_search.update_search_vectors(events.model.objects.filter(pk__in=ids))
+        cursor = ids[-1]
+
+
+@shared_task(name="events.tasks.refresh_event_search_vectors")
+def refresh_event_search_vectors(organization_id: str | None = None, event_series_id: str | None = None) -> int:
+    """Recompute the search documents of an organization's or a series' events.
+
+    Queued by ``events.signals`` after an organization or series is saved: their
+    names and descriptions are part of every one of their events' documents.
+
+    Returns:
+        The number of events updated.
+    """
+    from events.models import Event
+
+    events = Event.objects.all()
+    if organization_id:
+        events = events.filter(organization_id=organization_id)
+    if event_series_id:
+        events = events.filter(event_series_id=event_series_id)
+    updated = _update_in_chunks(events)
+    logger.info(
+        "event_search_vectors_refreshed",
+        organization_id=organization_id,
+        event_series_id=event_series_id,
+        updated=updated,
+    )
+    return updated
+
+
+@shared_task(name="events.tasks.fill_missing_event_search_vectors")
+def fill_missing_event_search_vectors() -> int:
+    """Compute the search document of every event that has none yet.
+
+    Runs every 5 minutes via Celery beat (see migration 0121): catches events written
+    by ``bulk_create`` (no signals) and backfills events that predate the column.
+
+    Returns:
+        The number of events updated.
+    """
+    from events.models import Event
+
+    updated = _update_in_chunks(Event.objects.filter(search_vector__isnull=True))
+    if updated:
+        logger.info("event_search_vectors_filled", updated=updated)
+    return updated
@@ -0,0 +1,90 @@
+"""Background pre-generation of ticket PDF and Apple Wallet files.
+
+Right after an on-sale, buyers download their tickets at once; without this every
+download renders synchronously in a web worker. Ticket activation enqueues a
+per-event run of :func:`prewarm_ticket_files`, so the files are usually cached by
+the time anyone asks. The download paths still render on a miss.
+"""
+
+from uuid import UUID
+
+import structlog
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from events.service import ticket_file_service
+
+logger = structlog.get_logger(__name__)
+
+# Lets the scheduled marker expire (and the next activation reschedule) if its run was lost.
+SCHEDULED_GRACE_SECONDS = 60
+
+
+def _scheduled_key(event_id: str) -> str:
+    return f"ticket_file_prewarm:{event_id}:scheduled"
+
+
+def _schedule(event_id: str, *, after: str | None = None) -> None:
+    """Schedule one debounced run for the event unless one is already pending."""
+    debounce = settings.TICKET_FILE_PREWARM_DEBOUNCE_SECONDS
+    try:
+        scheduled = not cache.add(_scheduled_key(event_id), 1, timeout=debounce + SCHEDULED_GRACE_SECONDS)
+    except Exception:
+        # Pre-generation is an optimization: downloads still render on a miss.
+        logger.warning("ticket_file_prewarm_schedule_failed", event_id=event_id, exc_info=True)
+        return
+    if not scheduled:
+        args = (event_id,) if after is None else (event_id, after)
+        prewarm_ticket_files.apply_async(args, countdown=debounce)
+
+
+def enqueue_ticket_file_prewarm(event_id: UUID | str) -> None:
+    """Pre-generate the event's ticket files after commit, coalescing with other activations.
+
+    Activations within ``TICKET_FILE_PREWARM_DEBOUNCE_SECONDS`` of each other share
+    one :func:`prewarm_ticket_files` run.
+    """
+    event_id = str(event_id)
+    transaction.on_commit(lambda: _schedule(event_id))
+
+
+@shared_task(name="events.tasks.prewarm_ticket_files")
+def prewarm_ticket_files(event_id: str, after: str | None = None) -> int:
+    """Generate missing or stale files for an event's active tickets, one bounded batch per run.
+
+    While more remain, the run reschedules itself one debounce later, so each event
+    costs at most ``TICKET_FILE_PREWARM_BATCH_SIZE`` renders per
+    ``TICKET_FILE_PREWARM_DEBOUNCE_SECONDS``. Staleness is the download paths' content
+    hash, so tickets whose files are already cached and fresh are skipped.
+
+    The continuation resumes ``after`` the last ticket of this batch, so a ticket that
+    keeps failing is tried once per chain instead of heading every batch; a batch that
+    renders nothing ends the chain. Either way, downloads still render on a miss.
+
+    Returns:
+        Number of tickets whose files were generated.
+    """
+    try:
+        # Clear the marker before reading: an activation landing after this point
+        # schedules its own run instead of being folded into one that missed it.
+        cache.delete(_scheduled_key(event_id))
+    except Exception:
+        logger.warning("ticket_file_prewarm_marker_clear_failed", event_id=event_id, exc_info=True)
+
+    batch_size = settings.TICKET_FILE_PREWARM_BATCH_SIZE
+    include_pkpass = ticket_file_service.wallet_passes_enabled()
+    stale = ticket_file_service.stale_ticket_ids(
+        event_id, limit=batch_size + 1, include_pkpass=include_pkpass, after=after
+    )
+    batch = stale[:batch_size]
+    rendered = ticket_file_service.render_tickets(batch, include_pkpass=include_pkpass)
+    more = len(stale) > batch_size and rendered > 0
+    if more:
+        _schedule(event_id, after=str(batch[-1]))
+
+    logger.info(
+        "ticket_file_prewarm_done", event_id=event_id, rendered=rendered, skipped=len(batch) - rendered, more=more
+    )
+    return rendered
@@ -71,15 +71,47 @@ def nudge_open_waitlists_task() -> dict[str, t.Any]:
     return {"events_nudged": len(event_ids)}
 
 
+def _offer_event_context(event: t.Any, frontend_base_url: str) -> dict[str, t.Any]:
+    """The WAITLIST_SPOT_AVAILABLE context keys shared by every offer for an event."""
+    from events.utils import format_event_datetime, get_event_timezone
+
+    start_local = event.start.astimezone(get_event_timezone(event)) if event.start else None
+    return {
+        "event_id": str(event.id),
+        "event_name": event.name,
+        "event_start": start_local.isoformat() if start_local else "",
+        "event_start_formatted": format_event_datetime(event.start, event),
+        "event_url": f"{frontend_base_url}/events/{event.slug}",
+        "organization_id": str(event.organization_id),
+        "organization_name": event.organization.name,
+    }
+
+
+def _offer_context(offer: t.Any) -> dict[str, t.Any]:
+    """The WAITLIST_SPOT_AVAILABLE context keys specific to one offer."""
+    from django.contrib.humanize.templatetags.humanize import naturaltime
+
+    from events.utils import format_event_datetime, get_event_timezone
+
+    return {
+        "offer_id": str(offer.id),
+        "expires_at": offer.expires_at.astimezone(get_event_timezone(offer.event)).isoformat(),
+        "expires_at_formatted": format_event_datetime(offer.expires_at, offer.event),
+        "time_remaining_formatted": str(naturaltime(offer.expires_at)),
+        "is_cutoff_batch": offer.is_cutoff_batch,
+    }
+
+
 @shared_task(name="events.send_waitlist_offer_notification")
 def send_waitlist_offer_notification_task(offer_id: str) -> dict[str, t.Any]:
-    """Dispatch WAITLIST_SPOT_AVAILABLE for a single offer. Transactional class (mirrors TICKET_CREATED)."""
-    from uuid import UUID as _UUID
+    """Dispatch WAITLIST_SPOT_AVAILABLE for a single offer. Transactional class (mirrors TICKET_CREATED).
 
-    from django.contrib.humanize.templatetags.humanize import naturaltime
+    Used for offers an admin issues or re-sends by hand; offer batches go through
+    ``send_waitlist_offer_notifications_task``.
+    """
+    from uuid import UUID as _UUID
 
     from events.models import WaitlistOffer
-    from events.utils import format_event_datetime, get_event_timezone
     from notifications.enums import NotificationType
     from notifications.signals import notification_requested
 
@@ -99,23 +131,9 @@ def send_waitlist_offer_notification_task(offer_id: str) -> dict[str, t.Any]:
         return {"status": "skipped", "offer_id": offer_id}
 
     site_settings = SiteSettings.get_solo()
-    event_tz = get_event_timezone(offer.event)
-    expires_local = offer.expires_at.astimezone(event_tz)
-    start_local = offer.event.start.astimezone(event_tz) if offer.event.start else None
-
     context = {
-        "event_id": str(offer.event_id),
-        "event_name": offer.event.name,
-        "event_start": start_local.isoformat() if start_local else "",
-        "event_start_formatted": format_event_datetime(offer.event.start, offer.event),
-        "event_url": f"{site_settings.frontend_base_url}/events/{offer.event.slug}",
-        "organization_id": str(offer.event.organization_id),
-        "organization_name": offer.event.organization.name,
-        "offer_id": str(offer.id),
-        "expires_at": expires_local.isoformat(),
-        "expires_at_formatted": format_event_datetime(offer.expires_at, offer.event),
-        "time_remaining_formatted": str(naturaltime(offer.expires_at)),
-        "is_cutoff_batch": offer.is_cutoff_batch,
+        **_offer_event_context(offer.event, site_settings.frontend_base_url),
+        **_offer_context(offer),
     }
 
     notification_requested.send(
@@ -130,3 +148,46 @@ def send_waitlist_offer_notification_task(offer_id: str) -> dict[str, t.Any]:
 
     logger.info("send_waitlist_offer_notification_dispatched", offer_id=offer_id)
     return {"status": "sent", "offer_id": offer_id}
+
+
+@shared_task(name="events.send_waitlist_offer_notifications")
+def send_waitlist_offer_notifications_task(offer_ids: list[str]) -> dict[str, t.Any]:
+    """Dispatch WAITLIST_SPOT_AVAILABLE for a batch of offers through ``notify_many``.
+
+    Same skips as the single-offer task (missing, non-PENDING, already expired), but
+    one notification INSERT per event and one ``notified_at`` UPDATE for the batch.
+    """
+    from events.models import WaitlistOffer
+    from notifications.enums import NotificationType
+    from notifications.service.dispatcher import notify_many
+
+    now = timezone.now()
+    offers = list(
+        WaitlistOffer.objects.select_related("user", "event__organization").filter(
+            pk__in=[UUID(offer_id) for offer_id in offer_ids],
+            status=WaitlistOffer.WaitlistOfferStatus.PENDING,
+            expires_at__gt=now,
+        )
+    )
+    skipped = len(offer_ids) - len(offers)
+    if not offers:
+        logger.info("send_waitlist_offer_notifications_skipped", skipped=skipped)
+        return {"status": "skipped", "sent": 0, "skipped": skipped}
+
+    by_event: dict[UUID, list[t.Any]] = {}
+    for offer in offers:
+        by_event.setdefault(offer.event_id, []).append(offer)
+
+    frontend_base_url = SiteSettings.get_solo().frontend_base_url
+    for event_offers in by_event.values():
+        notify_many(
+            NotificationType.WAITLIST_SPOT_AVAILABLE,
+            [offer.user for offer in event_offers],
+            _offer_event_context(event_offers[0].event, frontend_base_url),
+            {offer.user_id: _offer_context(offer) for offer in event_offers},
+        )
+
+    WaitlistOffer.objects.filter(pk__in=[offer.pk for offer in offers]).update(notified_at=timezone.now())
+
+    logger.info("send_waitlist_offer_notifications_dispatched", sent=len(offers), skipped=skipped)
+    return {"status": "sent", "sent": len(offers), "skipped": skipped}
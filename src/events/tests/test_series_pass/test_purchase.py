@@ -194,6 +194,20 @@ class TestFreePathPurchase:
         expected_guest_name = revel_user.get_full_name() or revel_user.username
         assert all(ticket.guest_name == expected_guest_name for ticket in tickets)
 
+    @patch("events.service.series_pass_service.enqueue_ticket_file_prewarm")
+    def test_enqueues_ticket_file_prewarm_per_event(
+        self,
+        mock_prewarm: MagicMock,
+        purchasable_free_pass: SeriesPass,
+        revel_user: RevelUser,
+        future_events: list[Event],
+    ) -> None:
+        """bulk_create sends no post_save, so the pass's active tickets are prewarmed explicitly."""
+        SeriesPassPurchaseService(purchasable_free_pass, revel_user).purchase()
+
+        assert {call.args[0] for call in mock_prewarm.call_args_list} == {event.id for event in future_events}
+        assert mock_prewarm.call_count == len(future_events)
+
     def test_increments_tier_and_pass_quantity_sold(
         self, purchasable_free_pass: SeriesPass, revel_user: RevelUser, future_tiers: list[TicketTier]
     ) -> None:
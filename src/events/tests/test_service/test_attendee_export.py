@@ -6,10 +6,12 @@ Tests cover:
 - Attendees sheet rows for tickets and RSVPs
 - Empty attendees case
 - Error handling (fail_export on exception)
+- Streaming: chunked rows and generation metadata
 """
 
 import typing as t
 from io import BytesIO
+from unittest.mock import patch
 
 import pytest
 from django.utils import timezone
@@ -428,6 +430,66 @@ class TestAttendeeExportEmpty:
         assert rows[0][0] == "Name"
 
 
+# --- Streaming Tests ---
+
+
+class TestAttendeeExportStreaming:
+    """Tests for the chunked, streamed generation."""
+
+    def test_rows_span_chunks(
+        self,
+        export_user: RevelUser,
+        att_event: Event,
+        free_tier: TicketTier,
+        revel_user_factory: RevelUserFactory,
+    ) -> None:
+        """Every attendee is written when tickets and RSVPs span several fetch chunks."""
+        for i in range(5):
+            Ticket.objects.create(event=att_event, user=revel_user_factory(username=f"chunk_{i}"), tier=free_tier)
+        for i in range(3):
+            EventRSVP.objects.create(
+                event=att_event, user=revel_user_factory(username=f"chunk_rsvp_{i}"), status=EventRSVP.RsvpStatus.YES
+            )
+        export = _create_attendee_export(export_user, att_event)
+
+        with patch("events.service.export.attendee_export.STREAM_CHUNK_SIZE", 2):
+            generate_attendee_export(export.id)
+
+        wb = _load_workbook_from_export(export)
+        rows = list(wb["Attendees"].iter_rows(min_row=2, values_only=True))
+        assert [row[3] for row in rows] == ["Ticket"] * 5 + ["RSVP"] * 3
+        assert wb["Attendees"].auto_filter.ref == "A1:L9"
+
+    def test_user_with_ticket_and_rsvp_counted_once_in_pronouns(
+        self,
+        export_user: RevelUser,
+        att_event: Event,
+        active_ticket: Ticket,
+        ticket_user: RevelUser,
+    ) -> None:
+        """The pronoun distribution is over distinct attendees."""
+        EventRSVP.objects.create(event=att_event, user=ticket_user, status=EventRSVP.RsvpStatus.YES)
+        export = _create_attendee_export(export_user, att_event)
+
+        generate_attendee_export(export.id)
+
+        wb = _load_workbook_from_export(export)
+        summary = {row[0]: row[1] for row in wb["Summary"].iter_rows(values_only=True) if row[0]}
+        assert summary["Total attendees"] == 2
+        assert summary["Total with pronouns"] == 1
+        assert summary["  she/her"] == 1
+
+    def test_generation_metadata_recorded(self, export_user: RevelUser, att_event: Event) -> None:
+        """File size and peak RSS are stored on the export."""
+        export = _create_attendee_export(export_user, att_event)
+
+        generate_attendee_export(export.id)
+
+        export.refresh_from_db()
+        assert export.metadata["size_bytes"] == export.file.size
+        assert export.metadata["peak_rss_bytes"] > 0
+
+
 # --- Error Handling Tests ---
 
 
@@ -0,0 +1,121 @@
+"""Query-time attendee visibility (``ATTENDEE_VISIBILITY_MODE = "lazy"``)."""
+
+import typing as t
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import RevelUser
+from conftest import RevelUserFactory
+from events.models import (
+    AttendeeVisibilityFlag,
+    Event,
+    EventInvitation,
+    EventRSVP,
+    GeneralUserPreferences,
+    OrganizationMember,
+    Ticket,
+)
+from events.service import attendee_visibility
+from events.service.user_preferences_service import resolve_visibility_fast
+from events.tasks import build_attendee_visibility_flags
+
+pytestmark = pytest.mark.django_db
+
+Pref = GeneralUserPreferences.VisibilityPreference
+
+
+@pytest.fixture
+def lazy_mode(settings: t.Any) -> None:
+    settings.ATTENDEE_VISIBILITY_MODE = "lazy"
+    settings.ATTENDEE_VISIBILITY_LAZY_THRESHOLD = 0
+
+
+@pytest.fixture
+def crowd(event: Event, revel_user_factory: RevelUserFactory) -> tuple[list[RevelUser], list[RevelUser]]:
+    """Every preference × membership × attendance combination, plus invitees and outsiders."""
+    tier = event.ticket_tiers.first()
+    assert tier is not None
+    attendees = []
+    for i, pref in enumerate([Pref.ALWAYS, Pref.TO_MEMBERS, Pref.TO_INVITEES, Pref.TO_BOTH, Pref.NEVER] * 2):
+        user = revel_user_factory()
+        GeneralUserPreferences.objects.filter(user=user).update(show_me_on_attendee_list=pref)
+        if i % 2:
+            OrganizationMember.objects.create(organization=event.organization, user=user)
+        if i % 3:
+            Ticket.objects.create(
+                guest_name="Guest", event=event, user=user, tier=tier, status=Ticket.TicketStatus.ACTIVE
+            )
+        else:
+            EventRSVP.objects.create(event=event, user=user, status=EventRSVP.RsvpStatus.YES)
+        attendees.append(user)
+    invitee, member_outsider, outsider = revel_user_factory(), revel_user_factory(), revel_user_factory()
+    EventInvitation.objects.create(event=event, user=invitee)
+    OrganizationMember.objects.create(organization=event.organization, user=member_outsider)
+    viewers = [*attendees, invitee, member_outsider, outsider]
+    return attendees, viewers
+
+
+@pytest.mark.usefixtures("lazy_mode")
+def test_lazy_list_matches_resolve_visibility_fast(
+    event: Event, crowd: tuple[list[RevelUser], list[RevelUser]]
+) -> None:
+    attendees, viewers = crowd
+    event = Event.objects.with_organization().get(pk=event.pk)
+    context = attendee_visibility.get_visibility_context(event)
+    targets = list(RevelUser.objects.filter(pk__in=[a.pk for a in attendees]).select_related("general_preferences"))
+
+    for viewer in viewers[:-2]:
+        expected = {target.pk for target in targets if resolve_visibility_fast(viewer, target, context)}
+        assert set(attendee_visibility.visible_attendees(event, viewer).values_list("pk", flat=True)) == expected
+    # Neither invited nor attending: no row in the matrix, nobody in the list.
+    for outsider in viewers[-2:]:
+        assert not attendee_visibility.visible_attendees(event, outsider).exists()
+
+
+@pytest.mark.usefixtures("lazy_mode")
+def test_lazy_list_matches_the_materialized_matrix(
+    event: Event, crowd: tuple[list[RevelUser], list[RevelUser]], settings: t.Any
+) -> None:
+    _, viewers = crowd
+    event = Event.objects.with_organization().get(pk=event.pk)
+    lazy = {v.pk: set(attendee_visibility.visible_attendees(event, v).values_list("pk", flat=True)) for v in viewers}
+
+    settings.ATTENDEE_VISIBILITY_MODE = "materialized"
+    build_attendee_visibility_flags(str(event.pk))
+    event.refresh_from_db()
+    for viewer in viewers:
+        assert set(attendee_visibility.visible_attendees(event, viewer).values_list("pk", flat=True)) == lazy[viewer.pk]
+
+
+@pytest.mark.usefixtures("lazy_mode")
+def test_context_is_cached_until_invalidated(event: Event, crowd: tuple[list[RevelUser], list[RevelUser]]) -> None:
+    _, viewers = crowd
+    event = Event.objects.with_organization().get(pk=event.pk)
+    list(attendee_visibility.visible_attendees(event, viewers[0]))
+
+    with CaptureQueriesContext(connection) as ctx:
+        list(attendee_visibility.visible_attendees(event, viewers[0]))
+    assert len(ctx.captured_queries) == 1  # the page itself
+
+    attendee_visibility.invalidate_visibility_context(event.pk)
+    with CaptureQueriesContext(connection) as ctx:
+        list(attendee_visibility.visible_attendees(event, viewers[0]))
+    assert len(ctx.captured_queries) > 1
+
+
+def test_events_above_the_threshold_skip_materialization(
+    event: Event, crowd: tuple[list[RevelUser], list[RevelUser]], settings: t.Any
+) -> None:
+    build_attendee_visibility_flags(str(event.pk))
+    assert AttendeeVisibilityFlag.objects.filter(event=event).exists()
+
+    settings.ATTENDEE_VISIBILITY_MODE = "lazy"
+    settings.ATTENDEE_VISIBILITY_LAZY_THRESHOLD = 10
+    build_attendee_visibility_flags(str(event.pk))
+    assert not AttendeeVisibilityFlag.objects.filter(event=event).exists()
+
+    settings.ATTENDEE_VISIBILITY_LAZY_THRESHOLD = 11
+    build_attendee_visibility_flags(str(event.pk))
+    assert AttendeeVisibilityFlag.objects.filter(event=event).exists()
@@ -0,0 +1,87 @@
+"""Event capacity ledger: the counter row the event-capacity check locks instead of every ticket."""
+
+import typing as t
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from ninja.errors import HttpError
+
+from accounts.models import RevelUser
+from events.models import Event, EventCapacityLedger, Ticket, TicketTier
+from events.service import capacity_ledger
+
+pytestmark = pytest.mark.django_db
+
+
+def _ledger(event: Event) -> int:
+    return EventCapacityLedger.objects.get(event=event).committed_tickets
+
+
+def test_checkout_seeds_then_advances_the_ledger(
+    batch_event: Event,
+    batch_offline_tier: TicketTier,
+    member_user: RevelUser,
+    run_checkout_offline: t.Callable[..., list[Ticket]],
+) -> None:
+    """A ticket written before the first check is seeded from the table; checkouts add to it."""
+    batch_event.max_attendees = 3
+    batch_event.save(update_fields=["max_attendees"])
+    Ticket.objects.create(event=batch_event, tier=batch_offline_tier, user=member_user, guest_name="Early")
+
+    run_checkout_offline(2)
+
+    assert _ledger(batch_event) == 3
+    with pytest.raises(HttpError) as exc_info:
+        run_checkout_offline(1)
+    assert exc_info.value.status_code == 429
+
+
+def test_capacity_check_locks_no_ticket_rows(
+    batch_event: Event, run_checkout_offline: t.Callable[..., list[Ticket]]
+) -> None:
+    batch_event.max_attendees = 10
+    batch_event.save(update_fields=["max_attendees"])
+    run_checkout_offline(1)
+
+    with CaptureQueriesContext(connection) as ctx:
+        run_checkout_offline(1)
+
+    locking = [q["sql"] for q in ctx.captured_queries if "FOR UPDATE" in q["sql"]]
+    assert any('"events_eventcapacityledger"' in sql for sql in locking)
+    assert not any('FROM "events_ticket"' in sql for sql in locking)
+
+
+def test_cancel_delete_and_resave_move_the_counter_once(
+    batch_event: Event, run_checkout_offline: t.Callable[..., list[Ticket]]
+) -> None:
+    batch_event.max_attendees = 10
+    batch_event.save(update_fields=["max_attendees"])
+    first, second, third = run_checkout_offline(3)
+    assert _ledger(batch_event) == 3
+
+    first = Ticket.objects.get(pk=first.pk)
+    first.status = Ticket.TicketStatus.CANCELLED
+    first.save(update_fields=["status"])
+    first.save(update_fields=["status"])  # re-save of an already-counted transition
+    assert _ledger(batch_event) == 2
+
+    Ticket.objects.filter(pk=second.pk).delete()
+    assert _ledger(batch_event) == 1
+
+    third.guest_name = "Renamed"
+    third.save(update_fields=["guest_name"])
+    first.status = Ticket.TicketStatus.ACTIVE
+    first.save()
+    assert _ledger(batch_event) == 2
+
+
+def test_reconcile_repairs_drift(batch_event: Event, run_checkout_offline: t.Callable[..., list[Ticket]]) -> None:
+    batch_event.max_attendees = 10
+    batch_event.save(update_fields=["max_attendees"])
+    run_checkout_offline(2)
+    EventCapacityLedger.objects.filter(event=batch_event).update(committed_tickets=7)
+
+    assert capacity_ledger.reconcile()["drifted"] == 1
+    assert _ledger(batch_event) == 2
+    assert capacity_ledger.reconcile()["drifted"] == 0
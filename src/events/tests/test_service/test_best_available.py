@@ -1,9 +1,17 @@
 """Pure scoring tests — no DB."""
 
+import random
 import typing as t
 import uuid
 
-from events.service.seating.best_available import CandidateSeat, pick_best_available
+import pytest
+
+from events.service.seating.best_available import (
+    CandidateSeat,
+    _contiguous_runs,
+    _placement_score,
+    pick_best_available,
+)
 
 
 def _row(
@@ -112,3 +120,63 @@ def test_quantity_zero_returns_empty() -> None:
     row = _row(0, 5, accessible={0, 1})
     assert pick_best_available(row, 0, seed=1) == []
     assert pick_best_available(row, 0, accessible_required=True, seed=1) == []
+
+
+def _exhaustive_pick(pool: list[CandidateSeat], quantity: int, seed: int | None) -> list[uuid.UUID]:
+    """The original picker: score every (run, start) placement, sort them all."""
+    rows: dict[tuple[int, int, str | None], list[CandidateSeat]] = {}
+    for s in pool:
+        rows.setdefault((s.sector_display_order, s.row_order, s.row_label), []).append(s)
+    row_len = {key: max(s.row_length for s in seats) for key, seats in rows.items()}
+    placements = [
+        (_placement_score(run, start, quantity, row_len[key]), run[start : start + quantity])
+        for key, seats in rows.items()
+        for run in _contiguous_runs(seats)
+        for start in range(0, len(run) - quantity + 1)
+    ]
+    if not placements:
+        return []
+    placements.sort(key=lambda p: p[0])
+    best = placements[0][0]
+    near_equal = [
+        p
+        for p in placements
+        if p[0][0] == best[0] and abs(p[0][1] - best[1]) <= 0.5 and p[0][2] == best[2] and p[0][3] == best[3]
+    ]
+    return [s.id for s in random.Random(seed).choice(near_equal)[1]]
+
+
+def _random_chart(rng: random.Random) -> list[CandidateSeat]:
+    """A shuffled pool over a few sectors, with shared row_orders, label-split rows and holes."""
+    pool: list[CandidateSeat] = []
+    for sector in range(rng.randint(1, 3)):
+        for row in range(rng.randint(1, 6)):
+            length = rng.randint(1, 40)
+            taken_ratio = rng.random()
+            for i in range(length):
+                if rng.random() < taken_ratio * 0.7:
+                    continue
+                pool.append(
+                    CandidateSeat(
+                        id=uuid.uuid4(),
+                        row_order=rng.choice([0, row, row // 2]),
+                        adjacency_index=i,
+                        is_accessible=rng.random() < 0.05,
+                        sector_display_order=sector,
+                        row_length=length,
+                        row_label=f"R{row}",
+                    )
+                )
+    rng.shuffle(pool)
+    return pool
+
+
+@pytest.mark.parametrize("case", range(300))
+def test_matches_exhaustive_picker(case: int) -> None:
+    """Property: same pick as the exhaustive scorer, seeded tiebreak included, on random charts."""
+    rng = random.Random(case)
+    pool = _random_chart(rng)
+    general = [s for s in pool if not s.is_accessible]
+    for quantity in (1, 2, 3, rng.randint(4, 12)):
+        seed = rng.randint(0, 2**32)
+        assert pick_best_available(pool, quantity, seed=seed) == _exhaustive_pick(general, quantity, seed)
@@ -9,6 +9,8 @@ import typing as t
 from datetime import timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from accounts.models import RevelUser
@@ -301,3 +303,103 @@ def test_get_user_invitations_exclude_accepted_hides_yes_rsvp(
 
     shown_qs = dashboard_service.get_user_invitations(dash_user, exclude_accepted=False)
     assert invite_evt.id in {inv.event_id for inv in shown_qs}
+
+
+# ---------------------------------------------------------------------------
+# Query shape: the intersection stays in SQL whatever the catalogue size
+# ---------------------------------------------------------------------------
+
+
+def _seed_public_catalogue(django_user_model: t.Type[RevelUser], count: int) -> list[models.Event]:
+    """Public upcoming events the dashboard user has no relationship with."""
+    org = models.Organization.objects.create(
+        name=f"Catalogue {count}", owner=django_user_model.objects.create_user(f"svc-catalogue-{count}")
+    )
+    return models.Event.objects.bulk_create(
+        models.Event(
+            name=f"Public {count}-{i}",
+            slug=f"public-{count}-{i}",
+            organization=org,
+            status="open",
+            visibility=models.Event.Visibility.PUBLIC,
+            start=timezone.now() + timedelta(days=1),
+        )
+        for i in range(count)
+    )
+
+
+def _dashboard_page_queries(user: RevelUser) -> list[str]:
+    """SQL for building the dashboard queryset, counting it and fetching a page."""
+    with CaptureQueriesContext(connection) as queries:
+        qs = dashboard_service.get_user_related_events(user, filters.DashboardEventsFiltersSchema())
+        qs.count()
+        list(qs.order_by("start")[:20].values_list("id", flat=True))
+    return [q["sql"] for q in queries.captured_queries]
+
+
+def test_event_intersection_sql_does_not_grow_with_public_catalogue(
+    dash_user: RevelUser, dash_setup: dict[str, t.Any], django_user_model: t.Type[RevelUser]
+) -> None:
+    """Count and page are one statement each, and no event id list is inlined."""
+    catalogue = _seed_public_catalogue(django_user_model, 5)
+    small = _dashboard_page_queries(dash_user)
+    catalogue += _seed_public_catalogue(django_user_model, 50)
+    large = _dashboard_page_queries(dash_user)
+
+    assert large == small
+    event_queries = [sql for sql in large if '"events_event"' in sql]
+    assert len(event_queries) == 2
+    assert not any(str(event.id) in sql or event.id.hex in sql for sql in large for event in catalogue)
+    related = {e.id for e in dash_setup["events"].values()}
+    assert not any(str(event_id) in sql or event_id.hex in sql for sql in event_queries for event_id in related)
+
+
+def test_organization_and_series_intersections_are_single_statements(
+    dash_user: RevelUser, dash_setup: dict[str, t.Any]
+) -> None:
+    with CaptureQueriesContext(connection) as queries:
+        orgs = dashboard_service.get_user_related_organizations(
+            dash_user, filters.DashboardOrganizationsFiltersSchema()
+        )
+        series = dashboard_service.get_user_related_event_series(dash_user, filters.DashboardEventSeriesFiltersSchema())
+        orgs.count()
+        series.count()
+
+    # One blacklist-identifier lookup per visibility predicate, then one COUNT each.
+    assert [q["sql"].lstrip().startswith("SELECT COUNT") for q in queries.captured_queries].count(True) == 2
+    assert len(queries.captured_queries) <= 4
+
+
+def test_member_of_restricted_org_sees_it_despite_other_banned_members(
+    dash_user: RevelUser, dash_setup: dict[str, t.Any], django_user_model: t.Type[RevelUser]
+) -> None:
+    """Visibility looks at this user's membership only, not anyone else's."""
+    org_member = dash_setup["orgs"]["member"]
+    org_member.visibility = models.Organization.Visibility.PRIVATE
+    org_member.save()
+    models.OrganizationMember.objects.create(
+        organization=org_member,
+        user=django_user_model.objects.create_user("svc-banned"),
+        status=models.OrganizationMember.MembershipStatus.BANNED,
+    )
+
+    qs = dashboard_service.get_user_related_organizations(dash_user, filters.DashboardOrganizationsFiltersSchema())
+
+    assert "Member Org" in {o.name for o in qs}
+
+
+def test_ban_hides_public_events_but_not_related_ones(dash_user: RevelUser, dash_setup: dict[str, t.Any]) -> None:
+    org = dash_setup["orgs"]["rsvp"]
+    unrelated = models.Event.objects.create(
+        name="Other Public Event", organization=org, status="open", visibility="public", start=timezone.now()
+    )
+    assert models.Event.objects.visible_to(dash_user).filter(pk=unrelated.pk).exists()
+
+    models.OrganizationMember.objects.create(
+        organization=org, user=dash_user, status=models.OrganizationMember.MembershipStatus.BANNED
+    )
+
+    assert not models.Event.objects.visible_to(dash_user).filter(pk=unrelated.pk).exists()
+    # The user's own RSVP still grants access, as it always has.
+    related = dashboard_service.get_user_related_events(dash_user, filters.DashboardEventsFiltersSchema())
+    assert "RSVP'd Event" in {e.name for e in related}
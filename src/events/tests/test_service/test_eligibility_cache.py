@@ -0,0 +1,86 @@
+"""Cross-request eligibility cache: hits, token bumps, fail-open."""
+
+import typing as t
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from conftest import RevelUserFactory
+from events.models import Blacklist, Event, OrganizationMember, Ticket, TicketTier
+from events.service import eligibility_cache
+from events.service.eligibility_cache import ELIGIBILITY_CACHE_LOOKUPS
+
+pytestmark = pytest.mark.django_db
+
+
+def _lookups(result: str) -> float:
+    return ELIGIBILITY_CACHE_LOOKUPS.labels(result=result)._value.get()  # type: ignore[no-any-return]
+
+
+def test_repeat_lookup_is_served_from_cache(public_event: Event, revel_user_factory: RevelUserFactory) -> None:
+    user = revel_user_factory()
+    hits, misses = _lookups("hit"), _lookups("miss")
+
+    first = eligibility_cache.get_eligibility(user, public_event)
+    with CaptureQueriesContext(connection) as queries:
+        second = eligibility_cache.get_eligibility(user, public_event)
+
+    assert second == first
+    assert len(queries) == 0
+    assert (_lookups("hit") - hits, _lookups("miss") - misses) == (1, 1)
+
+
+def test_event_writes_invalidate_every_user(public_event: Event, revel_user_factory: RevelUserFactory) -> None:
+    tier = TicketTier.objects.create(event=public_event, name="Free", payment_method=TicketTier.PaymentMethod.FREE)
+    public_event.max_attendees = 1
+    public_event.save()
+    user = revel_user_factory()
+    assert eligibility_cache.get_eligibility(user, public_event).allowed
+
+    Ticket.objects.create(event=public_event, tier=tier, user=revel_user_factory(), guest_name="Guest")
+
+    assert not eligibility_cache.get_eligibility(user, public_event).allowed
+
+
+def test_user_writes_invalidate_only_that_user(public_event: Event, revel_user_factory: RevelUserFactory) -> None:
+    banned, bystander = revel_user_factory(), revel_user_factory()
+    eligibility_cache.get_eligibility(banned, public_event)
+    before = eligibility_cache.get_eligibility(bystander, public_event)
+    misses = _lookups("miss")
+
+    Blacklist.objects.create(organization=public_event.organization, user=banned)
+
+    assert not eligibility_cache.get_eligibility(banned, public_event).allowed
+    assert eligibility_cache.get_eligibility(bystander, public_event) == before
+    assert _lookups("miss") - misses == 1
+
+
+def test_bumps_run_again_after_commit(
+    public_event: Event, revel_user_factory: RevelUserFactory, django_capture_on_commit_callbacks: t.Any
+) -> None:
+    user = revel_user_factory()
+    with django_capture_on_commit_callbacks() as callbacks:
+        OrganizationMember.objects.create(organization=public_event.organization, user=user)
+    eligibility_cache.get_eligibility(user, public_event)  # re-caches under a fresh token
+    key = eligibility_cache.get_cache_key(public_event, user)
+
+    for callback in callbacks:
+        callback()
+
+    assert eligibility_cache.get_cache_key(public_event, user) != key
+
+
+def test_cache_errors_fail_open(public_event: Event, revel_user_factory: RevelUserFactory) -> None:
+    user = revel_user_factory()
+    errors = _lookups("error")
+
+    with (
+        patch("events.service.eligibility_cache.cache.get_many", side_effect=ConnectionError("down")),
+        patch("events.service.eligibility_cache.cache.delete_many", side_effect=ConnectionError("down")),
+    ):
+        assert eligibility_cache.get_eligibility(user, public_event).event_id == public_event.id
+        eligibility_cache.bump_user(user.pk)
+
+    assert _lookups("error") - errors == 1
@@ -1,13 +1,16 @@
-"""EligibilityService waitlist prefetch."""
+"""EligibilityService loading: waitlist prefetch and per-user scoping."""
 
 import datetime as dt
+import typing as t
 import uuid
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from conftest import RevelUserFactory
-from events.models import Event, WaitlistOffer
+from events.models import Event, Organization, OrganizationMember, Ticket, TicketTier, WaitlistOffer
 from events.service.event_manager.service import EligibilityService
 
 pytestmark = pytest.mark.django_db
@@ -51,3 +54,49 @@ def test_expired_offer_does_not_count(event: Event, revel_user_factory: RevelUse
     viewer = revel_user_factory()
     svc = EligibilityService(viewer, event)
     assert svc.event.pending_waitlist_offer_count == 0
+
+
+def test_loader_cost_does_not_grow_with_the_event(
+    event: Event,
+    event_ticket_tier: TicketTier,
+    revel_user_factory: RevelUserFactory,
+    django_assert_num_queries: t.Any,
+) -> None:
+    viewer = revel_user_factory()
+    with CaptureQueriesContext(connection) as before:
+        EligibilityService(viewer, event).check_eligibility()
+
+    for attendee in [revel_user_factory() for _ in range(5)]:
+        OrganizationMember.objects.create(organization=event.organization, user=attendee)
+        Ticket.objects.create(event=event, tier=event_ticket_tier, user=attendee, guest_name="Guest")
+
+    with django_assert_num_queries(len(before.captured_queries)):
+        svc = EligibilityService(viewer, event)
+        svc.check_eligibility()
+    assert svc.event.attendee_count_for_check == 5
+
+
+def test_cancelled_tickets_do_not_count_as_attendees(
+    event: Event, event_ticket_tier: TicketTier, revel_user_factory: RevelUserFactory
+) -> None:
+    for status in (Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.CANCELLED):
+        Ticket.objects.create(event=event, tier=event_ticket_tier, user=revel_user_factory(), status=status)
+
+    assert EligibilityService(revel_user_factory(), event).event.attendee_count_for_check == 1
+
+
+def test_membership_is_scoped_to_the_event_organization(
+    event: Event, organization_owner_user: t.Any, revel_user_factory: RevelUserFactory
+) -> None:
+    user = revel_user_factory()
+    other_org = Organization.objects.create(name="Other", slug="other", owner=organization_owner_user)
+    OrganizationMember.objects.create(organization=other_org, user=user)
+    OrganizationMember.objects.create(
+        organization=event.organization, user=user, status=OrganizationMember.MembershipStatus.BANNED
+    )
+
+    svc = EligibilityService(user, event)
+
+    assert svc.membership_status == OrganizationMember.MembershipStatus.BANNED
+    assert not svc.is_active_member
+    assert not svc.is_staff
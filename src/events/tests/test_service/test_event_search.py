@@ -0,0 +1,129 @@
+"""Full-text event discovery search: document maintenance, matching and ranking."""
+
+import typing as t
+from datetime import datetime, timedelta
+
+import pytest
+from django.test.client import Client
+from django.urls import reverse
+from django.utils import translation
+
+from events.models import Event, EventSeries, Organization
+from events.service import event_search
+from events.tasks import fill_missing_event_search_vectors
+
+pytestmark = pytest.mark.django_db
+
+
+def _event(organization: Organization, name: str, next_week: datetime, **extra: t.Any) -> Event:
+    return Event.objects.create(
+        organization=organization,
+        name=name,
+        visibility=Event.Visibility.PUBLIC,
+        event_type=Event.EventType.PUBLIC,
+        status=Event.EventStatus.OPEN,
+        start=next_week,
+        end=next_week + timedelta(days=1),
+        **extra,
+    )
+
+
+def _search(term: str) -> set[str]:
+    query = event_search.build_search_query(term)
+    assert query is not None
+    return set(event_search.filter_by_search(Event.objects.all(), query).values_list("name", flat=True))
+
+
+def test_words_match_as_prefixes_and_stems(organization: Organization, next_week: datetime) -> None:
+    _event(organization, "Running Club", next_week)
+    _event(organization, "Lesung", next_week, description="Wir lesen Bücher.")
+
+    assert _search("runn") == {"Running Club"}
+    with translation.override("en"):
+        assert _search("runs") == {"Running Club"}
+    with translation.override("de"):
+        assert _search("buches") == {"Lesung"}
+    assert _search("running marathon") == set()
+    assert event_search.build_search_query("  !? ") is None
+
+
+def test_name_matches_outrank_description_matches(organization: Organization, next_week: datetime) -> None:
+    in_description = _event(organization, "Evening Meetup", next_week, description="Jazz standards.")
+    in_name = _event(organization, "Jazz Night", next_week + timedelta(days=1))
+    query = event_search.build_search_query("jazz")
+    assert query is not None
+
+    ranked = event_search.order_by_rank(event_search.filter_by_search(Event.objects.all(), query), query)
+
+    assert list(ranked) == [in_name, in_description]
+
+
+def test_tags_and_related_text_update_the_document(
+    organization: Organization,
+    event_series: EventSeries,
+    next_week: datetime,
+    django_capture_on_commit_callbacks: t.Any,
+) -> None:
+    event = _event(organization, "Evening", next_week, event_series=event_series)
+
+    event.add_tags("salsa")
+    assert _search("salsa") == {"Evening"}
+    event.remove_tags("salsa")
+    assert _search("salsa") == set()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        organization.description = "Home of the tango marathon"
+        organization.save()
+        event_series.name = "Milonga"
+        event_series.save(update_fields=["name"])
+    assert _search("tango") == {"Evening"}
+    assert _search("milonga") == {"Evening"}
+
+
+def test_unrelated_saves_keep_the_document(organization: Organization, next_week: datetime) -> None:
+    event = _event(organization, "Salsa Night", next_week)
+    Event.objects.filter(pk=event.pk).update(name="Tango Night")  # behind the ORM's back
+
+    event.attendee_count = 3
+    event.save(update_fields=["attendee_count"])
+
+    assert _search("salsa") == {"Salsa Night"}
+
+
+def test_bulk_created_events_are_filled_by_the_sweep(organization: Organization, next_week: datetime) -> None:
+    Event.objects.bulk_create(
+        [
+            Event(
+                organization=organization,
+                name=f"Generated {i}",
+                slug=f"generated-{i}",
+                start=next_week,
+                end=next_week + timedelta(days=1),
+            )
+            for i in range(3)
+        ]
+    )
+    assert _search("generated") == set()
+
+    assert fill_missing_event_search_vectors() == 3
+    assert _search("generated") == {"Generated 0", "Generated 1", "Generated 2"}
+    assert fill_missing_event_search_vectors() == 0
+
+
+def test_list_and_calendar_endpoints_search(client: Client, organization: Organization, next_week: datetime) -> None:
+    _event(organization, "Morning Stretch", next_week, description="Gentle yoga.")
+    _event(organization, "Yoga Retreat", next_week + timedelta(hours=1))
+    _event(organization, "Pottery", next_week)
+
+    # Relevance first (name beats description), then the requested order.
+    response = client.get(reverse("api:list_events"), {"search": "yoga", "order_by": "start"})
+    assert response.status_code == 200
+    assert [e["name"] for e in response.json()["results"]] == ["Yoga Retreat", "Morning Stretch"]
+
+    # The calendar keeps its chronological order.
+    response = client.get(
+        reverse("api:calendar_events"),
+        {"search": "yoga", "month": next_week.month, "year": next_week.year},
+    )
+    assert response.status_code == 200
+    assert [e["name"] for e in response.json()] == ["Morning Stretch", "Yoga Retreat"]
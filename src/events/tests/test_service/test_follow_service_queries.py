@@ -7,6 +7,8 @@ is_following checks, get_followers queries, and notification recipient selection
 import typing as t
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from accounts.models import RevelUser
 from events.models import EventSeries, Organization, OrganizationMember, OrganizationStaff
@@ -476,6 +478,61 @@ class TestGetFollowersForNewEventNotification:
         assert len(results) == 0
 
 
+class TestNewEventFollowerAudience:
+    """Tests for the set-based follower audience and its chunked stream."""
+
+    def test_audience_is_one_query_with_series_priority(
+        self,
+        organization: Organization,
+        event_series: EventSeries,
+        revel_user_factory: t.Any,
+    ) -> None:
+        """Test that the audience is one UNION ALL statement, series follows winning over org follows."""
+        # Arrange
+        both, series_only, org_only, member, staff = (revel_user_factory() for _ in range(5))
+        for user in (both, series_only, member, staff):
+            EventSeriesFollow.objects.create(user=user, event_series=event_series, notify_new_events=True)
+        for user in (both, org_only, member, staff, organization.owner):
+            OrganizationFollow.objects.create(user=user, organization=organization, notify_new_events=True)
+        OrganizationMember.objects.create(organization=organization, user=member)
+        OrganizationStaff.objects.create(organization=organization, user=staff)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(follow_service.new_event_follower_audience(organization, event_series))
+
+        # Assert
+        assert len(queries.captured_queries) == 1
+        assert "UNION ALL" in queries.captured_queries[0]["sql"]
+        assert sorted(rows) == sorted(
+            [
+                (both.id, NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES),
+                (series_only.id, NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES),
+                (org_only.id, NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG),
+            ]
+        )
+
+    def test_chunks_are_grouped_by_notification_type(
+        self,
+        organization: Organization,
+        revel_user_factory: t.Any,
+    ) -> None:
+        """Test that the stream yields id chunks of at most chunk_size, keyed by type."""
+        # Arrange
+        followers = [revel_user_factory() for _ in range(5)]
+        for user in followers:
+            OrganizationFollow.objects.create(user=user, organization=organization, notify_new_events=True)
+
+        # Act
+        chunks = list(follow_service.iter_new_event_follower_chunks(organization, chunk_size=2))
+
+        # Assert
+        assert [len(chunk[NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG]) for chunk in chunks] == [2, 2, 1]
+        assert {user_id for chunk in chunks for ids in chunk.values() for user_id in ids} == {
+            user.id for user in followers
+        }
+
+
 class TestGetUserFollows:
     """Tests for get_user_followed_organizations and get_user_followed_event_series."""
 
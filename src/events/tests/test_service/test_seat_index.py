@@ -0,0 +1,163 @@
+"""Cached per-event seat index: parity with the table read, writer patches, stale-entry fallback."""
+
+import typing as t
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from accounts.models import RevelUser
+from events.models import Event, EventSeatOverride, PriceCategory, SeatHold, Ticket, TicketTier, VenueSeat, VenueSector
+from events.service.seating import holds as holds_service
+from events.service.seating import overrides as overrides_service
+from events.service.seating import pick, seat_index
+from events.service.seating.chart import bump_chart_version
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def zone_tier(seated_event: tuple[Event, list[VenueSeat]]) -> tuple[TicketTier, PriceCategory]:
+    """A best-available tier over the seated fixture, every seat painted one zone."""
+    event, seats = seated_event
+    assert event.venue is not None
+    cat = PriceCategory.objects.create(venue=event.venue, name="Std", color="#00aa00")
+    VenueSeat.objects.filter(id__in=[s.id for s in seats]).update(default_price_category=cat)
+    sector = VenueSector.objects.get(venue=event.venue)
+    tier = TicketTier.objects.create(
+        event=event,
+        name="Std",
+        sector=sector,
+        category_prices={str(cat.id): "0"},
+        seat_assignment_mode=TicketTier.SeatAssignmentMode.BEST_AVAILABLE,
+    )
+    return tier, cat
+
+
+def _ids(
+    event: Event,
+    tier: TicketTier,
+    *,
+    from_index: bool,
+    zone_id: UUID | None = None,
+    owner: RevelUser | None = None,
+) -> list[UUID]:
+    candidates = pick.load_candidates(event, tier, set(), zone_id=zone_id, hold_owner_user=owner, from_index=from_index)
+    return [c.id for c in candidates]
+
+
+def test_index_candidates_match_the_table_read(
+    seated_event: tuple[Event, list[VenueSeat]],
+    zone_tier: tuple[TicketTier, PriceCategory],
+    member_user: RevelUser,
+    public_user: RevelUser,
+) -> None:
+    """Sold, blocked, foreign-held and expired-held seats resolve exactly as load_candidates does."""
+    event, seats = seated_event
+    tier, cat = zone_tier
+    now = timezone.now()
+    Ticket.objects.create(event=event, tier=tier, user=public_user, seat=seats[0], guest_name="Sold")
+    EventSeatOverride.objects.create(event=event, seat=seats[1], status=EventSeatOverride.OverrideStatus.KILLED)
+    SeatHold.objects.create(
+        event=event, seat=seats[2], user=public_user, acquired_at=now, expires_at=now + timedelta(minutes=5)
+    )
+    SeatHold.objects.create(
+        event=event, seat=seats[3], user=member_user, acquired_at=now, expires_at=now + timedelta(minutes=5)
+    )
+    SeatHold.objects.create(
+        event=event, seat=seats[4], user=public_user, acquired_at=now, expires_at=now - timedelta(seconds=1)
+    )
+
+    assert _ids(event, tier, from_index=True, zone_id=cat.id) == _ids(event, tier, from_index=False, zone_id=cat.id)
+    as_owner = _ids(event, tier, from_index=True, zone_id=cat.id, owner=member_user)
+    assert as_owner == _ids(event, tier, from_index=False, zone_id=cat.id, owner=member_user)
+    assert seats[3].id in as_owner  # own hold stays a candidate on the purchase path
+
+
+def test_candidates_carry_the_full_row_length(
+    seated_event: tuple[Event, list[VenueSeat]], zone_tier: tuple[TicketTier, PriceCategory], public_user: RevelUser
+) -> None:
+    """Centrality is scored against the physical row, not the free seats the index returns."""
+    event, seats = seated_event
+    tier, _cat = zone_tier
+    Ticket.objects.create(event=event, tier=tier, user=public_user, seat=seats[5], guest_name="Sold")
+
+    indexed = pick.load_candidates(event, tier, set(), from_index=True)
+
+    assert {c.row_length for c in indexed} == {6}
+    assert indexed == pick.load_candidates(event, tier, set())
+
+
+def test_writers_patch_the_cached_index(
+    django_capture_on_commit_callbacks: t.Any,
+    seated_event: tuple[Event, list[VenueSeat]],
+    zone_tier: tuple[TicketTier, PriceCategory],
+    public_user: RevelUser,
+) -> None:
+    """Holds, releases, overrides and ticket saves update the entry in place — no rebuild."""
+    event, seats = seated_event
+    tier, _cat = zone_tier
+    seat_index.get_seat_index(event)  # warm
+
+    with django_capture_on_commit_callbacks(execute=True):
+        holds_service.acquire_seats(event, [seats[0].id], user=public_user, guest_session=None)
+        overrides_service.apply_overrides(event, [(seats[1].id, EventSeatOverride.OverrideStatus.KILLED, "")], [])
+        ticket = Ticket.objects.create(event=event, tier=tier, user=public_user, seat=seats[2], guest_name="Sold")
+    free = set(_ids(event, tier, from_index=True))
+    assert free.isdisjoint({seats[0].id, seats[1].id, seats[2].id})
+
+    with django_capture_on_commit_callbacks(execute=True):
+        holds_service.release_seats(event, [seats[0].id], user=public_user, guest_session=None)
+        overrides_service.apply_overrides(event, [], [seats[1].id])
+        ticket.status = Ticket.TicketStatus.CANCELLED
+        ticket.save(update_fields=["status"])
+    assert _ids(event, tier, from_index=True) == _ids(event, tier, from_index=False)
+    assert len(_ids(event, tier, from_index=True)) == 6
+
+
+def test_chart_version_bump_rebuilds_the_layout(
+    seated_event: tuple[Event, list[VenueSeat]], zone_tier: tuple[TicketTier, PriceCategory]
+) -> None:
+    """A layout change the index never heard about is picked up through Venue.chart_version."""
+    event, seats = seated_event
+    tier, _cat = zone_tier
+    assert len(_ids(event, tier, from_index=True)) == 6
+
+    VenueSeat.objects.filter(pk=seats[0].pk).update(is_active=False)
+    assert event.venue_id is not None
+    bump_chart_version(event.venue_id)
+
+    assert seats[0].id not in _ids(event, tier, from_index=True)
+
+
+def test_stale_index_falls_back_to_the_tables(
+    django_capture_on_commit_callbacks: t.Any,
+    seated_event: tuple[Event, list[VenueSeat]],
+    zone_tier: tuple[TicketTier, PriceCategory],
+    member_user: RevelUser,
+    public_user: RevelUser,
+) -> None:
+    """A foreign hold the index missed costs one conflict, then the table read wins."""
+    event, seats = seated_event
+    tier, cat = zone_tier
+    seat_index.get_seat_index(event)  # warm, before the hold below exists
+    now = timezone.now()
+    # The two central seats (the picker's first choice), written behind the index's back.
+    for seat in seats[2:4]:
+        SeatHold.objects.create(
+            event=event, seat=seat, user=public_user, acquired_at=now, expires_at=now + timedelta(minutes=5)
+        )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        result = pick.hold_best_available(
+            event, tier, 2, user=member_user, guest_session=None, price_category_id=cat.id
+        )
+
+    assert result.conflicts == []
+    assert {h.seat_id for h in result.held}.isdisjoint({seats[2].id, seats[3].id})
+    cached = cache.get(seat_index.get_cache_key(event.id))
+    assert isinstance(cached, seat_index.SeatIndex)
+    # The conflicting seat is remembered, so the next request in the herd skips it.
+    assert set(cached.held) & {seats[2].id, seats[3].id}
@@ -1,6 +1,7 @@
 """Tests for the waitlist selection algorithm."""
 
 import datetime as dt
+import hashlib
 import uuid
 
 import pytest
@@ -104,28 +105,93 @@ class TestBatchedFIFO:
         assert all(o.is_cutoff_batch is False for o in offers)
 
 
+def _expected_draw(users: list[RevelUser], seed: str, count: int) -> set[uuid.UUID]:
+    """The lottery's ranking, recomputed: ascending md5(seed || user_id)."""
+    ranked = sorted(users, key=lambda u: hashlib.md5(f"{seed}{u.id}".encode()).hexdigest())
+    return {u.id for u in ranked[:count]}
+
+
 class TestBatchedLottery:
-    def test_random_sample_from_waitlist(
+    def test_seeded_draw_is_reproducible(
         self,
         event: Event,
         revel_user_factory: RevelUserFactory,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         _enable_waitlist(event, batch_size=2, lottery=True, max_attendees=10)
         Event.objects.filter(pk=event.pk).update(attendee_count=0)
         users = [revel_user_factory() for _ in range(5)]
         _put_on_waitlist(event, users)
 
-        # Deterministic sampling for assertion
-        monkeypatch.setattr(
-            "events.service.waitlist_service.random.sample",
-            lambda population, k: list(population)[:k],
-        )
-        result = waitlist_service.process_waitlist_for_event(event.id)
+        result = waitlist_service.process_waitlist_for_event(event.id, seed="draw-1")
         assert result.status == "ok"
         assert result.offers_created == 2
         offers = WaitlistOffer.objects.filter(event=event)
         assert all(o.is_cutoff_batch is False for o in offers)
+        assert {o.user_id for o in offers} == _expected_draw(users, "draw-1", 2)
+
+    def test_default_seed_is_the_batch_id(
+        self,
+        event: Event,
+        revel_user_factory: RevelUserFactory,
+    ) -> None:
+        _enable_waitlist(event, batch_size=3, lottery=True, max_attendees=10)
+        Event.objects.filter(pk=event.pk).update(attendee_count=0)
+        users = [revel_user_factory() for _ in range(6)]
+        _put_on_waitlist(event, users)
+
+        result = waitlist_service.process_waitlist_for_event(event.id)
+        assert result.status == "ok"
+        offered = set(WaitlistOffer.objects.filter(batch_id=result.batch_id).values_list("user_id", flat=True))
+        assert offered == _expected_draw(users, str(result.batch_id), 3)
+
+
+class TestLockedInsert:
+    """The selection runs unlocked; ``_create_offers`` rechecks it under the Event lock."""
+
+    def test_drops_users_no_longer_eligible_and_trims_to_free_seats(
+        self,
+        event: Event,
+        revel_user_factory: RevelUserFactory,
+    ) -> None:
+        _enable_waitlist(event, batch_size=5, max_attendees=3)
+        Event.objects.filter(pk=event.pk).update(attendee_count=0)
+        u1, u2, u3, u4 = (revel_user_factory() for _ in range(4))
+        _put_on_waitlist(event, [u1, u2, u3, u4])
+        # Between selection and insert, u1 got an offer elsewhere: one seat left reserved.
+        WaitlistOffer.objects.create(
+            event=event,
+            user=u1,
+            expires_at=timezone.now() + dt.timedelta(hours=1),
+            batch_id=uuid.uuid4(),
+        )
+
+        result = waitlist_service._create_offers(
+            event.id, [u1.id, u2.id, u3.id, u4.id], batch_id=uuid.uuid4(), is_cutoff=False
+        )
+
+        assert result.status == "ok"
+        assert result.offers_created == 2
+        offered = set(WaitlistOffer.objects.filter(batch_id=result.batch_id).values_list("user_id", flat=True))
+        assert offered == {u2.id, u3.id}
+
+    def test_cutoff_offers_are_inserted_in_chunks(
+        self,
+        event: Event,
+        revel_user_factory: RevelUserFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(waitlist_service, "OFFER_CHUNK_SIZE", 2)
+        past = timezone.now() - dt.timedelta(minutes=5)
+        _enable_waitlist(event, batch_size=2, cutoff_date=past, max_attendees=10)
+        Event.objects.filter(pk=event.pk).update(attendee_count=9)
+        users = [revel_user_factory() for _ in range(5)]
+        _put_on_waitlist(event, users)
+
+        result = waitlist_service.process_waitlist_for_event(event.id)
+
+        assert result.status == "ok"
+        assert result.offers_created == 5
+        assert WaitlistOffer.objects.filter(batch_id=result.batch_id, is_cutoff_batch=True).count() == 5
 
 
 class TestCutoff:
@@ -11,6 +11,7 @@ import pytest
 from django.utils import timezone
 
 from accounts.models import RevelUser
+from conftest import notify_many_sends
 from events.models import Event, EventSeries, Organization, OrganizationMember, OrganizationStaff
 from events.models.follow import EventSeriesFollow, OrganizationFollow
 from notifications.enums import NotificationType
@@ -113,21 +114,21 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
 
         # Assert
-        assert mock_send.called
+        assert mock_notify_many.called
         # Find the follower notification call
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == nonmember_user
+        assert follower_calls[0].kwargs["user"] == nonmember_user.id
 
         # Verify context
         context = follower_calls[0].kwargs["context"]
@@ -172,21 +173,21 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
 
         # Assert
-        assert mock_send.called
+        assert mock_notify_many.called
         # Find the series follower notification call
         series_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES
         ]
         assert len(series_calls) == 1
-        assert series_calls[0].kwargs["user"] == nonmember_user
+        assert series_calls[0].kwargs["user"] == nonmember_user.id
 
         # Verify series context is included
         context = series_calls[0].kwargs["context"]
@@ -236,13 +237,15 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
 
         # Assert - User should receive only series notification, not org notification
-        user_notifications = [c for c in mock_send.call_args_list if c.kwargs.get("user") == nonmember_user]
+        user_notifications = [
+            c for c in notify_many_sends(mock_notify_many) if c.kwargs.get("user") == nonmember_user.id
+        ]
         assert len(user_notifications) == 1
         assert user_notifications[0].kwargs["notification_type"] == NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES
 
@@ -298,7 +301,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -306,17 +309,17 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - Only non-member follower should get NEW_EVENT_FROM_FOLLOWED_ORG
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == nonmember_user
+        assert follower_calls[0].kwargs["user"] == nonmember_user.id
 
         # Member should NOT receive follower notification
         member_follower_calls = [
             c
-            for c in mock_send.call_args_list
-            if c.kwargs.get("user") == member_user
+            for c in notify_many_sends(mock_notify_many)
+            if c.kwargs.get("user") == member_user.id
             and c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(member_follower_calls) == 0
@@ -366,7 +369,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -374,16 +377,16 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - Staff should NOT get follower notification
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == nonmember_user
+        assert follower_calls[0].kwargs["user"] == nonmember_user.id
 
         staff_follower_calls = [
             c
-            for c in mock_send.call_args_list
-            if c.kwargs.get("user") == staff_user
+            for c in notify_many_sends(mock_notify_many)
+            if c.kwargs.get("user") == staff_user.id
             and c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(staff_follower_calls) == 0
@@ -430,7 +433,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -438,11 +441,11 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - Owner should NOT get follower notification
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == nonmember_user
+        assert follower_calls[0].kwargs["user"] == nonmember_user.id
 
     def test_cancelled_member_receives_follower_notification(
         self,
@@ -484,7 +487,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -492,11 +495,11 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - Cancelled member should receive follower notification
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == cancelled_member
+        assert follower_calls[0].kwargs["user"] == cancelled_member.id
 
     def test_banned_member_receives_no_notifications(
         self,
@@ -538,7 +541,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -546,8 +549,8 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - Banned member should NOT receive any follower notification
         banned_calls = [
             c
-            for c in mock_send.call_args_list
-            if c.kwargs.get("user") == banned_member
+            for c in notify_many_sends(mock_notify_many)
+            if c.kwargs.get("user") == banned_member.id
             and c.kwargs.get("notification_type")
             in [NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG, NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES]
         ]
@@ -587,7 +590,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act - Update a different field
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.max_attendees = 200
                 event.save(update_fields=["max_attendees"])
@@ -595,7 +598,7 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - No follower notifications should be sent
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type")
             in [
                 NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG,
@@ -625,7 +628,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 Event.objects.create(
                     organization=organization,
@@ -641,7 +644,7 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - No follower notifications
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type")
             in [
                 NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG,
@@ -672,7 +675,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 Event.objects.create(
                     organization=organization,
@@ -688,11 +691,11 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - Follower should be notified
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == nonmember_user
+        assert follower_calls[0].kwargs["user"] == nonmember_user.id
 
     def test_respects_notify_new_events_preference(
         self,
@@ -739,7 +742,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -747,11 +750,11 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - Only first user should receive notification
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == nonmember_user
+        assert follower_calls[0].kwargs["user"] == nonmember_user.id
 
     def test_archived_follows_not_notified(
         self,
@@ -787,7 +790,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -795,7 +798,7 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - No follower notifications (archived user excluded)
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 0
@@ -835,7 +838,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -843,7 +846,7 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
@@ -884,7 +887,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act - Change to CLOSED
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.CLOSED
                 event.save(update_fields=["status"])
@@ -892,7 +895,7 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert - No follower notifications
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type")
             in [
                 NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG,
@@ -952,7 +955,7 @@ class TestHandleEventOpenedNotifyFollowers:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -960,19 +963,19 @@ class TestHandleEventOpenedNotifyFollowers:
         # Assert
         series_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_SERIES
         ]
         org_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
 
         # Series follower gets series notification
         assert len(series_calls) == 1
-        assert series_calls[0].kwargs["user"] == series_follower
+        assert series_calls[0].kwargs["user"] == series_follower.id
 
         # Org-only follower gets org notification
         assert len(org_calls) == 1
-        assert org_calls[0].kwargs["user"] == org_only_follower
+        assert org_calls[0].kwargs["user"] == org_only_follower.id
@@ -11,6 +11,7 @@ import pytest
 from django.utils import timezone
 
 from accounts.models import RevelUser
+from conftest import notify_many_sends
 from events.models import Event, EventSeries, Organization
 from events.models.follow import EventSeriesFollow, OrganizationFollow
 from notifications.enums import NotificationType
@@ -70,14 +71,16 @@ class TestFollowerNotificationVisibility:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
 
         # Assert
         follower_calls = [
-            c for c in mock_send.call_args_list if c.kwargs.get("notification_type") in FOLLOWER_NOTIFICATION_TYPES
+            c
+            for c in notify_many_sends(mock_notify_many)
+            if c.kwargs.get("notification_type") in FOLLOWER_NOTIFICATION_TYPES
         ]
         assert len(follower_calls) == 0
 
@@ -99,7 +102,7 @@ class TestFollowerNotificationVisibility:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 Event.objects.create(
                     organization=organization,
@@ -114,7 +117,9 @@ class TestFollowerNotificationVisibility:
 
         # Assert
         follower_calls = [
-            c for c in mock_send.call_args_list if c.kwargs.get("notification_type") in FOLLOWER_NOTIFICATION_TYPES
+            c
+            for c in notify_many_sends(mock_notify_many)
+            if c.kwargs.get("notification_type") in FOLLOWER_NOTIFICATION_TYPES
         ]
         assert len(follower_calls) == 0
 
@@ -149,14 +154,16 @@ class TestFollowerNotificationVisibility:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
 
         # Assert
         follower_calls = [
-            c for c in mock_send.call_args_list if c.kwargs.get("notification_type") in FOLLOWER_NOTIFICATION_TYPES
+            c
+            for c in notify_many_sends(mock_notify_many)
+            if c.kwargs.get("notification_type") in FOLLOWER_NOTIFICATION_TYPES
         ]
         assert len(follower_calls) == 0
 
@@ -189,7 +196,7 @@ class TestFollowerNotificationVisibility:
         )
 
         # Act
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 event.status = Event.EventStatus.OPEN
                 event.save(update_fields=["status"])
@@ -197,8 +204,8 @@ class TestFollowerNotificationVisibility:
         # Assert
         follower_calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(follower_calls) == 1
-        assert follower_calls[0].kwargs["user"] == nonmember_user
+        assert follower_calls[0].kwargs["user"] == nonmember_user.id
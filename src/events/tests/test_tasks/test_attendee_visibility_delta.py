@@ -0,0 +1,140 @@
+"""Incremental attendee visibility: per-user deltas, debounced coalescing, periodic repair."""
+
+import typing as t
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+
+from accounts.models import RevelUser
+from conftest import RevelUserFactory
+from events.models import (
+    AttendeeVisibilityFlag,
+    Event,
+    EventInvitation,
+    EventRSVP,
+    GeneralUserPreferences,
+    OrganizationMember,
+    Ticket,
+)
+from events.tasks import (
+    build_attendee_visibility_flags,
+    enqueue_attendee_visibility_update,
+    repair_attendee_visibility_flags,
+    update_attendee_visibility_flags,
+)
+from events.tasks.attendees import refresh_attendee_visibility_flags
+
+pytestmark = pytest.mark.django_db
+
+Pref = GeneralUserPreferences.VisibilityPreference
+
+
+def _matrix(event: Event) -> dict[tuple[t.Any, t.Any], bool]:
+    return {
+        (user_id, target_id): is_visible
+        for user_id, target_id, is_visible in AttendeeVisibilityFlag.objects.filter(event=event).values_list(
+            "user_id", "target_id", "is_visible"
+        )
+    }
+
+
+def _attend(event: Event, user: RevelUser, pref: str) -> Ticket:
+    GeneralUserPreferences.objects.filter(user=user).update(show_me_on_attendee_list=pref)
+    tier = event.ticket_tiers.first()
+    assert tier is not None
+    return Ticket.objects.create(
+        guest_name="Guest", event=event, user=user, tier=tier, status=Ticket.TicketStatus.ACTIVE
+    )
+
+
+def test_delta_matches_full_rebuild(event: Event, revel_user_factory: RevelUserFactory) -> None:
+    """Joining, leaving and a preference change, applied as a delta, land on the full matrix."""
+    prefs = [Pref.ALWAYS, Pref.TO_MEMBERS, Pref.TO_INVITEES, Pref.TO_BOTH, Pref.NEVER]
+    users = [revel_user_factory() for _ in range(12)]
+    tickets = [_attend(event, user, prefs[i % len(prefs)]) for i, user in enumerate(users[:10])]
+    for user in users[::3]:
+        OrganizationMember.objects.create(organization=event.organization, user=user)
+    EventInvitation.objects.create(event=event, user=users[11])
+    build_attendee_visibility_flags(str(event.id))
+
+    joiner, leaver, changer = users[10], tickets[0].user, users[2]
+    EventRSVP.objects.create(event=event, user=joiner, status=EventRSVP.RsvpStatus.YES)
+    GeneralUserPreferences.objects.filter(user=joiner).update(show_me_on_attendee_list=Pref.TO_BOTH)
+    tickets[0].status = Ticket.TicketStatus.CANCELLED
+    tickets[0].save(update_fields=["status"])
+    GeneralUserPreferences.objects.filter(user=changer).update(show_me_on_attendee_list=Pref.NEVER)
+
+    refresh_attendee_visibility_flags(str(event.id), {joiner.id, leaver.id, changer.id})
+    delta = _matrix(event)
+    build_attendee_visibility_flags(str(event.id))
+
+    assert delta == _matrix(event)
+    assert not any(leaver.id == target for _, target in delta)
+
+
+def test_delta_writes_only_the_changed_row_and_column(event: Event, revel_user_factory: RevelUserFactory) -> None:
+    users = [revel_user_factory() for _ in range(6)]
+    for user in users[:5]:
+        _attend(event, user, Pref.ALWAYS)
+    build_attendee_visibility_flags(str(event.id))
+    AttendeeVisibilityFlag.objects.filter(event=event).update(is_visible=False)
+
+    _attend(event, users[5], Pref.ALWAYS)
+    refresh_attendee_visibility_flags(str(event.id), {users[5].id})
+
+    visible = {pair for pair, is_visible in _matrix(event).items() if is_visible}
+    assert visible == {(users[5].id, u.id) for u in users} | {(u.id, users[5].id) for u in users}
+
+
+def test_enqueues_within_the_window_coalesce_into_one_run(
+    event: Event, revel_user_factory: RevelUserFactory, django_capture_on_commit_callbacks: t.Any
+) -> None:
+    first, second = revel_user_factory(), revel_user_factory()
+
+    with patch("events.tasks.attendees.update_attendee_visibility_flags.apply_async") as mock_schedule:
+        with django_capture_on_commit_callbacks(execute=True):
+            enqueue_attendee_visibility_update(event.id, [first.id])
+            enqueue_attendee_visibility_update(event.id, [second.id])
+            enqueue_attendee_visibility_update(event.id, [first.id])
+    mock_schedule.assert_called_once()
+
+    with patch("events.tasks.attendees.refresh_attendee_visibility_flags") as mock_refresh:
+        update_attendee_visibility_flags(str(event.id))
+        update_attendee_visibility_flags(str(event.id))  # nothing new: no rewrite
+    mock_refresh.assert_called_once_with(str(event.id), {first.id, second.id})
+
+
+def test_lost_queue_entry_falls_back_to_full_rebuild(
+    event: Event, revel_user_factory: RevelUserFactory, django_capture_on_commit_callbacks: t.Any
+) -> None:
+    with patch("events.tasks.attendees.update_attendee_visibility_flags.apply_async"):
+        with django_capture_on_commit_callbacks(execute=True):
+            enqueue_attendee_visibility_update(event.id, [revel_user_factory().id])
+            enqueue_attendee_visibility_update(event.id, [revel_user_factory().id])
+    cache.delete(f"attendee_visibility:{event.id}:dirty:1")
+
+    with patch("events.tasks.attendees.refresh_attendee_visibility_flags") as mock_refresh:
+        update_attendee_visibility_flags(str(event.id))
+    mock_refresh.assert_called_once_with(str(event.id))
+
+
+def test_cache_failure_fails_open_to_full_rebuild(
+    event: Event, revel_user_factory: RevelUserFactory, django_capture_on_commit_callbacks: t.Any
+) -> None:
+    with (
+        patch("events.tasks.attendees.cache") as mock_cache,
+        patch("events.tasks.attendees.build_attendee_visibility_flags.delay") as mock_full,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        mock_cache.incr.side_effect = ConnectionError
+        enqueue_attendee_visibility_update(event.id, [revel_user_factory().id])
+    mock_full.assert_called_once_with(str(event.id))
+
+
+@patch("events.tasks.attendees.build_attendee_visibility_flags.delay")
+def test_repair_rebuilds_events_with_attendees(mock_full: MagicMock, event: Event) -> None:
+    Event.objects.filter(pk=event.pk).update(attendee_count=3)
+
+    assert repair_attendee_visibility_flags() == 1
+    mock_full.assert_called_once_with(str(event.id))
@@ -0,0 +1,150 @@
+"""Background ticket file pre-generation: per-event coalescing, bounded batches, cache hits."""
+
+import typing as t
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from accounts.models import RevelUser
+from conftest import RevelUserFactory
+from events.models import Event, Ticket, TicketTier
+from events.schema import TicketPurchaseItem
+from events.service import ticket_file_service
+from events.service.batch_ticket_service import BatchTicketService
+from events.service.ticket_file_service import TICKET_FILE_LOOKUPS
+from events.tasks import prewarm_ticket_files
+
+pytestmark = pytest.mark.django_db
+
+
+def _tickets(event: Event, revel_user_factory: RevelUserFactory, count: int) -> list[Ticket]:
+    tier = TicketTier.objects.create(event=event, name="Free", payment_method=TicketTier.PaymentMethod.FREE)
+    return [
+        Ticket.objects.create(
+            event=event, tier=tier, user=revel_user_factory(), guest_name="Guest", status=Ticket.TicketStatus.ACTIVE
+        )
+        for _ in range(count)
+    ]
+
+
+@patch("events.tasks.ticket_files.prewarm_ticket_files.apply_async")
+def test_activations_coalesce_per_event(
+    mock_apply_async: MagicMock,
+    public_event: Event,
+    revel_user_factory: RevelUserFactory,
+    django_capture_on_commit_callbacks: t.Any,
+) -> None:
+    with django_capture_on_commit_callbacks(execute=True):
+        tickets = _tickets(public_event, revel_user_factory, 3)
+        pending = tickets[0]
+        pending.status = Ticket.TicketStatus.PENDING
+        pending.save(update_fields=["status"])
+
+    mock_apply_async.assert_called_once()
+    assert mock_apply_async.call_args.args[0] == (str(public_event.id),)
+
+
+@patch("events.tasks.ticket_files._schedule")
+@patch("common.service.pdf_rendering.html_to_pdf", return_value=b"%PDF-prewarm")
+def test_run_renders_one_bounded_batch_then_reschedules(
+    mock_html_to_pdf: MagicMock,
+    mock_schedule: MagicMock,
+    public_event: Event,
+    revel_user_factory: RevelUserFactory,
+    settings: t.Any,
+) -> None:
+    settings.TICKET_FILE_PREWARM_BATCH_SIZE = 2
+    tickets = _tickets(public_event, revel_user_factory, 3)
+
+    assert prewarm_ticket_files(str(public_event.id)) == 2
+    mock_schedule.assert_called_once_with(str(public_event.id), after=str(tickets[1].id))
+
+    mock_schedule.reset_mock()
+    assert prewarm_ticket_files(str(public_event.id), str(tickets[1].id)) == 1
+    mock_schedule.assert_not_called()
+    assert prewarm_ticket_files(str(public_event.id)) == 0
+    assert mock_html_to_pdf.call_count == 3
+
+
+@patch("events.tasks.ticket_files._schedule")
+@patch("events.service.ticket_file_service.get_apple_pass_generator")
+@patch("events.service.ticket_file_service.wallet_passes_enabled", return_value=True)
+@patch("common.service.pdf_rendering.html_to_pdf", return_value=b"%PDF-prewarm")
+def test_pkpass_failure_keeps_the_pdf_and_the_chain_moves_on(
+    mock_html_to_pdf: MagicMock,
+    mock_wallet_enabled: MagicMock,
+    mock_generator: MagicMock,
+    mock_schedule: MagicMock,
+    public_event: Event,
+    revel_user_factory: RevelUserFactory,
+    settings: t.Any,
+) -> None:
+    settings.TICKET_FILE_PREWARM_BATCH_SIZE = 1
+    mock_generator.return_value.generate_pass.side_effect = RuntimeError("bad certificate")
+    first, second = _tickets(public_event, revel_user_factory, 2)
+
+    assert prewarm_ticket_files(str(public_event.id)) == 1
+    first.refresh_from_db()
+    with first.pdf_file.open("rb") as f:
+        assert f.read() == b"%PDF-prewarm"
+    mock_schedule.assert_called_once_with(str(public_event.id), after=str(first.id))
+
+    # The continuation starts past the ticket still missing its pass.
+    mock_schedule.reset_mock()
+    assert prewarm_ticket_files(str(public_event.id), str(first.id)) == 1
+    second.refresh_from_db()
+    assert second.pdf_file
+    mock_schedule.assert_not_called()
+
+
+@patch("events.tasks.ticket_files._schedule")
+@patch("common.service.pdf_rendering.html_to_pdf", side_effect=RuntimeError("layout"))
+def test_batch_without_progress_ends_the_chain(
+    mock_html_to_pdf: MagicMock,
+    mock_schedule: MagicMock,
+    public_event: Event,
+    revel_user_factory: RevelUserFactory,
+    settings: t.Any,
+) -> None:
+    settings.TICKET_FILE_PREWARM_BATCH_SIZE = 1
+    _tickets(public_event, revel_user_factory, 2)
+
+    assert prewarm_ticket_files(str(public_event.id)) == 0
+    mock_schedule.assert_not_called()
+
+
+@patch("events.tasks.ticket_files.prewarm_ticket_files.apply_async")
+def test_batch_checkout_enqueues_a_run(
+    mock_apply_async: MagicMock,
+    public_event: Event,
+    public_user: RevelUser,
+    django_capture_on_commit_callbacks: t.Any,
+) -> None:
+    """bulk_create sends no post_save, so the batch checkout enqueues the run itself."""
+    tier = TicketTier.objects.create(event=public_event, name="Free", payment_method=TicketTier.PaymentMethod.FREE)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tickets = BatchTicketService(public_event, tier, public_user).create_batch(
+            [TicketPurchaseItem(guest_name="Buyer")]
+        )
+
+    assert isinstance(tickets, list)
+    assert tickets[0].status == Ticket.TicketStatus.ACTIVE
+    mock_apply_async.assert_called_once()
+    assert mock_apply_async.call_args.args[0] == (str(public_event.id),)
+
+
+@patch("common.service.pdf_rendering.html_to_pdf", return_value=b"%PDF-prewarm")
+def test_prewarmed_download_is_a_cache_hit(
+    mock_html_to_pdf: MagicMock, public_event: Event, revel_user_factory: RevelUserFactory
+) -> None:
+    (ticket,) = _tickets(public_event, revel_user_factory, 1)
+    hits = TICKET_FILE_LOOKUPS.labels(kind="pdf", result="hit")._value.get()
+    prewarm_ticket_files(str(public_event.id))
+
+    ticket = Ticket.objects.full().get(pk=ticket.pk)
+    with patch("events.utils.create_ticket_pdf") as mock_create:
+        assert ticket_file_service.get_or_generate_pdf(ticket) == b"%PDF-prewarm"
+
+    mock_create.assert_not_called()
+    assert TICKET_FILE_LOOKUPS.labels(kind="pdf", result="hit")._value.get() - hits == 1
@@ -247,13 +247,13 @@ class TestRefundOneCancelledEventTicket:
             stripe_payment_intent_id="pi_visibility",
         )
 
-        with patch("events.tasks.refunds.build_attendee_visibility_flags.delay") as mock_visibility:
+        with patch("events.tasks.refunds.enqueue_attendee_visibility_update") as mock_visibility:
             with patch("stripe.Refund.create") as mock_create:
                 mock_create.return_value.id = "re_visibility"
                 with django_capture_on_commit_callbacks(execute=True):
                     refund_one_cancelled_event_ticket(str(tk.id), None)
 
-        mock_visibility.assert_called_once_with(str(event.id))
+        mock_visibility.assert_called_once_with(event.id, [tk.user_id])
 
     def test_resumes_after_refund_succeeds_but_cancellation_did_not_commit(
         self,
@@ -1,4 +1,4 @@
-"""Tests for send_waitlist_offer_notification_task."""
+"""Tests for send_waitlist_offer_notification_task and its batch counterpart."""
 
 import datetime as dt
 import uuid
@@ -10,7 +10,9 @@ from django.utils import timezone
 from accounts.models import RevelUser
 from conftest import RevelUserFactory
 from events.models import Event, WaitlistOffer
-from events.tasks import send_waitlist_offer_notification_task
+from events.tasks import send_waitlist_offer_notification_task, send_waitlist_offer_notifications_task
+from notifications.enums import NotificationType
+from notifications.models import Notification
 
 pytestmark = pytest.mark.django_db
 
@@ -135,3 +137,37 @@ def test_cutoff_batch_context_flag(event: Event, revel_user_factory: RevelUserFa
 
     ctx = mocked.call_args.kwargs["context"]
     assert ctx["is_cutoff_batch"] is True
+
+
+def test_batch_task_notifies_pending_offers_in_one_pass(event: Event, revel_user_factory: RevelUserFactory) -> None:
+    """One notification per live offer, offer-specific context per user, skips the rest."""
+    live = [_make_offer(event, revel_user_factory()) for _ in range(3)]
+    cutoff = _make_offer(event, revel_user_factory(), is_cutoff=True)
+    expired = _make_offer(event, revel_user_factory())
+    expired.status = WaitlistOffer.WaitlistOfferStatus.EXPIRED
+    expired.save(update_fields=["status"])
+
+    with mock.patch("notifications.tasks.dispatch_notifications_batch.delay"):
+        result = send_waitlist_offer_notifications_task([str(o.id) for o in [*live, cutoff, expired]])
+
+    assert result == {"status": "sent", "sent": 4, "skipped": 1}
+    notifications = Notification.objects.filter(notification_type=NotificationType.WAITLIST_SPOT_AVAILABLE)
+    contexts = {n.user_id: n.context for n in notifications}
+    assert set(contexts) == {o.user_id for o in [*live, cutoff]}
+    for offer in [*live, cutoff]:
+        assert contexts[offer.user_id]["offer_id"] == str(offer.id)
+        assert contexts[offer.user_id]["event_id"] == str(event.id)
+        assert contexts[offer.user_id]["is_cutoff_batch"] is offer.is_cutoff_batch
+    assert WaitlistOffer.objects.filter(notified_at__isnull=False).count() == 4
+    expired.refresh_from_db()
+    assert expired.notified_at is None
+
+
+def test_batch_task_with_nothing_to_send_is_skipped(event: Event, revel_user_factory: RevelUserFactory) -> None:
+    bogus = str(uuid.uuid4())
+
+    with mock.patch("notifications.service.dispatcher.notify_many") as mocked:
+        result = send_waitlist_offer_notifications_task([bogus])
+
+    assert result == {"status": "skipped", "sent": 0, "skipped": 1}
+    mocked.assert_not_called()
@@ -392,6 +392,49 @@ class TestCacheFiles:
         assert ticket_with_tier.file_content_hash is None
 
 
+# ---------------------------------------------------------------------------
+# render_tickets
+# ---------------------------------------------------------------------------
+
+
+class TestRenderTickets:
+    """Tests for ticket_file_service.render_tickets."""
+
+    @patch("common.service.pdf_rendering.html_to_pdf", return_value=b"%PDF-batch")
+    def test_renders_and_caches_stale_tickets_only(
+        self, mock_html_to_pdf: MagicMock, ticket_with_tier: Ticket, future_event: Event, tier: TicketTier
+    ) -> None:
+        """Fresh cached PDFs are kept; the rest are rendered and persisted."""
+        ticket_file_service.cache_files(ticket_with_tier, pdf_bytes=b"%PDF-fresh")
+        other = Ticket.objects.create(
+            event=future_event, user=future_event.organization.owner, tier=tier, guest_name="Other"
+        )
+
+        rendered = ticket_file_service.render_tickets([ticket_with_tier.id, other.id])
+
+        assert rendered == 1
+        mock_html_to_pdf.assert_called_once()
+        other.refresh_from_db()
+        assert ticket_file_service.is_cache_valid(other)
+        with other.pdf_file.open("rb") as f:
+            assert f.read() == b"%PDF-batch"
+
+    @patch("common.service.pdf_rendering.html_to_pdf", side_effect=[RuntimeError("layout"), b"%PDF-ok"])
+    def test_failure_does_not_sink_the_batch(
+        self, mock_html_to_pdf: MagicMock, ticket_with_tier: Ticket, future_event: Event, tier: TicketTier
+    ) -> None:
+        """A ticket that fails to render is skipped; the others are still cached."""
+        other = Ticket.objects.create(
+            event=future_event, user=future_event.organization.owner, tier=tier, guest_name="Other"
+        )
+
+        rendered = ticket_file_service.render_tickets([ticket_with_tier.id, other.id])
+
+        assert rendered == 1
+        cached = Ticket.objects.filter(pk__in=[ticket_with_tier.id, other.id]).exclude(file_content_hash=None)
+        assert cached.count() == 1
+
+
 # ---------------------------------------------------------------------------
 # _persist_and_update
 # ---------------------------------------------------------------------------
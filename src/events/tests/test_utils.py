@@ -8,6 +8,7 @@ import pytest
 from django.contrib.gis.geos import Point
 
 from accounts.models import RevelUser
+from common.service import pdf_rendering
 from events import models
 from events.utils import (
     create_ticket_pdf,
@@ -172,8 +173,8 @@ def test_create_ticket_pdf_basic_functionality(
     assert "ticket_id" in context
 
     # Assert HTML was converted to PDF
-    mock_html.assert_called_once_with(string="<html><body>Ticket</body></html>")
-    mock_html_instance.write_pdf.assert_called_once()
+    mock_html.assert_called_once_with(string="<html><body>Ticket</body></html>", url_fetcher=pdf_rendering.url_fetcher)
+    mock_html_instance.write_pdf.assert_called_once_with(font_config=pdf_rendering.font_configuration())
 
     # Assert correct return value
     assert pdf_bytes == b"fake-pdf-content"
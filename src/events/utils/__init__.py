@@ -7,7 +7,6 @@ Model imports are deferred to avoid circular-import issues when submodules
 """
 
 import base64
-import mimetypes
 import typing as t
 from collections import defaultdict
 from datetime import datetime
@@ -20,6 +19,8 @@ from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.dateformat import format as date_format
 
+from common.service.pdf_rendering import file_data_uri, html_to_pdf
+
 if t.TYPE_CHECKING:
     from accounts.models import RevelUser
     from events import models
@@ -294,35 +295,6 @@ def google_wallet_configured() -> bool:
     return bool(settings.GOOGLE_WALLET_ISSUER_ID and settings.GOOGLE_WALLET_SERVICE_ACCOUNT_KEY_PATH)
 
 
-def _file_to_data_uri(file_field: t.Any) -> str | None:
-    """Convert a Django FileField/ImageField to a base64 data URI.
-
-    Args:
-        file_field: Django file field to convert
-
-    Returns:
-        Data URI string or None if conversion fails
-    """
-    if not file_field:
-        return None
-
-    try:
-        file_field.open("rb")
-        file_data = file_field.read()
-        file_field.close()
-
-        # Detect MIME type from file extension
-        mime_type, _ = mimetypes.guess_type(file_field.name)
-        if not mime_type:
-            mime_type = "image/jpeg"  # Default fallback
-
-        file_base64 = base64.b64encode(file_data).decode("utf-8")
-        return f"data:{mime_type};base64,{file_base64}"
-    except Exception:
-        logger.debug("file_to_data_uri_failed", file_name=getattr(file_field, "name", None))
-        return None
-
-
 def _qr_code_base64(payload: str) -> str:
     """Render ``payload`` as a QR code PNG, base64-encoded (no data-URI prefix).
 
@@ -359,15 +331,22 @@ def create_ticket_pdf(ticket: "Ticket") -> bytes:
     Returns:
         The PDF content as bytes.
     """
-    from weasyprint import HTML
+    return html_to_pdf(ticket_pdf_html(ticket))
 
+
+def ticket_pdf_html(ticket: "Ticket") -> str:
+    """Render the ticket PDF's HTML: everything that needs the database, none of the layout.
+
+    Split from :func:`create_ticket_pdf` so batch renderers can lay out the HTML
+    in worker processes.
+    """
     event = ticket.event
 
     qr_code_base64 = _qr_code_base64(str(ticket.id))
 
     # Cover art with fallback priority: Event > EventSeries > Organization
     _logo_file, cover_art_file, _branding_source_name = _get_branding_assets(event)
-    cover_art_data_uri = _file_to_data_uri(cover_art_file)
+    cover_art_data_uri = file_data_uri(cover_art_file)
 
     # Prepare context for the HTML template
     context_data = {
@@ -397,10 +376,7 @@ def create_ticket_pdf(ticket: "Ticket") -> bytes:
         "brand_mark": str(settings.BASE_DIR / "assets" / "brand" / "revel-mark.svg"),
     }
 
-    # Render and generate PDF
-    html_string = render_to_string("events/ticket.html", context=context_data)
-    html = HTML(string=html_string)
-    return t.cast(bytes, html.write_pdf())
+    return render_to_string("events/ticket.html", context=context_data)
 
 
 def create_series_pass_pdf(held_pass: "HeldSeriesPass") -> bytes:
@@ -414,8 +390,6 @@ def create_series_pass_pdf(held_pass: "HeldSeriesPass") -> bytes:
     Returns:
         The PDF content as bytes.
     """
-    from weasyprint import HTML
-
     series_pass = held_pass.series_pass
     event_series = series_pass.event_series
     organization = event_series.organization
@@ -443,8 +417,8 @@ def create_series_pass_pdf(held_pass: "HeldSeriesPass") -> bytes:
             or organization.cover_art
         )
 
-    logo_data_uri = _file_to_data_uri(logo_file)
-    cover_art_data_uri = _file_to_data_uri(cover_art_file)
+    logo_data_uri = file_data_uri(logo_file)
+    cover_art_data_uri = file_data_uri(cover_art_file)
 
     context_data = {
         "series_name": event_series.name,
@@ -461,9 +435,7 @@ def create_series_pass_pdf(held_pass: "HeldSeriesPass") -> bytes:
         "brand_mark": str(settings.BASE_DIR / "assets" / "brand" / "revel-mark.svg"),
     }
 
-    html_string = render_to_string("events/series_pass.html", context=context_data)
-    html = HTML(string=html_string)
-    return t.cast(bytes, html.write_pdf())
+    return html_to_pdf(render_to_string("events/series_pass.html", context=context_data))
 
 
 def create_membership_pdf(member: "OrganizationMember") -> bytes:
@@ -476,8 +448,6 @@ def create_membership_pdf(member: "OrganizationMember") -> bytes:
     Returns:
         The PDF content as bytes.
     """
-    from weasyprint import HTML
-
     organization = member.organization
 
     # member.qr_payload is the single source of truth for the scan contract
@@ -495,12 +465,10 @@ def create_membership_pdf(member: "OrganizationMember") -> bytes:
         "qr_code_base64": qr_code_base64,
         "member_id": str(member.id),
         "member_id_short": str(member.id)[:8].upper(),
-        "logo_url": _file_to_data_uri(logo_file),
-        "cover_art_url": _file_to_data_uri(cover_art_file),
+        "logo_url": file_data_uri(logo_file),
+        "cover_art_url": file_data_uri(cover_art_file),
         "font_dir": str(settings.BASE_DIR / "fonts"),
         "brand_mark": str(settings.BASE_DIR / "assets" / "brand" / "revel-mark.svg"),
     }
 
-    html_string = render_to_string("events/membership_card.html", context=context_data)
-    html = HTML(string=html_string)
-    return t.cast(bytes, html.write_pdf())
+    return html_to_pdf(render_to_string("events/membership_card.html", context=context_data))
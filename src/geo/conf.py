@@ -8,6 +8,8 @@ IP2LOCATION_DB_PATH = GEO_DATA_DIR / "IP2LOCATION-LITE-DB5.BIN"
 WORLDCITIES_CSV_PATH = GEO_DATA_DIR / "worldcities.csv"
 WORLDCITIES_MINI_CSV_PATH = GEO_DATA_DIR / "worldcities.mini.csv"
 IP2LOCATION_TOKEN = getattr(settings, "IP2LOCATION_TOKEN", None)
+IP2LOCATION_CACHE_SIZE = getattr(settings, "IP2LOCATION_CACHE_SIZE", 65536)
+IP2LOCATION_RELOAD_CHECK_SECONDS = getattr(settings, "IP2LOCATION_RELOAD_CHECK_SECONDS", 60)
 
 
 def resolve_worldcities_csv() -> Path:
@@ -1,56 +1,228 @@
+"""IP geolocation against the IP2Location LITE DB5 ``.BIN`` database.
+
+The IP2Location client reads records through a single shared file cursor (seek +
+read), which is not thread-safe (issue #637), decodes every column on each lookup,
+and left us ``stat()``-ing the ~168 MB database per call to notice downloads.
+:class:`IP2LocationReader` instead maps the file read-only once per process and
+binary-searches it with ``struct.unpack_from`` at computed offsets: there is no
+cursor, so one reader serves every thread without locks, and only the city and
+coordinate columns are decoded. The pages live in the shared OS page cache.
+
+:func:`get_ip2location` checks the file's mtime every
+``IP2LOCATION_RELOAD_CHECK_SECONDS`` and swaps in a new reader when the downloader
+has replaced it (the rename leaves the old mapping valid for in-flight lookups).
+:func:`resolve_ip_to_point` fronts the reader with an LRU of
+``IP2LOCATION_CACHE_SIZE`` entries keyed by IPv4 /24 (the network address is what
+gets looked up) or the full IPv6 address; it is cleared on reload.
+"""
+
+import functools
+import mmap
+import os
+import socket
+import struct
 import threading
+import time
+import typing as t
+from pathlib import Path
 
 import structlog
 from django.contrib.gis.geos import Point
-from IP2Location import IP2Location
 
 from geo import conf
 
 logger = structlog.get_logger(__name__)
 
-# In the default FILE_IO mode, IP2Location reads records through a single shared
-# file cursor (seek + read), which is not thread-safe. Under Gunicorn's gthread
-# workers, concurrent requests on one shared instance corrupt each other's reads.
-# We therefore keep one handle per thread. The database pages stay in the shared
-# OS page cache (loaded once), so this costs only a cheap file descriptor per
-# thread — not a copy of the ~168 MB database. See issue #637.
-_local = threading.local()
+# dbtype, dbcolumn, year, month, day, then IPv4 count/address, IPv6 count/address,
+# IPv4/IPv6 index base. Addresses in the file are 1-based.
+_HEADER = struct.Struct("<5B6I")
+_PRODUCT_CODE_OFFSET = 29
+_INDEX_ENTRY = struct.Struct("<II")
+_U32 = struct.Struct("<I")
+# City pointer, latitude, longitude: columns 4-6 of every dbtype that has coordinates.
+_CITY_AND_COORDINATES = struct.Struct("<Iff")
+_CITY_COLUMN = 4
+_DB_TYPES_WITH_COORDINATES = frozenset({5, 6, *range(8, 27)})
 
+_MAX_IPV4 = 2**32 - 1
+_MAX_IPV6 = 2**128 - 1
+_V4_MAPPED = (0xFFFF_0000_0000, 0xFFFF_FFFF_FFFF)
+_6TO4 = (0x2002 << 112, (0x2003 << 112) - 1)
+_TEREDO = (0x2001_0000 << 96, (0x2001_0001 << 96) - 1)
 
-def get_ip2location() -> IP2Location:
-    """Return a thread-local IP2Location database handle.
 
-    Each thread gets its own file descriptor because FILE_IO mode is not
-    thread-safe. Uses the database file's modification time to detect when a new
-    database has been downloaded, reloading the calling thread's handle.
+class GeoRecord(t.NamedTuple):
+    """The columns we read from an IP2Location row."""
+
+    city: str
+    latitude: float
+    longitude: float
+
+
+def _parse_address(ip: str) -> tuple[int, int] | None:
+    """(version, number) for an address, mapping IPv6-embedded IPv4 the way IP2Location does."""
+    try:
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, ip), "big")
+    except OSError:
+        pass
+    try:
+        number = int.from_bytes(socket.inet_pton(socket.AF_INET6, ip), "big")
+    except OSError:
+        return None
+    if _6TO4[0] <= number <= _6TO4[1]:
+        return 4, (number >> 80) & _MAX_IPV4
+    if _TEREDO[0] <= number <= _TEREDO[1]:
+        return 4, ~number & _MAX_IPV4
+    if _V4_MAPPED[0] <= number <= _V4_MAPPED[1]:
+        return 4, number - _V4_MAPPED[0]
+    return 6, number
+
+
+class IP2LocationReader:
+    """A read-only, memory-mapped IP2Location database, safe to share across threads."""
+
+    def __init__(self, path: Path) -> None:
+        """Map the database and read its header."""
+        with path.open("rb") as f:
+            # The file's own mtime, not the path's: the downloader may rename a new one in meanwhile.
+            self.mtime = os.fstat(f.fileno()).st_mtime
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_RANDOM"):
+            self._buffer.madvise(mmap.MADV_RANDOM)
+        if len(self._buffer) < _PRODUCT_CODE_OFFSET + 1:
+            raise ValueError(f"{path} is too small to be an IP2Location database.")
+        (
+            self.db_type,
+            self._columns,
+            year,
+            _month,
+            _day,
+            self._ipv4_count,
+            self._ipv4_base,
+            self._ipv6_count,
+            self._ipv6_base,
+            self._ipv4_index,
+            self._ipv6_index,
+        ) = _HEADER.unpack_from(self._buffer, 0)
+        product_code = self._buffer[_PRODUCT_CODE_OFFSET]
+        if product_code not in (0, 1) and year > 20:
+            raise ValueError(f"{path} is not an IP2Location BIN database.")
+        if self.db_type not in _DB_TYPES_WITH_COORDINATES:
+            raise ValueError(f"IP2Location DB{self.db_type} has no coordinates.")
+
+    def lookup(self, ip: str) -> GeoRecord | None:
+        """The record for an address; None for invalid addresses or when it is not covered."""
+        parsed = _parse_address(ip)
+        if parsed is None:
+            return None
+        version, number = parsed
+        if version == 4:
+            return self._search(min(number, _MAX_IPV4 - 1), 4, self._ipv4_count, self._ipv4_base, self._ipv4_index)
+        if not self._ipv6_count:
+            return None
+        return self._search(min(number, _MAX_IPV6 - 1), 16, self._ipv6_count, self._ipv6_base, self._ipv6_index)
+
+    def _search(self, number: int, ip_width: int, count: int, base: int, index_base: int) -> GeoRecord | None:
+        buffer = self._buffer
+        # An IP takes the first column; IPv6 rows widen it from 4 to 16 bytes.
+        extra = ip_width - 4
+        row_size = self._columns * 4 + extra
+        base -= 1
+        low, high = 0, count
+        if index_base:
+            low, high = _INDEX_ENTRY.unpack_from(buffer, index_base - 1 + ((number >> (ip_width * 8 - 16)) << 3))
+        while low <= high:
+            mid = (low + high) >> 1
+            row = base + mid * row_size
+            ip_from = self._read_ip(row, ip_width)
+            if number < ip_from:
+                high = mid - 1
+            elif number >= self._read_ip(row + row_size, ip_width):
+                low = mid + 1
+            else:
+                return self._record(row + extra + (_CITY_COLUMN - 1) * 4)
+        return None
+
+    def _read_ip(self, offset: int, ip_width: int) -> int:
+        if ip_width == 4:
+            return t.cast(int, _U32.unpack_from(self._buffer, offset)[0])
+        return int.from_bytes(self._buffer[offset : offset + 16], "little")
+
+    def _record(self, offset: int) -> GeoRecord:
+        city_at, latitude, longitude = _CITY_AND_COORDINATES.unpack_from(self._buffer, offset)
+        length = self._buffer[city_at]
+        city = self._buffer[city_at + 1 : city_at + 1 + length].decode("iso-8859-1")
+        return GeoRecord(city=city, latitude=round(latitude, 6), longitude=round(longitude, 6))
+
+
+_reader: IP2LocationReader | None = None
+_next_check = 0.0
+_reload_lock = threading.Lock()
+
+
+def get_ip2location() -> IP2LocationReader:
+    """Return the process-wide reader, reloading it when the database file has changed.
+
+    The file is only ``stat()``-ed once every ``IP2LOCATION_RELOAD_CHECK_SECONDS``;
+    in between this is a clock read.
     """
-    # Get current file modification time
-    current_mtime = conf.IP2LOCATION_DB_PATH.stat().st_mtime
+    reader = _reader
+    if reader is not None and time.monotonic() < _next_check:
+        return reader
+    return _check_reload()
+
+
+def _check_reload() -> IP2LocationReader:
+    global _reader, _next_check
+    with _reload_lock:
+        if _reader is not None and time.monotonic() < _next_check:
+            return _reader
+        mtime = conf.IP2LOCATION_DB_PATH.stat().st_mtime
+        if _reader is None or _reader.mtime != mtime:
+            _reader = IP2LocationReader(conf.IP2LOCATION_DB_PATH)
+            clear_lookup_cache()
+            logger.info("ip2location_db_loaded", db_type=_reader.db_type, mtime=mtime)
+        _next_check = time.monotonic() + conf.IP2LOCATION_RELOAD_CHECK_SECONDS
+        return _reader
+
+
+def _cache_key(ip: str) -> str:
+    """The IPv4 /24 network address, or the address itself for IPv6."""
+    if ":" in ip:
+        return ip
+    return ip.rpartition(".")[0] + ".0"
+
+
+@functools.lru_cache(maxsize=conf.IP2LOCATION_CACHE_SIZE)
+def _lookup(key: str) -> tuple[float, float] | None:
+    record = get_ip2location().lookup(key)
+    if record is None or record.city == "-":
+        return None
+    return float(record.longitude), float(record.latitude)
 
-    # Reload if this thread hasn't loaded the database or the file has changed
-    db: IP2Location | None = getattr(_local, "db", None)
-    if db is None or _local.mtime != current_mtime:
-        db = IP2Location(conf.IP2LOCATION_DB_PATH)
-        _local.db = db
-        _local.mtime = current_mtime
 
-    return db
+def clear_lookup_cache() -> None:
+    """Forget every cached lookup."""
+    _lookup.cache_clear()
 
 
 def resolve_ip_to_point(ip: str) -> Point | None:
     """Resolves an IP address to a geographical point."""
-    ipdb = get_ip2location()
+    if not ip:
+        return None
     try:
-        record = ipdb.get_all(ip)
-        if record is None or record.city == "-":
-            return None
-        return Point(float(record.longitude), float(record.latitude), srid=4326)
+        # Runs the reload check even when the answer is cached, so a new database clears the cache.
+        get_ip2location()
+        coordinates = _lookup(_cache_key(ip))
     except Exception:
         # warning, not debug: a broken database otherwise fails every lookup
         # invisibly (a corrupt .BIN disabled nearest-first sorting in
         # production for months — the downloader saved the ZIP as the .BIN).
         logger.warning("ip_resolution_failed", ip=ip, exc_info=True)
         return None
+    if coordinates is None:
+        return None
+    return Point(*coordinates, srid=4326)
 
 
 class LazyGeoPoint:
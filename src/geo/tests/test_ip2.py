@@ -1,104 +1,209 @@
-"""Thread-safety tests for the IP2Location handle cache (issue #637).
+"""Tests for the memory-mapped IP2Location reader and the lookup cache in front of it.
 
-FILE_IO mode reads through a single shared file cursor, so one instance shared
-across gthread worker threads corrupts concurrent reads. ``get_ip2location`` must
-hand each thread its own handle, while still hot-reloading when the ``.BIN`` is
-replaced by the downloader.
+The reader replaces thread-local FILE_IO handles (issue #637): one mapping per
+process must answer concurrent lookups correctly, pick up a database the
+downloader swapped in (checked on a timer, not per call), and the LRU must serve
+repeat lookups from the same /24 without touching the database.
 """
 
+import bisect
+import os
+import struct
 import threading
 import typing as t
-from unittest.mock import MagicMock
+from pathlib import Path
 
 import pytest
 from pytest import MonkeyPatch
 
-from geo.ip2 import get_ip2location
+from geo import ip2
+from geo.ip2 import GeoRecord, IP2LocationReader, get_ip2location, resolve_ip_to_point
+
+Row = tuple[int, str, float, float]
+
+IPV4_ROWS: list[Row] = [
+    (0, "-", 0.0, 0.0),
+    (int.from_bytes(bytes([8, 8, 8, 0])), "Mountain View", 37.405991, -122.078514),
+    (int.from_bytes(bytes([8, 8, 9, 0])), "-", 0.0, 0.0),
+    (int.from_bytes(bytes([93, 184, 0, 0])), "Vienna", 48.208488, 16.372080),
+    (int.from_bytes(bytes([93, 185, 0, 0])), "-", 0.0, 0.0),
+]
+IPV6_ROWS: list[Row] = [
+    (0, "-", 0.0, 0.0),
+    (0x2A00_1450 << 96, "Zürich", 47.366669, 8.55),
+    (0x2A00_1451 << 96, "-", 0.0, 0.0),
+]
+
+
+def write_bin(path: Path, ipv4_rows: list[Row], ipv6_rows: t.Sequence[Row] = ()) -> None:
+    """Write a minimal DB5 database (with IPv4 and IPv6 indexes) in the IP2Location BIN layout."""
+    columns = 6  # ip_from, country, region, city, latitude, longitude
+    strings = bytearray()
+    string_base = 64
+
+    def string(value: str) -> int:
+        offset = string_base + len(strings)
+        encoded = value.encode("iso-8859-1")
+        strings.extend(bytes([len(encoded)]) + encoded)
+        return offset
+
+    country = string("-")
+
+    def rows(data: list[Row], ip_width: int, max_ip: int) -> bytes:
+        # Two trailing sentinel rows so the search can always read the next row's ip_from.
+        out = bytearray()
+        for ip_from, city, lat, lon in [*data, (max_ip, "-", 0.0, 0.0), (max_ip, "-", 0.0, 0.0)]:
+            out += ip_from.to_bytes(ip_width, "little")
+            out += struct.pack("<IIIff", country, country, string(city), lat, lon)
+        return bytes(out)
+
+    def index(data: list[Row], shift: int) -> bytes:
+        starts = [ip_from for ip_from, *_ in data]
+        out = bytearray()
+        for prefix in range(65536):
+            low = bisect.bisect_right(starts, prefix << shift) - 1
+            high = bisect.bisect_right(starts, ((prefix + 1) << shift) - 1)
+            out += struct.pack("<II", max(low, 0), min(high, len(data)))
+        return bytes(out)
+
+    ipv4 = rows(ipv4_rows, 4, 2**32 - 1)
+    ipv6 = rows(list(ipv6_rows), 16, 2**128 - 1) if ipv6_rows else b""
+    ipv4_index = index(ipv4_rows, 16)
+    ipv6_index = index(list(ipv6_rows), 112) if ipv6_rows else b""
+    # Strings are complete once the rows are built; lay out the remaining sections after them.
+    ipv4_index_at = string_base + len(strings)
+    ipv6_index_at = ipv4_index_at + len(ipv4_index)
+    ipv4_at = ipv6_index_at + len(ipv6_index)
+    ipv6_at = ipv4_at + len(ipv4)
+    header = struct.pack(
+        "<5B6IB",
+        5,
+        columns,
+        25,
+        1,
+        1,
+        len(ipv4_rows),
+        ipv4_at + 1,
+        len(ipv6_rows),
+        ipv6_at + 1 if ipv6_rows else 0,
+        ipv4_index_at + 1,
+        ipv6_index_at + 1 if ipv6_rows else 0,
+        1,
+    )
+    path.write_bytes(header.ljust(string_base, b"\0") + strings + ipv4_index + ipv6_index + ipv4 + ipv6)
 
 
 @pytest.fixture(autouse=True)
 def mock_ip2location() -> t.Iterator[None]:
-    """Shadow conftest's autouse mock so these tests hit the real get_ip2location."""
+    """Shadow conftest's autouse mock so these tests hit the real reader."""
+    ip2.clear_lookup_cache()
     yield
+    ip2.clear_lookup_cache()
 
 
-def test_get_ip2location_is_thread_local(monkeypatch: MonkeyPatch) -> None:
-    """Each thread gets its own handle; a thread reuses its own across calls."""
-    calls = {"n": 0}
-    calls_lock = threading.Lock()
+@pytest.fixture
+def db_path(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """A synthetic database the process-wide reader is pointed at, with a fresh reload timer."""
+    path = tmp_path / "IP2LOCATION-LITE-DB5.BIN"
+    write_bin(path, IPV4_ROWS, IPV6_ROWS)
+    monkeypatch.setattr(ip2.conf, "IP2LOCATION_DB_PATH", path)
+    monkeypatch.setattr(ip2, "_reader", None)
+    monkeypatch.setattr(ip2, "_next_check", 0.0)
+    return path
 
-    class FakeDB:
-        def __init__(self, path: t.Any) -> None:
-            with calls_lock:
-                calls["n"] += 1
 
-    monkeypatch.setattr("geo.ip2.IP2Location", FakeDB)
+def test_lookup_finds_ipv4_and_ipv6_ranges(db_path: Path) -> None:
+    reader = IP2LocationReader(db_path)
 
-    fake_path = MagicMock()
-    fake_path.stat.return_value.st_mtime = 1.0
-    monkeypatch.setattr("geo.ip2.conf.IP2LOCATION_DB_PATH", fake_path)
+    assert reader.lookup("8.8.8.8") == GeoRecord("Mountain View", 37.405991, -122.078514)
+    assert reader.lookup("93.184.216.34") == GeoRecord("Vienna", 48.208488, 16.37208)
+    assert reader.lookup("::ffff:8.8.8.8") == reader.lookup("8.8.8.8")
+    assert reader.lookup("2a00:1450:4001::1") == GeoRecord("Zürich", 47.366669, 8.55)
+    assert reader.lookup("8.8.9.1") == GeoRecord("-", 0.0, 0.0)
+    assert reader.lookup("255.255.255.255") == GeoRecord("-", 0.0, 0.0)
+    assert reader.lookup("not-an-ip") is None
+    assert reader.lookup("") is None
 
-    n_threads = 5
-    barrier = threading.Barrier(n_threads)
-    results: dict[int, tuple[t.Any, t.Any]] = {}
-    results_lock = threading.Lock()
 
-    def worker(i: int) -> None:
-        barrier.wait()  # release all threads together to force concurrent access
-        first = get_ip2location()
-        second = get_ip2location()
-        with results_lock:
-            results[i] = (first, second)
+def test_ipv4_only_database_has_no_ipv6_answers(tmp_path: Path) -> None:
+    path = tmp_path / "v4.BIN"
+    write_bin(path, IPV4_ROWS)
+
+    reader = IP2LocationReader(path)
+
+    assert reader.lookup("2a00:1450:4001::1") is None
+    assert reader.lookup("8.8.8.8") is not None
+
+
+def test_one_reader_answers_concurrent_lookups(db_path: Path) -> None:
+    """No shared cursor: threads hammering one reader all get their own answers."""
+    reader = IP2LocationReader(db_path)
+    expected = {"8.8.8.8": "Mountain View", "93.184.1.1": "Vienna", "2a00:1450::1": "Zürich", "1.1.1.1": "-"}
+    barrier = threading.Barrier(8)
+    errors: list[str] = []
 
-    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    def worker(i: int) -> None:
+        ips = list(expected)
+        barrier.wait()
+        for n in range(2000):
+            ip = ips[(i + n) % len(ips)]
+            record = reader.lookup(ip)
+            if record is None or record.city != expected[ip]:
+                errors.append(f"{ip}: {record}")
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
     for th in threads:
         th.start()
     for th in threads:
         th.join()
 
-    # One construction per thread — no shared handle, no redundant re-loads.
-    assert calls["n"] == n_threads
-    # Within a thread the same handle is reused...
-    for first, second in results.values():
-        assert first is second
-    # ...and every thread received a distinct handle.
-    handles = [first for first, _ in results.values()]
-    assert len({id(h) for h in handles}) == n_threads
+    assert not errors, errors[:5]
+
+
+def test_reload_is_checked_on_a_timer(db_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(ip2.conf, "IP2LOCATION_RELOAD_CHECK_SECONDS", 3600)
+    first = get_ip2location()
+    assert get_ip2location() is first
+    assert resolve_ip_to_point("8.8.8.8") is not None
+
+    # Swapped in by rename, like the downloader does, with an unmistakably different mtime.
+    moved = db_path.with_suffix(".new")
+    write_bin(moved, [(0, "Elsewhere", 1.0, 2.0)])
+    os.utime(moved, (1, 1))
+    moved.replace(db_path)
+    assert get_ip2location() is first  # the timer has not fired: no stat, no reload
 
+    monkeypatch.setattr(ip2, "_next_check", 0.0)
+    second = get_ip2location()
 
-def test_get_ip2location_reloads_on_mtime_change(monkeypatch: MonkeyPatch) -> None:
-    """A thread reloads its handle when the database file's mtime changes."""
-    calls = {"n": 0}
+    assert second is not first
+    assert second.mtime == 1
+    point = resolve_ip_to_point("8.8.8.8")  # the reload cleared the cached answer
+    assert point is not None
+    assert (point.x, point.y) == (2.0, 1.0)
 
-    class FakeDB:
-        def __init__(self, path: t.Any) -> None:
-            calls["n"] += 1
 
-    monkeypatch.setattr("geo.ip2.IP2Location", FakeDB)
+def test_resolve_caches_by_ipv4_24(db_path: Path, monkeypatch: MonkeyPatch) -> None:
+    point = resolve_ip_to_point("8.8.8.8")
+    assert point is not None
+    assert (point.x, point.y) == pytest.approx((-122.078514, 37.405991))
 
-    fake_path = MagicMock()
-    fake_path.stat.return_value.st_mtime = 1.0
-    monkeypatch.setattr("geo.ip2.conf.IP2LOCATION_DB_PATH", fake_path)
+    def fail(self: IP2LocationReader, ip: str) -> None:
+        raise AssertionError(f"unexpected database lookup for {ip}")
 
-    errors: list[Exception] = []
+    monkeypatch.setattr(IP2LocationReader, "lookup", fail)
+    assert resolve_ip_to_point("8.8.8.4") == point
+    assert resolve_ip_to_point("8.8.9.1") is None  # a new /24: the lookup raises, resolve fails soft
 
-    def run() -> None:
-        try:
-            db1 = get_ip2location()
-            db2 = get_ip2location()  # same mtime -> no reload
-            assert db1 is db2
-            assert calls["n"] == 1
 
-            fake_path.stat.return_value.st_mtime = 2.0  # downloader replaced the .BIN
-            db3 = get_ip2location()  # different mtime -> reload
-            assert db3 is not db1
-            assert calls["n"] == 2
-        except Exception as e:  # surface assertion failures from the worker thread
-            errors.append(e)
+def test_unknown_city_and_broken_database_resolve_to_none(db_path: Path) -> None:
+    assert resolve_ip_to_point("1.1.1.1") is None
 
-    # Run on a fresh thread so thread-local state starts empty.
-    th = threading.Thread(target=run)
-    th.start()
-    th.join()
+    broken = db_path.with_suffix(".zip")
+    broken.write_bytes(b"PK\x03\x04 not a database")
+    os.utime(broken, (1, 1))
+    broken.replace(db_path)
+    ip2.clear_lookup_cache()
+    ip2._next_check = 0.0
 
-    assert not errors, errors
+    assert resolve_ip_to_point("8.8.8.8") is None
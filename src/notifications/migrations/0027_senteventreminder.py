@@ -0,0 +1,69 @@
+# Generated by Django 5.2.17 on 2026-10-16 09:12
+
+import typing as t
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_from_reminder_notifications(apps: t.Any, schema_editor: t.Any) -> None:
+    """Seed the ledger from reminders already sent for events that have not started yet.
+
+    Until now the sweep deduplicated by scanning ``Notification.context``; without this
+    the first sweep after deploy would remind everyone again.
+    """
+    Event = apps.get_model("events", "Event")
+    Notification = apps.get_model("notifications", "Notification")
+    SentEventReminder = apps.get_model("notifications", "SentEventReminder")
+
+    upcoming = {str(pk) for pk in Event.objects.filter(start__gte=timezone.now()).values_list("pk", flat=True)}
+    if not upcoming:
+        return
+    sent = (
+        Notification.objects.filter(
+            notification_type="event_reminder",
+            created_at__gte=timezone.now() - timedelta(days=15),
+        )
+        .values_list("user_id", "context__event_id", "context__days_until")
+        .distinct()
+    )
+    SentEventReminder.objects.bulk_create(
+        (
+            SentEventReminder(user_id=user_id, event_id=event_id, days_until=days_until)
+            for user_id, event_id, days_until in sent.iterator()
+            if event_id in upcoming and isinstance(days_until, int)
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0121_add_fill_missing_event_search_vectors_periodic_task'),
+        ('notifications', '0026_alter_notification_notification_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SentEventReminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('days_until', models.PositiveSmallIntegerField(help_text='Days before the event the reminder was for')),
+                ('sent_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sent_reminders', to='events.event')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sent_event_reminders', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Sent Event Reminder',
+                'verbose_name_plural': 'Sent Event Reminders',
+                'constraints': [models.UniqueConstraint(fields=('user', 'event', 'days_until'), name='unique_sent_event_reminder')],
+            },
+        ),
+        migrations.RunPython(backfill_from_reminder_notifications, migrations.RunPython.noop),
+    ]
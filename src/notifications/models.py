@@ -342,3 +342,27 @@ class NotificationPreference(TimeStampedModel):
                 setting["channels"] = [c for c in channels if c != channel]
                 changed = True
         return changed
+
+
+class SentEventReminder(models.Model):
+    """Ledger of event reminders already sent: one row per user, event and offset.
+
+    The reminder sweep claims recipients by inserting here with ``ON CONFLICT DO
+    NOTHING``, so the unique index is the deduplication: only the rows the insert
+    actually created are notified.
+    """
+
+    user = models.ForeignKey(RevelUser, on_delete=models.CASCADE, related_name="sent_event_reminders")
+    event = models.ForeignKey("events.Event", on_delete=models.CASCADE, related_name="sent_reminders")
+    days_until = models.PositiveSmallIntegerField(help_text="Days before the event the reminder was for")
+    sent_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "event", "days_until"], name="unique_sent_event_reminder")
+        ]
+        verbose_name = "Sent Event Reminder"
+        verbose_name_plural = "Sent Event Reminders"
+
+    def __str__(self) -> str:
+        return f"{self.days_until}-day reminder for event {self.event_id} to user {self.user_id}"
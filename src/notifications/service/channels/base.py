@@ -1,6 +1,8 @@
 """Base channel interface for notification delivery."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
 
 from notifications.models import Notification, NotificationDelivery
 
@@ -46,6 +48,26 @@ class NotificationChannel(ABC):
         """
         pass
 
+    def deliver_batch(self, deliveries: Sequence[NotificationDelivery]) -> dict[UUID, Exception]:
+        """Deliver a chunk of this channel's deliveries.
+
+        The default delivers one at a time; override when the channel can do
+        better in bulk. Deliveries must come with their notification loaded.
+
+        Args:
+            deliveries: Delivery records to deliver
+
+        Returns:
+            The exceptions raised, keyed by delivery id (the caller decides on retries)
+        """
+        errors: dict[UUID, Exception] = {}
+        for delivery in deliveries:
+            try:
+                self.deliver(delivery.notification, delivery)
+            except Exception as e:
+                errors[delivery.id] = e
+        return errors
+
     def should_retry(self, error: Exception) -> bool:
         """Determine if delivery should be retried based on error type.
 
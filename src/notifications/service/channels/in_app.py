@@ -1,5 +1,8 @@
 """In-app notification channel implementation."""
 
+from collections.abc import Sequence
+from uuid import UUID
+
 import structlog
 from django.utils import timezone
 
@@ -55,3 +58,23 @@ class InAppChannel(NotificationChannel):
         )
 
         return True
+
+    def deliver_batch(self, deliveries: Sequence[NotificationDelivery]) -> dict[UUID, Exception]:
+        """Mark a chunk of in-app deliveries as sent in a single update.
+
+        Args:
+            deliveries: Delivery records to mark
+
+        Returns:
+            Always empty (nothing to fail)
+        """
+        if not deliveries:
+            return {}
+        now = timezone.now()
+        NotificationDelivery.objects.filter(pk__in=[delivery.id for delivery in deliveries]).update(
+            status=DeliveryStatus.SENT, attempted_at=now, delivered_at=now, updated_at=now
+        )
+
+        logger.info("in_app_notifications_delivered", count=len(deliveries))
+
+        return {}
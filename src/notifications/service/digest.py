@@ -1,20 +1,23 @@
 """Notification digest service for batching notifications."""
 
 import typing as t
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 
 import structlog
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, Q, QuerySet
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.translation import ngettext
 
 from accounts.models import RevelUser
 from notifications.enums import DeliveryChannel, DeliveryStatus, NotificationType
-from notifications.models import Notification, NotificationPreference
+from notifications.models import Notification, NotificationDelivery, NotificationPreference
 
 logger = structlog.get_logger(__name__)
 
+# A digest goes out when the sweep runs within this many minutes of the user's send time.
+DIGEST_SEND_WINDOW_MINUTES = 30
+
 
 class DigestNotification(t.TypedDict):
     """Structure for a single notification row in a digest."""
@@ -256,7 +259,7 @@ def should_send_digest_now(user: RevelUser) -> bool:
     preferred_time = prefs.digest_send_time
     time_diff = abs((current_time.hour * 60 + current_time.minute) - (preferred_time.hour * 60 + preferred_time.minute))
 
-    if time_diff > 30:
+    if time_diff > DIGEST_SEND_WINDOW_MINUTES:
         return False  # Not within send window
 
     # For weekly, also check day of week
@@ -288,3 +291,70 @@ def get_digest_lookback_period(frequency: str) -> timedelta:
         return timedelta(weeks=1)
     else:
         raise ValueError(f"Invalid digest frequency: {frequency}")
+
+
+def _due_for_digest_q(now: datetime) -> Q:
+    """:func:`should_send_digest_now` as a filter over ``NotificationPreference``."""
+    local_now = timezone.localtime(now)
+    minute = local_now.hour * 60 + local_now.minute
+    earliest = max(0, minute - DIGEST_SEND_WINDOW_MINUTES)
+    # Send times carry seconds: "within the window" compares whole minutes, so the
+    # upper bound is the start of the minute after the last one that qualifies.
+    after_latest = minute + DIGEST_SEND_WINDOW_MINUTES + 1
+
+    q = ~Q(digest_frequency=NotificationPreference.DigestFrequency.IMMEDIATE) & Q(
+        digest_send_time__gte=time(earliest // 60, earliest % 60)
+    )
+    if after_latest < 24 * 60:
+        q &= Q(digest_send_time__lt=time(after_latest // 60, after_latest % 60))
+    if local_now.weekday() != 0:
+        # Weekly digests go out on Mondays
+        q &= ~Q(digest_frequency=NotificationPreference.DigestFrequency.WEEKLY)
+    return q
+
+
+def get_pending_digest_notifications(now: datetime) -> QuerySet[Notification]:
+    """Every user's notifications pending digest delivery as of ``now``.
+
+    The set-based counterpart of :func:`get_pending_notifications_for_digest`: each
+    notification is matched against its own recipient's lookback period.
+
+    Args:
+        now: The digest run's reference time
+
+    Returns:
+        QuerySet of pending notifications (unordered)
+    """
+    in_lookback = Q()
+    for frequency in (
+        NotificationPreference.DigestFrequency.HOURLY,
+        NotificationPreference.DigestFrequency.DAILY,
+        NotificationPreference.DigestFrequency.WEEKLY,
+    ):
+        in_lookback |= Q(
+            user__notification_preferences__digest_frequency=frequency,
+            created_at__gte=now - get_digest_lookback_period(frequency),
+        )
+    email_sent = NotificationDelivery.objects.filter(
+        notification_id=OuterRef("pk"), channel=DeliveryChannel.EMAIL, status=DeliveryStatus.SENT
+    )
+    return Notification.objects.filter(in_lookback, read_at__isnull=True).exclude(Exists(email_sent))
+
+
+def get_due_digest_user_ids(now: datetime) -> QuerySet[NotificationPreference, t.Any]:
+    """IDs of users whose digest is due at ``now`` and who have something pending.
+
+    One query for the whole user base, ordered by user id for keyset pagination.
+
+    Args:
+        now: The digest run's reference time
+
+    Returns:
+        ``values_list`` queryset of user ids
+    """
+    pending = get_pending_digest_notifications(now).filter(user_id=OuterRef("user_id"))
+    return (
+        NotificationPreference.objects.filter(_due_for_digest_q(now), Exists(pending))
+        .order_by("user_id")
+        .values_list("user_id", flat=True)
+    )
@@ -1,10 +1,14 @@
 """Core notification dispatcher service."""
 
+import functools
 import typing as t
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import batched
+from uuid import UUID
 
 import structlog
 from django.conf import settings
+from django.db import transaction
 
 from accounts.models import RevelUser
 from notifications.enums import DeliveryChannel, NotificationType
@@ -37,6 +41,11 @@ TRANSACTIONAL_TYPES: frozenset[str] = frozenset(
 )
 
 
+# Notifications inserted per bulk_create in notify_many; each chunk becomes one
+# dispatch_notifications_batch task, so this matches its DISPATCH_CHUNK_SIZE.
+NOTIFY_CHUNK_SIZE = 500
+
+
 class NotificationData(t.NamedTuple):
     """Data for creating a notification."""
 
@@ -145,6 +154,77 @@ def bulk_create_notifications(
     return created_notifications
 
 
+def notify_many(
+    notification_type: NotificationType | str,
+    recipients: Iterable[RevelUser] | Iterable[UUID],
+    shared_context: dict[str, t.Any],
+    per_user_overrides: Mapping[UUID, dict[str, t.Any]] | None = None,
+    *,
+    chunk_size: int = NOTIFY_CHUNK_SIZE,
+) -> int:
+    """Notify many users of the same event: the bulk counterpart of ``notification_requested``.
+
+    Recipients are streamed in chunks of ``chunk_size``: each chunk is one INSERT and,
+    after commit, one ``dispatch_notifications_batch`` task. A user's context is
+    ``shared_context`` updated with their entry in ``per_user_overrides`` (keyed by user
+    id), if any. Validation only checks required keys, so it runs once per distinct set
+    of override keys instead of once per user.
+
+    Like the signal handler, this MUST NOT raise into emitters: errors are logged and
+    the chunks already created are kept.
+
+    Args:
+        notification_type: Type of notification
+        recipients: Users (or user ids) to notify; any iterable, consumed once
+        shared_context: Context common to every recipient
+        per_user_overrides: Extra or replaced context keys per user id
+        chunk_size: Notifications per INSERT and per dispatch task
+
+    Returns:
+        Number of notifications created
+    """
+    from notifications.context_schemas import validate_notification_context
+    from notifications.tasks import dispatch_notifications_batch
+
+    overrides = per_user_overrides or {}
+    validated: set[frozenset[str]] = set()
+    created = 0
+    try:
+        notification_type = NotificationType(notification_type)
+        for chunk in batched(recipients, chunk_size):
+            notifications = []
+            for recipient in chunk:
+                user_id = recipient if isinstance(recipient, UUID) else recipient.id
+                context = shared_context
+                extra = overrides.get(user_id)
+                override_keys = frozenset(extra) if extra else frozenset()
+                if extra:
+                    context = {**shared_context, **extra}
+                if override_keys not in validated:
+                    validate_notification_context(notification_type, context)
+                    validated.add(override_keys)
+                notifications.append(
+                    Notification(
+                        notification_type=notification_type,
+                        user_id=user_id,
+                        context=context,
+                        title="",  # Will be rendered by dispatcher task
+                        body="",  # Will be rendered by dispatcher task
+                    )
+                )
+            Notification.objects.bulk_create(notifications)
+            notification_ids = [str(notification.id) for notification in notifications]
+            transaction.on_commit(functools.partial(dispatch_notifications_batch.delay, notification_ids))
+            created += len(notifications)
+    except Exception:
+        # CRITICAL: Never let notification errors crash endpoints/signals
+        logger.exception("notify_many_failed", notification_type=notification_type, created=created)
+        return created
+
+    logger.info("notifications_fanned_out", notification_type=notification_type, count=created)
+    return created
+
+
 def determine_delivery_channels(user: RevelUser, notification_type: str) -> list[str]:
     """Determine which channels should receive this notification.
 
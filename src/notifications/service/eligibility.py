@@ -4,6 +4,9 @@ This module contains functions for checking user participation in events/organiz
 and determining which users should receive specific notification types.
 """
 
+import typing as t
+from collections.abc import Iterator
+from itertools import batched
 from uuid import UUID
 
 from django.db.models import Q, QuerySet
@@ -15,12 +18,14 @@ from events.models import (
     EventRSVP,
     Organization,
     OrganizationMember,
+    OrganizationStaff,
     ResourceVisibility,
     Ticket,
     TicketTier,
 )
 from notifications.enums import NotificationType
 from notifications.models import NotificationPreference
+from notifications.service.dispatcher import NOTIFY_CHUNK_SIZE
 
 
 class BatchParticipationChecker:
@@ -414,14 +419,70 @@ def is_user_eligible_for_notification(
     return False
 
 
+def _event_audience_ids(event: Event, notification_type: NotificationType) -> QuerySet[t.Any]:
+    """UNION of the user ids that may be notified about an event, before preferences.
+
+    Every branch is a narrow scan of one table on its (event|organization, user) index,
+    so the planner never builds the join product of all of them against the user table.
+    This is the intersection of the visibility-based candidates with
+    ``is_user_eligible_for_notification``'s participation rules:
+
+    - staff and owners, always (the only audience for STAFF_ONLY events);
+    - RSVPs (YES/MAYBE), ACTIVE tickets, PENDING tickets on offline-payment tiers and
+      invitations, for every other visibility;
+    - members with visibility access, for EVENT_OPEN on MEMBERS_ONLY and PUBLIC events.
+    """
+    organization_id = event.organization_id
+    branches: list[QuerySet[t.Any]] = [
+        Organization.objects.filter(pk=organization_id).values_list("owner_id", flat=True),
+        OrganizationStaff.objects.filter(organization_id=organization_id).values_list("user_id", flat=True),
+    ]
+
+    if event.visibility != Event.Visibility.STAFF_ONLY:
+        branches += [
+            EventRSVP.objects.filter(
+                event=event, status__in=[EventRSVP.RsvpStatus.YES, EventRSVP.RsvpStatus.MAYBE]
+            ).values_list("user_id", flat=True),
+            Ticket.objects.filter(event=event, status=Ticket.TicketStatus.ACTIVE).values_list("user_id", flat=True),
+            Ticket.objects.filter(event=event, status=Ticket.TicketStatus.PENDING)
+            .exclude(tier__payment_method=TicketTier.PaymentMethod.ONLINE)
+            .values_list("user_id", flat=True),
+            EventInvitation.objects.filter(event=event).values_list("user_id", flat=True),
+        ]
+
+    # UNLISTED events are not broadcast to followers or org members — the org decides
+    # explicitly who to share them with — and PRIVATE ones never are.
+    if notification_type == NotificationType.EVENT_OPEN and event.visibility in (
+        Event.Visibility.MEMBERS_ONLY,
+        Event.Visibility.PUBLIC,
+    ):
+        branches.append(
+            OrganizationMember.objects.for_visibility()
+            .filter(organization_id=organization_id)
+            .values_list("user_id", flat=True)
+        )
+
+    # Model Meta.ordering has no place inside a compound statement.
+    first, *rest = (branch.order_by() for branch in branches)
+    return first.union(*rest)
+
+
 def get_eligible_users_for_event_notification(event: Event, notification_type: NotificationType) -> QuerySet[RevelUser]:
     """Get users eligible to receive notifications for an event.
 
     Eligibility is based on actual participation AND event visibility:
     - STAFF_ONLY: Only org staff and owners
-    - MEMBERS_ONLY: Org staff, owners, members, and users with explicit participation
+    - MEMBERS_ONLY: Org staff, owners, and users with explicit participation; members too for EVENT_OPEN
     - PRIVATE / UNLISTED: Org staff, owners, and users with explicit participation (invitations, tickets, RSVPs)
-    - PUBLIC: Anyone with any form of participation
+    - PUBLIC: Anyone with any form of participation; members too for EVENT_OPEN
+
+    The audience is a UNION of per-table subqueries (see ``_event_audience_ids``) and
+    the preference checks of ``is_user_eligible_for_notification`` (silenced, or the type
+    switched off) run in the same SQL statement, so nothing is filtered in Python. Both
+    checks are exclusions, so a user without a preferences row is still eligible. The
+    type opt-out is an anti-join on the preferences that set ``enabled: false``: a
+    JSON lookup through the user join would be NULL (and drop the user) for every row
+    that has no entry for the type, which is the default for most types.
 
     Args:
         event: The event for which to send notifications
@@ -430,90 +491,76 @@ def get_eligible_users_for_event_notification(event: Event, notification_type: N
     Returns:
         QuerySet of eligible users
     """
-    # Build query for participating users
-    participants_q = Q()
-
-    # Organization staff and owners (for all event notifications and all visibility levels)
-    staff_and_owners_q = Q(owned_organizations=event.organization_id) | Q(
-        organization_staff_memberships__organization_id=event.organization_id
-    )
-    participants_q |= staff_and_owners_q
-
-    # Reusable Q for org members with visibility access (ACTIVE/PAUSED only)
-    active_members_q = Q(
-        organization_memberships__organization_id=event.organization_id,
-        organization_memberships__status__in=[
-            OrganizationMember.MembershipStatus.ACTIVE,
-            OrganizationMember.MembershipStatus.PAUSED,
-        ],
+    type_disabled = NotificationPreference.objects.filter(
+        **{f"notification_type_settings__{notification_type}__enabled": False}
+    ).values("user_id")
+    return (
+        RevelUser.objects.filter(id__in=_event_audience_ids(event, notification_type))
+        .exclude(notification_preferences__silence_all_notifications=True)
+        .exclude(id__in=type_disabled)
     )
 
-    # Apply visibility-specific rules
-    if event.visibility == Event.Visibility.STAFF_ONLY:
-        # Only staff and owners (already added above)
-        pass
 
-    elif event.visibility == Event.Visibility.MEMBERS_ONLY:
-        # Include org members with visibility access
-        participants_q |= active_members_q
+class EventAudienceMember(t.NamedTuple):
+    """One recipient of an event notification, as read from the audience query."""
 
-        # Include users with explicit participation
-        participants_q |= Q(
-            rsvps__event=event, rsvps__status__in=[EventRSVP.RsvpStatus.YES, EventRSVP.RsvpStatus.MAYBE]
-        )
-        participants_q |= Q(
-            tickets__event=event, tickets__status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.PENDING]
-        )
-        participants_q |= Q(invitations__event=event)
-
-    elif event.visibility in (Event.Visibility.PRIVATE, Event.Visibility.UNLISTED):
-        # Only explicitly invited/participating users (not all org members).
-        # UNLISTED events are not broadcast to followers or org members —
-        # the org decides explicitly who to share them with.
-        participants_q |= Q(
-            rsvps__event=event, rsvps__status__in=[EventRSVP.RsvpStatus.YES, EventRSVP.RsvpStatus.MAYBE]
-        )
-        participants_q |= Q(
-            tickets__event=event, tickets__status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.PENDING]
-        )
-        participants_q |= Q(invitations__event=event)
+    id: UUID
+    # Django superuser or staff: sees the event address without participating.
+    is_privileged: bool
 
-    elif event.visibility == Event.Visibility.PUBLIC:
-        # For EVENT_OPEN notifications, include org members with visibility access
-        if notification_type == NotificationType.EVENT_OPEN:
-            participants_q |= active_members_q
 
-        # Include users with explicit participation
-        participants_q |= Q(
-            rsvps__event=event, rsvps__status__in=[EventRSVP.RsvpStatus.YES, EventRSVP.RsvpStatus.MAYBE]
-        )
-        participants_q |= Q(
-            tickets__event=event, tickets__status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.PENDING]
-        )
-        participants_q |= Q(invitations__event=event)
+def iter_event_audience(
+    event: Event,
+    notification_type: NotificationType,
+    *,
+    chunk_size: int = NOTIFY_CHUNK_SIZE,
+) -> Iterator[list[EventAudienceMember]]:
+    """Yield ``get_eligible_users_for_event_notification`` in chunks, from a single query.
 
-    # Filter out users who have silenced all notifications early to reduce Python iteration
-    participants_with_prefs_q = participants_q & ~Q(notification_preferences__silence_all_notifications=True)
+    Only the columns the senders need are fetched (no user rows are built), sized to
+    feed ``notify_many`` one chunk per INSERT and batch dispatch task. Users missing
+    a preferences row get a default one, as ``is_user_eligible_for_notification``
+    does, since dispatch reads them.
+
+    Args:
+        event: The event for which to send notifications
+        notification_type: The type of notification being sent
+        chunk_size: Recipients per chunk
 
-    # Get unique users with preferences prefetched to avoid N+1 queries
-    potential_users = (
-        RevelUser.objects.filter(participants_with_prefs_q).select_related("notification_preferences").distinct()
+    Yields:
+        Lists of at most ``chunk_size`` recipients
+    """
+    rows = get_eligible_users_for_event_notification(event, notification_type).values_list(
+        "id", "is_superuser", "is_staff", "notification_preferences__id"
     )
+    for chunk in batched(rows.iterator(chunk_size=chunk_size), chunk_size):
+        if missing := [user_id for user_id, _, _, prefs_id in chunk if prefs_id is None]:
+            NotificationPreference.objects.bulk_create(
+                [NotificationPreference(user_id=user_id) for user_id in missing], ignore_conflicts=True
+            )
+        yield [EventAudienceMember(user_id, is_superuser or is_staff) for user_id, is_superuser, is_staff, _ in chunk]
 
-    # Create batch checker to avoid N+1 queries when checking participation
-    # This prefetches all RSVPs, tickets, invitations, and staff/member data in ~5 queries
-    # instead of 4+ queries per user
-    batch_checker = BatchParticipationChecker(event)
 
-    # Filter based on notification preferences and participation rules
-    # Using batch_checker for O(1) participation lookups
-    eligible_user_ids: list[UUID] = []
+def iter_eligible_user_ids_for_event_notification(
+    event: Event,
+    notification_type: NotificationType,
+    *,
+    chunk_size: int = NOTIFY_CHUNK_SIZE,
+) -> Iterator[tuple[UUID, ...]]:
+    """Yield the ids of ``get_eligible_users_for_event_notification`` in chunks.
 
-    for user in potential_users:
-        if is_user_eligible_for_notification(user, notification_type, event=event, batch_checker=batch_checker):
-            eligible_user_ids.append(user.id)
+    See :func:`iter_event_audience`, which this narrows to the ids.
 
-    return RevelUser.objects.filter(id__in=eligible_user_ids)
+    Args:
+        event: The event for which to send notifications
+        notification_type: The type of notification being sent
+        chunk_size: Ids per chunk
+
+    Yields:
+        Tuples of at most ``chunk_size`` user ids
+    """
+    for chunk in iter_event_audience(event, notification_type, chunk_size=chunk_size):
+        yield tuple(member.id for member in chunk)
 
 
 def get_organization_staff_and_owners(organization_id: UUID) -> QuerySet[RevelUser]:
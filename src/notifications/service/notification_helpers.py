@@ -15,10 +15,10 @@ from common.models import SiteSettings
 from events.models import Event, EventSeries
 from events.utils import format_event_datetime, get_event_timezone
 from notifications.enums import NotificationType
-from notifications.service.dispatcher import NotificationData, bulk_create_notifications
+from notifications.service.dispatcher import NotificationData, bulk_create_notifications, notify_many
 from notifications.service.eligibility import (
     BatchParticipationChecker,
-    get_eligible_users_for_event_notification,
+    iter_event_audience,
 )
 
 logger = structlog.get_logger(__name__)
@@ -46,9 +46,9 @@ def get_event_location_for_user(event: Event, user: RevelUser) -> tuple[str, str
 def notify_event_opened(event: Event) -> int:
     """Send notifications when an event is opened.
 
-    Uses bulk notification creation for efficiency:
-    - Single bulk INSERT for all notifications
-    - Single batch dispatch task
+    Streams the eligible user ids in chunks straight into notify_many: one bulk INSERT
+    and one batch dispatch task per chunk, without loading user rows. Only the
+    address differs per user.
 
     Args:
         event: Event instance or event ID
@@ -56,19 +56,6 @@ def notify_event_opened(event: Event) -> int:
     Returns:
         Number of notifications sent
     """
-    from notifications.tasks import dispatch_notifications_batch
-
-    # Get all eligible users for notification
-    eligible_users = list(get_eligible_users_for_event_notification(event, NotificationType.EVENT_OPEN))
-
-    if not eligible_users:
-        logger.info(
-            "event_open_notifications_sent",
-            event_id=str(event.id),
-            count=0,
-        )
-        return 0
-
     # Build frontend URL
     frontend_base_url = SiteSettings.get_solo().frontend_base_url
     frontend_url = f"{frontend_base_url}/events/{event.id}"
@@ -82,73 +69,51 @@ def notify_event_opened(event: Event) -> int:
     if hasattr(event, "registration_opens_at") and event.registration_opens_at:
         registration_opens_at = format_event_datetime(event.registration_opens_at, event)
 
-    # Pre-compute event-level data outside the loop to avoid N+1 queries
-    questionnaire_required = event.org_questionnaires.exists()
+    # The address is only added for users who may see it
+    context: dict[str, t.Any] = {
+        "event_id": str(event.id),
+        "event_name": event.name,
+        "event_description": event.description or "",
+        "event_start": event.start.isoformat() if event.start else "",
+        "event_start_formatted": event_start_formatted,
+        "event_end": event.end.isoformat() if event.end else "",
+        "event_location": "",
+        "event_url": frontend_url,
+        "organization_id": str(event.organization.id),
+        "organization_name": event.organization.name,
+        "rsvp_required": not event.requires_ticket,
+        "tickets_available": event.requires_ticket,
+        "questionnaire_required": event.org_questionnaires.exists(),
+    }
+    if event_end_formatted:
+        context["event_end_formatted"] = event_end_formatted
+    if registration_opens_at:
+        context["registration_opens_at"] = registration_opens_at
+
+    address_context: dict[str, t.Any] = {"event_location": event.full_address()}
+    if event.location_maps_url:
+        address_context["address_url"] = event.location_maps_url
 
-    # Create batch checker for O(1) address visibility lookups
+    # Address visibility: O(1) set lookups via the batch checker, plus the (few)
+    # Django superusers/staff in the audience, who always see it.
     batch_checker = BatchParticipationChecker(event)
 
-    # Pre-compute full address (only computed if any user can see it)
-    full_address = event.full_address()
-    maps_url = event.location_maps_url or ""
-
-    # Build list of notifications to create
-    notifications_data: list[NotificationData] = []
-
-    for user in eligible_users:
-        # Check address visibility per user (O(1) set lookup via batch checker)
-        if user.is_superuser or user.is_staff or batch_checker.can_see_address(user.id):
-            event_location = full_address
-            address_url = maps_url
-        else:
-            event_location = ""
-            address_url = ""
-
-        context: dict[str, t.Any] = {
-            "event_id": str(event.id),
-            "event_name": event.name,
-            "event_description": event.description or "",
-            "event_start": event.start.isoformat() if event.start else "",
-            "event_start_formatted": event_start_formatted,
-            "event_end": event.end.isoformat() if event.end else "",
-            "event_location": event_location,
-            "event_url": frontend_url,
-            "organization_id": str(event.organization.id),
-            "organization_name": event.organization.name,
-            "rsvp_required": not event.requires_ticket,
-            "tickets_available": event.requires_ticket,
-            "questionnaire_required": questionnaire_required,
+    count = 0
+    for members in iter_event_audience(event, NotificationType.EVENT_OPEN):
+        overrides = {
+            member.id: address_context
+            for member in members
+            if member.is_privileged or batch_checker.can_see_address(member.id)
         }
-
-        if event_end_formatted:
-            context["event_end_formatted"] = event_end_formatted
-        if registration_opens_at:
-            context["registration_opens_at"] = registration_opens_at
-        if address_url:
-            context["address_url"] = address_url
-
-        notifications_data.append(
-            NotificationData(
-                notification_type=NotificationType.EVENT_OPEN,
-                user=user,
-                context=context,
-            )
-        )
-
-    # Bulk create all notifications (single INSERT)
-    created_notifications = bulk_create_notifications(notifications_data)
-
-    # Dispatch all notifications in a batch task
-    notification_ids = [str(n.id) for n in created_notifications]
-    dispatch_notifications_batch.delay(notification_ids)
+        count += notify_many(NotificationType.EVENT_OPEN, [member.id for member in members], context, overrides)
 
     logger.info(
         "event_open_notifications_sent",
         event_id=str(event.id),
-        count=len(created_notifications),
+        count=count,
     )
 
-    return len(created_notifications)
+    return count
 
 
 def _collect_series_digest_candidates(
@@ -2,22 +2,36 @@
 
 import typing as t
 from datetime import timedelta
+from itertools import batched
 from uuid import UUID
 
 import structlog
-from django.db.models import Prefetch, QuerySet
+from django.db import connection, transaction
+from django.db.models import QuerySet
 from django.utils import timezone
 
 from accounts.models import RevelUser
 from common.models import SiteSettings
 from events.models import Event, EventRSVP, Ticket
 from notifications.enums import NotificationType
-from notifications.models import Notification
+from notifications.service.dispatcher import NOTIFY_CHUNK_SIZE, notify_many
 from notifications.service.notification_helpers import format_event_datetime, get_event_location_for_user
-from notifications.signals import notification_requested
 
 logger = structlog.get_logger(__name__)
 
+# Claims a chunk of reminders; the rows that come back are the ones that were new.
+_CLAIM_SQL = """
+INSERT INTO notifications_senteventreminder (user_id, event_id, days_until, sent_at)
+SELECT user_id, %(event_id)s, %(days_until)s, now()
+FROM unnest(%(user_ids)s::uuid[]) AS user_id
+ON CONFLICT (user_id, event_id, days_until) DO NOTHING
+RETURNING user_id
+"""
+
+
+class _NotifyIncomplete(Exception):
+    """Raised inside the claim transaction to roll the claims back."""
+
 
 class EventReminderService:
     """Service for managing event reminder notifications.
@@ -25,28 +39,37 @@ class EventReminderService:
     This service handles the complete workflow of sending event reminders:
     - Querying events happening at specific intervals
     - Building notification contexts
-    - Deduplication of reminders
+    - Deduplication of reminders through the SentEventReminder ledger
     - Sending reminders to ticket holders and RSVP users
     """
 
-    def __init__(self, reminder_days: list[int] | None = None, frontend_base_url: str | None = None):
+    def __init__(
+        self,
+        reminder_days: list[int] | None = None,
+        frontend_base_url: str | None = None,
+        chunk_size: int = NOTIFY_CHUNK_SIZE,
+    ):
         """Initialize the reminder service.
 
         Args:
             reminder_days: Days before event to send reminders (default: [14, 7, 1])
             frontend_base_url: Frontend base URL (fetched from settings if not provided)
+            chunk_size: Attendees loaded, claimed and notified per batch
         """
         self.reminder_days = reminder_days or [14, 7, 1]
         self.frontend_base_url = frontend_base_url or SiteSettings.get_solo().frontend_base_url
+        self.chunk_size = chunk_size
 
     def get_events_for_reminder(self, days: int) -> QuerySet[Event]:
         """Get events that start in exactly N days.
 
+        Attendees are not prefetched: each event's are streamed in chunks when sent.
+
         Args:
             days: Number of days until event
 
         Returns:
-            QuerySet of events with prefetched tickets and RSVPs
+            QuerySet of events with their organization, staff and city loaded
         """
         now = timezone.now()
         target_date = now + timedelta(days=days)
@@ -56,48 +79,34 @@ class EventReminderService:
         return (
             Event.objects.filter(start__gte=date_start, start__lt=date_end, status=Event.EventStatus.OPEN)
             .select_related("organization", "city")
-            .prefetch_related(
-                Prefetch(
-                    "tickets",
-                    queryset=Ticket.objects.filter(
-                        status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.PENDING]
-                    ).select_related("user", "user__notification_preferences", "tier"),
-                ),
-                Prefetch(
-                    "rsvps",
-                    queryset=EventRSVP.objects.filter(status=EventRSVP.RsvpStatus.YES).select_related(
-                        "user", "user__notification_preferences"
-                    ),
-                ),
-            )
+            .prefetch_related("organization__staff_members")
         )
 
-    def get_already_sent_reminders(self, event_ids: list[str], days: int) -> set[tuple[UUID, str]]:
-        """Get set of (user_id, event_id) for already-sent reminders.
+    def claim_reminders(self, event: Event, days: int, user_ids: list[UUID]) -> set[UUID]:
+        """Record reminders in the ledger and return the users they were new for.
+
+        The insert is the deduplication: rows that already exist are skipped by the
+        unique (user, event, days_until) index, and only the inserted ones come back.
 
         Args:
-            event_ids: List of event IDs to check
+            event: Event the reminder is for
             days: Days until event
+            user_ids: Candidate recipients
 
         Returns:
-            Set of (user_id, event_id) tuples for sent reminders
+            Set of user IDs that had not been reminded yet
         """
-        existing_reminders = (
-            Notification.objects.filter(
-                notification_type=NotificationType.EVENT_REMINDER,
-                context__event_id__in=event_ids,
-                context__days_until=days,
-            )
-            .values_list("user_id", "context__event_id")
-            .distinct()
-        )
-        return {(user_id, event_id) for user_id, event_id in existing_reminders}
+        if not user_ids:
+            return set()
+        with connection.cursor() as cursor:
+            cursor.execute(_CLAIM_SQL, {"user_ids": user_ids, "event_id": event.id, "days_until": days})
+            return {user_id for (user_id,) in cursor.fetchall()}
 
     def build_event_context(self, event: Event, days: int) -> dict[str, t.Any]:
         """Build base context dictionary for event reminder.
 
         Note: Does NOT include event_location as that depends on user permissions.
-        Use _add_user_location_context to add location info per user.
+        Use _user_location_context to add location info per user.
 
         Args:
             event: Event to build context for
@@ -124,30 +133,29 @@ class EventReminderService:
 
         return context
 
-    def _add_user_location_context(self, context: dict[str, t.Any], event: Event, user: RevelUser) -> dict[str, t.Any]:
-        """Add location context based on user's address visibility permissions.
+    def _user_location_context(self, event: Event, user: RevelUser) -> dict[str, t.Any]:
+        """Location context based on user's address visibility permissions.
 
         Args:
-            context: Base context to extend
             event: Event to check visibility for
             user: User to check permissions for
 
         Returns:
-            Context dict with location info added if user can see address
+            Context keys to add to the base context (address_url only if user can see address)
         """
         event_location, address_url = get_event_location_for_user(event, user)
-        user_context = {**context, "event_location": event_location}
+        user_context: dict[str, t.Any] = {"event_location": event_location}
         if address_url:
             user_context["address_url"] = address_url
         return user_context
 
-    def should_send_reminder(self, user: RevelUser, event_id: str, already_sent: set[tuple[UUID, str]]) -> bool:
-        """Check if reminder should be sent to user.
+    def should_send_reminder(self, user: RevelUser) -> bool:
+        """Check if the user wants event reminders.
+
+        Whether they already got this one is decided by the ledger, in ``claim_reminders``.
 
         Args:
             user: User to check
-            event_id: Event ID
-            already_sent: Set of already-sent (user_id, event_id) tuples
 
         Returns:
             True if reminder should be sent
@@ -156,92 +164,103 @@ class EventReminderService:
         if not prefs.event_reminders_enabled:
             return False
 
-        if not prefs.is_notification_type_enabled(NotificationType.EVENT_REMINDER):
-            return False
+        return prefs.is_notification_type_enabled(NotificationType.EVENT_REMINDER)
 
-        if (user.id, event_id) in already_sent:
-            return False
-
-        return True
-
-    def send_ticket_reminders(
-        self, event: Event, base_context: dict[str, t.Any], already_sent: set[tuple[UUID, str]]
-    ) -> tuple[int, set[UUID]]:
-        """Send reminders to all ticket holders for an event.
+    def send_ticket_reminders(self, event: Event, base_context: dict[str, t.Any]) -> int:
+        """Send reminders to all ticket holders for an event, streamed in chunks.
 
         Args:
             event: Event to send reminders for
             base_context: Base context dictionary
-            already_sent: Set of already-sent (user_id, event_id) tuples
 
         Returns:
-            Tuple of (count sent, set of user IDs sent to)
+            Count of reminders sent
         """
-        count = 0
-        sent_to_users: set[UUID] = set()
-        event_id_str = str(event.id)
-
-        for ticket in event.tickets.all():
-            user = ticket.user
-            if user.id in sent_to_users or not self.should_send_reminder(user, event_id_str, already_sent):
-                continue
-
-            # Add location info based on user's visibility permissions
-            context = self._add_user_location_context(base_context, event, user)
-            context["ticket_id"] = str(ticket.id)
-            context["tier_name"] = ticket.tier.name
-
-            notification_requested.send(
-                sender=Ticket,
-                user=user,
-                notification_type=NotificationType.EVENT_REMINDER,
-                context=context,
-            )
-            sent_to_users.add(user.id)
-            count += 1
-
-        return count, sent_to_users
-
-    def send_rsvp_reminders(
-        self,
-        event: Event,
-        base_context: dict[str, t.Any],
-        already_sent: set[tuple[UUID, str]],
-        sent_to_users: set[UUID],
-    ) -> int:
-        """Send reminders to users who RSVP'd YES but don't have tickets.
+        tickets = (
+            Ticket.objects.filter(event=event, status__in=[Ticket.TicketStatus.ACTIVE, Ticket.TicketStatus.PENDING])
+            .select_related("user", "user__notification_preferences", "tier")
+            .order_by("pk")
+        )
+        sent = 0
+        for chunk in batched(tickets.iterator(chunk_size=self.chunk_size), self.chunk_size):
+            overrides: dict[UUID, dict[str, t.Any]] = {}
+            for ticket in chunk:
+                user = ticket.user
+                if user.id in overrides or not self.should_send_reminder(user):
+                    continue
+                # Add location info based on user's visibility permissions
+                context = self._user_location_context(event, user)
+                context["ticket_id"] = str(ticket.id)
+                context["tier_name"] = ticket.tier.name
+                overrides[user.id] = context
+            sent += self._claim_and_notify(event, base_context, overrides)
+        return sent
+
+    def send_rsvp_reminders(self, event: Event, base_context: dict[str, t.Any]) -> int:
+        """Send reminders to users who RSVP'd YES, streamed in chunks.
+
+        Users already reminded as ticket holders are skipped by the ledger.
 
         Args:
             event: Event to send reminders for
             base_context: Base context dictionary
-            already_sent: Set of already-sent (user_id, event_id) tuples
-            sent_to_users: Set of user IDs already sent to (will not send again)
 
         Returns:
             Count of reminders sent
         """
-        count = 0
-        event_id_str = str(event.id)
-
-        for rsvp in event.rsvps.all():
-            user = rsvp.user
-            if user.id in sent_to_users or not self.should_send_reminder(user, event_id_str, already_sent):
-                continue
-
-            # Add location info based on user's visibility permissions
-            context = self._add_user_location_context(base_context, event, user)
-            context["rsvp_status"] = rsvp.status
-
-            notification_requested.send(
-                sender=EventRSVP,
-                user=user,
-                notification_type=NotificationType.EVENT_REMINDER,
-                context=context,
-            )
-            sent_to_users.add(user.id)
-            count += 1
+        rsvps = (
+            EventRSVP.objects.filter(event=event, status=EventRSVP.RsvpStatus.YES)
+            .select_related("user", "user__notification_preferences")
+            .order_by("pk")
+        )
+        sent = 0
+        for chunk in batched(rsvps.iterator(chunk_size=self.chunk_size), self.chunk_size):
+            overrides: dict[UUID, dict[str, t.Any]] = {}
+            for rsvp in chunk:
+                user = rsvp.user
+                if not self.should_send_reminder(user):
+                    continue
+                # Add location info based on user's visibility permissions
+                context = self._user_location_context(event, user)
+                context["rsvp_status"] = rsvp.status
+                overrides[user.id] = context
+            sent += self._claim_and_notify(event, base_context, overrides)
+        return sent
+
+    def _claim_and_notify(
+        self, event: Event, base_context: dict[str, t.Any], overrides: dict[UUID, dict[str, t.Any]]
+    ) -> int:
+        """Claim one chunk of reminders in the ledger and notify the users it was new for.
 
-        return count
+        Claim and notifications commit together. ``notify_many`` logs its failures
+        instead of raising, so a short count is what rolls the claims back; the next
+        sweep then retries them.
+
+        Returns:
+            Number of reminders sent.
+        """
+        if not overrides:
+            return 0
+        claimed: set[UUID] = set()
+        sent = 0
+        try:
+            with transaction.atomic():
+                claimed = self.claim_reminders(event, base_context["days_until"], list(overrides))
+                if claimed:
+                    sent = notify_many(
+                        NotificationType.EVENT_REMINDER,
+                        list(claimed),
+                        base_context,
+                        {user_id: overrides[user_id] for user_id in claimed},
+                    )
+                    if sent != len(claimed):
+                        raise _NotifyIncomplete
+        except _NotifyIncomplete:
+            logger.error(
+                "event_reminder_chunk_rolled_back", event_id=str(event.id), claimed=len(claimed), notified=sent
+            )
+            return 0
+        return sent
 
     def send_all_reminders(self) -> dict[str, t.Any]:
         """Send reminders for all upcoming events.
@@ -260,20 +279,15 @@ class EventReminderService:
                 events_found=len(events),
             )
 
-            event_ids = [str(e.id) for e in events]
-            already_sent = self.get_already_sent_reminders(event_ids, days)
-
             for event in events:
                 event_context = self.build_event_context(event, days)
 
                 # Send to ticket holders
-                ticket_count, sent_to_users = self.send_ticket_reminders(event, event_context, already_sent)
-                reminders_sent += ticket_count
+                reminders_sent += self.send_ticket_reminders(event, event_context)
 
                 # Send to RSVP users (if event doesn't require tickets)
                 if not event.requires_ticket:
-                    rsvp_count = self.send_rsvp_reminders(event, event_context, already_sent, sent_to_users)
-                    reminders_sent += rsvp_count
+                    reminders_sent += self.send_rsvp_reminders(event, event_context)
 
         logger.info("event_reminders_sent", count=reminders_sent)
         return {"reminders_sent": reminders_sent}
@@ -9,7 +9,7 @@ from django.dispatch import receiver
 
 from common.models import SiteSettings
 from events.models import EventInvitation, EventInvitationRequest, PendingEventInvitation
-from events.tasks import build_attendee_visibility_flags
+from events.tasks import enqueue_attendee_visibility_update
 from notifications.enums import NotificationType
 from notifications.service.eligibility import get_staff_for_notification
 from notifications.service.notification_helpers import format_event_datetime
@@ -23,7 +23,7 @@ def handle_invitation_save(
     sender: type[EventInvitation], instance: EventInvitation, created: bool, **kwargs: t.Any
 ) -> None:
     """Send notifications after invitation is created."""
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(str(instance.event_id)))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
     if not created:
         return
 
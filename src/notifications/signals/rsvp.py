@@ -8,7 +8,7 @@ from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from events.models import EventRSVP
-from events.tasks import build_attendee_visibility_flags
+from events.tasks import enqueue_attendee_visibility_update
 from notifications.enums import NotificationType
 from notifications.service.eligibility import get_organization_staff_and_owners
 from notifications.service.notification_helpers import format_event_datetime
@@ -138,7 +138,7 @@ def handle_event_rsvp_save(sender: type[EventRSVP], instance: EventRSVP, created
     Sends notifications to:
     - Organization staff and owners (NOT the user who RSVPed)
     """
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(str(instance.event_id)))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
 
     def send_notifications() -> None:
         if created:
@@ -164,7 +164,7 @@ def handle_event_rsvp_delete(sender: type[EventRSVP], instance: EventRSVP, **kwa
     Sends notifications to:
     - Organization staff and owners (the user already knows they cancelled)
     """
-    transaction.on_commit(lambda: build_attendee_visibility_flags.delay(str(instance.event_id)))
+    enqueue_attendee_visibility_update(instance.event_id, [instance.user_id])
 
     # Send notifications after transaction commits
     def send_notifications() -> None:
@@ -2,20 +2,76 @@
 
 import traceback
 import typing as t
-from datetime import timedelta
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from itertools import batched
 
 import structlog
 from celery import group, shared_task
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone, translation
 
 from notifications.enums import DeliveryChannel, DeliveryStatus
-from notifications.models import Notification, NotificationDelivery, NotificationPreference
+from notifications.models import Notification, NotificationDelivery, NotificationPreference, SentEventReminder
 from notifications.service.channels.registry import get_channel_instance
 
 logger = structlog.get_logger(__name__)
 
 
+# Notifications handled per dispatch_notifications_batch task; bigger batches fan out
+# into chunks of this size.
+DISPATCH_CHUNK_SIZE = 500
+# Deliveries handed to one deliver_to_channel_batch task.
+DELIVERY_CHUNK_SIZE = 100
+
+
+def _render_notifications(notifications: Sequence[Notification]) -> list[Notification]:
+    """Render title/body for each notification in its recipient's language.
+
+    Grouped by (type, language) so each template is looked up and each locale
+    activated once per group rather than once per notification.
+
+    Returns:
+        The notifications that rendered; failures are logged and left unrendered
+        (channels can use the context directly).
+    """
+    from notifications.service.templates.registry import get_template
+
+    groups: dict[tuple[str, str], list[Notification]] = defaultdict(list)
+    for notification in notifications:
+        # CRITICAL: Activate recipient's language, not sender's or system default
+        user_language = getattr(notification.user, "language", settings.LANGUAGE_CODE)
+        groups[notification.notification_type, user_language].append(notification)
+
+    rendered: list[Notification] = []
+    for (notification_type, user_language), members in groups.items():
+        with translation.override(user_language):
+            for notification in members:
+                try:
+                    template = get_template(notification_type)
+                    notification.title = template.get_in_app_title(notification)
+                    notification.body = template.get_in_app_body(notification)
+                except Exception as e:
+                    logger.exception(
+                        "notification_render_failed",
+                        notification_id=str(notification.id),
+                        notification_type=notification_type,
+                        error=str(e),
+                    )
+                    continue
+                rendered.append(notification)
+        logger.debug(
+            "notifications_rendered",
+            notification_type=notification_type,
+            user_language=user_language,
+            count=len(members),
+        )
+    return rendered
+
+
 @shared_task(name="notifications.tasks.dispatch_notification")
 def dispatch_notification(notification_id: str) -> dict[str, t.Any]:
     """Main dispatcher task - creates delivery records and dispatches to channels.
@@ -35,38 +91,9 @@ def dispatch_notification(notification_id: str) -> dict[str, t.Any]:
     """
     notification = Notification.objects.select_related("user", "user__notification_preferences").get(pk=notification_id)
 
-    # Get recipient's language preference
-    user_language = getattr(notification.user, "language", settings.LANGUAGE_CODE)
-
-    # Render title and body from template
-    # CRITICAL: Activate recipient's language, not sender's or system default
-    try:
-        from notifications.service.templates.registry import get_template
-
-        template = get_template(notification.notification_type)
-
-        # Activate user's language for rendering
-        with translation.override(user_language):
-            notification.title = template.get_in_app_title(notification)
-            notification.body = template.get_in_app_body(notification)
-
+    if _render_notifications([notification]):
         notification.save(update_fields=["title", "body", "updated_at"])
 
-        logger.debug(
-            "notification_rendered",
-            notification_id=notification_id,
-            notification_type=notification.notification_type,
-            user_language=user_language,
-        )
-    except Exception as e:
-        logger.exception(
-            "notification_render_failed",
-            notification_id=notification_id,
-            notification_type=notification.notification_type,
-            error=str(e),
-        )
-        # Continue even if rendering fails - channels can use context directly
-
     # Determine delivery channels
     from notifications.service.dispatcher import determine_delivery_channels
 
@@ -123,16 +150,82 @@ class BatchDispatchError(Exception):
         return (self.__class__, (self.failed_ids, self.total))
 
 
+def _dispatch_chunk(notification_ids: list[str]) -> tuple[int, list[str]]:
+    """Dispatch one chunk of notifications with a constant number of queries.
+
+    Returns:
+        (number of notifications dispatched, ids that failed)
+    """
+    from notifications.service.dispatcher import determine_delivery_channels
+
+    notifications = list(
+        Notification.objects.select_related("user", "user__notification_preferences").filter(pk__in=notification_ids)
+    )
+    found = {str(n.id) for n in notifications}
+    failed_ids = [nid for nid in notification_ids if nid not in found]
+    for notification_id in failed_ids:
+        logger.error("batch_dispatch_item_failed", notification_id=notification_id, error="notification not found")
+
+    rendered = _render_notifications(notifications)
+    now = timezone.now()
+    for notification in rendered:
+        notification.updated_at = now
+    Notification.objects.bulk_update(rendered, ["title", "body", "updated_at"])
+
+    wanted: list[tuple[Notification, str]] = []
+    processed = 0
+    for notification in notifications:
+        try:
+            channels = determine_delivery_channels(notification.user, notification.notification_type)
+        except Exception as e:
+            failed_ids.append(str(notification.id))
+            logger.exception("batch_dispatch_item_failed", notification_id=str(notification.id), error=str(e))
+            continue
+        wanted.extend((notification, channel) for channel in channels)
+        processed += 1
+
+    # Same idempotency as dispatch_notification's get_or_create: a re-run (or a
+    # concurrent dispatcher) never creates or re-sends a second delivery per channel.
+    existing = set(
+        NotificationDelivery.objects.filter(notification__in=notifications).values_list("notification_id", "channel")
+    )
+    new = [
+        NotificationDelivery(notification=notification, channel=channel, status=DeliveryStatus.PENDING)
+        for notification, channel in wanted
+        if (notification.id, channel) not in existing
+    ]
+    NotificationDelivery.objects.bulk_create(new, ignore_conflicts=True)
+    # ignore_conflicts skips rows a concurrent dispatcher won; only dispatch our own.
+    created = set(NotificationDelivery.objects.filter(pk__in=[d.id for d in new]).values_list("pk", flat=True))
+
+    by_channel: dict[str, list[str]] = defaultdict(list)
+    for delivery in new:
+        if delivery.id in created:
+            by_channel[delivery.channel].append(str(delivery.id))
+    for channel, delivery_ids in by_channel.items():
+        for chunk in batched(delivery_ids, DELIVERY_CHUNK_SIZE):
+            deliver_to_channel_batch.delay(channel, list(chunk))
+
+    logger.info(
+        "notification_chunk_dispatched",
+        notifications=len(notifications),
+        deliveries_created=len(created),
+        channels={channel: len(ids) for channel, ids in by_channel.items()},
+    )
+    return processed, failed_ids
+
+
 @shared_task(name="notifications.tasks.dispatch_notifications_batch")
 def dispatch_notifications_batch(notification_ids: list[str]) -> dict[str, t.Any]:
     """Dispatch multiple notifications efficiently.
 
-    This task is more efficient than dispatching individual tasks for each notification
-    because it can batch some operations. Each notification still goes through the
-    same rendering and channel determination logic.
+    Loads the notifications and their recipients' preferences in one query,
+    renders them grouped by (type, language), bulk-creates the delivery rows and
+    hands each channel chunks of deliveries (``deliver_to_channel_batch``) rather
+    than one task per delivery.
 
-    For very large batches (>100), this task automatically chunks the work
-    to avoid memory issues and long task execution times.
+    Batches over ``DISPATCH_CHUNK_SIZE`` fan out into one task per chunk to keep
+    memory and task duration bounded.
 
     Args:
         notification_ids: List of notification UUIDs to dispatch
@@ -146,38 +239,23 @@ def dispatch_notifications_batch(notification_ids: list[str]) -> dict[str, t.Any
     if not notification_ids:
         return {"processed": 0, "errors": 0}
 
-    # For large batches, use individual dispatch tasks to spread load
-    if len(notification_ids) > 100:
-        # Create a group of individual dispatch tasks
-        task_group = group(dispatch_notification.s(nid) for nid in notification_ids)
-        task_group.apply_async()
+    if len(notification_ids) > DISPATCH_CHUNK_SIZE:
+        group(
+            dispatch_notifications_batch.s(list(chunk)) for chunk in batched(notification_ids, DISPATCH_CHUNK_SIZE)
+        ).apply_async()
 
         logger.info(
             "notifications_batch_chunked",
             count=len(notification_ids),
-            strategy="individual_tasks",
+            chunk_size=DISPATCH_CHUNK_SIZE,
         )
 
         return {
             "processed": len(notification_ids),
-            "strategy": "chunked_to_individual",
+            "strategy": "chunked",
         }
 
-    # For smaller batches, process directly in this task
-    processed = 0
-    failed_ids: list[str] = []
-
-    for notification_id in notification_ids:
-        try:
-            dispatch_notification(notification_id)
-            processed += 1
-        except Exception as e:
-            failed_ids.append(notification_id)
-            logger.exception(
-                "batch_dispatch_item_failed",
-                notification_id=notification_id,
-                error=str(e),
-            )
+    processed, failed_ids = _dispatch_chunk(notification_ids)
 
     logger.info(
         "notifications_batch_dispatched",
@@ -197,6 +275,80 @@ def dispatch_notifications_batch(notification_ids: list[str]) -> dict[str, t.Any
     }
 
 
+@shared_task(name="notifications.tasks.deliver_to_channel_batch")
+def deliver_to_channel_batch(channel_name: str, delivery_ids: list[str]) -> dict[str, t.Any]:
+    """Deliver a chunk of one channel's deliveries.
+
+    The batch twin of :func:`deliver_to_channel`: one query loads the chunk, skips
+    are written in one update, and the channel gets the rest at once
+    (:meth:`NotificationChannel.deliver_batch`). A delivery that fails with a
+    retryable error is handed to ``deliver_to_channel`` on the usual backoff.
+
+    Args:
+        channel_name: Channel every delivery in the chunk belongs to
+        delivery_ids: UUIDs of the delivery records
+
+    Returns:
+        Dict with per-outcome counts
+    """
+    channel = get_channel_instance(channel_name)
+    deliveries = list(
+        NotificationDelivery.objects.select_related(
+            "notification", "notification__user", "notification__user__notification_preferences"
+        ).filter(pk__in=delivery_ids, channel=channel_name)
+    )
+
+    deliverable: list[NotificationDelivery] = []
+    skipped: list[NotificationDelivery] = []
+    for delivery in deliveries:
+        (deliverable if channel.can_deliver(delivery.notification) else skipped).append(delivery)
+    if skipped:
+        NotificationDelivery.objects.filter(pk__in=[d.pk for d in skipped]).update(
+            status=DeliveryStatus.SKIPPED, updated_at=timezone.now()
+        )
+
+    errors = channel.deliver_batch(deliverable)
+
+    retry_counts = dict(NotificationDelivery.objects.filter(pk__in=errors).values_list("pk", "retry_count"))
+    retrying = 0
+    for delivery_id, error in errors.items():
+        retry_count = retry_counts.get(delivery_id, 0)
+        logger.error(
+            "delivery_exception",
+            delivery_id=str(delivery_id),
+            channel=channel_name,
+            error=str(error),
+            retry_count=retry_count,
+            exc_info=error,
+        )
+        if channel.should_retry(error) and retry_count < 3:
+            # Exponential backoff: 2^retry_count minutes
+            deliver_to_channel.apply_async((str(delivery_id),), countdown=2**retry_count * 60)
+            retrying += 1
+        else:
+            NotificationDelivery.objects.filter(pk=delivery_id).update(
+                status=DeliveryStatus.FAILED,
+                error_message="".join(traceback.format_exception(error)),
+                updated_at=timezone.now(),
+            )
+
+    logger.info(
+        "delivery_batch_processed",
+        channel=channel_name,
+        total=len(deliveries),
+        skipped=len(skipped),
+        errors=len(errors),
+        retrying=retrying,
+    )
+    return {
+        "channel": channel_name,
+        "attempted": len(deliverable),
+        "skipped": len(skipped),
+        "failed": len(errors) - retrying,
+        "retrying": retrying,
+    }
+
+
 @shared_task(name="notifications.tasks.deliver_to_channel", bind=True, max_retries=3)
 def deliver_to_channel(self: t.Any, delivery_id: str) -> dict[str, t.Any]:
     """Deliver notification through specific channel.
@@ -276,86 +428,139 @@ def deliver_to_channel(self: t.Any, delivery_id: str) -> dict[str, t.Any]:
 # ===== Digest Tasks =====
 
 
-@shared_task(name="notifications.tasks.send_notification_digests")
-def send_notification_digests() -> dict[str, t.Any]:
+# Users per send_digest_chunk task.
+DIGEST_CHUNK_SIZE = 200
+# A sweep's checkpoint outlives any redelivery of the task, not the next hourly run.
+DIGEST_CHECKPOINT_TTL_SECONDS = 3600
+
+
+def _digest_checkpoint_key(task_id: str) -> str:
+    return f"notification_digests:checkpoint:{task_id}"
+
+
+def _save_digest_checkpoint(key: str, checkpoint: dict[str, t.Any]) -> None:
+    try:
+        cache.set(key, checkpoint, timeout=DIGEST_CHECKPOINT_TTL_SECONDS)
+    except Exception:
+        logger.warning("digest_checkpoint_save_failed", exc_info=True)
+
+
+@shared_task(name="notifications.tasks.send_notification_digests", bind=True)
+def send_notification_digests(self: t.Any) -> dict[str, t.Any]:
     """Send notification digests to users based on their preferences.
 
     Runs every hour via Celery beat.
-    Checks which users should receive digests now and sends them.
+    Selects the users who are due and have pending notifications in one query,
+    pages through them by user id and fans each page out to ``send_digest_chunk``.
+
+    The run's reference time and keyset cursor are checkpointed in the cache under
+    the task id, so a redelivered task (acks are late) resumes after the last
+    dispatched page with the same due set instead of starting over.
+
+    Args:
+        self: Celery task instance (automatically passed when bind=True)
 
     Returns:
         Dict with digest stats
     """
-    from notifications.service.digest import (
-        NotificationDigest,
-        get_digest_lookback_period,
-        get_pending_notifications_for_digest,
-        should_send_digest_now,
-    )
+    from notifications.service.digest import get_due_digest_user_ids
 
-    # Get users who want digests (not immediate)
-    users_with_digests = NotificationPreference.objects.exclude(
-        digest_frequency=NotificationPreference.DigestFrequency.IMMEDIATE
-    ).select_related("user")
+    key = _digest_checkpoint_key(self.request.id)
+    try:
+        checkpoint = cache.get(key)
+    except Exception:
+        logger.warning("digest_checkpoint_load_failed", exc_info=True)
+        checkpoint = None
+    if checkpoint is None:
+        checkpoint = {"run_at": timezone.now().isoformat(), "cursor": None, "users": 0, "chunks": 0}
+    elif checkpoint["cursor"] is not None:
+        logger.info("digest_sweep_resumed", task_id=self.request.id, cursor=checkpoint["cursor"])
+
+    due = get_due_digest_user_ids(datetime.fromisoformat(checkpoint["run_at"]))
+    while True:
+        page = due.filter(user_id__gt=checkpoint["cursor"]) if checkpoint["cursor"] else due
+        user_ids = [str(user_id) for user_id in page[:DIGEST_CHUNK_SIZE]]
+        if not user_ids:
+            break
+        send_digest_chunk.delay(user_ids, checkpoint["run_at"])
+        checkpoint["cursor"] = user_ids[-1]
+        checkpoint["users"] += len(user_ids)
+        checkpoint["chunks"] += 1
+        _save_digest_checkpoint(key, checkpoint)
 
-    digests_sent = 0
-    digests_skipped = 0
+    try:
+        cache.delete(key)
+    except Exception:
+        logger.warning("digest_checkpoint_delete_failed", exc_info=True)
 
-    for prefs in users_with_digests:
-        # Check if it's time to send digest for this user
-        if not should_send_digest_now(prefs.user):
-            digests_skipped += 1
-            continue
+    logger.info("digests_scheduled", users=checkpoint["users"], chunks=checkpoint["chunks"])
 
-        # Get lookback period
-        lookback = get_digest_lookback_period(prefs.digest_frequency)
-        since = timezone.now() - lookback
+    return {"users": checkpoint["users"], "chunks": checkpoint["chunks"]}
 
-        # Get pending notifications
-        pending = get_pending_notifications_for_digest(prefs.user, since)
 
-        if not pending.exists():
-            continue  # No notifications to send
+@shared_task(name="notifications.tasks.send_digest_chunk")
+def send_digest_chunk(user_ids: list[str], run_at: str) -> dict[str, t.Any]:
+    """Send the digests for one page of due users.
 
-        # Build and send digest
-        digest = NotificationDigest(prefs.user, pending)
-        if not digest.send_digest_email():
-            continue
+    The users' preference rows are locked with SKIP LOCKED while their delivery rows
+    are written, and emails go out only after that commits. A page dispatched twice
+    (a sweep killed between dispatch and checkpoint) therefore sends each digest
+    once: the duplicate either skips the locked users or finds nothing pending.
+
+    Args:
+        user_ids: UUIDs of due users
+        run_at: ISO timestamp the sweep computed the due set at
 
-        # Mark notifications as having email delivery using bulk operations
-        pending_list = list(pending)
-        notification_ids = [n.id for n in pending_list]
+    Returns:
+        Dict with digest stats
+    """
+    from notifications.service.digest import NotificationDigest, get_pending_digest_notifications
+
+    now = timezone.now()
+    with transaction.atomic():
+        locked = list(
+            NotificationPreference.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("user")
+            .filter(user_id__in=user_ids)
+        )
+        users = {prefs.user_id: prefs.user for prefs in locked}
+        pending = get_pending_digest_notifications(datetime.fromisoformat(run_at)).filter(user_id__in=list(users))
 
-        # Find which notifications already have email delivery records
-        existing_deliveries = set(
+        by_user: dict[t.Any, list[t.Any]] = defaultdict(list)
+        for notification_id, user_id in pending.values_list("pk", "user_id"):
+            by_user[user_id].append(notification_id)
+
+        # Pending notifications have no SENT email delivery, but may have a failed one
+        existing = set(
             NotificationDelivery.objects.filter(
-                notification_id__in=notification_ids,
+                notification_id__in=[nid for ids in by_user.values() for nid in ids],
                 channel=DeliveryChannel.EMAIL,
             ).values_list("notification_id", flat=True)
         )
-
-        # Bulk create delivery records for notifications that don't have them
-        now = timezone.now()
-        deliveries_to_create = [
+        NotificationDelivery.objects.bulk_create(
             NotificationDelivery(
-                notification=notification,
+                notification_id=notification_id,
                 channel=DeliveryChannel.EMAIL,
                 status=DeliveryStatus.SENT,
                 delivered_at=now,
                 metadata={"digest": True},
             )
-            for notification in pending_list
-            if notification.id not in existing_deliveries
-        ]
-
-        if deliveries_to_create:
-            NotificationDelivery.objects.bulk_create(deliveries_to_create)
+            for ids in by_user.values()
+            for notification_id in ids
+            if notification_id not in existing
+        )
 
-        digests_sent += 1
+        for user_id, notification_ids in by_user.items():
+            digest = NotificationDigest(users[user_id], Notification.objects.filter(pk__in=notification_ids))
+            transaction.on_commit(digest.send_digest_email)
 
-    logger.info("digests_sent", count=digests_sent, skipped=digests_skipped)
+    logger.info(
+        "digests_sent",
+        count=len(by_user),
+        locked_elsewhere=len(user_ids) - len(locked),
+    )
 
-    return {"digests_sent": digests_sent, "digests_skipped": digests_skipped}
+    return {"digests_sent": len(by_user), "digests_skipped": len(user_ids) - len(by_user)}
 
 
 # ===== Maintenance Tasks =====
@@ -376,10 +581,17 @@ def cleanup_old_notifications() -> dict[str, t.Any]:
 
     # Delete old notifications (cascades to deliveries)
     deleted_count, _ = Notification.objects.filter(created_at__lt=cutoff).delete()
+    # The reminder ledger is only consulted before an event starts
+    reminders_deleted, _ = SentEventReminder.objects.filter(event__start__lt=cutoff).delete()
 
-    logger.info("notifications_cleaned_up", retention_days=retention_days, deleted_count=deleted_count)
+    logger.info(
+        "notifications_cleaned_up",
+        retention_days=retention_days,
+        deleted_count=deleted_count,
+        reminders_deleted=reminders_deleted,
+    )
 
-    return {"deleted_count": deleted_count, "retention_days": retention_days}
+    return {"deleted_count": deleted_count, "reminders_deleted": reminders_deleted, "retention_days": retention_days}
 
 
 @shared_task(name="notifications.tasks.retry_failed_deliveries")
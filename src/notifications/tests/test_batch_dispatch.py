@@ -0,0 +1,116 @@
+"""Bulk dispatch: batched rendering, bulk delivery rows, per-channel delivery chunks."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from accounts.models import RevelUser
+from notifications.enums import DeliveryChannel, DeliveryStatus, NotificationType
+from notifications.models import Notification, NotificationDelivery
+from notifications.service.dispatcher import determine_delivery_channels
+from notifications.tasks import (
+    BatchDispatchError,
+    deliver_to_channel_batch,
+    dispatch_notifications_batch,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def _notifications(regular_user: RevelUser, count: int) -> list[Notification]:
+    return Notification.objects.bulk_create(
+        Notification(
+            notification_type=NotificationType.SYSTEM_ANNOUNCEMENT,
+            user=regular_user,
+            context={"announcement_title": f"Title {i}", "announcement_body": "Body"},
+        )
+        for i in range(count)
+    )
+
+
+@patch("notifications.tasks.deliver_to_channel_batch.delay")
+def test_batch_renders_and_creates_one_delivery_per_channel(mock_deliver: MagicMock, regular_user: RevelUser) -> None:
+    notifications = _notifications(regular_user, 3)
+    channels = determine_delivery_channels(regular_user, NotificationType.SYSTEM_ANNOUNCEMENT)
+
+    result = dispatch_notifications_batch([str(n.id) for n in notifications])
+    dispatch_notifications_batch([str(n.id) for n in notifications])  # re-run: no new rows, nothing re-sent
+
+    assert result["processed"] == 3
+    assert NotificationDelivery.objects.count() == 3 * len(channels)
+    assert all(n.title for n in Notification.objects.filter(pk__in=[n.id for n in notifications]))
+    assert sorted(call.args[0] for call in mock_deliver.call_args_list) == sorted(channels)
+    assert sum(len(call.args[1]) for call in mock_deliver.call_args_list) == 3 * len(channels)
+
+
+@patch("notifications.tasks.deliver_to_channel_batch.delay")
+def test_missing_notifications_fail_the_batch_after_the_rest(mock_deliver: MagicMock, regular_user: RevelUser) -> None:
+    (notification,) = _notifications(regular_user, 1)
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    with pytest.raises(BatchDispatchError) as exc_info:
+        dispatch_notifications_batch([str(notification.id), missing])
+
+    assert exc_info.value.failed_ids == [missing]
+    assert NotificationDelivery.objects.filter(notification=notification).exists()
+
+
+@patch("notifications.tasks.DISPATCH_CHUNK_SIZE", 2)
+@patch("notifications.tasks.deliver_to_channel_batch.delay")
+def test_large_batches_fan_out_in_chunks(mock_deliver: MagicMock, regular_user: RevelUser) -> None:
+    notifications = _notifications(regular_user, 5)
+
+    result = dispatch_notifications_batch([str(n.id) for n in notifications])
+
+    assert result["strategy"] == "chunked"
+    dispatched = NotificationDelivery.objects.filter(notification__in=notifications).values("notification")
+    assert dispatched.distinct().count() == 5
+
+
+def test_in_app_chunk_is_marked_sent(regular_user: RevelUser) -> None:
+    notifications = _notifications(regular_user, 3)
+    deliveries = NotificationDelivery.objects.bulk_create(
+        NotificationDelivery(notification=n, channel=DeliveryChannel.IN_APP) for n in notifications
+    )
+
+    result = deliver_to_channel_batch(DeliveryChannel.IN_APP, [str(d.id) for d in deliveries])
+
+    assert result["attempted"] == 3
+    assert set(NotificationDelivery.objects.values_list("status", flat=True)) == {DeliveryStatus.SENT}
+    assert not NotificationDelivery.objects.filter(delivered_at__isnull=True).exists()
+
+
+def test_undeliverable_chunk_is_skipped(regular_user: RevelUser) -> None:
+    notifications = _notifications(regular_user, 2)
+    deliveries = NotificationDelivery.objects.bulk_create(
+        NotificationDelivery(notification=n, channel=DeliveryChannel.IN_APP) for n in notifications
+    )
+
+    with patch("notifications.service.channels.in_app.InAppChannel.can_deliver", return_value=False):
+        result = deliver_to_channel_batch(DeliveryChannel.IN_APP, [str(d.id) for d in deliveries])
+
+    assert result == {"channel": DeliveryChannel.IN_APP, "attempted": 0, "skipped": 2, "failed": 0, "retrying": 0}
+    assert set(NotificationDelivery.objects.values_list("status", flat=True)) == {DeliveryStatus.SKIPPED}
+
+
+def test_failed_delivery_is_retried_or_marked_failed(regular_user: RevelUser) -> None:
+    first, second = _notifications(regular_user, 2)
+    retryable, permanent = NotificationDelivery.objects.bulk_create(
+        [
+            NotificationDelivery(notification=first, channel=DeliveryChannel.EMAIL),
+            NotificationDelivery(notification=second, channel=DeliveryChannel.EMAIL, retry_count=3),
+        ]
+    )
+
+    with (
+        patch("notifications.service.channels.email.EmailChannel.can_deliver", return_value=True),
+        patch("notifications.service.channels.email.EmailChannel.deliver", side_effect=ConnectionError("down")),
+        patch("notifications.tasks.deliver_to_channel.apply_async") as mock_retry,
+    ):
+        result = deliver_to_channel_batch(DeliveryChannel.EMAIL, [str(retryable.id), str(permanent.id)])
+
+    assert (result["retrying"], result["failed"]) == (1, 1)
+    mock_retry.assert_called_once_with((str(retryable.id),), countdown=60)
+    permanent.refresh_from_db()
+    assert permanent.status == DeliveryStatus.FAILED
+    assert "ConnectionError" in permanent.error_message
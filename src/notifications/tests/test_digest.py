@@ -1,10 +1,13 @@
 """Tests for notification digest functionality."""
 
-from datetime import time, timedelta
+import typing as t
+from datetime import datetime, time, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone, translation
+from freezegun import freeze_time
 
 from accounts.models import RevelUser
 from notifications.enums import DeliveryChannel, DeliveryStatus
@@ -13,9 +16,11 @@ from notifications.service import digest
 from notifications.service.digest import (
     NotificationDigest,
     get_digest_lookback_period,
+    get_due_digest_user_ids,
     get_pending_notifications_for_digest,
     should_send_digest_now,
 )
+from notifications.tasks import send_digest_chunk, send_notification_digests
 
 pytestmark = pytest.mark.django_db
 
@@ -318,3 +323,94 @@ class TestGetDigestLookbackPeriod:
         """Test that invalid frequency raises ValueError."""
         with pytest.raises(ValueError, match="Invalid digest frequency"):
             get_digest_lookback_period("invalid")
+
+
+def _digest_now(regular_user: RevelUser, frequency: str = NotificationPreference.DigestFrequency.DAILY) -> None:
+    prefs = regular_user.notification_preferences
+    prefs.digest_frequency = frequency
+    prefs.digest_send_time = timezone.localtime().time()
+    prefs.save()
+
+
+class TestDigestSweep:
+    """Test the set-based, chunked digest sweep."""
+
+    @pytest.mark.parametrize(
+        "local_now",
+        [
+            datetime(2026, 3, 2, 9, 15),  # Monday
+            datetime(2026, 3, 3, 9, 15),  # Tuesday
+            datetime(2026, 3, 3, 0, 10),
+            datetime(2026, 3, 3, 23, 50),
+        ],
+    )
+    def test_due_query_matches_should_send_digest_now(self, regular_user: RevelUser, local_now: datetime) -> None:
+        """The SQL filter agrees with the per-user check, edges of the window included."""
+        Notification.objects.create(user=regular_user, notification_type="event_reminder", context={})
+        prefs = regular_user.notification_preferences
+        now = timezone.make_aware(local_now)
+
+        with freeze_time(now):
+            for frequency in NotificationPreference.DigestFrequency.values:
+                for send_time in [time(8, 44), time(8, 45, 30), time(9, 45, 59), time(9, 46), time(0, 0), time(23, 59)]:
+                    prefs.digest_frequency = frequency
+                    prefs.digest_send_time = send_time
+                    prefs.save()
+                    regular_user.refresh_from_db()
+                    due = regular_user.id in set(get_due_digest_user_ids(now))
+                    assert due == should_send_digest_now(regular_user), (frequency, send_time)
+
+    @patch("common.tasks.send_email.delay")
+    def test_sweep_sends_each_digest_once(
+        self,
+        mock_send_email: MagicMock,
+        regular_user: RevelUser,
+        digest_notifications: list[Notification],
+        django_capture_on_commit_callbacks: t.Any,
+    ) -> None:
+        _digest_now(regular_user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            result = send_notification_digests.apply().get()
+            send_notification_digests.apply().get()
+
+        assert result == {"users": 1, "chunks": 1}
+        mock_send_email.assert_called_once()
+        assert NotificationDelivery.objects.filter(
+            notification__in=digest_notifications, channel=DeliveryChannel.EMAIL, status=DeliveryStatus.SENT
+        ).count() == len(digest_notifications)
+
+    @patch("common.tasks.send_email.delay")
+    def test_duplicate_chunk_sends_nothing(
+        self,
+        mock_send_email: MagicMock,
+        regular_user: RevelUser,
+        digest_notifications: list[Notification],
+        django_capture_on_commit_callbacks: t.Any,
+    ) -> None:
+        _digest_now(regular_user)
+        run_at = timezone.now().isoformat()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first = send_digest_chunk([str(regular_user.id)], run_at)
+            second = send_digest_chunk([str(regular_user.id)], run_at)
+
+        assert (first["digests_sent"], second["digests_sent"]) == (1, 0)
+        mock_send_email.assert_called_once()
+
+    @patch("notifications.tasks.send_digest_chunk.delay")
+    def test_redelivered_sweep_resumes_after_checkpoint(
+        self, mock_chunk: MagicMock, regular_user: RevelUser, digest_notifications: list[Notification]
+    ) -> None:
+        _digest_now(regular_user)
+        run_at = timezone.now().isoformat()
+        cache.set(
+            "notification_digests:checkpoint:task-1",
+            {"run_at": run_at, "cursor": str(regular_user.id), "users": 1, "chunks": 1},
+        )
+
+        result = send_notification_digests.apply(task_id="task-1").get()
+
+        mock_chunk.assert_not_called()
+        assert result == {"users": 1, "chunks": 1}
+        assert cache.get("notification_digests:checkpoint:task-1") is None
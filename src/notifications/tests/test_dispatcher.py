@@ -1,13 +1,18 @@
 """Tests for notification dispatcher service."""
 
 import pickle
+import typing as t
+from unittest.mock import MagicMock, patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from accounts.models import RevelUser
+from conftest import RevelUserFactory
 from notifications.enums import DeliveryChannel, NotificationType
-from notifications.models import NotificationPreference
-from notifications.service.dispatcher import create_notification, determine_delivery_channels
+from notifications.models import Notification, NotificationPreference
+from notifications.service.dispatcher import create_notification, determine_delivery_channels, notify_many
 from notifications.tasks import BatchDispatchError
 
 pytestmark = pytest.mark.django_db
@@ -105,6 +110,86 @@ class TestCreateNotification:
         assert notification.notification_type == NotificationType.EVENT_REMINDER
 
 
+class TestNotifyMany:
+    """Test bulk fan-out of one notification type to many users."""
+
+    SHARED = {"announcement_title": "Title", "announcement_body": "Body"}
+
+    @staticmethod
+    def _announcements() -> t.Any:
+        return Notification.objects.filter(notification_type=NotificationType.SYSTEM_ANNOUNCEMENT)
+
+    @patch("notifications.tasks.dispatch_notifications_batch.delay")
+    def test_one_insert_and_one_dispatch_per_chunk(
+        self,
+        mock_dispatch: MagicMock,
+        revel_user_factory: RevelUserFactory,
+        django_capture_on_commit_callbacks: t.Any,
+    ) -> None:
+        """Five users in chunks of two: three INSERTs, three batch dispatches after commit."""
+        users = [revel_user_factory() for _ in range(5)]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with CaptureQueriesContext(connection) as queries:
+                created = notify_many(NotificationType.SYSTEM_ANNOUNCEMENT, iter(users), self.SHARED, chunk_size=2)
+
+        table = Notification._meta.db_table
+        inserts = [q for q in queries.captured_queries if q["sql"].startswith(f'INSERT INTO "{table}"')]
+        assert created == 5
+        assert len(inserts) == 3
+        assert [len(c.args[0]) for c in mock_dispatch.call_args_list] == [2, 2, 1]
+        assert set(self._announcements().values_list("user_id", flat=True)) == {u.id for u in users}
+
+    @patch("notifications.tasks.dispatch_notifications_batch.delay")
+    def test_per_user_overrides_are_merged(
+        self, mock_dispatch: MagicMock, revel_user_factory: RevelUserFactory
+    ) -> None:
+        """Overrides replace or add keys for their user only."""
+        alice, bob = revel_user_factory(), revel_user_factory()
+
+        notify_many(
+            NotificationType.SYSTEM_ANNOUNCEMENT,
+            [alice, bob],
+            self.SHARED,
+            {alice.id: {"announcement_title": "For Alice", "policy_url": "https://example.com"}},
+        )
+
+        assert self._announcements().get(user=alice).context == {
+            "announcement_title": "For Alice",
+            "announcement_body": "Body",
+            "policy_url": "https://example.com",
+        }
+        assert self._announcements().get(user=bob).context == self.SHARED
+
+    @patch("notifications.tasks.dispatch_notifications_batch.delay")
+    def test_validates_once_per_override_key_set(
+        self, mock_dispatch: MagicMock, revel_user_factory: RevelUserFactory
+    ) -> None:
+        """Validation only checks keys, so users sharing a key set share one validation."""
+        users = [revel_user_factory() for _ in range(4)]
+        overrides = {u.id: {"policy_url": f"https://example.com/{i}"} for i, u in enumerate(users[:3])}
+
+        with patch("notifications.context_schemas.validate_notification_context") as mock_validate:
+            notify_many(NotificationType.SYSTEM_ANNOUNCEMENT, users, self.SHARED, overrides)
+
+        assert mock_validate.call_count == 2
+
+    @patch("notifications.tasks.dispatch_notifications_batch.delay")
+    def test_invalid_context_creates_nothing_and_does_not_raise(
+        self,
+        mock_dispatch: MagicMock,
+        regular_user: RevelUser,
+        django_capture_on_commit_callbacks: t.Any,
+    ) -> None:
+        """Like the signal handler, errors are logged and swallowed."""
+        with django_capture_on_commit_callbacks(execute=True):
+            created = notify_many(NotificationType.SYSTEM_ANNOUNCEMENT, [regular_user], {"announcement_title": "x"})
+
+        assert created == 0
+        assert not self._announcements().exists()
+        mock_dispatch.assert_not_called()
+
+
 class TestDetermineDeliveryChannels:
     """Test channel determination based on user preferences."""
 
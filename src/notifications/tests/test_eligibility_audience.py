@@ -0,0 +1,226 @@
+"""Tests for the UNION-based event audience resolver.
+
+``get_eligible_users_for_event_notification`` builds its audience from narrow
+per-table subqueries and applies the preference checks in the same statement; these
+tests pin the audience per visibility and notification type, and the query shape.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import RevelUser
+from conftest import RevelUserFactory
+from events.models import (
+    Event,
+    EventInvitation,
+    EventRSVP,
+    Organization,
+    OrganizationMember,
+    OrganizationStaff,
+    Ticket,
+    TicketTier,
+)
+from notifications.enums import NotificationType
+from notifications.models import NotificationPreference
+from notifications.service.eligibility import (
+    get_eligible_users_for_event_notification,
+    iter_eligible_user_ids_for_event_notification,
+)
+from notifications.service.notification_helpers import notify_event_opened
+
+pytestmark = pytest.mark.django_db
+
+
+def _event(organization: Organization, visibility: str) -> Event:
+    next_week = timezone.now() + timedelta(days=7)
+    return Event.objects.create(
+        organization=organization,
+        name=f"{visibility} event",
+        slug=f"{visibility}-event",
+        visibility=visibility,
+        status=Event.EventStatus.OPEN,
+        start=next_week,
+        end=next_week + timedelta(hours=2),
+        requires_ticket=True,
+    )
+
+
+def _population(organization: Organization, event: Event, revel_user_factory: RevelUserFactory) -> dict[str, RevelUser]:
+    """One user per way of relating to the event, keyed by role."""
+    users = {
+        role: revel_user_factory()
+        for role in [
+            "staff",
+            "member",
+            "cancelled_member",
+            "rsvp_yes",
+            "rsvp_no",
+            "ticket_active",
+            "ticket_pending_offline",
+            "ticket_pending_online",
+            "invited",
+            "random",
+            "silenced_rsvp",
+            "type_disabled_rsvp",
+        ]
+    }
+    users["owner"] = organization.owner
+    offline = TicketTier.objects.create(
+        event=event, name="Offline", payment_method=TicketTier.PaymentMethod.OFFLINE, price=10
+    )
+    online = TicketTier.objects.create(
+        event=event, name="Online", payment_method=TicketTier.PaymentMethod.ONLINE, price=10
+    )
+
+    OrganizationStaff.objects.create(organization=organization, user=users["staff"])
+    OrganizationMember.objects.create(organization=organization, user=users["member"])
+    OrganizationMember.objects.create(
+        organization=organization,
+        user=users["cancelled_member"],
+        status=OrganizationMember.MembershipStatus.CANCELLED,
+    )
+    for role, status in [
+        ("rsvp_yes", EventRSVP.RsvpStatus.YES),
+        ("rsvp_no", EventRSVP.RsvpStatus.NO),
+        ("silenced_rsvp", EventRSVP.RsvpStatus.YES),
+        ("type_disabled_rsvp", EventRSVP.RsvpStatus.MAYBE),
+    ]:
+        EventRSVP.objects.create(event=event, user=users[role], status=status)
+    for role, tier, status in [
+        ("ticket_active", online, Ticket.TicketStatus.ACTIVE),
+        ("ticket_pending_offline", offline, Ticket.TicketStatus.PENDING),
+        ("ticket_pending_online", online, Ticket.TicketStatus.PENDING),
+    ]:
+        Ticket.objects.create(event=event, user=users[role], tier=tier, status=status, guest_name="Guest")
+    EventInvitation.objects.create(event=event, user=users["invited"])
+
+    NotificationPreference.objects.filter(user=users["silenced_rsvp"]).update(silence_all_notifications=True)
+    NotificationPreference.objects.filter(user=users["type_disabled_rsvp"]).update(
+        notification_type_settings={
+            NotificationType.EVENT_OPEN: {"enabled": False},
+            NotificationType.EVENT_UPDATED: {"enabled": False},
+        }
+    )
+    return users
+
+
+PARTICIPANTS = {"owner", "staff", "rsvp_yes", "ticket_active", "ticket_pending_offline", "invited"}
+
+
+@pytest.mark.parametrize(
+    ("visibility", "notification_type", "expected"),
+    [
+        (Event.Visibility.PUBLIC, NotificationType.EVENT_OPEN, PARTICIPANTS | {"member"}),
+        (Event.Visibility.PUBLIC, NotificationType.EVENT_UPDATED, PARTICIPANTS),
+        (Event.Visibility.MEMBERS_ONLY, NotificationType.EVENT_OPEN, PARTICIPANTS | {"member"}),
+        (Event.Visibility.MEMBERS_ONLY, NotificationType.EVENT_UPDATED, PARTICIPANTS),
+        (Event.Visibility.PRIVATE, NotificationType.EVENT_OPEN, PARTICIPANTS),
+        (Event.Visibility.UNLISTED, NotificationType.EVENT_OPEN, PARTICIPANTS),
+        (Event.Visibility.STAFF_ONLY, NotificationType.EVENT_OPEN, {"owner", "staff"}),
+    ],
+)
+def test_audience_by_visibility_and_type(
+    organization: Organization,
+    revel_user_factory: RevelUserFactory,
+    visibility: str,
+    notification_type: NotificationType,
+    expected: set[str],
+) -> None:
+    event = _event(organization, visibility)
+    users = _population(organization, event, revel_user_factory)
+
+    eligible_ids = set(get_eligible_users_for_event_notification(event, notification_type).values_list("id", flat=True))
+
+    assert {role for role, user in users.items() if user.id in eligible_ids} == expected
+
+
+@pytest.mark.parametrize(
+    "notification_type",
+    [
+        NotificationType.EVENT_OPEN,
+        NotificationType.EVENT_UPDATED,
+        NotificationType.EVENT_CANCELLED,
+        NotificationType.POTLUCK_ITEM_CREATED,
+    ],
+)
+def test_default_preferences_keep_user_in_audience(
+    organization: Organization, revel_user_factory: RevelUserFactory, notification_type: NotificationType
+) -> None:
+    """Types without an entry in the default settings are enabled, not filtered out."""
+    event = _event(organization, Event.Visibility.PUBLIC)
+    default_user, other_type_off = revel_user_factory(), revel_user_factory()
+    for user in (default_user, other_type_off):
+        EventRSVP.objects.create(event=event, user=user, status=EventRSVP.RsvpStatus.YES)
+    NotificationPreference.objects.filter(user=other_type_off).update(
+        notification_type_settings={NotificationType.EVENT_REMINDER: {"enabled": False}}
+    )
+
+    eligible_ids = set(get_eligible_users_for_event_notification(event, notification_type).values_list("id", flat=True))
+
+    assert {default_user.id, other_type_off.id} <= eligible_ids
+
+
+def test_audience_is_one_union_query_without_distinct(
+    organization: Organization, revel_user_factory: RevelUserFactory
+) -> None:
+    event = _event(organization, Event.Visibility.PUBLIC)
+    _population(organization, event, revel_user_factory)
+
+    with CaptureQueriesContext(connection) as queries:
+        list(get_eligible_users_for_event_notification(event, NotificationType.EVENT_OPEN))
+
+    assert len(queries.captured_queries) == 1
+    sql = queries.captured_queries[0]["sql"]
+    assert "UNION" in sql
+    assert "DISTINCT" not in sql
+
+
+def test_ids_are_streamed_in_chunks(organization: Organization, revel_user_factory: RevelUserFactory) -> None:
+    event = _event(organization, Event.Visibility.PUBLIC)
+    _population(organization, event, revel_user_factory)
+    expected = set(
+        get_eligible_users_for_event_notification(event, NotificationType.EVENT_OPEN).values_list("id", flat=True)
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        chunks = list(iter_eligible_user_ids_for_event_notification(event, NotificationType.EVENT_OPEN, chunk_size=3))
+
+    assert len(queries.captured_queries) == 1
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert {user_id for chunk in chunks for user_id in chunk} == expected
+
+
+def test_user_without_preferences_is_notified_and_backfilled(
+    organization: Organization, revel_user_factory: RevelUserFactory
+) -> None:
+    event = _event(organization, Event.Visibility.PUBLIC)
+    user = revel_user_factory()
+    EventRSVP.objects.create(event=event, user=user, status=EventRSVP.RsvpStatus.YES)
+    NotificationPreference.objects.filter(user=user).delete()
+
+    assert get_eligible_users_for_event_notification(event, NotificationType.EVENT_OPEN).filter(pk=user.pk).exists()
+
+    user_ids = {
+        user_id
+        for chunk in iter_eligible_user_ids_for_event_notification(event, NotificationType.EVENT_OPEN)
+        for user_id in chunk
+    }
+    assert user.id in user_ids
+    assert NotificationPreference.objects.filter(user=user).exists()
+
+
+def test_event_opened_resolves_the_audience_once(
+    organization: Organization, revel_user_factory: RevelUserFactory
+) -> None:
+    event = _event(organization, Event.Visibility.PUBLIC)
+    _population(organization, event, revel_user_factory)
+
+    with CaptureQueriesContext(connection) as queries:
+        count = notify_event_opened(event)
+
+    assert count == len(PARTICIPANTS | {"member"})
+    assert sum("UNION" in query["sql"] for query in queries.captured_queries) == 1
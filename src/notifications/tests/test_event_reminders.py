@@ -8,16 +8,21 @@ import pytest
 from django.utils import timezone
 
 from accounts.models import RevelUser
-from conftest import RevelUserFactory
+from conftest import RevelUserFactory, notify_many_sends
 from events.models import Event, EventRSVP, Organization, Ticket, TicketTier
 from notifications.enums import NotificationType
-from notifications.models import Notification
+from notifications.models import SentEventReminder
 from notifications.service.reminder_service import EventReminderService
 from notifications.tasks import send_event_reminders
 
 pytestmark = pytest.mark.django_db
 
 
+def _notify_all(notification_type: NotificationType, recipients: list[t.Any], *args: t.Any, **kwargs: t.Any) -> int:
+    """Stand-in for ``notify_many`` that reports every recipient notified."""
+    return len(recipients)
+
+
 @pytest.fixture
 def org_owner(revel_user_factory: RevelUserFactory) -> RevelUser:
     """Organization owner."""
@@ -160,13 +165,9 @@ class TestShouldSendReminder:
         ticket_holder_1: RevelUser,
     ) -> None:
         """Test that eligible users should receive reminders."""
-        # Arrange
-        event_id = "test-event-id"
-        already_sent: set[tuple[t.Any, str]] = set()
-
         # Act
         service = EventReminderService()
-        result = service.should_send_reminder(ticket_holder_1, event_id, already_sent)
+        result = service.should_send_reminder(ticket_holder_1)
 
         # Assert
         assert result is True
@@ -176,13 +177,9 @@ class TestShouldSendReminder:
         disabled_reminders_user: RevelUser,
     ) -> None:
         """Test that users with reminders disabled don't receive them."""
-        # Arrange
-        event_id = "test-event-id"
-        already_sent: set[tuple[t.Any, str]] = set()
-
         # Act
         service = EventReminderService()
-        result = service.should_send_reminder(disabled_reminders_user, event_id, already_sent)
+        result = service.should_send_reminder(disabled_reminders_user)
 
         # Assert
         assert result is False
@@ -193,9 +190,6 @@ class TestShouldSendReminder:
     ) -> None:
         """Test that users with EVENT_REMINDER type disabled don't receive them."""
         # Arrange
-        event_id = "test-event-id"
-        already_sent: set[tuple[t.Any, str]] = set()
-
         # Disable EVENT_REMINDER notification type
         prefs = ticket_holder_1.notification_preferences
         prefs.notification_type_settings[NotificationType.EVENT_REMINDER] = {
@@ -206,26 +200,35 @@ class TestShouldSendReminder:
 
         # Act
         service = EventReminderService()
-        result = service.should_send_reminder(ticket_holder_1, event_id, already_sent)
+        result = service.should_send_reminder(ticket_holder_1)
 
         # Assert
         assert result is False
 
-    def test_returns_false_when_already_sent(
+
+class TestClaimReminders:
+    """Test the sent-reminder ledger."""
+
+    def test_returns_only_users_not_yet_reminded(
         self,
+        future_event_14_days: Event,
         ticket_holder_1: RevelUser,
+        ticket_holder_2: RevelUser,
     ) -> None:
-        """Test that reminders aren't sent twice for same event."""
+        """Test that claiming is the deduplication: existing rows are skipped, new ones returned."""
         # Arrange
-        event_id = "test-event-id"
-        already_sent = {(ticket_holder_1.id, event_id)}
+        SentEventReminder.objects.create(user=ticket_holder_1, event=future_event_14_days, days_until=14)
+        service = EventReminderService()
 
         # Act
-        service = EventReminderService()
-        result = service.should_send_reminder(ticket_holder_1, event_id, already_sent)
+        claimed = service.claim_reminders(future_event_14_days, 14, [ticket_holder_1.id, ticket_holder_2.id])
 
         # Assert
-        assert result is False
+        assert claimed == {ticket_holder_2.id}
+        assert service.claim_reminders(future_event_14_days, 14, [ticket_holder_2.id]) == set()
+        # Another offset is a different reminder
+        assert service.claim_reminders(future_event_14_days, 7, [ticket_holder_1.id]) == {ticket_holder_1.id}
+        assert SentEventReminder.objects.filter(event=future_event_14_days).count() == 3
 
 
 class TestBuildEventContext:
@@ -238,7 +241,7 @@ class TestBuildEventContext:
         """Test that all required context fields are included.
 
         Note: event_location is NOT included in base context as it depends
-        on per-user visibility permissions. It's added via _add_user_location_context.
+        on per-user visibility permissions. It's added via _user_location_context.
         """
         # Arrange
         service = EventReminderService()
@@ -253,7 +256,7 @@ class TestBuildEventContext:
         assert context["event_start"] == future_event_14_days.start.isoformat()
         assert "event_start_formatted" in context
         assert "event_end_formatted" in context  # Event has end time by default
-        # event_location is added per-user via _add_user_location_context
+        # event_location is added per-user via _user_location_context
         assert "event_location" not in context
         assert "event_url" in context
         assert context["days_until"] == days
@@ -262,10 +265,10 @@ class TestBuildEventContext:
 class TestSendTicketReminders:
     """Test ticket reminder sending."""
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     def test_sends_reminders_to_ticket_holders(
         self,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         future_event_14_days: Event,
         ticket_holder_1: RevelUser,
         ticket_holder_2: RevelUser,
@@ -297,23 +300,21 @@ class TestSendTicketReminders:
             "event_url": "https://example.com/events/test",
             "days_until": 14,
         }
-        already_sent: set[tuple[t.Any, str]] = set()
-        sent_to_users: set[t.Any] = set()
-
         # Act
         service = EventReminderService()
-        count, sent_to_users = service.send_ticket_reminders(future_event_14_days, event_context, already_sent)
+        count = service.send_ticket_reminders(future_event_14_days, event_context)
+        sent_to_users = {send.kwargs["user"] for send in notify_many_sends(mock_notify_many)}
 
         # Assert
         assert count == 2
-        assert mock_signal.call_count == 2
+        assert len(notify_many_sends(mock_notify_many)) == 2
         assert ticket_holder_1.id in sent_to_users
         assert ticket_holder_2.id in sent_to_users
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     def test_skips_users_with_reminders_disabled(
         self,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         future_event_14_days: Event,
         ticket_holder_1: RevelUser,
         disabled_reminders_user: RevelUser,
@@ -345,23 +346,21 @@ class TestSendTicketReminders:
             "event_url": "https://example.com/events/test",
             "days_until": 14,
         }
-        already_sent: set[tuple[t.Any, str]] = set()
-        sent_to_users: set[t.Any] = set()
-
         # Act
         service = EventReminderService()
-        count, sent_to_users = service.send_ticket_reminders(future_event_14_days, event_context, already_sent)
+        count = service.send_ticket_reminders(future_event_14_days, event_context)
+        sent_to_users = {send.kwargs["user"] for send in notify_many_sends(mock_notify_many)}
 
         # Assert
         assert count == 1  # Only one reminder sent
-        assert mock_signal.call_count == 1
+        assert len(notify_many_sends(mock_notify_many)) == 1
         assert ticket_holder_1.id in sent_to_users
         assert disabled_reminders_user.id not in sent_to_users
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     def test_skips_already_sent_reminders(
         self,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         future_event_14_days: Event,
         ticket_holder_1: RevelUser,
     ) -> None:
@@ -386,21 +385,20 @@ class TestSendTicketReminders:
             "days_until": 14,
         }
         # Mark as already sent
-        already_sent = {(ticket_holder_1.id, str(future_event_14_days.id))}
-        sent_to_users: set[t.Any] = set()
+        SentEventReminder.objects.create(user=ticket_holder_1, event=future_event_14_days, days_until=14)
 
         # Act
         service = EventReminderService()
-        count, sent_to_users = service.send_ticket_reminders(future_event_14_days, event_context, already_sent)
+        count = service.send_ticket_reminders(future_event_14_days, event_context)
 
         # Assert
         assert count == 0
-        mock_signal.assert_not_called()
+        mock_notify_many.assert_not_called()
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     def test_includes_ticket_context(
         self,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         future_event_14_days: Event,
         ticket_holder_1: RevelUser,
     ) -> None:
@@ -424,14 +422,12 @@ class TestSendTicketReminders:
             "event_url": "https://example.com/events/test",
             "days_until": 14,
         }
-        already_sent: set[tuple[t.Any, str]] = set()
-
         # Act
         service = EventReminderService()
-        service.send_ticket_reminders(future_event_14_days, event_context, already_sent)
+        service.send_ticket_reminders(future_event_14_days, event_context)
 
         # Assert
-        call_kwargs = mock_signal.call_args.kwargs
+        call_kwargs = notify_many_sends(mock_notify_many)[-1].kwargs
         assert call_kwargs["context"]["ticket_id"] == str(ticket.id)
         assert call_kwargs["context"]["tier_name"] == ticket_tier.name
 
@@ -439,10 +435,10 @@ class TestSendTicketReminders:
 class TestSendRSVPReminders:
     """Test RSVP reminder sending."""
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     def test_sends_reminders_to_rsvp_attendees(
         self,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         rsvp_event: Event,
         rsvp_user: RevelUser,
         ticket_holder_1: RevelUser,
@@ -469,21 +465,18 @@ class TestSendRSVPReminders:
             "event_url": "https://example.com/events/test",
             "days_until": 7,
         }
-        already_sent: set[tuple[t.Any, str]] = set()
-        sent_to_users: set[t.Any] = set()
-
         # Act
         service = EventReminderService()
-        count = service.send_rsvp_reminders(rsvp_event, event_context, already_sent, sent_to_users)
+        count = service.send_rsvp_reminders(rsvp_event, event_context)
 
         # Assert
         assert count == 2
-        assert mock_signal.call_count == 2
+        assert len(notify_many_sends(mock_notify_many)) == 2
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     def test_includes_rsvp_status_in_context(
         self,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         rsvp_event: Event,
         rsvp_user: RevelUser,
     ) -> None:
@@ -504,27 +497,24 @@ class TestSendRSVPReminders:
             "event_url": "https://example.com/events/test",
             "days_until": 7,
         }
-        already_sent: set[tuple[t.Any, str]] = set()
-        sent_to_users: set[t.Any] = set()
-
         # Act
         service = EventReminderService()
-        service.send_rsvp_reminders(rsvp_event, event_context, already_sent, sent_to_users)
+        service.send_rsvp_reminders(rsvp_event, event_context)
 
         # Assert
-        call_kwargs = mock_signal.call_args.kwargs
+        call_kwargs = notify_many_sends(mock_notify_many)[-1].kwargs
         assert call_kwargs["context"]["rsvp_status"] == EventRSVP.RsvpStatus.YES
 
 
 class TestSendEventReminders:
     """Test main event reminder task."""
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     @patch("common.models.SiteSettings.get_solo")
     def test_sends_reminders_for_14_day_events(
         self,
         mock_site_settings: MagicMock,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         future_event_14_days: Event,
         ticket_holder_1: RevelUser,
     ) -> None:
@@ -546,14 +536,14 @@ class TestSendEventReminders:
 
         # Assert
         assert result["reminders_sent"] > 0
-        mock_signal.assert_called()
+        mock_notify_many.assert_called()
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     @patch("common.models.SiteSettings.get_solo")
     def test_prevents_duplicate_reminders(
         self,
         mock_site_settings: MagicMock,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         future_event_14_days: Event,
         ticket_holder_1: RevelUser,
     ) -> None:
@@ -562,7 +552,7 @@ class TestSendEventReminders:
         mock_site_settings.return_value.frontend_base_url = "https://example.com"
 
         ticket_tier = get_or_create_ticket_tier(future_event_14_days)
-        ticket = Ticket.objects.create(
+        Ticket.objects.create(
             guest_name="Test Guest",
             event=future_event_14_days,
             user=ticket_holder_1,
@@ -570,30 +560,54 @@ class TestSendEventReminders:
             status=Ticket.TicketStatus.ACTIVE,
         )
 
-        # Create existing reminder
-        Notification.objects.create(
-            user=ticket_holder_1,
-            notification_type=NotificationType.EVENT_REMINDER,
-            context={
-                "event_id": str(future_event_14_days.id),
-                "days_until": 14,
-                "ticket_id": str(ticket.id),
-            },
-        )
+        # Reminder already recorded in the ledger
+        SentEventReminder.objects.create(user=ticket_holder_1, event=future_event_14_days, days_until=14)
 
         # Act
         result = send_event_reminders()
 
         # Assert - Should not send duplicate
         assert result["reminders_sent"] == 0
-        mock_signal.assert_not_called()
+        mock_notify_many.assert_not_called()
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
+    @patch("common.models.SiteSettings.get_solo")
+    def test_second_run_sends_nothing(
+        self,
+        mock_site_settings: MagicMock,
+        mock_notify_many: MagicMock,
+        future_event_14_days: Event,
+        ticket_holder_1: RevelUser,
+    ) -> None:
+        """Test that the first run's ledger rows stop the next run from reminding again."""
+        # Arrange
+        mock_site_settings.return_value.frontend_base_url = "https://example.com"
+        Ticket.objects.create(
+            guest_name="Test Guest",
+            event=future_event_14_days,
+            user=ticket_holder_1,
+            tier=get_or_create_ticket_tier(future_event_14_days),
+            status=Ticket.TicketStatus.ACTIVE,
+        )
+
+        # Act
+        first = send_event_reminders()
+        second = send_event_reminders()
+
+        # Assert
+        assert first["reminders_sent"] == 1
+        assert second["reminders_sent"] == 0
+        assert mock_notify_many.call_count == 1
+        assert SentEventReminder.objects.filter(
+            user=ticket_holder_1, event=future_event_14_days, days_until=14
+        ).exists()
+
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     @patch("common.models.SiteSettings.get_solo")
     def test_only_sends_for_open_events(
         self,
         mock_site_settings: MagicMock,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         organization: Organization,
         ticket_holder_1: RevelUser,
     ) -> None:
@@ -628,14 +642,14 @@ class TestSendEventReminders:
 
         # Assert - No reminders for draft events
         assert result["reminders_sent"] == 0
-        mock_signal.assert_not_called()
+        mock_notify_many.assert_not_called()
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     @patch("common.models.SiteSettings.get_solo")
     def test_sends_reminders_for_multiple_time_windows(
         self,
         mock_site_settings: MagicMock,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         organization: Organization,
         ticket_holder_1: RevelUser,
     ) -> None:
@@ -675,14 +689,14 @@ class TestSendEventReminders:
 
         # Assert - Should send 3 reminders (one for each time window)
         assert result["reminders_sent"] == 3
-        assert mock_signal.call_count == 3
+        assert len(notify_many_sends(mock_notify_many)) == 3
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     @patch("common.models.SiteSettings.get_solo")
     def test_handles_rsvp_events_separately(
         self,
         mock_site_settings: MagicMock,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         rsvp_event: Event,
         rsvp_user: RevelUser,
     ) -> None:
@@ -701,18 +715,18 @@ class TestSendEventReminders:
 
         # Assert
         assert result["reminders_sent"] > 0
-        mock_signal.assert_called()
+        mock_notify_many.assert_called()
 
         # Verify RSVP context
-        call_kwargs = mock_signal.call_args.kwargs
+        call_kwargs = notify_many_sends(mock_notify_many)[-1].kwargs
         assert "rsvp_status" in call_kwargs["context"]
 
-    @patch("notifications.signals.notification_requested.send")
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
     @patch("common.models.SiteSettings.get_solo")
     def test_handles_events_with_no_attendees(
         self,
         mock_site_settings: MagicMock,
-        mock_signal: MagicMock,
+        mock_notify_many: MagicMock,
         future_event_14_days: Event,
     ) -> None:
         """Test that events with no attendees don't cause errors."""
@@ -724,4 +738,78 @@ class TestSendEventReminders:
 
         # Assert - Should complete without error
         assert result["reminders_sent"] == 0
-        mock_signal.assert_not_called()
+        mock_notify_many.assert_not_called()
+
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
+    def test_ticket_holder_who_also_rsvpd_is_reminded_once(
+        self,
+        mock_notify_many: MagicMock,
+        rsvp_event: Event,
+        ticket_holder_1: RevelUser,
+    ) -> None:
+        """Test that the RSVP pass skips users the ticket pass already claimed."""
+        # Arrange
+        Ticket.objects.create(
+            guest_name="Test Guest",
+            event=rsvp_event,
+            user=ticket_holder_1,
+            tier=get_or_create_ticket_tier(rsvp_event),
+            status=Ticket.TicketStatus.ACTIVE,
+        )
+        EventRSVP.objects.create(event=rsvp_event, user=ticket_holder_1, status=EventRSVP.RsvpStatus.YES)
+        service = EventReminderService(frontend_base_url="https://example.com")
+        context = service.build_event_context(rsvp_event, 7)
+
+        # Act
+        ticket_count = service.send_ticket_reminders(rsvp_event, context)
+        rsvp_count = service.send_rsvp_reminders(rsvp_event, context)
+
+        # Assert
+        assert (ticket_count, rsvp_count) == (1, 0)
+        sends = notify_many_sends(mock_notify_many)
+        assert len(sends) == 1
+        assert "ticket_id" in sends[0].kwargs["context"]
+
+    @patch("notifications.service.reminder_service.notify_many", side_effect=_notify_all)
+    def test_attendees_are_streamed_in_chunks(
+        self,
+        mock_notify_many: MagicMock,
+        rsvp_event: Event,
+        revel_user_factory: RevelUserFactory,
+    ) -> None:
+        """Test that each chunk of attendees is claimed and notified on its own."""
+        # Arrange
+        users = [revel_user_factory() for _ in range(5)]
+        for user in users:
+            EventRSVP.objects.create(event=rsvp_event, user=user, status=EventRSVP.RsvpStatus.YES)
+        service = EventReminderService(frontend_base_url="https://example.com", chunk_size=2)
+
+        # Act
+        count = service.send_rsvp_reminders(rsvp_event, service.build_event_context(rsvp_event, 7))
+
+        # Assert
+        assert count == 5
+        assert [len(c.args[1]) for c in mock_notify_many.call_args_list] == [2, 2, 1]
+        assert {send.kwargs["user"] for send in notify_many_sends(mock_notify_many)} == {user.id for user in users}
+
+
+class TestClaimRollback:
+    """The ledger claims roll back when notify_many does not notify everyone it was given."""
+
+    @patch("notifications.service.reminder_service.notify_many", return_value=0)
+    def test_failed_notify_releases_the_claims(
+        self, mock_notify_many: MagicMock, future_event_14_days: Event, ticket_holder_1: RevelUser
+    ) -> None:
+        Ticket.objects.create(
+            guest_name="Test Guest",
+            event=future_event_14_days,
+            user=ticket_holder_1,
+            tier=get_or_create_ticket_tier(future_event_14_days),
+            status=Ticket.TicketStatus.ACTIVE,
+        )
+        service = EventReminderService(frontend_base_url="https://example.com")
+        context = service.build_event_context(future_event_14_days, 14)
+
+        assert service.send_ticket_reminders(future_event_14_days, context) == 0
+        mock_notify_many.assert_called_once()
+        assert not SentEventReminder.objects.filter(event=future_event_14_days).exists()
@@ -16,6 +16,7 @@ from django.contrib.gis.geos import Point
 from django.template.loader import render_to_string
 
 from accounts.models import RevelUser
+from conftest import notify_many_sends
 from events.models import Event, EventInvitation, Organization
 from events.models.follow import OrganizationFollow
 from geo.models import City
@@ -152,14 +153,14 @@ class TestFollowerContextTimezone:
             notify_new_events=True,
         )
 
-        with patch("events.signals.notification_requested.send") as mock_send:
+        with patch("events.signals.notify_many") as mock_notify_many:
             with django_capture_on_commit_callbacks(execute=True):
                 vienna_event.status = Event.EventStatus.OPEN
                 vienna_event.save(update_fields=["status"])
 
         calls = [
             c
-            for c in mock_send.call_args_list
+            for c in notify_many_sends(mock_notify_many)
             if c.kwargs.get("notification_type") == NotificationType.NEW_EVENT_FROM_FOLLOWED_ORG
         ]
         assert len(calls) == 1
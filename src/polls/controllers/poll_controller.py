@@ -32,6 +32,7 @@ from polls.schema import (
     PollCreateSchema,
     PollDetailSchema,
     PollDuplicateSchema,
+    PollFreeTextPageSchema,
     PollListItemSchema,
     PollReopenSchema,
     PollResultsSchema,
@@ -40,7 +41,7 @@ from polls.schema import (
 )
 from polls.service import eligibility, poll_service
 from polls.service import user_vote as user_vote_service
-from polls.service.aggregation import compute_poll_results
+from polls.service.aggregation import FREE_TEXT_PAGE_SIZE, compute_poll_results, free_text_page
 from polls.types import UserLike
 
 
@@ -176,6 +177,32 @@ class PollController(UserAwareController):
             poll, viewer_sees_identity=self._viewer_sees_identity(poll, user, _is_staff=is_staff)
         )
 
+    @route.get(
+        "/{poll_id}/results/free-text",
+        url_name="get_poll_free_text_results",
+        response=PollFreeTextPageSchema,
+    )
+    def get_poll_free_text_results(
+        self, poll_id: UUID, cursor: str | None = None, limit: int = FREE_TEXT_PAGE_SIZE
+    ) -> PollFreeTextPageSchema:
+        """Page through a poll's free-text responses, oldest first.
+
+        Pass the ``free_text_next_cursor`` from the results (or ``next_cursor`` from
+        the previous page) as ``cursor``. Same visibility rules as the results.
+        """
+        user = self.maybe_user()
+        poll = t.cast(Poll, self.get_object_or_exception(self._detail_queryset(), pk=poll_id))
+        is_staff = eligibility.is_staff_or_owner(user, poll)
+        if not eligibility.can_see_results(user, poll, _is_staff=is_staff):
+            raise HttpError(403, "You are not allowed to see the results for this poll.")
+        results, next_cursor = free_text_page(
+            poll,
+            viewer_sees_identity=self._viewer_sees_identity(poll, user, _is_staff=is_staff),
+            cursor=cursor,
+            limit=limit,
+        )
+        return PollFreeTextPageSchema(results=results, next_cursor=next_cursor)
+
     # ------------------------------------------------------------------ writes
 
     @route.post(
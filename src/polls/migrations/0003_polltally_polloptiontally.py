@@ -0,0 +1,31 @@
+# Generated by Django 5.2.14 on 2026-10-16 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0002_add_close_polls_periodic_task'),
+        ('questionnaires', '0012_alter_questionnaire_llm_backend'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PollTally',
+            fields=[
+                ('poll', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='tally', serialize=False, to='polls.poll')),
+                ('voter_count', models.IntegerField(default=0)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PollOptionTally',
+            fields=[
+                ('option', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='poll_tally', serialize=False, to='questionnaires.multiplechoiceoption')),
+                ('count', models.IntegerField(default=0)),
+                ('poll', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='option_tallies', to='polls.poll')),
+            ],
+        ),
+    ]
@@ -0,0 +1,37 @@
+import typing as t
+
+from django.apps.registry import Apps
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+
+def create_reconcile_poll_tallies_periodic_task(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    IntervalSchedule: t.Any = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask: t.Any = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = IntervalSchedule.objects.get_or_create(every=15, period="minutes")
+    PeriodicTask.objects.update_or_create(
+        name="Reconcile poll tallies",
+        defaults={
+            "task": "polls.tasks.reconcile_poll_tallies",
+            "interval": schedule,
+            "enabled": True,
+        },
+    )
+
+
+def delete_reconcile_poll_tallies_periodic_task(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    PeriodicTask: t.Any = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Reconcile poll tallies").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0003_polltally_polloptiontally"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_reconcile_poll_tallies_periodic_task, reverse_code=delete_reconcile_poll_tallies_periodic_task),
+    ]
@@ -329,3 +329,39 @@ class Poll(TimeStampedModel):
             ):
                 raise PollAnonymityImmutableError()
         super().save(*args, **kwargs)
+
+
+class PollTally(models.Model):
+    """Live voter count for a poll, read by results instead of re-aggregating submissions.
+
+    Maintained by ``polls.service.tally`` (see its module docstring for the
+    consistency model); created on the poll's first vote or results read.
+    """
+
+    poll = models.OneToOneField(Poll, on_delete=models.CASCADE, primary_key=True, related_name="tally")
+    # Plain integers: a drifted counter may briefly dip below zero until reconciled,
+    # and must never fail the vote that moves it.
+    voter_count = models.IntegerField(default=0)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"PollTally<{self.poll_id}> ({self.voter_count})"
+
+
+class PollOptionTally(models.Model):
+    """Live answer count for one multiple-choice option of a poll (see :class:`PollTally`).
+
+    Options nobody picked have no row; results treat a missing row as zero.
+    """
+
+    option = models.OneToOneField(
+        "questionnaires.MultipleChoiceOption",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="poll_tally",
+    )
+    poll = models.ForeignKey(Poll, on_delete=models.CASCADE, related_name="option_tallies")
+    count = models.IntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"PollOptionTally<{self.option_id}> ({self.count})"
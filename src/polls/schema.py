@@ -305,9 +305,23 @@ class PollMcQuestionStatSchema(Schema):
 
 
 class PollResultsSchema(Schema):
+    """Poll results.
+
+    ``free_text_responses`` is the first page; when ``free_text_next_cursor`` is
+    set, fetch the rest from the free-text results endpoint.
+    """
+
     total_voters: int
     mc_question_stats: list[PollMcQuestionStatSchema] = Field(default_factory=list)
     free_text_responses: list[PollFreeTextResponseSchema] = Field(default_factory=list)
+    free_text_next_cursor: str | None = None
+
+
+class PollFreeTextPageSchema(Schema):
+    """A page of free-text responses; ``next_cursor`` is ``None`` on the last page."""
+
+    results: list[PollFreeTextResponseSchema]
+    next_cursor: str | None = None
 
 
 PollDetailSchema.model_rebuild()
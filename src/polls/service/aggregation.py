@@ -1,16 +1,20 @@
 """Aggregate poll results for the API response.
 
-Reuses :func:`events.service.event_questionnaire_service.aggregate_mc_distributions`
-to compute the multiple-choice statistics and adds poll-specific free-text
-aggregation that honours the anonymity contract (see :class:`polls.models.Poll`).
+Counts come from the live counters in :mod:`polls.service.tally`, so a results
+request no longer re-aggregates every submission. Free-text responses are paged
+with a keyset cursor (see :func:`free_text_page`), and voter identity is attached
+only as the anonymity contract allows (see :class:`polls.models.Poll`).
 """
 
+import base64
+import binascii
 from collections import defaultdict
+from datetime import datetime
 from uuid import UUID
 
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 
-from events.service.event_questionnaire_service import aggregate_mc_distributions
+from polls.exceptions import PollValidationError
 from polls.models import Poll
 from polls.schema import (
     PollFreeTextResponseSchema,
@@ -19,7 +23,11 @@ from polls.schema import (
     PollResultsSchema,
     PollVoterSchema,
 )
-from questionnaires.models import FreeTextAnswer, MultipleChoiceAnswer, QuestionnaireSubmission
+from polls.service import tally
+from questionnaires.models import FreeTextAnswer, MultipleChoiceAnswer, MultipleChoiceOption, QuestionnaireSubmission
+
+FREE_TEXT_PAGE_SIZE = 50
+FREE_TEXT_MAX_PAGE_SIZE = 200
 
 
 def compute_poll_results(poll: Poll, *, viewer_sees_identity: bool) -> PollResultsSchema:
@@ -35,92 +43,128 @@ def compute_poll_results(poll: Poll, *, viewer_sees_identity: bool) -> PollResul
             and MC ``voters`` stays ``None``).
 
     Returns:
-        A :class:`PollResultsSchema` with the total voter count,
-        multiple-choice distributions, and free-text responses.
+        A :class:`PollResultsSchema` with the total voter count, multiple-choice
+        distributions, and the first page of free-text responses
+        (``free_text_next_cursor`` continues it).
     """
-    base_qs = QuestionnaireSubmission.objects.filter(
-        questionnaire_id=poll.questionnaire_id,
-        status=QuestionnaireSubmission.QuestionnaireSubmissionStatus.READY,
-        submitted_at__isnull=False,
-    )
-    total_voters = base_qs.values("user_id").distinct().count()
-    mc_stats = _build_mc_question_stats(poll, base_qs, viewer_sees_identity=viewer_sees_identity)
-
-    # ``submission__user`` is select_related only when the viewer is allowed
-    # to see identity, so we don't pay for the join in the anonymous path.
-    ft_answers = FreeTextAnswer.objects.filter(submission__in=base_qs).order_by("submission__submitted_at", "id")
-    if viewer_sees_identity:
-        ft_answers = ft_answers.select_related("submission__user")
-    else:
-        ft_answers = ft_answers.select_related("submission")
-
-    free_text_responses: list[PollFreeTextResponseSchema] = []
-    for ans in ft_answers:
-        submitted_at = ans.submission.submitted_at
-        if submitted_at is None:  # pragma: no cover - filtered out in base_qs above
-            continue
-        if viewer_sees_identity:
-            voter = ans.submission.user
-            free_text_responses.append(
-                PollFreeTextResponseSchema(
-                    question_id=ans.question_id,
-                    answer=ans.answer,
-                    answered_at=submitted_at,
-                    user_id=voter.id,
-                    user_display_name=voter.get_display_name(),
-                    user_email=voter.email,
-                )
-            )
-        else:
-            free_text_responses.append(
-                PollFreeTextResponseSchema(
-                    question_id=ans.question_id,
-                    answer=ans.answer,
-                    answered_at=submitted_at,
-                )
-            )
-
+    total_voters, option_counts = tally.read(poll)
+    mc_stats = _build_mc_question_stats(poll, option_counts, viewer_sees_identity=viewer_sees_identity)
+    free_text_responses, next_cursor = free_text_page(poll, viewer_sees_identity=viewer_sees_identity)
     return PollResultsSchema(
         total_voters=total_voters,
         mc_question_stats=mc_stats,
         free_text_responses=free_text_responses,
+        free_text_next_cursor=next_cursor,
+    )
+
+
+def free_text_page(
+    poll: Poll,
+    *,
+    viewer_sees_identity: bool,
+    cursor: str | None = None,
+    limit: int = FREE_TEXT_PAGE_SIZE,
+) -> tuple[list[PollFreeTextResponseSchema], str | None]:
+    """One page of free-text responses in submission order, and the cursor for the next.
+
+    Keyset-paginated on (submission time, answer id), so deep pages cost the same as
+    the first and votes arriving between requests never shift or repeat entries.
+
+    Raises:
+        PollValidationError: when ``cursor`` is malformed.
+    """
+    limit = max(1, min(limit, FREE_TEXT_MAX_PAGE_SIZE))
+    # ``submission__user`` is select_related only when the viewer is allowed
+    # to see identity, so we don't pay for the join in the anonymous path.
+    answers = FreeTextAnswer.objects.filter(submission__in=tally.counted_submissions(poll.questionnaire_id)).order_by(
+        "submission__submitted_at", "id"
+    )
+    if cursor is not None:
+        submitted_at, answer_id = _decode_cursor(cursor)
+        answers = answers.filter(
+            Q(submission__submitted_at__gt=submitted_at) | Q(submission__submitted_at=submitted_at, id__gt=answer_id)
+        )
+    answers = answers.select_related("submission__user" if viewer_sees_identity else "submission")
+
+    page = list(answers[: limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+    next_cursor = None
+    if has_more:
+        last = page[-1]
+        assert last.submission.submitted_at is not None  # counted submissions are submitted
+        next_cursor = _encode_cursor(last.submission.submitted_at, last.id)
+    return [_free_text_response(ans, viewer_sees_identity=viewer_sees_identity) for ans in page], next_cursor
+
+
+def _free_text_response(ans: FreeTextAnswer, *, viewer_sees_identity: bool) -> PollFreeTextResponseSchema:
+    submitted_at = ans.submission.submitted_at
+    assert submitted_at is not None  # counted submissions are submitted
+    if not viewer_sees_identity:
+        return PollFreeTextResponseSchema(question_id=ans.question_id, answer=ans.answer, answered_at=submitted_at)
+    voter = ans.submission.user
+    return PollFreeTextResponseSchema(
+        question_id=ans.question_id,
+        answer=ans.answer,
+        answered_at=submitted_at,
+        user_id=voter.id,
+        user_display_name=voter.get_display_name(),
+        user_email=voter.email,
     )
 
 
+def _encode_cursor(submitted_at: datetime, answer_id: UUID) -> str:
+    return base64.urlsafe_b64encode(f"{submitted_at.isoformat()}|{answer_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        submitted_at, answer_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(submitted_at), UUID(answer_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise PollValidationError("Invalid free-text cursor.") from exc
+
+
 def _build_mc_question_stats(
     poll: Poll,
-    base_qs: QuerySet[QuestionnaireSubmission],
+    option_counts: dict[UUID, int],
     *,
     viewer_sees_identity: bool,
 ) -> list[PollMcQuestionStatSchema]:
-    """Build the poll MC stats, attaching per-option voters when allowed.
-
-    The aggregate counts come from the shared
-    :func:`events.service.event_questionnaire_service.aggregate_mc_distributions`
-    helper; this wraps them in the poll-specific schema and, when
-    ``viewer_sees_identity`` is True, attaches the voter list to each option.
-    When identity is hidden, ``voters`` is ``None`` (not ``[]``) so the FE can
-    tell "anonymous poll" apart from "nobody picked this option".
+    """Build the poll MC stats from the live counters, attaching per-option voters when allowed.
+
+    When ``viewer_sees_identity`` is False, ``voters`` is ``None`` (not ``[]``)
+    so the FE can tell "anonymous poll" apart from "nobody picked this option".
     """
-    aggregate = aggregate_mc_distributions(poll.questionnaire_id, base_qs)
-    voters_by_option = _mc_voters_by_option(poll.questionnaire_id, base_qs) if viewer_sees_identity else {}
-    return [
-        PollMcQuestionStatSchema(
-            question_id=question.question_id,
-            question_text=question.question_text,
-            options=[
-                PollMcOptionStatSchema(
-                    option_id=option.option_id,
-                    option_text=option.option_text,
-                    is_correct=option.is_correct,
-                    count=option.count,
-                    voters=(voters_by_option.get(option.option_id, []) if viewer_sees_identity else None),
-                )
-                for option in question.options
-            ],
+    options = (
+        MultipleChoiceOption.objects.filter(question__questionnaire_id=poll.questionnaire_id)
+        .values("id", "option", "is_correct", "question_id", "question__question")
+        .order_by("question__order", "order")
+    )
+    voters_by_option = (
+        _mc_voters_by_option(poll.questionnaire_id, tally.counted_submissions(poll.questionnaire_id))
+        if viewer_sees_identity
+        else {}
+    )
+
+    questions: dict[UUID, PollMcQuestionStatSchema] = {}
+    for row in options:
+        question_id = row["question_id"]
+        if question_id not in questions:
+            questions[question_id] = PollMcQuestionStatSchema(
+                question_id=question_id, question_text=row["question__question"], options=[]
+            )
+        question = questions[question_id]
+        question.options.append(
+            PollMcOptionStatSchema(
+                option_id=row["id"],
+                option_text=row["option"],
+                is_correct=row["is_correct"],
+                count=option_counts.get(row["id"], 0),
+                voters=(voters_by_option.get(row["id"], []) if viewer_sees_identity else None),
+            )
         )
-        for question in aggregate
-    ]
+    return list(questions.values())
 
 
 def _mc_voters_by_option(
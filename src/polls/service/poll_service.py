@@ -37,6 +37,7 @@ from polls.schema import (
     PollUpdateSchema,
     PollVoteSchema,
 )
+from polls.service import tally
 from polls.signals import suppress_question_lock
 from questionnaires.models import Questionnaire, QuestionnaireSubmission
 from questionnaires.schema import QuestionnaireCreateSchema
@@ -559,7 +560,8 @@ def vote(
 
     Acquires ``SELECT FOR UPDATE`` on the Poll row so that close races resolve
     deterministically. Single submission per (user, questionnaire); replaced
-    in place when ``allow_vote_changes`` is True.
+    in place when ``allow_vote_changes`` is True. The poll's live counters
+    (:mod:`polls.service.tally`) move in the same transaction.
 
     Args:
         user: Authenticated user casting the vote.
@@ -592,7 +594,9 @@ def vote(
         if existing is not None and not poll.allow_vote_changes:
             raise PollVoteAlreadyCastError()
 
+        removed: list[UUID] = []
         if existing is None:
+            was_counted = False
             submission = QuestionnaireSubmission.objects.create(
                 user=user,
                 questionnaire=poll.questionnaire,
@@ -600,13 +604,22 @@ def vote(
                 submitted_at=timezone.now(),
             )
         else:
+            was_counted = tally.is_counted(existing)
             submission = existing
             submission.status = QuestionnaireSubmission.QuestionnaireSubmissionStatus.READY
             submission.submitted_at = timezone.now()
             submission.save(update_fields=["status", "submitted_at", "updated_at"])
-            _clear_answers(submission)
+            cleared = _clear_answers(submission)
+            # An uncounted submission's answers were never in the tally.
+            removed = cleared if was_counted else []
 
         _write_answers(submission, payload)
+        tally.apply_vote(
+            poll.pk,
+            voters=0 if was_counted else 1,
+            added=[option_id for mc in payload.mc_answers for option_id in mc.option_ids],
+            removed=removed,
+        )
         return submission
 
 
@@ -633,16 +646,32 @@ def withdraw_vote(*, user: t.Any, poll_id: UUID) -> None:
             raise PollNotOpenError()
         if not poll.allow_vote_changes:
             raise PollVoteChangesNotAllowedError()
-        QuestionnaireSubmission.objects.filter(user=user, questionnaire=poll.questionnaire).delete()
+        for submission in QuestionnaireSubmission.objects.filter(user=user, questionnaire=poll.questionnaire):
+            if tally.is_counted(submission):
+                tally.apply_vote(poll.pk, voters=-1, removed=_mc_option_ids(submission))
+            submission.delete()
+
+
+def _mc_option_ids(submission: QuestionnaireSubmission) -> list[UUID]:
+    """One option id per multiple-choice answer row of the submission."""
+    from questionnaires.models import MultipleChoiceAnswer
+
+    return list(MultipleChoiceAnswer.objects.filter(submission=submission).values_list("option_id", flat=True))
 
 
-def _clear_answers(submission: QuestionnaireSubmission) -> None:
-    """Remove all answers tied to a submission prior to rewriting them."""
+def _clear_answers(submission: QuestionnaireSubmission) -> list[UUID]:
+    """Remove all answers tied to a submission prior to rewriting them.
+
+    Returns:
+        The option ids of the removed multiple-choice answers, for the tally.
+    """
     from questionnaires.models import FileUploadAnswer, FreeTextAnswer, MultipleChoiceAnswer
 
+    removed = _mc_option_ids(submission)
     MultipleChoiceAnswer.objects.filter(submission=submission).delete()
     FreeTextAnswer.objects.filter(submission=submission).delete()
     FileUploadAnswer.objects.filter(submission=submission).delete()
+    return removed
 
 
 def _write_answers(submission: QuestionnaireSubmission, payload: PollVoteSchema) -> None:
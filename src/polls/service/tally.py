@@ -0,0 +1,132 @@
+"""Live vote counters behind poll results.
+
+Results read the voter count and per-option counts from :class:`PollTally` /
+:class:`PollOptionTally` rather than re-aggregating every submission per request.
+
+``poll_service.vote`` and ``withdraw_vote`` move the counters through
+:func:`apply_vote` inside their own transaction, while holding the poll's row lock:
+the counters commit or roll back with the vote, and votes on one poll serialize.
+Writes that bypass the service (an account deletion cascading to its submissions,
+admin edits) drift the counters until :func:`reconcile` recounts them — from the
+periodic ``polls.tasks.reconcile_poll_tallies`` sweep, or on the first vote or
+results read of a poll that has no tally yet.
+"""
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from uuid import UUID
+
+import structlog
+from django.db import transaction
+from django.db.models import Count, F, QuerySet
+from django.utils import timezone
+
+from polls.models import Poll, PollOptionTally, PollTally
+from questionnaires.models import MultipleChoiceAnswer, QuestionnaireSubmission
+
+logger = structlog.get_logger(__name__)
+
+
+def counted_submissions(questionnaire_id: UUID) -> QuerySet[QuestionnaireSubmission]:
+    """The submissions a poll's results count: READY and submitted."""
+    return QuestionnaireSubmission.objects.filter(
+        questionnaire_id=questionnaire_id,
+        status=QuestionnaireSubmission.QuestionnaireSubmissionStatus.READY,
+        submitted_at__isnull=False,
+    )
+
+
+def is_counted(submission: QuestionnaireSubmission) -> bool:
+    """Whether ``submission`` is one :func:`counted_submissions` would return."""
+    return (
+        submission.status == QuestionnaireSubmission.QuestionnaireSubmissionStatus.READY
+        and submission.submitted_at is not None
+    )
+
+
+def apply_vote(poll_id: UUID, *, voters: int, added: Iterable[UUID] = (), removed: Iterable[UUID] = ()) -> None:
+    """Move the poll's counters by one vote change, after its answer rows are written.
+
+    Must run in the vote's transaction, under the poll's row lock.
+
+    Args:
+        poll_id: The poll voted on.
+        voters: +1 for a new vote, -1 for a withdrawn one, 0 for a replaced one.
+        added: Option ids of the answer rows written (one per row).
+        removed: Option ids of the answer rows deleted.
+    """
+    if not PollTally.objects.filter(poll_id=poll_id).update(voter_count=F("voter_count") + voters):
+        # First vote since the counters existed: the recount already includes this one.
+        _recount(poll_id)
+        return
+
+    deltas = Counter(added)
+    deltas.subtract(removed)
+    option_ids_by_delta: dict[int, list[UUID]] = defaultdict(list)
+    for option_id, delta in deltas.items():
+        if delta:
+            option_ids_by_delta[delta].append(option_id)
+    if not option_ids_by_delta:
+        return
+
+    PollOptionTally.objects.bulk_create(
+        [PollOptionTally(poll_id=poll_id, option_id=option_id) for option_id, delta in deltas.items() if delta],
+        ignore_conflicts=True,
+    )
+    for delta, option_ids in option_ids_by_delta.items():
+        PollOptionTally.objects.filter(option_id__in=option_ids).update(count=F("count") + delta)
+
+
+def read(poll: Poll) -> tuple[int, dict[UUID, int]]:
+    """The poll's voter count and per-option counts (options nobody picked are absent)."""
+    tally = PollTally.objects.filter(poll_id=poll.pk).values_list("voter_count", flat=True).first()
+    if tally is None:
+        reconcile(poll.pk)
+        tally = PollTally.objects.values_list("voter_count", flat=True).get(poll_id=poll.pk)
+    option_counts = dict(PollOptionTally.objects.filter(poll_id=poll.pk).values_list("option_id", "count"))
+    return tally, option_counts
+
+
+def reconcile(poll_id: UUID) -> bool:
+    """Recount the poll's counters from its submissions under the poll's row lock.
+
+    Returns:
+        True if the stored counters had drifted (or did not exist yet).
+    """
+    with transaction.atomic():
+        list(Poll.objects.select_for_update().filter(pk=poll_id).values_list("pk", flat=True))
+        return _recount(poll_id)
+
+
+def _recount(poll_id: UUID) -> bool:
+    questionnaire_id = Poll.objects.values_list("questionnaire_id", flat=True).get(pk=poll_id)
+    submissions = counted_submissions(questionnaire_id)
+    voter_count = submissions.values("user_id").distinct().count()
+    option_counts = dict(
+        MultipleChoiceAnswer.objects.filter(submission__in=submissions)
+        .values("option_id")
+        .annotate(n=Count("id"))
+        .values_list("option_id", "n")
+    )
+
+    stored_voters = PollTally.objects.filter(poll_id=poll_id).values_list("voter_count", flat=True).first()
+    stored_options = {
+        option_id: count
+        for option_id, count in PollOptionTally.objects.filter(poll_id=poll_id).values_list("option_id", "count")
+        if count
+    }
+    drifted = stored_voters != voter_count or stored_options != option_counts
+    if drifted and stored_voters is not None:
+        logger.warning("poll_tally_drift", poll_id=str(poll_id), stored_voters=stored_voters, actual_voters=voter_count)
+
+    PollTally.objects.update_or_create(
+        poll_id=poll_id, defaults={"voter_count": voter_count, "reconciled_at": timezone.now()}
+    )
+    PollOptionTally.objects.filter(poll_id=poll_id).exclude(option_id__in=list(option_counts)).delete()
+    PollOptionTally.objects.bulk_create(
+        [PollOptionTally(poll_id=poll_id, option_id=option_id, count=n) for option_id, n in option_counts.items()],
+        update_conflicts=True,
+        unique_fields=["option"],
+        update_fields=["count"],
+    )
+    return drifted
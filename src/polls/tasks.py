@@ -1,10 +1,14 @@
 """Celery tasks for polls."""
 
+from datetime import timedelta
+
 from celery import shared_task
 from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from polls.models import Poll
+from polls.service import tally
 
 
 @shared_task(name="polls.tasks.close_polls_due")
@@ -38,3 +42,28 @@ def close_polls_due() -> int:
             locked.save(update_fields=["status", "closed_at", "updated_at"])
             closed += 1
     return closed
+
+
+# Closed polls stop receiving votes; a day is plenty to catch drift from their last writes.
+RECONCILE_CLOSED_WITHIN = timedelta(days=1)
+
+
+@shared_task(name="polls.tasks.reconcile_poll_tallies")
+def reconcile_poll_tallies() -> int:
+    """Recount the live counters of open and recently closed polls.
+
+    Catches drift from writes that bypass ``poll_service`` (see
+    :mod:`polls.service.tally`). Each poll is recounted in its own transaction
+    under its row lock; IDs are materialized for the same PgBouncer reason as
+    :func:`close_polls_due`.
+
+    Returns:
+        The number of polls whose counters had drifted.
+    """
+    poll_ids = list(
+        Poll.objects.filter(
+            Q(status=Poll.PollStatus.OPEN)
+            | Q(status=Poll.PollStatus.CLOSED, closed_at__gte=timezone.now() - RECONCILE_CLOSED_WITHIN)
+        ).values_list("id", flat=True)
+    )
+    return sum(tally.reconcile(poll_id) for poll_id in poll_ids)
@@ -0,0 +1,135 @@
+"""Tests for the live poll counters and the paged free-text results."""
+
+import typing as t
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from events.models.mixins import ResourceVisibility
+from polls.exceptions import PollValidationError
+from polls.models import Poll, PollOptionTally, PollTally
+from polls.schema import FreeTextAnswerInput, McAnswerInput, PollVoteSchema
+from polls.service import poll_service, tally
+from polls.service.aggregation import compute_poll_results, free_text_page
+from polls.tasks import reconcile_poll_tallies
+from questionnaires.models import (
+    FreeTextQuestion,
+    MultipleChoiceAnswer,
+    MultipleChoiceOption,
+    MultipleChoiceQuestion,
+    Questionnaire,
+    QuestionnaireSubmission,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def live_poll(organization: t.Any) -> tuple[Poll, MultipleChoiceQuestion, list[MultipleChoiceOption], FreeTextQuestion]:
+    """An OPEN poll allowing vote changes, with one MC question (3 options) and one free-text question."""
+    q = Questionnaire.objects.create(name="Live Q")
+    # Build questions BEFORE the poll so the question-lockdown signal allows mutations.
+    mcq = MultipleChoiceQuestion.objects.create(questionnaire=q, question="pick", allow_multiple_answers=True)
+    options = [MultipleChoiceOption.objects.create(question=mcq, option=f"o-{i}") for i in range(3)]
+    ftq = FreeTextQuestion.objects.create(questionnaire=q, question="why?")
+    poll = Poll.objects.create(
+        organization=organization,
+        questionnaire=q,
+        vote_visibility=ResourceVisibility.PUBLIC,
+        status=Poll.PollStatus.OPEN,
+        opened_at=timezone.now(),
+        allow_vote_changes=True,
+    )
+    return poll, mcq, options, ftq
+
+
+def _vote(poll: Poll, mcq: MultipleChoiceQuestion, user: t.Any, *options: MultipleChoiceOption) -> None:
+    poll_service.vote(
+        user=user,
+        poll_id=poll.id,
+        payload=PollVoteSchema(mc_answers=[McAnswerInput(question_id=mcq.id, option_ids=[o.id for o in options])]),
+    )
+
+
+def _counts(poll: Poll) -> tuple[int, dict[t.Any, int]]:
+    voters, option_counts = tally.read(poll)
+    return voters, {option_id: n for option_id, n in option_counts.items() if n}
+
+
+def test_votes_changes_and_withdrawals_keep_counters_exact(
+    live_poll: tuple[Poll, MultipleChoiceQuestion, list[MultipleChoiceOption], FreeTextQuestion],
+    revel_user_factory: t.Any,
+) -> None:
+    poll, mcq, (a, b, c), _ = live_poll
+    alice, bob, carol = revel_user_factory(), revel_user_factory(), revel_user_factory()
+
+    _vote(poll, mcq, alice, a, b)
+    _vote(poll, mcq, bob, a)
+    _vote(poll, mcq, carol, c)
+    _vote(poll, mcq, bob, b, c)  # change
+    poll_service.withdraw_vote(user=carol, poll_id=poll.id)
+
+    assert _counts(poll) == (2, {a.id: 1, b.id: 2, c.id: 1})
+    assert tally.reconcile(poll.id) is False
+
+
+def test_results_are_served_from_the_counters(
+    live_poll: tuple[Poll, MultipleChoiceQuestion, list[MultipleChoiceOption], FreeTextQuestion],
+    revel_user_factory: t.Any,
+) -> None:
+    poll, mcq, (a, *_), _ = live_poll
+    for _ in range(3):
+        _vote(poll, mcq, revel_user_factory(), a)
+
+    with CaptureQueriesContext(connection) as queries:
+        result = compute_poll_results(poll, viewer_sees_identity=False)
+
+    assert result.total_voters == 3
+    assert result.mc_question_stats[0].options[0].count == 3
+    assert not any("COUNT(" in query["sql"].upper() for query in queries.captured_queries)
+
+
+def test_reconcile_repairs_drift_from_writes_behind_the_service(
+    live_poll: tuple[Poll, MultipleChoiceQuestion, list[MultipleChoiceOption], FreeTextQuestion],
+    revel_user_factory: t.Any,
+) -> None:
+    poll, mcq, (a, b, _), _ = live_poll
+    _vote(poll, mcq, revel_user_factory(), a)
+    sub = QuestionnaireSubmission.objects.create(
+        user=revel_user_factory(),
+        questionnaire=poll.questionnaire,
+        status=QuestionnaireSubmission.QuestionnaireSubmissionStatus.READY,
+        submitted_at=timezone.now(),
+    )
+    MultipleChoiceAnswer.objects.create(submission=sub, question=mcq, option=b)
+    assert _counts(poll) == (1, {a.id: 1})
+
+    assert reconcile_poll_tallies() == 1
+
+    assert _counts(poll) == (2, {a.id: 1, b.id: 1})
+    assert PollTally.objects.get(poll=poll).reconciled_at is not None
+    assert PollOptionTally.objects.filter(poll=poll).count() == 2
+
+
+def test_free_text_is_cursor_paginated(
+    live_poll: tuple[Poll, MultipleChoiceQuestion, list[MultipleChoiceOption], FreeTextQuestion],
+    revel_user_factory: t.Any,
+) -> None:
+    poll, _, _, ftq = live_poll
+    for i in range(5):
+        poll_service.vote(
+            user=revel_user_factory(),
+            poll_id=poll.id,
+            payload=PollVoteSchema(free_text_answers=[FreeTextAnswerInput(question_id=ftq.id, answer=f"answer {i}")]),
+        )
+
+    first, cursor = free_text_page(poll, viewer_sees_identity=False, limit=2)
+    second, cursor = free_text_page(poll, viewer_sees_identity=False, cursor=cursor, limit=2)
+    third, cursor = free_text_page(poll, viewer_sees_identity=False, cursor=cursor, limit=2)
+
+    assert [r.answer for r in first + second + third] == [f"answer {i}" for i in range(5)]
+    assert cursor is None
+    with pytest.raises(PollValidationError):
+        free_text_page(poll, viewer_sees_identity=False, cursor="not-a-cursor")
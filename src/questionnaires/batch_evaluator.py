@@ -0,0 +1,228 @@
+"""Evaluate many submissions of one questionnaire together.
+
+After an application deadline, submissions queue up faster than one task and one
+LLM call per submission can drain them. :func:`evaluate_submissions` runs the
+scoring steps that need no LLM for a whole batch, lets a
+:class:`~questionnaires.llms.llm_interfaces.PrescreeningEvaluator` backend screen
+every answer in one pass, sends the remaining LLM calls concurrently (at most
+``LLM_BATCH_CONCURRENCY`` in flight, paced to the backend's
+``max_requests_per_second``), and writes the evaluations with one bulk insert.
+
+The pacing is per worker process: each batch run gets its own limiter.
+"""
+
+import asyncio
+import time
+import typing as t
+from collections.abc import Sequence
+from uuid import UUID
+
+import structlog
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_save
+
+from questionnaires.evaluator import SubmissionEvaluator
+from questionnaires.llms.llm_interfaces import (
+    AnswerToEvaluate,
+    EvaluationResponse,
+    FreeTextEvaluator,
+    PrescreeningEvaluator,
+)
+from questionnaires.models import QuestionnaireEvaluation, QuestionnaireSubmission
+
+logger = structlog.get_logger(__name__)
+
+
+def pending_submissions(
+    questionnaire_id: UUID | str, *, after: UUID | str | None = None
+) -> QuerySet[QuestionnaireSubmission]:
+    """Submitted submissions of the questionnaire that have no evaluation yet, oldest first.
+
+    ``after`` resumes past that submission in the same order.
+    """
+    pending = QuestionnaireSubmission.objects.filter(
+        questionnaire_id=questionnaire_id,
+        status=QuestionnaireSubmission.QuestionnaireSubmissionStatus.READY,
+        evaluation__isnull=True,
+    ).order_by("submitted_at", "id")
+    if after is not None:
+        cursor = QuestionnaireSubmission.objects.filter(pk=after).values_list("submitted_at", flat=True).first()
+        if cursor is not None:
+            pending = pending.filter(Q(submitted_at__gt=cursor) | Q(submitted_at=cursor, id__gt=after))
+    return pending
+
+
+def evaluate_submissions(
+    questionnaire_id: UUID | str,
+    submission_ids: Sequence[UUID],
+    *,
+    llm_evaluator: FreeTextEvaluator | None = None,
+) -> int:
+    """Evaluate the given pending submissions of one questionnaire as a batch.
+
+    Submissions that are no longer pending are skipped. A failed LLM call leaves its
+    submission pending for a later run without failing the rest of the batch.
+
+    Returns:
+        Number of evaluations written.
+    """
+    questionnaire = SubmissionEvaluator.load_questionnaire(UUID(str(questionnaire_id)))
+    llm_evaluator = llm_evaluator or questionnaire.get_llm_backend()
+    submissions = pending_submissions(questionnaire_id).filter(pk__in=submission_ids).select_related("questionnaire")
+    evaluators = [
+        SubmissionEvaluator(submission, llm_evaluator, questionnaire=questionnaire) for submission in submissions
+    ]
+    if not evaluators:
+        return 0
+
+    prepared = [(evaluator, evaluator.prepare()) for evaluator in evaluators]
+    needs_llm = [(evaluator, questions) for evaluator, questions in prepared if questions]
+    logger.info(
+        "questionnaire_batch_evaluation_started",
+        questionnaire_id=str(questionnaire_id),
+        submissions=len(evaluators),
+        llm_calls=len(needs_llm),
+        llm_backend=llm_evaluator.__class__.__name__,
+    )
+    responses = _evaluate_concurrently(
+        llm_evaluator, [questions for _, questions in needs_llm], questionnaire.llm_guidelines
+    )
+
+    failed: set[UUID] = set()
+    for (evaluator, _), response in zip(needs_llm, responses, strict=True):
+        if isinstance(response, Exception):
+            logger.error(
+                "questionnaire_batch_evaluation_llm_failed",
+                submission_id=str(evaluator.submission.id),
+                error=str(response),
+                exc_info=response,
+            )
+            failed.add(evaluator.submission.id)
+            continue
+        evaluator.apply_llm_response(response)
+
+    written = _persist([evaluator for evaluator in evaluators if evaluator.submission.id not in failed])
+    logger.info(
+        "questionnaire_batch_evaluation_completed",
+        questionnaire_id=str(questionnaire_id),
+        written=written,
+        failed=len(failed),
+    )
+    return written
+
+
+def _evaluate_concurrently(
+    llm_evaluator: FreeTextEvaluator,
+    batches: list[list[AnswerToEvaluate]],
+    questionnaire_guidelines: str | None,
+) -> list[EvaluationResponse | Exception]:
+    """One response (or the exception raised) per batch, in order."""
+    if not batches:
+        return []
+    evaluate: t.Callable[..., EvaluationResponse]
+    if isinstance(llm_evaluator, PrescreeningEvaluator):
+        screened = llm_evaluator.prescreen(batches)
+        evaluate = llm_evaluator.evaluate_prescreened
+    else:
+        screened = [None] * len(batches)
+        evaluate = llm_evaluator.evaluate
+
+    to_call = [i for i, response in enumerate(screened) if response is None]
+    called = asyncio.run(
+        _call_all(
+            evaluate,
+            [batches[i] for i in to_call],
+            questionnaire_guidelines,
+            requests_per_second=llm_evaluator.max_requests_per_second,
+        )
+    )
+    responses: list[EvaluationResponse | Exception | None] = list(screened)
+    for i, response in zip(to_call, called, strict=True):
+        responses[i] = response
+    return t.cast(list[EvaluationResponse | Exception], responses)
+
+
+async def _call_all(
+    evaluate: t.Callable[..., EvaluationResponse],
+    batches: list[list[AnswerToEvaluate]],
+    questionnaire_guidelines: str | None,
+    *,
+    requests_per_second: float | None,
+) -> list[EvaluationResponse | Exception]:
+    semaphore = asyncio.Semaphore(settings.LLM_BATCH_CONCURRENCY)
+    limiter = _RateLimiter(requests_per_second)
+
+    async def call(batch: list[AnswerToEvaluate]) -> EvaluationResponse | Exception:
+        async with semaphore:
+            await limiter.wait()
+            try:
+                # Backends are synchronous clients: each call gets a thread, the semaphore bounds them.
+                return await asyncio.to_thread(
+                    evaluate, questions_to_evaluate=batch, questionnaire_guidelines=questionnaire_guidelines
+                )
+            except Exception as exc:
+                return exc
+
+    return list(await asyncio.gather(*(call(batch) for batch in batches)))
+
+
+class _RateLimiter:
+    """Spaces call starts at least ``1 / requests_per_second`` apart; unlimited when None."""
+
+    def __init__(self, requests_per_second: float | None) -> None:
+        self._interval = 1 / requests_per_second if requests_per_second else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _persist(evaluators: list[SubmissionEvaluator]) -> int:
+    """Insert the batch's evaluations in one statement, skipping any written meanwhile.
+
+    ``bulk_create`` sends no signals, so ``post_save`` is sent for each new evaluation
+    to keep the notification and eligibility-cache receivers in the loop. Rows that
+    lost a race to a concurrent writer are silently skipped by the INSERT, so only the
+    primary keys that actually landed are signalled and counted.
+    """
+    if not evaluators:
+        return 0
+    with transaction.atomic():
+        taken = set(
+            QuestionnaireEvaluation.objects.filter(
+                submission_id__in=[evaluator.submission.id for evaluator in evaluators]
+            ).values_list("submission_id", flat=True)
+        )
+        evaluations = [
+            QuestionnaireEvaluation(submission=evaluator.submission, **evaluator.evaluation_data())
+            for evaluator in evaluators
+            if evaluator.submission.id not in taken
+        ]
+        QuestionnaireEvaluation.objects.bulk_create(evaluations, ignore_conflicts=True)
+        stored = set(
+            QuestionnaireEvaluation.objects.filter(pk__in=[evaluation.pk for evaluation in evaluations]).values_list(
+                "pk", flat=True
+            )
+        )
+        evaluations = [evaluation for evaluation in evaluations if evaluation.pk in stored]
+        using = router.db_for_write(QuestionnaireEvaluation)
+        for evaluation in evaluations:
+            post_save.send(
+                sender=QuestionnaireEvaluation,
+                instance=evaluation,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=using,
+            )
+    return len(evaluations)
@@ -1,5 +1,6 @@
 """This module contains the business logic for evaluating questionnaire submissions."""
 
+import typing as t
 from decimal import Decimal
 from uuid import UUID
 
@@ -12,6 +13,7 @@ from questionnaires.llms.llm_interfaces import AnswerToEvaluate, EvaluationRespo
 from .models import (
     EvaluationAuditData,
     FileUploadQuestion,
+    FreeTextAnswer,
     FreeTextQuestion,
     MultipleChoiceQuestion,
     Questionnaire,
@@ -33,31 +35,24 @@ class SubmissionEvaluator:
     final or proposed status based on the questionnaire's evaluation mode.
     """
 
-    def __init__(self, submission: QuestionnaireSubmission, llm_evaluator: FreeTextEvaluator | None = None):
-        """Initialize the evaluator."""
+    def __init__(
+        self,
+        submission: QuestionnaireSubmission,
+        llm_evaluator: FreeTextEvaluator | None = None,
+        *,
+        questionnaire: Questionnaire | None = None,
+    ):
+        """Initialize the evaluator.
+
+        ``questionnaire`` lets a batch share one :meth:`load_questionnaire` result
+        across the submissions it evaluates.
+        """
         if submission.status != QuestionnaireSubmission.QuestionnaireSubmissionStatus.READY:
             raise ValueError("Only submitted questionnaires can be evaluated.")
 
         self.submission = submission
         self.llm_evaluator = llm_evaluator if llm_evaluator else submission.questionnaire.get_llm_backend()
-        self.questionnaire = Questionnaire.objects.prefetch_related(
-            Prefetch(
-                "multiplechoicequestion_questions",
-                queryset=MultipleChoiceQuestion.objects.prefetch_related("options"),
-            ),
-            Prefetch(
-                "freetextquestion_questions",
-                queryset=FreeTextQuestion.objects.all(),
-            ),
-            Prefetch(
-                "fileuploadquestion_questions",
-                queryset=FileUploadQuestion.objects.all(),
-            ),
-            Prefetch(
-                "sections",
-                queryset=QuestionnaireSection.objects.all(),
-            ),
-        ).get(pk=submission.questionnaire_id)
+        self.questionnaire = questionnaire or self.load_questionnaire(submission.questionnaire_id)
 
         # Initialize state
         self.mc_points_scored = Decimal("0.0")
@@ -69,6 +64,7 @@ class SubmissionEvaluator:
         self.llm_batch_response: EvaluationResponse | None = None
         self.fatal_error = False
         self.missing_mandatory: list[UUID] = []
+        self._ft_answers: list[FreeTextAnswer] = []
 
         # Compute applicable questions based on conditional dependencies
         self._selected_option_ids: set[UUID] = set()
@@ -78,6 +74,28 @@ class SubmissionEvaluator:
         self._applicable_fuq_ids: set[UUID] = set()
         self._compute_applicable_questions()
 
+    @staticmethod
+    def load_questionnaire(questionnaire_id: UUID) -> Questionnaire:
+        """Load a questionnaire with the questions and sections evaluation reads."""
+        return Questionnaire.objects.prefetch_related(
+            Prefetch(
+                "multiplechoicequestion_questions",
+                queryset=MultipleChoiceQuestion.objects.prefetch_related("options"),
+            ),
+            Prefetch(
+                "freetextquestion_questions",
+                queryset=FreeTextQuestion.objects.all(),
+            ),
+            Prefetch(
+                "fileuploadquestion_questions",
+                queryset=FileUploadQuestion.objects.all(),
+            ),
+            Prefetch(
+                "sections",
+                queryset=QuestionnaireSection.objects.all(),
+            ),
+        ).get(pk=questionnaire_id)
+
     def _compute_applicable_questions(self) -> None:
         """Compute which questions are applicable based on conditional dependencies.
 
@@ -147,13 +165,9 @@ class SubmissionEvaluator:
             questionnaire_id=str(self.questionnaire.id),
             user_id=str(self.submission.user_id),
         )
-        # First, check for a hard failure condition: unanswered mandatory questions.
-        self._check_for_missing_mandatory_answers()
-
-        # We proceed with scoring to provide a partial score for audit purposes,
-        # but the final result will be overridden if a mandatory question was missed.
-        self._evaluate_mc_answers()
-        self._evaluate_ft_answers_in_batch()
+        questions_for_llm = self.prepare()
+        if questions_for_llm:
+            self._evaluate_ft_answers_in_batch(questions_for_llm)
         evaluation = self._create_or_update_evaluation()
         logger.info(
             "questionnaire_evaluation_completed",
@@ -164,6 +178,21 @@ class SubmissionEvaluator:
         )
         return evaluation
 
+    def prepare(self) -> list[AnswerToEvaluate]:
+        """Run every scoring step that needs no LLM call.
+
+        Returns:
+            The free-text answers to send to the LLM backend, or an empty list when
+            no call is needed. Their result goes to :meth:`apply_llm_response`.
+        """
+        # First, check for a hard failure condition: unanswered mandatory questions.
+        self._check_for_missing_mandatory_answers()
+
+        # We proceed with scoring to provide a partial score for audit purposes,
+        # but the final result will be overridden if a mandatory question was missed.
+        self._evaluate_mc_answers()
+        return self._prepare_ft_answers()
+
     def _check_for_missing_mandatory_answers(self) -> None:
         """Checks if any applicable mandatory questions were left unanswered.
 
@@ -229,16 +258,16 @@ class SubmissionEvaluator:
                 self.mc_points_scored -= answer.question.negative_weight
                 self._fatalize(answer.question)
 
-    def _evaluate_ft_answers_in_batch(self) -> None:
-        """Evaluates all applicable free-text answers in a single batch call."""
+    def _prepare_ft_answers(self) -> list[AnswerToEvaluate]:
+        """Collect the applicable free-text answers for a single batch LLM call."""
         # Only evaluate answers for applicable questions
-        answers_to_evaluate = [
+        self._ft_answers = [
             answer
             for answer in self.submission.freetextanswer_answers.all().select_related("question")
             if answer.question_id in self._applicable_ftq_ids
         ]
-        if not answers_to_evaluate:
-            return
+        if not self._ft_answers:
+            return []
 
         # Only count max points for applicable questions
         self.max_ft_points = sum(
@@ -249,25 +278,27 @@ class SubmissionEvaluator:
 
         # If we already know the submission fails on a mandatory check, don't waste tokens.
         if self._missing_mandatory_or_fatal():
-            return
+            return []
 
-        questions_for_llm = [
+        return [
             AnswerToEvaluate(
                 question_id=answer.question_id,
                 question_text=answer.question.question,
                 answer_text=answer.answer,
                 guidelines=answer.question.llm_guidelines,
             )
-            for answer in answers_to_evaluate
+            for answer in self._ft_answers
         ]
 
+    def _evaluate_ft_answers_in_batch(self, questions_for_llm: list[AnswerToEvaluate]) -> None:
+        """Evaluates all applicable free-text answers in a single batch call."""
         logger.info(
             "questionnaire_llm_evaluation_started",
             submission_id=str(self.submission.id),
             question_count=len(questions_for_llm),
             llm_backend=self.llm_evaluator.__class__.__name__,
         )
-        self.llm_batch_response = self.llm_evaluator.evaluate(
+        response = self.llm_evaluator.evaluate(
             questions_to_evaluate=questions_for_llm,
             questionnaire_guidelines=self.questionnaire.llm_guidelines,
         )
@@ -275,9 +306,13 @@ class SubmissionEvaluator:
             "questionnaire_llm_evaluation_completed",
             submission_id=str(self.submission.id),
         )
+        self.apply_llm_response(response)
 
-        results_map = {result.question_id: result for result in self.llm_batch_response.evaluations}
-        for answer in answers_to_evaluate:
+    def apply_llm_response(self, response: EvaluationResponse) -> None:
+        """Score the free-text answers returned by :meth:`prepare` from the backend's response."""
+        self.llm_batch_response = response
+        results_map = {result.question_id: result for result in response.evaluations}
+        for answer in self._ft_answers:
             result = results_map.get(answer.question_id)
             if result:  # pragma: no branch
                 if result.is_passing:
@@ -296,11 +331,20 @@ class SubmissionEvaluator:
     def _create_or_update_evaluation(self) -> QuestionnaireEvaluation:
         """Creates or updates the QuestionnaireEvaluation object.
 
-        Applies the business logic for different evaluation modes and storing the audit trail.
-
         Returns:
             QuestionnaireEvaluation
         """
+        evaluation, _ = QuestionnaireEvaluation.objects.select_related("submission").update_or_create(
+            submission=self.submission,
+            defaults=self.evaluation_data(),
+        )
+        return evaluation
+
+    def evaluation_data(self) -> dict[str, t.Any]:
+        """The QuestionnaireEvaluation field values for the scores computed so far.
+
+        Applies the business logic for different evaluation modes and storing the audit trail.
+        """
         total_points_scored = self.mc_points_scored + self.ft_points_scored
         total_max_points = self.max_mc_points + self.max_ft_points
 
@@ -354,8 +398,4 @@ class SubmissionEvaluator:
                 f"This submission was automatically evaluated and is pending human review.{missing_mandatory_str}"
             )
 
-        evaluation, _ = QuestionnaireEvaluation.objects.select_related("submission").update_or_create(
-            submission=self.submission,
-            defaults=evaluation_data,
-        )
-        return evaluation
+        return evaluation_data
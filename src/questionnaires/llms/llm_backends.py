@@ -1,9 +1,12 @@
 # ruff: noqa: E501
 
+import gc
 import re
+import time
 import typing as t
 from textwrap import dedent
 
+import structlog
 from django.conf import settings
 from jinja2.sandbox import SandboxedEnvironment
 
@@ -24,6 +27,8 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
 
+logger = structlog.get_logger(__name__)
+
 _jinja_env = SandboxedEnvironment()
 
 
@@ -62,6 +67,11 @@ class MockEvaluator(FreeTextEvaluator):
 class BaseLLMEvaluator(FreeTextEvaluator):
     """Base class for LLM evaluators with defensive prompting against prompt injection."""
 
+    @property
+    def max_requests_per_second(self) -> float | None:  # type: ignore[override]
+        """The provider's request budget for concurrent batch evaluation."""
+        return settings.LLM_MAX_REQUESTS_PER_SECOND or None
+
     SYSTEM_PROMPT: str = dedent("""
     You are an expert questionnaire evaluator. Follow the following guidelines to evaluate the answers to the questions:
 
@@ -237,28 +247,64 @@ _sentinel_pipeline: t.Any = None
 
 def _get_sentinel_pipeline() -> t.Any:
     """Load and cache the sentinel model pipeline for reuse."""
+    global _sentinel_pipeline
+    if _sentinel_pipeline is None:
+        _sentinel_pipeline = load_sentinel_pipeline(quantize=settings.SENTINEL_QUANTIZE)
+    return _sentinel_pipeline
+
+
+def load_sentinel_pipeline(*, quantize: bool = False) -> t.Any:
+    """Load a fresh sentinel pipeline from the local model, bypassing the cache."""
     if not TRANSFORMERS_AVAILABLE:
         msg = "Transformers library is not installed. Please install it with: uv sync --group sentinel"
         raise ImportError(msg)
 
-    global _sentinel_pipeline
-    if _sentinel_pipeline is None:
-        if not SENTINEL_MODEL_PATH.exists():
-            msg = (
-                f"Sentinel model not found at {SENTINEL_MODEL_PATH}. "
-                "Please run 'python manage.py download_sentinel_model' first."
-            )
-            raise FileNotFoundError(msg)
+    if not SENTINEL_MODEL_PATH.exists():
+        msg = (
+            f"Sentinel model not found at {SENTINEL_MODEL_PATH}. "
+            "Please run 'python manage.py download_sentinel_model' first."
+        )
+        raise FileNotFoundError(msg)
 
-        try:
-            tokenizer = AutoTokenizer.from_pretrained(str(SENTINEL_MODEL_PATH))  # nosec B615 - local path, not downloading
-            model = AutoModelForSequenceClassification.from_pretrained(str(SENTINEL_MODEL_PATH))  # nosec B615 - local path, not downloading
-            _sentinel_pipeline = pipeline("text-classification", model=model, tokenizer=tokenizer)
-        except Exception as e:
-            msg = f"Failed to load sentinel model: {e}"
-            raise RuntimeError(msg) from e
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(str(SENTINEL_MODEL_PATH))  # nosec B615 - local path, not downloading
+        model = AutoModelForSequenceClassification.from_pretrained(str(SENTINEL_MODEL_PATH))  # nosec B615 - local path, not downloading
+        if quantize:
+            model = _quantize(model)
+        return pipeline("text-classification", model=model, tokenizer=tokenizer)
+    except Exception as e:
+        msg = f"Failed to load sentinel model: {e}"
+        raise RuntimeError(msg) from e
 
-    return _sentinel_pipeline
+
+def _quantize(model: t.Any) -> t.Any:
+    """Dynamic int8 quantization of the model's linear layers: smaller weights, faster CPU inference."""
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def preload_sentinel_pipeline() -> bool:
+    """Load the sentinel pipeline now, in a process that is about to fork workers.
+
+    Children inherit the loaded weights and share their pages copy-on-write instead of
+    each loading a private copy on its first evaluation. The objects loaded so far are
+    moved out of the garbage collector's reach (``gc.freeze``) so collections in the
+    children don't write to, and thereby copy, those pages. No inference runs here:
+    torch's thread pools must not be started before the fork.
+
+    Returns:
+        Whether the pipeline is loaded. Failures are logged; children then load lazily as before.
+    """
+    started = time.perf_counter()
+    try:
+        _get_sentinel_pipeline()
+    except Exception:
+        logger.warning("sentinel_preload_failed", exc_info=True)
+        return False
+    gc.freeze()
+    logger.info("sentinel_preloaded", seconds=round(time.perf_counter() - started, 3))
+    return True
 
 
 class SentinelLLMEvaluator(SanitizingLLMEvaluator):
@@ -282,6 +328,60 @@ class SentinelLLMEvaluator(SanitizingLLMEvaluator):
             return "benign"
         return "jailbreak"
 
+    @staticmethod
+    def _check_prompt_injections(texts: list[str]) -> list[t.Literal["benign", "jailbreak"]]:
+        """Classify many texts with one batched sentinel pipeline call.
+
+        Same verdicts as :meth:`_check_prompt_injection`, one per text, in order.
+        """
+        if not texts:
+            return []
+        sentinel = _get_sentinel_pipeline()
+        results = sentinel(texts, batch_size=settings.SENTINEL_BATCH_SIZE)
+        if not isinstance(results, list) or len(results) != len(texts):
+            return ["jailbreak"] * len(texts)
+        return [
+            "benign" if isinstance(result, dict) and result.get("label") == "benign" else "jailbreak"
+            for result in results
+        ]
+
+    @staticmethod
+    def _prompt_injection_response(questions_to_evaluate: list[AnswerToEvaluate]) -> EvaluationResponse:
+        return EvaluationResponse(
+            evaluations=[
+                EvaluationResult(
+                    question_id=q.question_id,
+                    is_passing=False,
+                    explanation="Answer failed due to prompt injection attempt detected.",
+                )
+                for q in questions_to_evaluate
+            ]
+        )
+
+    def prescreen(self, batches: list[list[AnswerToEvaluate]]) -> list[EvaluationResponse | None]:
+        """Classify every answer of every batch in one pipeline call.
+
+        A batch with any jailbreak answer fails whole, as in :meth:`evaluate`.
+        """
+        verdicts = iter(self._check_prompt_injections([item.answer_text for batch in batches for item in batch]))
+        screened: list[EvaluationResponse | None] = []
+        for batch in batches:
+            batch_verdicts = [next(verdicts) for _ in batch]
+            screened.append(self._prompt_injection_response(batch) if "jailbreak" in batch_verdicts else None)
+        return screened
+
+    def evaluate_prescreened(
+        self,
+        *,
+        questions_to_evaluate: list[AnswerToEvaluate],
+        questionnaire_guidelines: str | None,
+    ) -> EvaluationResponse:
+        """Evaluate via LLM answers that :meth:`prescreen` already let through."""
+        return super().evaluate(
+            questions_to_evaluate=questions_to_evaluate,
+            questionnaire_guidelines=questionnaire_guidelines,
+        )
+
     def evaluate(
         self,
         *,
@@ -296,16 +396,7 @@ class SentinelLLMEvaluator(SanitizingLLMEvaluator):
         """
         for item in questions_to_evaluate:
             if self._check_prompt_injection(item.answer_text) == "jailbreak":
-                return EvaluationResponse(
-                    evaluations=[
-                        EvaluationResult(
-                            question_id=q.question_id,
-                            is_passing=False,
-                            explanation="Answer failed due to prompt injection attempt detected.",
-                        )
-                        for q in questions_to_evaluate
-                    ]
-                )
+                return self._prompt_injection_response(questions_to_evaluate)
 
         return super().evaluate(
             questions_to_evaluate=questions_to_evaluate,
@@ -35,6 +35,10 @@ class EvaluationResponse(BaseModel):
 class FreeTextEvaluator(t.Protocol):
     """Defines the interface for any class that can evaluate a BATCH of free-text answers."""
 
+    # Upper bound on evaluate() calls per second when many submissions are evaluated
+    # concurrently (see questionnaires.batch_evaluator). None means unlimited.
+    max_requests_per_second: float | None = None
+
     def evaluate(
         self,
         *,
@@ -48,3 +52,24 @@ class FreeTextEvaluator(t.Protocol):
             evaluation results. The implementation MUST guarantee that every
             question sent is present in the response.
         """
+
+
+@t.runtime_checkable
+class PrescreeningEvaluator(FreeTextEvaluator, t.Protocol):
+    """A backend that can screen many submissions' answers at once before any LLM call."""
+
+    def prescreen(self, batches: list[list[AnswerToEvaluate]]) -> list[EvaluationResponse | None]:
+        """Screen each submission's answers in one pass over all of them.
+
+        Returns:
+            For each batch, the final response when screening already decides it,
+            or None when it still needs :meth:`evaluate_prescreened`.
+        """
+
+    def evaluate_prescreened(
+        self,
+        *,
+        questions_to_evaluate: list[AnswerToEvaluate],
+        questionnaire_guidelines: str | None,
+    ) -> EvaluationResponse:
+        """Like evaluate(), for a batch that :meth:`prescreen` already let through."""
@@ -2,22 +2,62 @@ from uuid import UUID
 
 import structlog
 from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
 
+from . import batch_evaluator
 from .evaluator import SubmissionEvaluator
 from .exceptions import SubmissionInDraftError
 from .models import QuestionnaireSubmission
 
 logger = structlog.get_logger(__name__)
 
+# Lets the batch marker expire (and the next submission reschedule) if its run was lost.
+BATCH_SCHEDULED_GRACE_SECONDS = 600
+
+
+def _batch_scheduled_key(questionnaire_id: str) -> str:
+    return f"questionnaire_evaluation_batch:{questionnaire_id}:scheduled"
+
+
+def _schedule_batch(questionnaire_id: str, *, after: str | None = None) -> bool:
+    """Schedule one debounced batch run for the questionnaire unless one is pending or running.
+
+    Returns:
+        False if the marker could not be checked, so no batch is sure to pick the submissions up.
+    """
+    debounce = settings.QUESTIONNAIRE_EVALUATION_BATCH_DEBOUNCE_SECONDS
+    try:
+        added = cache.add(_batch_scheduled_key(questionnaire_id), 1, timeout=debounce + BATCH_SCHEDULED_GRACE_SECONDS)
+    except Exception:
+        logger.warning(
+            "questionnaire_evaluation_batch_schedule_failed", questionnaire_id=questionnaire_id, exc_info=True
+        )
+        return False
+    if added:
+        args = (questionnaire_id,) if after is None else (questionnaire_id, after)
+        evaluate_pending_submissions.apply_async(args, countdown=debounce)
+    return True
+
 
 @shared_task(name="questionnaires.tasks.evaluate_questionnaire_submission")
-def evaluate_questionnaire_submission(questionnaire_submission_id: str) -> UUID:
-    """Evaluate a questionnaire submission automatically."""
+def evaluate_questionnaire_submission(questionnaire_submission_id: str) -> UUID | None:
+    """Evaluate a questionnaire submission automatically.
+
+    When ``QUESTIONNAIRE_EVALUATION_BATCH_THRESHOLD`` submissions of the same
+    questionnaire are waiting, hands them all to :func:`evaluate_pending_submissions`
+    instead and returns None.
+    """
     logger.info("questionnaire_evaluation_task_started", submission_id=questionnaire_submission_id)
     submission = QuestionnaireSubmission.objects.get(id=questionnaire_submission_id)
     if submission.status == QuestionnaireSubmission.QuestionnaireSubmissionStatus.DRAFT:
         logger.warning("questionnaire_evaluation_task_draft_error", submission_id=questionnaire_submission_id)
         raise SubmissionInDraftError("Submission is still in draft.")
+    threshold = settings.QUESTIONNAIRE_EVALUATION_BATCH_THRESHOLD
+    pending = batch_evaluator.pending_submissions(submission.questionnaire_id)
+    if pending[:threshold].count() >= threshold and _schedule_batch(str(submission.questionnaire_id)):
+        logger.info("questionnaire_evaluation_task_batched", submission_id=questionnaire_submission_id)
+        return None
     try:
         evaluator = SubmissionEvaluator(submission)
         result = evaluator.evaluate()
@@ -35,3 +75,50 @@ def evaluate_questionnaire_submission(questionnaire_submission_id: str) -> UUID:
             exc_info=True,
         )
         raise
+
+
+@shared_task(name="questionnaires.tasks.evaluate_pending_submissions")
+def evaluate_pending_submissions(questionnaire_id: str, after: str | None = None) -> int:
+    """Evaluate the questionnaire's oldest pending submissions as one batch.
+
+    Runs one ``QUESTIONNAIRE_EVALUATION_BATCH_SIZE`` batch, then reschedules itself
+    while submissions it did not pick up are pending. The continuation resumes
+    ``after`` the last submission of this batch, so one whose LLM call failed stays
+    pending without heading every later batch; it is retried by the next run that
+    starts from the beginning. A batch that writes nothing (e.g. the provider is
+    down) ends the chain.
+
+    Returns:
+        Number of evaluations written.
+    """
+    batch_size = settings.QUESTIONNAIRE_EVALUATION_BATCH_SIZE
+    pending = batch_evaluator.pending_submissions(questionnaire_id, after=after)
+    try:
+        submission_ids = list(pending.values_list("id", flat=True)[:batch_size])
+        written = batch_evaluator.evaluate_submissions(questionnaire_id, submission_ids)
+    except Exception as e:
+        logger.error(
+            "questionnaire_batch_evaluation_task_failed", questionnaire_id=questionnaire_id, error=str(e), exc_info=True
+        )
+        raise
+    finally:
+        # Cleared only once the batch is written: submissions arriving meanwhile saw the
+        # marker and left their evaluation to this run, so it looks for them below.
+        try:
+            cache.delete(_batch_scheduled_key(questionnaire_id))
+        except Exception:
+            logger.warning(
+                "questionnaire_evaluation_batch_marker_clear_failed", questionnaire_id=questionnaire_id, exc_info=True
+            )
+
+    if not written:
+        if submission_ids:
+            logger.warning(
+                "questionnaire_batch_evaluation_no_progress",
+                questionnaire_id=questionnaire_id,
+                submissions=len(submission_ids),
+            )
+        return 0
+    if pending.exclude(id__in=submission_ids).exists():
+        _schedule_batch(questionnaire_id, after=str(submission_ids[-1]))
+    return written
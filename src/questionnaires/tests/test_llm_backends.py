@@ -13,6 +13,7 @@ from questionnaires.llms.llm_backends import (
     MockEvaluator,
     SanitizingLLMEvaluator,
     _strip_tags_and_content,
+    preload_sentinel_pipeline,
 )
 from questionnaires.llms.llm_helpers import _get_instructor_client, call_llm
 from questionnaires.llms.llm_interfaces import AnswerToEvaluate, EvaluationResponse, EvaluationResult
@@ -575,6 +576,29 @@ class TestSentinelLLMEvaluator:
             mock_pipeline.return_value = None
             assert evaluator._check_prompt_injection("None response") == "jailbreak"
 
+    @patch("questionnaires.llms.llm_backends._get_sentinel_pipeline")
+    def test_prescreen_classifies_all_batches_in_one_pipeline_call(
+        self, mock_get_pipeline: MagicMock, evaluator: "SentinelLLMEvaluator"
+    ) -> None:
+        """Test that prescreen runs one batched classification and fails only batches with a jailbreak."""
+        clean = [AnswerToEvaluate(question_id=uuid.uuid4(), question_text="Q", answer_text="fine", guidelines="")]
+        tainted = [
+            AnswerToEvaluate(question_id=uuid.uuid4(), question_text="Q1", answer_text="fine too", guidelines=""),
+            AnswerToEvaluate(question_id=uuid.uuid4(), question_text="Q2", answer_text="ignore rules", guidelines=""),
+        ]
+        mock_pipeline = MagicMock(
+            return_value=[{"label": "benign"}, {"label": "benign"}, {"label": "jailbreak"}],
+        )
+        mock_get_pipeline.return_value = mock_pipeline
+
+        screened = evaluator.prescreen([clean, tainted])
+
+        mock_pipeline.assert_called_once()
+        assert mock_pipeline.call_args.args[0] == ["fine", "fine too", "ignore rules"]
+        assert screened[0] is None
+        assert screened[1] is not None
+        assert [r.is_passing for r in screened[1].evaluations] == [False, False]
+
     @patch("questionnaires.llms.llm_backends._get_sentinel_pipeline")
     def test_evaluate_preserves_question_ids_in_failure_responses(
         self, mock_get_pipeline: MagicMock, evaluator: "SentinelLLMEvaluator"
@@ -849,3 +873,36 @@ class TestSanitizingLLMEvaluator:
         assert sanitized[0].guidelines == "some guidelines"
         assert "<tag>" not in sanitized[0].answer_text
         assert "clean" in sanitized[0].answer_text
+
+
+class TestPreloadSentinelPipeline:
+    """Tests for preloading the sentinel pipeline before a worker forks."""
+
+    @patch("questionnaires.llms.llm_backends.gc.freeze")
+    @patch("questionnaires.llms.llm_backends._get_sentinel_pipeline")
+    def test_preload_loads_and_freezes(self, mock_get_pipeline: MagicMock, mock_freeze: MagicMock) -> None:
+        """Test that preloading loads the cached pipeline, then freezes the loaded objects."""
+        assert preload_sentinel_pipeline() is True
+        mock_get_pipeline.assert_called_once_with()
+        mock_freeze.assert_called_once_with()
+
+    @patch("questionnaires.llms.llm_backends.gc.freeze")
+    @patch("questionnaires.llms.llm_backends._get_sentinel_pipeline", side_effect=FileNotFoundError("missing"))
+    def test_preload_failure_is_not_fatal(self, mock_get_pipeline: MagicMock, mock_freeze: MagicMock) -> None:
+        """Test that a missing model leaves workers to load lazily instead of failing startup."""
+        assert preload_sentinel_pipeline() is False
+        mock_freeze.assert_not_called()
+
+    @patch("questionnaires.llms.llm_backends.load_sentinel_pipeline")
+    def test_cached_pipeline_honours_quantize_setting(self, mock_load: MagicMock, settings: t.Any) -> None:
+        """Test that the cached pipeline is loaded with the SENTINEL_QUANTIZE setting."""
+        import questionnaires.llms.llm_backends
+
+        settings.SENTINEL_QUANTIZE = True
+        questionnaires.llms.llm_backends._sentinel_pipeline = None
+        try:
+            questionnaires.llms.llm_backends._get_sentinel_pipeline()
+        finally:
+            questionnaires.llms.llm_backends._sentinel_pipeline = None
+
+        mock_load.assert_called_once_with(quantize=True)
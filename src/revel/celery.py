@@ -5,7 +5,7 @@ import typing as t
 
 import structlog
 from celery import Celery
-from celery.signals import task_postrun, task_prerun
+from celery.signals import task_postrun, task_prerun, worker_init
 from opentelemetry import trace
 
 # Set the default Django settings module for the 'celery' program.
@@ -85,6 +85,23 @@ def celery_task_postrun(*args: t.Any, **kwargs: t.Any) -> None:
     structlog.contextvars.clear_contextvars()
 
 
+@worker_init.connect
+def preload_sentinel_model(*args: t.Any, **kwargs: t.Any) -> None:
+    """Load the sentinel model in the worker's parent process, before the pool forks.
+
+    Opt-in via ``SENTINEL_PRELOAD``; see
+    :func:`questionnaires.llms.llm_backends.preload_sentinel_pipeline`.
+    """
+    from django.conf import settings
+
+    if not settings.SENTINEL_PRELOAD:
+        return
+
+    from questionnaires.llms.llm_backends import preload_sentinel_pipeline
+
+    preload_sentinel_pipeline()
+
+
 # run:
 # celery -A revel worker -l INFO
 # celery -A revel beat -l INFO --scheduler django_celery_beat.schedulers:DatabaseScheduler
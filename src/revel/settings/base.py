@@ -212,6 +212,17 @@ LANGUAGES = [
     ("pt", "Português"),
 ]
 
+# Postgres text-search configuration per language, for event discovery search. Every
+# event's search document is indexed in all of these (plus "simple").
+EVENT_SEARCH_CONFIGS = {
+    "en": "english",
+    "de": "german",
+    "it": "italian",
+    "fr": "french",
+    "es": "spanish",
+    "pt": "portuguese",
+}
+
 LOCALE_PATHS = [
     BASE_DIR / "locale",
 ]
@@ -341,11 +352,30 @@ CLAMAV_HOST = config("CLAMAV_HOST", default="localhost")
 CLAMAV_PORT = config("CLAMAV_PORT", default=3310, cast=int)
 
 IP2LOCATION_TOKEN = config("IP2LOCATION_TOKEN", default=None)
+# Per-process LRU of resolved IPv4 /24s (and IPv6 addresses); ~200 bytes an entry.
+IP2LOCATION_CACHE_SIZE = config("IP2LOCATION_CACHE_SIZE", default=65536, cast=int)
+# How often a process checks whether the downloader replaced the database file.
+IP2LOCATION_RELOAD_CHECK_SECONDS = config("IP2LOCATION_RELOAD_CHECK_SECONDS", default=60, cast=int)
 
 
 # NOTIFICATIONS
 NOTIFICATION_RETENTION_DAYS = config("NOTIFICATION_RETENTION_DAYS", default=90, cast=int)
 
+# ATTENDEE VISIBILITY
+# Ticket/RSVP/invitation writes within this window share one incremental flag update.
+ATTENDEE_VISIBILITY_DEBOUNCE_SECONDS = config("ATTENDEE_VISIBILITY_DEBOUNCE_SECONDS", default=5, cast=int)
+# "materialized" keeps a viewer×target AttendeeVisibilityFlag matrix for every event.
+# "lazy" skips it for events with at least ATTENDEE_VISIBILITY_LAZY_THRESHOLD attendees
+# and resolves their attendee lists per viewer at query time instead.
+ATTENDEE_VISIBILITY_MODE = config("ATTENDEE_VISIBILITY_MODE", default="materialized")
+ATTENDEE_VISIBILITY_LAZY_THRESHOLD = config("ATTENDEE_VISIBILITY_LAZY_THRESHOLD", default=1000, cast=int)
+
+# TICKET FILES
+# Ticket activations within this window share one background pre-generation run, and
+# each run renders at most TICKET_FILE_PREWARM_BATCH_SIZE tickets before rescheduling.
+TICKET_FILE_PREWARM_DEBOUNCE_SECONDS = config("TICKET_FILE_PREWARM_DEBOUNCE_SECONDS", default=10, cast=int)
+TICKET_FILE_PREWARM_BATCH_SIZE = config("TICKET_FILE_PREWARM_BATCH_SIZE", default=200, cast=int)
+
 # PUSHOVER
 PUSHOVER_USER_KEY = config("PUSHOVER_USER_KEY", default=None)
 PUSHOVER_APP_TOKEN = config("PUSHOVER_APP_TOKEN", default=None)
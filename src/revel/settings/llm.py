@@ -32,3 +32,25 @@ LLM_MAX_RETRIES: int = config("LLM_MAX_RETRIES", default=3, cast=int)
 # Valid values: TOOLS, JSON, JSON_SCHEMA, MD_JSON (see instructor.Mode).
 # Set to empty string to use Instructor's provider-based auto-detection.
 LLM_INSTRUCTOR_MODE: str = config("LLM_INSTRUCTOR_MODE", default="JSON")
+
+# Batch evaluation (questionnaires/batch_evaluator.py). Once a questionnaire has
+# QUESTIONNAIRE_EVALUATION_BATCH_THRESHOLD submissions waiting, they are evaluated
+# together: one sentinel pass over all answers, then at most LLM_BATCH_CONCURRENCY
+# LLM calls in flight, paced to LLM_MAX_REQUESTS_PER_SECOND per worker (0 = unpaced).
+QUESTIONNAIRE_EVALUATION_BATCH_THRESHOLD: int = config("QUESTIONNAIRE_EVALUATION_BATCH_THRESHOLD", default=5, cast=int)
+QUESTIONNAIRE_EVALUATION_BATCH_SIZE: int = config("QUESTIONNAIRE_EVALUATION_BATCH_SIZE", default=100, cast=int)
+QUESTIONNAIRE_EVALUATION_BATCH_DEBOUNCE_SECONDS: int = config(
+    "QUESTIONNAIRE_EVALUATION_BATCH_DEBOUNCE_SECONDS", default=5, cast=int
+)
+LLM_BATCH_CONCURRENCY: int = config("LLM_BATCH_CONCURRENCY", default=8, cast=int)
+LLM_MAX_REQUESTS_PER_SECOND: float = config("LLM_MAX_REQUESTS_PER_SECOND", default=0.0, cast=float)
+
+# Texts per forward pass of the sentinel prompt-injection classifier.
+SENTINEL_BATCH_SIZE: int = config("SENTINEL_BATCH_SIZE", default=32, cast=int)
+
+# Load the sentinel model in the Celery worker's parent process before it forks its
+# pool, so prefork children share the weights instead of each loading a copy.
+SENTINEL_PRELOAD: bool = config("SENTINEL_PRELOAD", default=False, cast=bool)
+
+# Dynamic int8 quantization of the sentinel model at load time (smaller, faster on CPU).
+SENTINEL_QUANTIZE: bool = config("SENTINEL_QUANTIZE", default=False, cast=bool)
@@ -8,7 +8,7 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from accounts.models import RevelUser
 from common.models import SiteSettings
 from events.models import Event, Organization, OrganizationMembershipRequest
-from events.service.event_manager import EligibilityService
+from events.service import eligibility_cache
 from notifications.enums import NotificationType
 from notifications.models import Notification
 from telegram.keyboards import get_event_eligible_keyboard
@@ -128,8 +128,7 @@ def _get_event_keyboard(event_id: str, user: RevelUser) -> InlineKeyboardMarkup:
         InlineKeyboardMarkup with appropriate actions
     """
     event = Event.objects.select_related("organization").prefetch_related("ticket_tiers").get(pk=event_id)
-    eligibility_service = EligibilityService(user=user, event=event)
-    eligibility = eligibility_service.check_eligibility()
+    eligibility = eligibility_cache.get_eligibility(user, event)
 
     # Reuse existing keyboard handler from keyboards.py
     return get_event_eligible_keyboard(event=event, eligibility=eligibility, user=user)